@@ -14,32 +14,178 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
-from typing import Any, Dict
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import mmcv
 import numpy as np
 from mmaction.datasets.builder import PIPELINES
 
 from otx.api.entities.datasets import DatasetEntity
+from otx.core.data.caching import MemCacheHandlerError, MemCacheHandlerSingleton
 
 
 @PIPELINES.register_module(force=True)
 class RawFrameDecode:
-    """Load and decode frames with given indices."""
+    """Load and decode frames with given indices.
+
+    Decoded frames are cached one by one in the memory pool of MemCacheHandlerSingleton,
+    which is shared by the DataLoader workers, so that overlapping clips and later epochs
+    do not decode the same frames again.
+
+    Args:
+        enable_memcache (bool): True to cache the decoded frames in the memory pool. Defaults to True.
+        resize_scale (Optional[Tuple[int, int]]): If given, frames are downscaled keeping their aspect ratio
+            before being cached, as the Resize pipeline with keep_ratio=True and the same scale,
+            e.g. (-1, 256) for a short edge of 256. Frames are never upscaled. Defaults to None.
+        num_prefetch_workers (int): If greater than 0, the frames of a clip are decoded by this number of threads,
+            and the frames of the next clip of the same video are decoded and cached in the background.
+            Defaults to 0.
+    """
 
     otx_dataset: DatasetEntity
 
+    def __init__(
+        self,
+        enable_memcache: bool = True,
+        resize_scale: Optional[Tuple[int, int]] = None,
+        num_prefetch_workers: int = 0,
+    ):
+        self._enable_memcache = enable_memcache
+        self._resize_scale: Optional[Tuple[float, float]] = None
+        if resize_scale is not None:
+            max_long_edge, max_short_edge = max(resize_scale), min(resize_scale)
+            # assign np.inf to long edge for rescaling short edge, as the Resize pipeline does
+            self._resize_scale = (np.inf, max_long_edge) if max_short_edge == -1 else (resize_scale[0], resize_scale[1])
+        self._num_prefetch_workers = num_prefetch_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetching: set = set()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
     def __call__(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Call function of RawFrameDecode."""
         results = self._decode_from_list(results)
         return results
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the thread pool and the lock, which cannot be pickled for the DataLoader workers."""
+        state = self.__dict__.copy()
+        state.update(_executor=None, _prefetching=set(), _lock=None, _pid=None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the state dropped by __getstate__."""
+        self.__dict__.update(state)
+        self._reset_if_forked()
+
+    def _reset_if_forked(self):
+        """Reset the thread pool and the lock in a new process, the threads are not inherited by forked workers."""
+        if self._pid != os.getpid():
+            self._executor = None
+            self._prefetching = set()
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    def _get_memcache_handler(self):
+        """Get memcache handler."""
+        try:
+            mem_cache_handler = MemCacheHandlerSingleton.get()
+        except MemCacheHandlerError:
+            # Create a null handler
+            MemCacheHandlerSingleton.create(mode="null", mem_size=0)
+            mem_cache_handler = MemCacheHandlerSingleton.get()
+
+        return mem_cache_handler
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool decoding the frames."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._num_prefetch_workers, thread_name_prefix="RawFrameDecode"
+            )
+        return self._executor
+
+    def _get_unique_key(self, index: int) -> Tuple:
+        """Returns unique key of the frame, which depends on the resize scale of the cached frames."""
+        d_item = self.otx_dataset[index]
+        return self.__class__.__name__, d_item.media.path, d_item.roi.id, self._resize_scale
+
+    def _load_frame(self, index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """Decode a frame and resize it if needed, returns the frame and its original shape."""
+        img = self.otx_dataset[index].media.numpy
+        original_shape = img.shape[:2]
+        if self._resize_scale is not None:
+            img_h, img_w = original_shape
+            new_w, new_h = mmcv.rescale_size((img_w, img_h), self._resize_scale)
+            if new_w * new_h < img_w * img_h:
+                img = mmcv.imresize(img, (new_w, new_h), interpolation="bilinear")
+        return img, original_shape
+
+    def _get_frame(self, index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """Get a frame from the cache, or decode it and cache it."""
+        if not self._enable_memcache:
+            return self._load_frame(index)
+
+        mem_cache_handler = self._get_memcache_handler()
+        key = self._get_unique_key(index)
+        img, meta = mem_cache_handler.get(key)
+        if img is not None and meta is not None:
+            return img, meta["original_shape"]
+
+        img, original_shape = self._load_frame(index)
+        with self._lock:
+            mem_cache_handler.put(key, img, {"original_shape": original_shape})
+        return img, original_shape
+
+    def _prefetch(self, indices: Sequence[int]):
+        """Decode and cache the frames which are not cached yet in the background."""
+        mem_cache_handler = self._get_memcache_handler()
+        if not self._enable_memcache or mem_cache_handler.mem_size == 0:
+            return
+
+        executor = self._get_executor()
+
+        def _load(index: int):
+            try:
+                self._get_frame(index)
+            finally:
+                with self._lock:
+                    self._prefetching.discard(index)
+
+        for index in indices:
+            with self._lock:
+                if index in self._prefetching:
+                    continue
+                self._prefetching.add(index)
+            executor.submit(_load, index)
+
+    @staticmethod
+    def _get_next_frame_inds(results: Dict[str, Any], num_frames: int) -> List[int]:
+        """Returns the frame indices of the next clip, shifted by the span of the current clip."""
+        frame_inds = np.asarray(results["frame_inds"], dtype=np.int64)
+        start = int(results.get("start_index", 0))
+        end = start + int(results.get("total_frames", num_frames - start))
+        if frame_inds.min() < start or frame_inds.max() >= end:
+            # the indices are not in the video range, bound them by the dataset size
+            start, end = 0, num_frames
+        next_frame_inds = frame_inds + int(frame_inds.max() - frame_inds.min() + 1)
+        return sorted({int(index) for index in next_frame_inds if start <= index < min(end, num_frames)})
+
     def _decode_from_list(self, results: Dict[str, Any]):
         """Generate numpy array list from list of DatasetItemEntity."""
-        imgs = []
-        for index in results["frame_inds"]:
-            imgs.append(self.otx_dataset[int(index)].media.numpy)
+        self._reset_if_forked()
+        frame_inds = [int(index) for index in results["frame_inds"]]
+        if self._num_prefetch_workers > 0 and len(frame_inds) > 1:
+            frames = list(self._get_executor().map(self._get_frame, frame_inds))
+            self._prefetch(self._get_next_frame_inds(results, len(self.otx_dataset)))
+        else:
+            frames = [self._get_frame(index) for index in frame_inds]
+        imgs = [img for img, _ in frames]
         results["imgs"] = imgs
-        results["original_shape"] = imgs[0].shape[:2]
+        results["original_shape"] = frames[0][1]
         results["img_shape"] = imgs[0].shape[:2]
 
         # we resize the gt_bboxes and proposals to their real scale
@@ -582,11 +582,22 @@ class MMActionTask(OTXActionTask):
 
             return self._hyperparams.algo_backend.mem_cache_size
 
+        def _get_mem_cache_eviction_policy():
+            return str(getattr(self._hyperparams.algo_backend, "mem_cache_eviction_policy", "lru"))
+
+        def _get_enable_disk_cache():
+            return bool(getattr(self._hyperparams.algo_backend, "enable_disk_cache", False))
+
+        def _get_disk_cache_size():
+            return int(getattr(self._hyperparams.algo_backend, "disk_cache_size", caching.DEFAULT_DISK_CACHE_SIZE))
+
         max_num_workers = _find_max_num_workers(data_cfg)
         mem_cache_size = _get_mem_cache_size()
+        eviction_policy = _get_mem_cache_eviction_policy()
 
         mode = "multiprocessing" if max_num_workers > 0 else "singleprocessing"
-        caching.MemCacheHandlerSingleton.create(mode, mem_cache_size)
+        caching.MemCacheHandlerSingleton.create(mode, mem_cache_size, eviction_policy)
+        caching.DiskCacheHandlerSingleton.create(_get_enable_disk_cache(), max_size=_get_disk_cache_size())
 
         update_or_add_custom_hook(
             self._recipe_cfg,
@@ -36,6 +36,7 @@ from otx.algorithms.action.adapters.openvino import (
     model_wrappers,
 )
 from otx.algorithms.action.configs.base import ActionConfig
+from otx.algorithms.common.utils import prefetch_items
 from otx.algorithms.common.utils.ir import check_if_quantized
 from otx.api.entities.annotation import AnnotationSceneEntity
 from otx.api.entities.datasets import DatasetEntity, DatasetItemEntity
@@ -197,14 +198,26 @@ class ActionOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOpti
     ) -> DatasetEntity:
         """Infer function of OpenVINOTask for Action Recognition."""
         update_progress_callback = default_progress_callback
+        num_prefetch_workers, max_prefetch = 0, 16
+        if inference_parameters is not None:
+            num_prefetch_workers = inference_parameters.num_prefetch_workers
+            max_prefetch = inference_parameters.max_prefetch
         clip_len = self.inferencer.model.t
         width = self.inferencer.model.w
         height = self.inferencer.model.h
         dataloader = get_ovdataloader(dataset, self.task_type, clip_len, width, height)
         dataset_size = len(dataloader)
         prog_bar = ProgressBar(len(dataloader))
-        for i, data in enumerate(dataloader):
-            prediction = self.inferencer.predict(data)
+        # the frames of the upcoming clips are decoded and preprocessed while the current clip is inferred
+        preprocess = self.inferencer.pre_process if num_prefetch_workers > 0 else lambda data: None
+        for i, (data, preprocessed) in enumerate(
+            prefetch_items(dataloader, preprocess, num_prefetch_workers, max_prefetch)
+        ):
+            if preprocessed is None:
+                prediction = self.inferencer.predict(data)
+            else:
+                inputs, metadata = preprocessed
+                prediction = self.inferencer.post_process(self.inferencer.forward(inputs), metadata)
             if isinstance(dataloader, ActionOVClsDataLoader):
                 dataloader.add_prediction(dataset, data, prediction)
             else:
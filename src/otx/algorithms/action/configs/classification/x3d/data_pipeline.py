@@ -25,7 +25,7 @@ clip_len = 8
 frame_interval = 4
 train_pipeline = [
     dict(type="SampleFrames", clip_len=clip_len, frame_interval=frame_interval, num_clips=1),
-    dict(type="RawFrameDecode"),
+    dict(type="RawFrameDecode", resize_scale=(-1, 256), num_prefetch_workers=2),
     dict(type="Resize", scale=(-1, 256)),
     dict(type="RandomResizedCrop"),
     dict(type="Resize", scale=(224, 224), keep_ratio=False),
@@ -38,7 +38,7 @@ train_pipeline = [
 
 val_pipeline = [
     dict(type="SampleFrames", clip_len=clip_len, frame_interval=frame_interval, num_clips=1, test_mode=True),
-    dict(type="RawFrameDecode"),
+    dict(type="RawFrameDecode", resize_scale=(-1, 256), num_prefetch_workers=2),
     dict(type="Resize", scale=(-1, 256)),
     dict(type="CenterCrop", crop_size=224),
     dict(type="Normalize", **img_norm_cfg),
@@ -49,7 +49,7 @@ val_pipeline = [
 # TODO Delete label in meta key in test pipeline
 test_pipeline = [
     dict(type="SampleFrames", clip_len=clip_len, frame_interval=frame_interval, num_clips=1, test_mode=True),
-    dict(type="RawFrameDecode"),
+    dict(type="RawFrameDecode", resize_scale=(-1, 256), num_prefetch_workers=2),
     dict(type="Resize", scale=(-1, 256)),
     dict(type="CenterCrop", crop_size=224),
     dict(type="Normalize", **img_norm_cfg),
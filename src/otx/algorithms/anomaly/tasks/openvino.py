@@ -19,6 +19,7 @@ import json
 import os
 import random
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 
@@ -33,9 +34,9 @@ from openvino.model_api.models import AnomalyDetection, AnomalyResult
 
 from otx.algorithms.anomaly.adapters.anomalib.config import get_anomalib_config
 from otx.algorithms.anomaly.configs.base.configuration import BaseAnomalyConfig
-from otx.algorithms.common.utils import embed_ir_model_data
+from otx.algorithms.common.utils import embed_ir_model_data, prefetch_items
 from otx.algorithms.common.utils.ir import check_if_quantized
-from otx.algorithms.common.utils.utils import read_py_config
+from otx.algorithms.common.utils.utils import get_default_async_reqs_num, read_py_config
 from otx.api.configuration.configurable_parameters import ConfigurableParameters
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.inference_parameters import (
@@ -61,6 +62,7 @@ from otx.api.usecases.evaluation.performance_provider_interface import (
     IPerformanceProvider,
 )
 from otx.api.usecases.exportable_code import demo
+from otx.api.usecases.exportable_code.inference import IInferencer
 from otx.api.usecases.tasks.interfaces.deployment_interface import IDeploymentTask
 from otx.api.usecases.tasks.interfaces.evaluate_interface import IEvaluationTask
 from otx.api.usecases.tasks.interfaces.inference_interface import IInferenceTask
@@ -127,6 +129,92 @@ class OTXNNCFAnomalyDataloader:
         return len(self.dataset)
 
 
+class OpenVINOAnomalyInferencer(IInferencer):
+    """Inferencer of the anomaly OpenVINO model with async inference.
+
+    In async inference, the raw results are copied in the infer request callbacks, then the post-processing
+    of the model and the result handler, e.g. building polygons from the anomaly map, run in a thread pool
+    so that the infer requests are not held by them.
+
+    Args:
+        model (AnomalyDetection): The modelAPI model.
+        num_workers (int, optional): The number of threads post-processing the results. Defaults to 1.
+    """
+
+    def __init__(self, model: AnomalyDetection, num_workers: int = 1):
+        self.model = model
+        self.callback_exceptions: List[Exception] = []
+        self.executor = ThreadPoolExecutor(max_workers=num_workers)
+        self.futures: List[Future] = []
+        self.model.inference_adapter.set_callback(self._async_callback)
+
+    def pre_process(self, image: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Pre-process the image to the inputs of the model and the preprocessing metadata."""
+        return self.model.preprocess(image)
+
+    def predict(self, image: np.ndarray) -> AnomalyResult:
+        """Predict the anomaly result of the image synchronously."""
+        return self.model(image)
+
+    def predict_preprocessed(self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> AnomalyResult:
+        """Predict the anomaly result of the inputs given by pre_process synchronously."""
+        return self.model.postprocess(self.model.infer_sync(inputs), metadata)
+
+    def _async_callback(self, request: Any, callback_args: tuple) -> None:
+        """Fetches the raw results of async inference and post-processes them in the thread pool."""
+        try:
+            id, preprocessing_meta, result_handler = callback_args
+            raw_prediction = self.model.inference_adapter.copy_raw_result(request)
+            self.futures.append(
+                self.executor.submit(self._post_process, raw_prediction, id, preprocessing_meta, result_handler)
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.callback_exceptions.append(e)
+
+    def _post_process(
+        self, raw_prediction: Dict[str, np.ndarray], id: int, preprocessing_meta: Dict[str, Any], result_handler: Any
+    ) -> None:
+        result_handler(id, self.model.postprocess(raw_prediction, preprocessing_meta))
+
+    def enqueue_prediction(self, image: np.ndarray, id: int, result_handler: Any) -> None:
+        """Runs async inference.
+
+        Args:
+            image (np.ndarray): The input image.
+            id (int): The id passed to the result handler.
+            result_handler (Any): The function called with the id and the AnomalyResult of the image.
+        """
+        self.enqueue_preprocessed(*self.pre_process(image), id, result_handler)
+
+    def enqueue_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any], id: int, result_handler: Any
+    ) -> None:
+        """Runs async inference of the inputs given by pre_process.
+
+        Args:
+            inputs (Dict[str, np.ndarray]): The inputs of the model.
+            metadata (Dict[str, Any]): The preprocessing metadata of the image.
+            id (int): The id passed to the result handler.
+            result_handler (Any): The function called with the id and the AnomalyResult of the image.
+        """
+        if not self.model.is_ready():
+            self.model.await_any()
+        self.model.infer_async_raw(inputs, (id, metadata, result_handler))
+
+    def await_all(self) -> None:
+        """Await all running infer requests and post-processing."""
+        self.model.await_all()
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+        if self.callback_exceptions:
+            raise self.callback_exceptions[0]
+
+    def shutdown(self) -> None:
+        """Shut down the threads post-processing the results after the queued post-processing is done."""
+        self.executor.shutdown(wait=True)
+
+
 class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeploymentTask):
     """OpenVINO inference task.
 
@@ -174,12 +262,16 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
 
         logger.info("Start OpenVINO inference.")
         update_progress_callback = default_progress_callback
+        enable_async_inference = True
+        num_prefetch_workers, max_prefetch = 0, 16
         if inference_parameters is not None:
             update_progress_callback = inference_parameters.update_progress  # type: ignore
+            enable_async_inference = inference_parameters.enable_async_inference
+            num_prefetch_workers = inference_parameters.num_prefetch_workers
+            max_prefetch = inference_parameters.max_prefetch
 
-        for idx, dataset_item in enumerate(dataset):
-            image_result: AnomalyResult = self.inference_model(dataset_item.numpy)
-
+        def add_prediction(id: int, image_result: AnomalyResult):
+            dataset_item = dataset[id]
             # TODO: inferencer should return predicted label and mask
             pred_label = image_result.pred_label
             pred_mask = image_result.pred_mask
@@ -214,8 +306,23 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
                 numpy=image_result.anomaly_map,
             )
             dataset_item.append_metadata_item(heatmap_media)
-            update_progress_callback(int((idx + 1) / len(dataset) * 100))
 
+        inferencer = OpenVINOAnomalyInferencer(self.inference_model, num_workers=get_default_async_reqs_num())
+        try:
+            # the upcoming images are decoded and preprocessed while the current one is inferred
+            preprocessed = prefetch_items(
+                dataset, lambda item: inferencer.pre_process(item.numpy), num_prefetch_workers, max_prefetch
+            )
+            for idx, (_, (inputs, metadata)) in enumerate(preprocessed):
+                if enable_async_inference:
+                    inferencer.enqueue_preprocessed(inputs, metadata, idx, add_prediction)
+                else:
+                    add_prediction(idx, inferencer.predict_preprocessed(inputs, metadata))
+                update_progress_callback(int((idx + 1) / len(dataset) * 100))
+
+            inferencer.await_all()
+        finally:
+            inferencer.shutdown()
         return dataset
 
     def get_metadata(self) -> Dict:
@@ -386,6 +493,7 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
             model = AnomalyDetection.create_model(
                 model=self.task_environment.model.get_data("openvino.xml"),
                 weights_path=self.task_environment.model.get_data("openvino.bin"),
+                max_num_requests=get_default_async_reqs_num(),
             )
         except RuntimeError as exception:
             logger.exception(exception)
@@ -394,6 +502,7 @@ class OpenVINOTask(IInferenceTask, IEvaluationTask, IOptimizationTask, IDeployme
             model = AnomalyDetection.create_model(
                 model=self.task_environment.model.get_data("openvino.xml"),
                 weights_path=self.task_environment.model.get_data("openvino.bin"),
+                max_num_requests=get_default_async_reqs_num(),
             )
 
         return model
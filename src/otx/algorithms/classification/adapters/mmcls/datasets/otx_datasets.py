@@ -21,6 +21,7 @@ from otx.algorithms.common.utils import get_cls_img_indices, get_old_new_img_ind
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.id import ID
 from otx.api.entities.label import LabelEntity
+from otx.core.data.columnar import ColumnarDataset, as_columnar_dataset
 from otx.utils.logger import get_logger
 
 logger = get_logger()
@@ -32,7 +33,12 @@ class OTXClsDataset(BaseDataset):
     """Multi-class classification dataset class."""
 
     def __init__(
-        self, otx_dataset: DatasetEntity, labels: List[LabelEntity], empty_label=None, pipeline=[], **kwargs
+        self,
+        otx_dataset: Union[DatasetEntity, ColumnarDataset],
+        labels: List[LabelEntity],
+        empty_label=None,
+        pipeline=[],
+        **kwargs,
     ):  # pylint: disable=super-init-not-called
         self.otx_dataset = otx_dataset
         self.labels = labels
@@ -53,6 +59,10 @@ class OTXClsDataset(BaseDataset):
 
         self.pipeline = Compose([build_from_cfg(p, PIPELINES) for p in pipeline])
         self.load_annotations()
+        # items are read from the columnar snapshot by the loading operations, which keeps the memory of
+        # the DataLoader workers flat. otx_dataset is only used in the main process, e.g. by the samplers.
+        self.columnar = as_columnar_dataset(otx_dataset, labels)
+        self.label_indices = self.columnar.get_label_indices(labels)
 
     def get_indices(self, *args):  # pylint: disable=unused-argument
         """Get indices."""
@@ -61,10 +71,10 @@ class OTXClsDataset(BaseDataset):
     def load_annotations(self):
         """Load annotations."""
         include_empty = self.empty_label in self.labels
-        for i, _ in enumerate(self.otx_dataset):
+        for item in self.otx_dataset:
             class_indices = []
-            item_labels = self.otx_dataset[i].get_roi_labels(self.labels, include_empty=include_empty)
-            ignored_labels = self.otx_dataset[i].ignored_labels
+            item_labels = item.get_roi_labels(self.labels, include_empty=include_empty)
+            ignored_labels = item.ignored_labels
             if item_labels:
                 for otx_lbl in item_labels:
                     if otx_lbl not in ignored_labels:
@@ -78,23 +88,23 @@ class OTXClsDataset(BaseDataset):
 
     def __getitem__(self, index: int):
         """Get item from dataset."""
-        dataset = self.otx_dataset
-        item = dataset[index]
-        ignored_labels = np.array([self.label_idx[lbs.id] for lbs in item.ignored_labels])
+        ignored_labels = self.columnar.get_ignored_label_indices(index, self.label_indices)
 
-        height, width = item.height, item.width
+        height, width = int(self.columnar.heights[index]), int(self.columnar.widths[index])
 
         gt_label = self.gt_labels[index]
         data_info = dict(
-            dataset_item=item,
+            columnar=self.columnar,
             width=width,
             height=height,
             index=index,
             gt_label=gt_label,
             ignored_labels=ignored_labels,
-            entity_id=getattr(item, "id_", None),
+            entity_id=self.columnar.get_item_id(index),
             label_id=self._get_label_id(gt_label),
         )
+        if self.columnar.needs_item(index):
+            data_info["dataset_item"] = self.columnar[index]
 
         if self.pipeline is None:
             return data_info
@@ -114,7 +124,7 @@ class OTXClsDataset(BaseDataset):
 
     def __len__(self):
         """Get dataset length."""
-        return len(self.otx_dataset)
+        return len(self.columnar)
 
     def evaluate(
         self, results, metric="accuracy", metric_options=None, logger=None
@@ -193,9 +203,9 @@ class OTXMultilabelClsDataset(OTXClsDataset):
     def load_annotations(self):
         """Load annotations."""
         include_empty = self.empty_label in self.labels
-        for i, _ in enumerate(self.otx_dataset):
-            item_labels = self.otx_dataset[i].get_roi_labels(self.labels, include_empty=include_empty)
-            ignored_labels = self.otx_dataset[i].ignored_labels
+        for item in self.otx_dataset:
+            item_labels = item.get_roi_labels(self.labels, include_empty=include_empty)
+            ignored_labels = item.ignored_labels
             onehot_indices = np.zeros(len(self.labels))
             if item_labels:
                 for otx_lbl in item_labels:
@@ -304,9 +314,9 @@ class OTXHierarchicalClsDataset(OTXMultilabelClsDataset):
     def load_annotations(self):
         """Load annotations."""
         include_empty = self.empty_label in self.labels
-        for i, _ in enumerate(self.otx_dataset):
+        for item in self.otx_dataset:
             class_indices = []
-            item_labels = self.otx_dataset[i].get_roi_labels(self.labels, include_empty=include_empty)
+            item_labels = item.get_roi_labels(self.labels, include_empty=include_empty)
             if self.label_schema:
                 # NOTE: Parent labels might be missing in annotations.
                 # This code fills the gap just in case.
@@ -314,7 +324,7 @@ class OTXHierarchicalClsDataset(OTXMultilabelClsDataset):
                 for label in item_labels:
                     full_item_labels.update(self.label_schema.get_ancestors(label))
                 item_labels = full_item_labels
-            ignored_labels = self.otx_dataset[i].ignored_labels
+            ignored_labels = item.ignored_labels
             if item_labels:
                 num_cls_heads = self.hierarchical_info["num_multiclass_heads"]
 
@@ -20,7 +20,7 @@ import os
 import tempfile
 import time
 import warnings
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from zipfile import ZipFile
 
 import nncf
@@ -38,7 +38,7 @@ from otx.algorithms.classification.utils import (
     get_cls_inferencer_configuration,
     get_hierarchical_label_list,
 )
-from otx.algorithms.common.utils import OTXOpenVinoDataLoader
+from otx.algorithms.common.utils import BatchedInferQueue, OTXOpenVinoDataLoader, prefetch_items
 from otx.algorithms.common.utils.ir import check_if_quantized
 from otx.algorithms.common.utils.utils import get_default_async_reqs_num, read_py_config
 from otx.api.entities.annotation import AnnotationSceneEntity
@@ -130,12 +130,16 @@ class ClassificationOpenVINOInferencer(IInferencer):
         self.converter = ClassificationToAnnotationConverter(self.label_schema)
         self.callback_exceptions: List[Exception] = []
         self.model.inference_adapter.set_callback(self._async_callback)
+        self.batch_queue: Optional[BatchedInferQueue] = None
 
     def _async_callback(self, request: Any, callback_args: tuple) -> None:
         """Fetches the results of async inference."""
+        self._process_raw_prediction(self.model.inference_adapter.copy_raw_result(request), callback_args)
+
+    def _process_raw_prediction(self, raw_prediction: Dict[str, np.ndarray], callback_args: tuple) -> None:
+        """Post-processes the raw prediction of an image and passes it to the result handler."""
         try:
             id, preprocessing_meta, result_handler = callback_args
-            raw_prediction = self.model.inference_adapter.copy_raw_result(request)
             processed_prediciton = self.model.postprocess(raw_prediction, preprocessing_meta)
             annotation = self.converter.convert_to_annotation(processed_prediciton, preprocessing_meta)
             aux_data = (
@@ -148,21 +152,57 @@ class ClassificationOpenVINOInferencer(IInferencer):
         except Exception as e:
             self.callback_exceptions.append(e)
 
+    def pre_process(self, image: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Pre-process function of OpenVINO Classification Inferencer."""
+        return self.model.preprocess(image)
+
     def predict(self, image: np.ndarray) -> Tuple[ClassificationResult, AnnotationSceneEntity]:
         """Predict function of OpenVINO Classification Inferencer."""
         cls_result = self.model(image)
         return cls_result, self.converter.convert_to_annotation(cls_result)
 
+    def predict_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any]
+    ) -> Tuple[ClassificationResult, AnnotationSceneEntity]:
+        """Predict function of OpenVINO Classification Inferencer for the inputs given by pre_process."""
+        cls_result = self.model.postprocess(self.model.infer_sync(inputs), metadata)
+        return cls_result, self.converter.convert_to_annotation(cls_result)
+
+    def set_max_batch_size(self, max_batch_size: int, max_wait_ms: float = 10.0) -> None:
+        """Coalesce up to max_batch_size images into one infer request in async inference.
+
+        The model is reshaped to a dynamic batch the first time max_batch_size is greater than 1.
+
+        :param max_batch_size: Maximum number of images inferred in one request, 1 disables batching.
+        :param max_wait_ms: Maximum time in milliseconds an image waits for its batch to be filled.
+        """
+        if self.batch_queue is None:
+            if max_batch_size <= 1:
+                return
+            self.batch_queue = BatchedInferQueue(self.model.inference_adapter, self._process_raw_prediction)
+        self.batch_queue.max_batch_size = max_batch_size
+        self.batch_queue.max_wait_ms = max_wait_ms
+
     def enqueue_prediction(self, image: np.ndarray, id: int, result_handler: Any) -> None:
         """Runs async inference."""
+        self.enqueue_preprocessed(*self.pre_process(image), id, result_handler)
+
+    def enqueue_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any], id: int, result_handler: Any
+    ) -> None:
+        """Runs async inference of the inputs given by pre_process."""
+        callback_data = id, metadata, result_handler
+        if self.batch_queue is not None:
+            self.batch_queue.submit(inputs, callback_data)
+            return
         if not self.model.is_ready():
             self.model.await_any()
-        image, metadata = self.model.preprocess(image)
-        callback_data = id, metadata, result_handler
-        self.model.inference_adapter.infer_async(image, callback_data)
+        self.model.inference_adapter.infer_async(inputs, callback_data)
 
     def await_all(self) -> None:
         """Await all running infer requests if any."""
+        if self.batch_queue is not None:
+            self.batch_queue.await_all()
         self.model.await_all()
 
 
@@ -208,6 +248,10 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
         process_saliency_maps = False
         explain_predicted_classes = True
         enable_async_inference = True
+        max_batch_size = 1
+        max_batch_wait_ms = 10.0
+        num_prefetch_workers = 0
+        max_prefetch = 16
 
         if inference_parameters is not None:
             update_progress_callback = inference_parameters.update_progress  # type: ignore
@@ -215,6 +259,13 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
             process_saliency_maps = inference_parameters.process_saliency_maps
             explain_predicted_classes = inference_parameters.explain_predicted_classes
             enable_async_inference = inference_parameters.enable_async_inference
+            max_batch_size = inference_parameters.max_batch_size
+            max_batch_wait_ms = inference_parameters.max_batch_wait_ms
+            num_prefetch_workers = inference_parameters.num_prefetch_workers
+            max_prefetch = inference_parameters.max_prefetch
+
+        if enable_async_inference:
+            self.inferencer.set_max_batch_size(max_batch_size, max_batch_wait_ms)
 
         def add_prediction(id: int, predicted_scene: AnnotationSceneEntity, aux_data: tuple):
             dataset_item = dataset[id]
@@ -262,12 +313,16 @@ class ClassificationOpenVINOTask(IDeploymentTask, IInferenceTask, IEvaluationTas
 
         dataset_size = len(dataset)
         total_time = 0.0
-        for i, dataset_item in enumerate(dataset, 1):
+        # the upcoming images are decoded and preprocessed while the current image is inferred
+        preprocessed = prefetch_items(
+            dataset, lambda item: self.inferencer.pre_process(item.numpy), num_prefetch_workers, max_prefetch
+        )
+        for i, (_, (inputs, metadata)) in enumerate(preprocessed, 1):
             start_time = time.perf_counter()
             if enable_async_inference:
-                self.inferencer.enqueue_prediction(dataset_item.numpy, i - 1, add_prediction)
+                self.inferencer.enqueue_preprocessed(inputs, metadata, i - 1, add_prediction)
             else:
-                cls_result, predicted_scene = self.inferencer.predict(dataset_item.numpy)
+                cls_result, predicted_scene = self.inferencer.predict_preprocessed(inputs, metadata)
                 add_prediction(i - 1, predicted_scene, (None, cls_result.saliency_map, cls_result.feature_vector))
 
             end_time = time.perf_counter() - start_time
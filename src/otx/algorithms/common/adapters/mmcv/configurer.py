@@ -443,11 +443,22 @@ class BaseConfigurer:
 
             return cfg.algo_backend.mem_cache_size
 
+        def _get_mem_cache_eviction_policy(cfg):
+            return str(getattr(cfg.algo_backend, "mem_cache_eviction_policy", "lru"))
+
+        def _get_enable_disk_cache(cfg):
+            return bool(getattr(cfg.algo_backend, "enable_disk_cache", False))
+
+        def _get_disk_cache_size(cfg):
+            return int(getattr(cfg.algo_backend, "disk_cache_size", caching.DEFAULT_DISK_CACHE_SIZE))
+
         max_num_workers = _find_max_num_workers(cfg.data)
         mem_cache_size = _get_mem_cache_size(cfg)
+        eviction_policy = _get_mem_cache_eviction_policy(cfg)
 
         mode = "multiprocessing" if max_num_workers > 0 else "singleprocessing"
-        caching.MemCacheHandlerSingleton.create(mode, mem_cache_size)
+        caching.MemCacheHandlerSingleton.create(mode, mem_cache_size, eviction_policy)
+        caching.DiskCacheHandlerSingleton.create(_get_enable_disk_cache(cfg), max_size=_get_disk_cache_size(cfg))
 
         update_or_add_custom_hook(
             cfg,
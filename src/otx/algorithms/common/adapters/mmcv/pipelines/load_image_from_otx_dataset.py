@@ -2,13 +2,19 @@
 # Copyright (C) 2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 from tempfile import TemporaryDirectory
 from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 
 from otx.algorithms.common.utils.data import get_image
-from otx.core.data.caching import MemCacheHandlerError, MemCacheHandlerSingleton
+from otx.core.data.caching import (
+    DiskCacheHandlerError,
+    DiskCacheHandlerSingleton,
+    MemCacheHandlerError,
+    MemCacheHandlerSingleton,
+)
 
 _CACHE_DIR = TemporaryDirectory(prefix="img-cache-")  # pylint: disable=consider-using-with
 
@@ -21,17 +27,20 @@ class LoadImageFromOTXDataset:
     Can do conversion to float 32 if needed.
     Expected entries in the 'results' dict that should be passed to this pipeline element are:
         results['dataset_item']: dataset_item from which to load the image
+            or results['columnar']: columnar snapshot of the dataset, from which the image is loaded by the index
         results['dataset_id']: id of the dataset to which the item belongs
         results['index']: index of the item in the dataset
 
     Args:
         to_float32 (bool, optional): True to convert images to fp32. defaults to False.
-        enable_memcache (bool, optional): True to enable in-memory cache. defaults to True.
+        enable_memcache (bool, optional): True to enable in-memory cache and its disk tier, if created.
+            defaults to True.
     """
 
     def __init__(self, to_float32: bool = False, enable_memcache: bool = True):
         self._to_float32 = to_float32
         self._enable_memcache = enable_memcache
+        self._enable_diskcache = enable_memcache
 
     @staticmethod
     def _get_unique_key(results: Dict[str, Any]) -> Tuple:
@@ -41,10 +50,48 @@ class LoadImageFromOTXDataset:
         # d_item.media.path is None, but d_item.media.data is not None
         if "cache_key" in results:
             return results["cache_key"]
-        d_item = results["dataset_item"]
-        results["cache_key"] = d_item.media.path, d_item.roi.id
+        d_item = results.get("dataset_item")
+        if d_item is not None:
+            results["cache_key"] = d_item.media.path, d_item.roi.id
+        else:
+            columnar, index = results["columnar"], results["index"]
+            results["cache_key"] = columnar.get_path(index), columnar.get_roi_id(index)
         return results["cache_key"]
 
+    def _get_cache_config(self) -> Tuple:
+        """Returns the config which affects the cached results."""
+        return (self.__class__.__name__,)
+
+    def _get_persistent_key(self, results: Dict[str, Any]) -> Optional[Tuple]:
+        """Returns a key of data item which is valid across processes and runs.
+
+        It consists of the media path, its modification time, ROI and the config affecting the cached results.
+        Return None if the data item is not from a file.
+        """
+        if "persistent_cache_key" in results:
+            return results["persistent_cache_key"]
+        d_item = results.get("dataset_item")
+        columnar = results.get("columnar")
+        if d_item is not None:
+            path = d_item.media.path
+        else:
+            path = columnar.get_path(results["index"]) if columnar is not None else None
+        if path is None or not os.path.isfile(path):
+            results["persistent_cache_key"] = None
+            return None
+        if d_item is not None:
+            roi = d_item.roi.shape
+            roi_box = (roi.x1, roi.y1, roi.x2, roi.y2) if hasattr(roi, "x1") else repr(roi)
+        else:
+            roi_box = tuple(columnar.get_roi_box(results["index"]).tolist())
+        results["persistent_cache_key"] = (
+            os.path.abspath(path),
+            os.stat(path).st_mtime_ns,
+            roi_box,
+            self._get_cache_config(),
+        )
+        return results["persistent_cache_key"]
+
     def _get_memcache_handler(self):
         """Get memcache handler."""
         try:
@@ -56,6 +103,36 @@ class LoadImageFromOTXDataset:
 
         return mem_cache_handler
 
+    def _get_diskcache_handler(self):
+        """Get disk cache handler."""
+        try:
+            disk_cache_handler = DiskCacheHandlerSingleton.get()
+        except DiskCacheHandlerError:
+            # Create a disabled handler
+            disk_cache_handler = DiskCacheHandlerSingleton.create(enable=False)
+
+        return disk_cache_handler
+
+    def _load_diskcache(self, results: Dict[str, Any]) -> Tuple[Optional[np.ndarray], Optional[Dict]]:
+        """Try to load pre-computed image and metadata from the disk cache."""
+        disk_cache_handler = self._get_diskcache_handler()
+        if not disk_cache_handler.enabled:
+            return None, None
+        key = self._get_persistent_key(results)
+        if key is None:
+            return None, None
+        return disk_cache_handler.get(key)
+
+    def _save_diskcache(self, results: Dict[str, Any], img: np.ndarray, meta: Optional[Dict] = None):
+        """Try to save pre-computed image and metadata to the disk cache."""
+        disk_cache_handler = self._get_diskcache_handler()
+        if not disk_cache_handler.enabled:
+            return
+        key = self._get_persistent_key(results)
+        if key is None:
+            return
+        disk_cache_handler.put(key, img, meta)
+
     def __call__(self, results: Dict[str, Any]):
         """Callback function of LoadImageFromOTXDataset."""
         img = None
@@ -65,11 +142,18 @@ class LoadImageFromOTXDataset:
             key = self._get_unique_key(results)
             img, meta = mem_cache_handler.get(key)
 
+        if img is None and self._enable_diskcache:
+            img, _ = self._load_diskcache(results)
+            if img is not None and self._enable_memcache:
+                mem_cache_handler.put(key, img)
+
         if img is None:
             # Get image (possibly from file cache)
             img = get_image(results, _CACHE_DIR.name, to_float32=False)
             if self._enable_memcache:
                 mem_cache_handler.put(key, img)
+            if self._enable_diskcache:
+                self._save_diskcache(results, img)
 
         if self._to_float32:
             img = img.astype(np.float32)
@@ -116,6 +200,8 @@ class LoadResizeDataFromOTXDataset(LoadImageFromOTXDataset):
         resize_cfg (Dict, optional): Optionally creates resize operation based on the config. Defaults to None.
     """
 
+    _ITEM_REF_KEYS = ("dataset_item", "columnar")
+
     def __init__(
         self,
         load_ann_cfg: Optional[Dict] = None,
@@ -135,6 +221,20 @@ class LoadResizeDataFromOTXDataset(LoadImageFromOTXDataset):
             assert isinstance(self._resize_shape, tuple), f"Random scale is not supported by {self.__class__.__name__}"
         else:
             self._resize_shape = None
+        self._cache_config = (self.__class__.__name__, repr(load_ann_cfg), repr(resize_cfg), self._downscale_only)
+        # Loaded annotations depend on the label schema and annotation scene, which are not in the persistent key.
+        # Therefore, if annotations are loaded, only the decoded image is stored in the disk cache.
+        self._enable_diskcache = self._enable_outer_memcache and self._load_ann_op is not None
+        self._enable_outer_diskcache = self._enable_outer_memcache and self._load_ann_op is None
+
+    def _get_cache_config(self) -> Tuple:
+        """Returns the config which affects the cached results."""
+        return self._cache_config
+
+    @classmethod
+    def _pop_item_refs(cls, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Pop the references to the dataset item and the columnar snapshot, which are not cached."""
+        return {key: results.pop(key) for key in cls._ITEM_REF_KEYS if key in results}
 
     def _create_load_ann_op(self, cfg: Optional[Dict]) -> Optional[Any]:
         """Creates annotation loading operation."""
@@ -177,13 +277,46 @@ class LoadResizeDataFromOTXDataset(LoadImageFromOTXDataset):
         mem_cache_handler = self._get_memcache_handler()
         img, meta = mem_cache_handler.get(key)
         if img is None or meta is None:
-            return None
-        dataset_item = results.pop("dataset_item")
+            return self._load_outer_diskcache(results)
+        item_refs = self._pop_item_refs(results)
         results = meta.copy()
         results["img"] = img
-        results["dataset_item"] = dataset_item
+        results.update(item_refs)
+        return results
+
+    def _load_outer_diskcache(self, results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Try to load pre-computed results from the disk cache and promote them to the memory cache.
+
+        The disk cache only has the results produced by this operation,
+        so that the other entries of the given results are kept as they are in the current run.
+        """
+        if not self._enable_outer_diskcache:
+            return None
+        img, meta = self._load_diskcache(results)
+        if img is None or meta is None:
+            return None
+        item_refs = self._pop_item_refs(results)
+        results.update(meta)
+
+        mem_cache_handler = self._get_memcache_handler()
+        mem_cache_handler.put(self._get_unique_key(results), img, results.copy())
+
+        results["img"] = img
+        results.update(item_refs)
         return results
 
+    def _save_outer_diskcache(self, inputs: Dict[str, Any], results: Dict[str, Any]):
+        """Try to save the results produced by this operation to the disk cache."""
+        if not self._enable_outer_diskcache:
+            return
+        excludes = ("img", *self._ITEM_REF_KEYS, "cache_key", "persistent_cache_key")
+        meta = {
+            key: value
+            for key, value in results.items()
+            if key not in excludes and (key not in inputs or inputs[key] is not value)
+        }
+        self._save_diskcache(results, results["img"], meta)
+
     def _save_cache(self, results: Dict[str, Any]):
         """Try to save pre-computed results to cache."""
         if not self._enable_outer_memcache:
@@ -202,9 +335,11 @@ class LoadResizeDataFromOTXDataset(LoadImageFromOTXDataset):
         cached_results = self._load_cache(results)
         if cached_results:
             return cached_results
+        inputs = results.copy()
         results = self._load_img(results)
         results = self._load_ann_if_any(results)
-        results.pop("dataset_item", None)  # Prevent deepcopy or caching
+        self._pop_item_refs(results)  # Prevent deepcopy or caching
         results = self._resize_img_ann_if_any(results)
         self._save_cache(results)
+        self._save_outer_diskcache(inputs, results)
         return results
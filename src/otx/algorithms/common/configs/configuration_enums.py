@@ -26,6 +26,19 @@ class StorageCacheScheme(ConfigurableEnum):
     TIFF = "TIFF"
 
 
+class MemCacheEvictionPolicy(ConfigurableEnum):
+    """This Enum represents the eviction policy of the in-memory cache.
+
+    LRU : Evict the least recently used sample first.
+    LFU : Evict the least frequently used sample first.
+    SIZE : Evict the sample with the largest decoded size first.
+    """
+
+    LRU = "lru"
+    LFU = "lfu"
+    SIZE = "size"
+
+
 class BatchSizeAdaptType(ConfigurableEnum):
     """This Enum represents the type of adapting batch size.
 
@@ -19,7 +19,13 @@ from otx.api.configuration.elements import (
 )
 from otx.api.configuration.model_lifecycle import ModelLifecycle
 
-from .configuration_enums import BatchSizeAdaptType, InputSizePreset, POTQuantizationPreset, StorageCacheScheme
+from .configuration_enums import (
+    BatchSizeAdaptType,
+    InputSizePreset,
+    MemCacheEvictionPolicy,
+    POTQuantizationPreset,
+    StorageCacheScheme,
+)
 
 # pylint: disable=invalid-name
 
@@ -332,6 +338,36 @@ class BaseConfig(ConfigurableParameters):
             affects_outcome_of=ModelLifecycle.TRAINING,
         )
 
+        mem_cache_eviction_policy = selectable(
+            default_value=MemCacheEvictionPolicy.LRU,
+            header="Eviction policy of memory pool",
+            description="Which cached samples are evicted first if the memory pool for caching is full",
+            editable=True,
+            visible_in_ui=False,
+            affects_outcome_of=ModelLifecycle.TRAINING,
+        )
+
+        enable_disk_cache = configurable_boolean(
+            default_value=False,
+            header="Enable disk cache for decoded data",
+            description="Set to True to store decoded (and resized) data in the cache directory "
+            "to reuse them across runs and HPO trials",
+            editable=True,
+            visible_in_ui=False,
+            affects_outcome_of=ModelLifecycle.TRAINING,
+        )
+
+        disk_cache_size = configurable_integer(
+            header="Size of disk cache for decoded data",
+            description="Maximum size of the disk cache for decoded data (bytes). "
+            "The least recently used samples are evicted if it is exceeded. If it is 0, the size is not limited.",
+            default_value=10 * 1024**3,
+            min_value=0,
+            max_value=maxsize,
+            visible_in_ui=False,
+            affects_outcome_of=ModelLifecycle.TRAINING,
+        )
+
         storage_cache_scheme = selectable(
             default_value=StorageCacheScheme.NONE,
             header="Scheme for storage cache",
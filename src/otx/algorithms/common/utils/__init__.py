@@ -14,12 +14,19 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+from .batching import BatchedInferQueue
 from .callback import (
     InferenceProgressCallback,
     OptimizationProgressCallback,
     TrainingProgressCallback,
 )
-from .data import OTXOpenVinoDataLoader, get_cls_img_indices, get_image, get_old_new_img_indices
+from .data import (
+    OTXOpenVinoDataLoader,
+    get_cls_img_indices,
+    get_image,
+    get_old_new_img_indices,
+    prefetch_items,
+)
 from .dist_utils import append_dist_rank_suffix
 from .ir import embed_ir_model_data
 from .utils import (
@@ -49,4 +56,6 @@ __all__ = [
     "OTXOpenVinoDataLoader",
     "read_py_config",
     "get_default_async_reqs_num",
+    "BatchedInferQueue",
+    "prefetch_items",
 ]
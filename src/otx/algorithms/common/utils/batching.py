@@ -0,0 +1,146 @@
+"""Coalescing of single-image OpenVINO infer requests into batched infer requests."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+class BatchedInferQueue:
+    """Coalesce single-image async infer requests into batched infer requests of a dynamic-batch model.
+
+    The batch dimension of the model inputs is made dynamic and the model is recompiled.
+    Submitted inputs are collected per input shape, and a batch is inferred once it has
+    `max_batch_size` items or its first item has waited `max_wait_ms`. The outputs of a batch
+    are split back into the outputs of the items, which are passed to the callback one by one
+    with the callback data of the item, as if the items had been inferred alone. Only the outputs
+    whose first dimension is dynamic after the reshape are split, the others are shared by the items.
+
+    Args:
+        inference_adapter (Any): OpenvinoAdapter of the model, its callback is replaced.
+        callback (Callable[[Dict[str, np.ndarray], Any], None]): function called with the outputs
+            and the callback data of each item.
+        max_batch_size (int): maximum number of items in a batch. Defaults to 8.
+        max_wait_ms (float): maximum time in milliseconds an item waits for its batch to be filled.
+            Defaults to 10.0.
+    """
+
+    def __init__(
+        self,
+        inference_adapter: Any,
+        callback: Callable[[Dict[str, np.ndarray], Any], None],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+    ):
+        self.inference_adapter = inference_adapter
+        self.callback = callback
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.callback_exceptions: List[Exception] = []
+        # input shapes -> (submission time of the first item, inputs, callback data)
+        self._pending: Dict[Tuple, Tuple[float, List[Dict[str, np.ndarray]], List[Any]]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._batched_outputs: Set[str] = set()
+
+        self._reshape_to_dynamic_batch()
+        self.inference_adapter.set_callback(self._batch_callback)
+
+    def _reshape_to_dynamic_batch(self) -> None:
+        """Make the batch dimension of the model inputs dynamic and recompile the model.
+
+        The outputs whose first dimension becomes dynamic are the ones which have the batch dimension.
+        """
+        new_shape = {}
+        for model_input in self.inference_adapter.model.inputs:
+            dims = list(model_input.get_partial_shape())
+            new_shape[model_input.get_any_name()] = [-1] + [
+                dim.get_length() if dim.is_static else -1 for dim in dims[1:]
+            ]
+        self.inference_adapter.reshape_model(new_shape)
+        self.inference_adapter.load_model()
+        for model_output in self.inference_adapter.model.outputs:
+            partial_shape = model_output.get_partial_shape()
+            if partial_shape.rank.is_static and partial_shape.rank.get_length() > 0 and partial_shape[0].is_dynamic:
+                self._batched_outputs.add(model_output.get_any_name())
+
+    def submit(self, inputs: Dict[str, np.ndarray], callback_data: Any) -> None:
+        """Add the preprocessed inputs of one item to its batch.
+
+        Args:
+            inputs (Dict[str, np.ndarray]): model inputs of the item with the batch dimension of size 1.
+            callback_data (Any): data passed to the callback with the outputs of the item.
+        """
+        key = tuple((name, value.shape, value.dtype.str) for name, value in sorted(inputs.items()))
+        with self._lock:
+            if key not in self._pending:
+                self._pending[key] = (time.monotonic(), [], [])
+            _, batch_inputs, batch_data = self._pending[key]
+            batch_inputs.append(inputs)
+            batch_data.append(callback_data)
+            if len(batch_inputs) >= self.max_batch_size:
+                self._infer_batch(key)
+            self._flush_expired()
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """Infer all the pending batches whatever their size."""
+        with self._lock:
+            for key in list(self._pending):
+                self._infer_batch(key)
+
+    def await_all(self) -> None:
+        """Infer the pending batches and await all running infer requests."""
+        self.flush()
+        self.inference_adapter.await_all()
+        if self.callback_exceptions:
+            raise self.callback_exceptions[0]
+
+    def _infer_batch(self, key: Tuple) -> None:
+        """Infer the pending batch of the input shapes, the lock must be held."""
+        _, batch_inputs, batch_data = self._pending.pop(key)
+        if len(batch_inputs) == 1:
+            inputs = batch_inputs[0]
+        else:
+            inputs = {name: np.concatenate([item[name] for item in batch_inputs]) for name in batch_inputs[0]}
+        self.inference_adapter.infer_async(inputs, batch_data)
+
+    def _flush_expired(self) -> None:
+        """Infer the pending batches whose first item waited for max_wait_ms, the lock must be held."""
+        deadline = time.monotonic() - self.max_wait_ms / 1000
+        for key in [key for key, (start, _, _) in self._pending.items() if start <= deadline]:
+            self._infer_batch(key)
+
+    def _schedule_flush(self) -> None:
+        """Start a timer to infer the oldest pending batch at its deadline, the lock must be held."""
+        if not self._pending or (self._timer is not None and self._timer.is_alive()):
+            return
+        oldest_start = min(start for start, _, _ in self._pending.values())
+        delay = max(oldest_start + self.max_wait_ms / 1000 - time.monotonic(), 0.0)
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._flush_expired()
+            self._schedule_flush()
+
+    def _batch_callback(self, request: Any, batch_data: List[Any]) -> None:
+        """Split the outputs of a batch and pass them to the callback item by item."""
+        try:
+            outputs = self.inference_adapter.copy_raw_result(request)
+            for i, callback_data in enumerate(batch_data):
+                item_outputs = {
+                    name: value[i : i + 1] if name in self._batched_outputs else value
+                    for name, value in outputs.items()
+                }
+                self.callback(item_outputs, callback_data)
+        except Exception as e:  # pylint: disable=broad-except
+            self.callback_exceptions.append(e)
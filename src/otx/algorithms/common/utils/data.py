@@ -7,7 +7,9 @@
 import glob
 import os
 import random
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -168,6 +170,11 @@ def get_image(results: Dict[str, Any], cache_dir: str, to_float32=False) -> np.n
                 os.remove(tmp_filename)
                 logger.warning(f"Failed to rename {tmp_filename} -> {filename} \nError msg: {e}")
 
+    if "dataset_item" not in results:
+        # the image of the item in the columnar snapshot, which is always from a file
+        img = results["columnar"].load_image(results["index"])
+        return img.astype(np.float32) if to_float32 else img
+
     subset = results["dataset_item"].subset
     media = results["dataset_item"].media
     if is_training_video_frame(subset, media):
@@ -188,6 +195,46 @@ def get_image(results: Dict[str, Any], cache_dir: str, to_float32=False) -> np.n
     return img
 
 
+def prefetch_items(
+    items: Iterable[Any], func: Callable[[Any], Any], num_workers: int = 0, max_prefetch: int = 16
+) -> Iterator[Tuple[Any, Any]]:
+    """Yield each item with func(item), computing func for the upcoming items in background threads.
+
+    It overlaps the image decoding and preprocessing of the next items, which mostly release the GIL,
+    with the inference of the current item. The results are yielded in the order of the items.
+
+    Args:
+        items (Iterable[Any]): items to process, e.g. dataset items.
+        func (Callable[[Any], Any]): function applied to each item, e.g. decoding its image.
+        num_workers (int): number of threads applying func. If 0, func is applied in the calling thread
+            when the item is consumed.
+        max_prefetch (int): maximum number of items processed ahead of the consumer.
+
+    Yields:
+        Tuple[Any, Any]: the item and func(item).
+    """
+    if num_workers <= 0:
+        for item in items:
+            yield item, func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending: Deque[Tuple[Any, Future]] = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(func, item)))
+                if len(pending) > max_prefetch:
+                    ready_item, future = pending.popleft()
+                    yield ready_item, future.result()
+            while pending:
+                ready_item, future = pending.popleft()
+                yield ready_item, future.result()
+        finally:
+            # the consumer stopped early or func raised
+            for _, future in pending:
+                future.cancel()
+
+
 class OTXOpenVinoDataLoader:
     """DataLoader implementation for ClassificationOpenVINOTask."""
 
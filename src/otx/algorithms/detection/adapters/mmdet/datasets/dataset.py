@@ -33,6 +33,7 @@ from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import Domain, LabelEntity
 from otx.api.entities.subset import Subset
 from otx.api.utils.shape_factory import ShapeFactory
+from otx.core.data.columnar import ColumnarDataset, as_columnar_dataset
 
 from .tiling import Tile
 
@@ -83,6 +84,70 @@ def get_annotation_mmdet_format(
         item_id = getattr(dataset_item, "id_", None)
         gt_ann_ids.append((item_id, annotation.id_))
 
+    return _pack_ann_info(gt_bboxes, gt_labels, gt_polygons, gt_ann_ids, height, width)
+
+
+def get_annotation_mmdet_format_from_columnar(
+    columnar: ColumnarDataset,
+    index: int,
+    labels: List[LabelEntity],
+    domain: Domain,
+    min_size: int = -1,
+) -> dict:
+    """Function to convert the annotations of an item of a columnar snapshot to mmdetection format.
+
+    It's same as `get_annotation_mmdet_format`, but the boxes, polygons and labels are read from the arrays
+    instead of the annotation objects. The items which need the DatasetItemEntity are rebuilt.
+
+    :param columnar: Columnar snapshot of the dataset
+    :param index: Index of the item in the snapshot
+    :param labels: List of labels that are used in the task
+    :return dict: annotation information dict in mmdet format
+    """
+    if columnar.needs_item(index):
+        return get_annotation_mmdet_format(columnar[index], labels, domain, min_size)
+
+    width, height = int(columnar.widths[index]), int(columnar.heights[index])
+    class_idx = columnar.get_label_indices(labels)
+    label_domains = [label.domain for label in columnar.labels]
+    item_id = columnar.get_item_id(index)
+
+    gt_bboxes = []
+    gt_labels = []
+    gt_polygons = []
+    gt_ann_ids = []
+
+    for ann_index, label_indices in columnar.get_annotations(index):
+        label_indices = label_indices[class_idx[label_indices] >= 0]
+        if len(label_indices) == 0:
+            continue
+
+        x1, y1, x2, y2 = columnar.ann_boxes[ann_index].tolist()
+        if min((x2 - x1) * width, (y2 - y1) * height) < min_size:
+            continue
+
+        class_indices = [class_idx[i] for i in label_indices.tolist() if label_domains[i] == domain]
+
+        n = len(class_indices)
+        gt_bboxes.extend([[x1 * width, y1 * height, x2 * width, y2 * height] for _ in range(n)])
+        if domain != Domain.DETECTION:
+            polygon = (columnar.get_annotation_polygon(ann_index) * [width, height]).reshape(-1)
+            gt_polygons.extend([[polygon] for _ in range(n)])
+        gt_labels.extend(class_indices)
+        gt_ann_ids.append((item_id, columnar.get_annotation_id(ann_index)))
+
+    return _pack_ann_info(gt_bboxes, gt_labels, gt_polygons, gt_ann_ids, height, width)
+
+
+def _pack_ann_info(
+    gt_bboxes: List[List[float]],
+    gt_labels: List[int],
+    gt_polygons: List[List[np.ndarray]],
+    gt_ann_ids: list,
+    height: int,
+    width: int,
+) -> dict:
+    """Pack the annotations of an item to the annotation information dict in mmdet format."""
     if len(gt_bboxes) > 0:
         ann_info = dict(
             bboxes=np.array(gt_bboxes, dtype=np.float32).reshape(-1, 4),
@@ -119,17 +184,19 @@ class OTXDetDataset(CustomDataset):
 
         Instead of using list `data_infos` as in CustomDataset, our implementation of dataset OTXDataset
         uses this proxy class with overriden __len__ and __getitem__; this proxy class
-        forwards data access operations to otx_dataset and converts the dataset items to the view
-        convenient for mmdetection.
+        forwards data access operations to a columnar snapshot of otx_dataset and converts the dataset items
+        to the view convenient for mmdetection. The loading operations read the image and the annotations
+        from the arrays of the snapshot by the index, so that otx_dataset is not accessed in the workers.
         """
 
         def __init__(self, otx_dataset, labels):
-            self.otx_dataset = otx_dataset
             self.labels = labels
             self.label_idx = {label.id: i for i, label in enumerate(labels)}
+            self.columnar = as_columnar_dataset(otx_dataset, labels)
+            self.label_indices = self.columnar.get_label_indices(labels)
 
         def __len__(self):
-            return len(self.otx_dataset)
+            return len(self.columnar)
 
         def __getitem__(self, index):
             """Prepare a dict 'data_info' that is expected by the mmdet pipeline to handle images and annotations.
@@ -138,26 +205,26 @@ class OTXDetDataset(CustomDataset):
             the objects in the image
             """
 
-            dataset = self.otx_dataset
-            item = dataset[index]
-            ignored_labels = np.array([self.label_idx[lbs.id] for lbs in item.ignored_labels])
+            ignored_labels = self.columnar.get_ignored_label_indices(index, self.label_indices)
 
-            height, width = item.height, item.width
+            height, width = int(self.columnar.heights[index]), int(self.columnar.widths[index])
 
             data_info = dict(
-                dataset_item=item,
+                columnar=self.columnar,
                 width=width,
                 height=height,
                 index=index,
                 ann_info=dict(label_list=self.labels),
                 ignored_labels=ignored_labels,
             )
+            if self.columnar.needs_item(index):
+                data_info["dataset_item"] = self.columnar[index]
 
             return data_info
 
     def __init__(
         self,
-        otx_dataset: DatasetEntity,
+        otx_dataset: Union[DatasetEntity, ColumnarDataset],
         labels: List[LabelEntity],
         pipeline: Sequence[dict],
         test_mode: bool = False,
@@ -241,9 +308,7 @@ class OTXDetDataset(CustomDataset):
         :param idx: index of the dataset item for which to get the annotations
         :return ann_info: dict that contains the coordinates of the bboxes and their corresponding labels
         """
-        dataset_item = self.otx_dataset[idx]
-        labels = self.labels
-        return get_annotation_mmdet_format(dataset_item, labels, self.domain)
+        return get_annotation_mmdet_format_from_columnar(self.data_infos.columnar, idx, self.labels, self.domain)
 
     def evaluate(  # pylint: disable=too-many-branches
         self,
@@ -379,7 +444,7 @@ class ImageTilingDataset(OTXDetDataset):
         """
         return self.tile_dataset.get_ann_info(idx)
 
-    def merge(self, results) -> Union[List[Tuple[np.ndarray, list]], List[np.ndarray]]:
+    def merge(self, results) -> Union[List[Tuple[List[np.ndarray], list]], List[List[np.ndarray]]]:
         """Merge tile-level results to image-level results.
 
         Args:
@@ -11,6 +11,7 @@ from mmdet.datasets.pipelines import Resize
 import otx.algorithms.common.adapters.mmcv.pipelines.load_image_from_otx_dataset as load_image_base
 from otx.algorithms.detection.adapters.mmdet.datasets.dataset import (
     get_annotation_mmdet_format,
+    get_annotation_mmdet_format_from_columnar,
 )
 from otx.api.entities.label import Domain
 
@@ -71,6 +72,7 @@ class LoadAnnotationFromOTXDataset:
 
     Expected entries in the 'results' dict that should be passed to this pipeline element are:
         results['dataset_item']: dataset_item from which to load the annotation
+            or results['columnar'] and results['index']: columnar snapshot and index of the item
         results['ann_info']['label_list']: list of all labels in the project
     """
 
@@ -119,9 +121,16 @@ class LoadAnnotationFromOTXDataset:
 
     def __call__(self, results: Dict[str, Any]):
         """Callback function of LoadAnnotationFromOTXDataset."""
-        dataset_item = results.pop("dataset_item")  # Prevent unnecessary deepcopy
+        # Prevent unnecessary deepcopy
+        dataset_item = results.pop("dataset_item", None)
+        columnar = results.pop("columnar", None)
         label_list = results.pop("ann_info")["label_list"]
-        ann_info = get_annotation_mmdet_format(dataset_item, label_list, self.domain, self.min_size)
+        if dataset_item is not None:
+            ann_info = get_annotation_mmdet_format(dataset_item, label_list, self.domain, self.min_size)
+        else:
+            ann_info = get_annotation_mmdet_format_from_columnar(
+                columnar, results["index"], label_list, self.domain, self.min_size
+            )
         if self.with_bbox:
             results = self._load_bboxes(results, ann_info)
             if results is None or len(results["gt_bboxes"]) == 0:
@@ -5,18 +5,22 @@
 
 import copy
 import uuid
-from itertools import product
+from concurrent.futures import ThreadPoolExecutor
 from random import sample
 from time import time
-from typing import Callable, Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import cv2
 import numpy as np
-from mmcv.ops import nms
-from mmdet.core import BitmapMasks, bbox2result
+from mmdet.core import BitmapMasks, PolygonMasks, bbox2result
 from tqdm import tqdm
 
+from otx.algorithms.common.adapters.mmcv.pipelines.load_image_from_otx_dataset import (
+    LoadImageFromOTXDataset,
+)
 from otx.api.utils.dataset_utils import non_linear_normalization
+from otx.api.utils.lru_cache import LRUCache
+from otx.api.utils.nms import batched_nms
 
 
 def timeit(func) -> Callable:
@@ -38,10 +42,26 @@ def timeit(func) -> Callable:
     return wrapper
 
 
+class DecodedImageCache(LRUCache[int, np.ndarray]):
+    """Least recently used cache of the decoded images shared by the tiles cropped from them.
+
+    Neighbouring tiles are cropped from the same image, so that the image is decoded once
+    while its tiles are loaded instead of keeping every image of the dataset in memory.
+
+    Args:
+        max_bytes (int): Maximum number of bytes of the cached images. Defaults to 256 MiB.
+    """
+
+
 # pylint: disable=too-many-instance-attributes, too-many-arguments
 class Tile:
     """Tile and merge datasets.
 
+    Tiles are stored in compact arrays of their boxes, source image indices and matched annotation indices.
+    The image-level annotations are kept without the images, which are loaded on demand by the image loading
+    operation of the dataset pipeline and shared across neighbouring tiles through a `DecodedImageCache`.
+    Only the tile region is cropped from the source image when a tile is fetched.
+
     Args:
         dataset (CustomDataset): the dataset to be tiled.
         tile_size (int): the length of side of each tile. Defaults to 400
@@ -61,9 +81,11 @@ class Tile:
             boxes of the dataset's classes will be filtered out. This option
             only works when `test_mode=False`, i.e., we never filter images
             during tests. Defaults to True.
-        nproc (int, optional): Processes used for processing masks. Default: 4.
+        nproc (int, optional): Threads merging the tile predictions of different images in parallel. Default: 2.
         sampling_ratio (float): Ratio for sampling entire tile dataset. Default: 1.0.(No sample)
         include_full_img (bool): Whether to include full-size image for inference or training. Default: False.
+        image_cache_bytes (int): Maximum number of bytes of the decoded images cached for cropping tiles.
+            Default: 256 MiB.
     """
 
     def __init__(
@@ -80,6 +102,7 @@ class Tile:
         nproc: int = 2,
         sampling_ratio: float = 1.0,
         include_full_img: bool = False,
+        image_cache_bytes: int = 256 * 1024 * 1024,
     ):
         self.min_area_ratio = min_area_ratio
         self.filter_empty_gt = filter_empty_gt
@@ -100,37 +123,75 @@ class Tile:
                 break
 
         self.dataset = dataset
-        self.tiles_all, self.cached_results = self.gen_tile_ann(include_full_img)
+        self.image_cache = DecodedImageCache(image_cache_bytes)
+        self._uuid_namespace = uuid.uuid4()
+        self.tiles_all = self.gen_tile_ann(include_full_img)
         self.sample_num = max(int(len(self.tiles_all) * sampling_ratio), 1)
+        self.tiles: Sequence[int]
         if sampling_ratio < 1.0:
             self.tiles = sample(self.tiles_all, self.sample_num)
         else:
             self.tiles = self.tiles_all
 
     @timeit
-    def gen_tile_ann(self, include_full_img) -> Tuple[List[Dict], List[Dict]]:
-        """Generate tile annotations and cache the original image-level annotations.
+    def gen_tile_ann(self, include_full_img: bool) -> range:
+        """Generate tile annotations and keep the original image-level annotations without the images.
+
+        It sets the image-level annotations to `image_metas` and the tiles to the following arrays.
+        The full-size images come first if included, followed by the tiles of each image.
+
+            - tile_boxes: tile boxes in the image coordinates, in shape (N, 4).
+            - tile_image_indices: the image index each tile belongs to, in shape (N, ).
+            - tile_full_res: whether each tile is the full-size image, in shape (N, ).
+            - tile_ann_offsets, tile_ann_indices: the annotations of the i-th tile are
+              `tile_ann_indices[tile_ann_offsets[i] : tile_ann_offsets[i + 1]]` of its image.
+
+        Args:
+            include_full_img (bool): whether to include full-size image for inference or training.
 
         Returns:
-            tiles: a list of tile annotations with some other useful information for data pipeline.
-            cache_result: a list of original image-level annotations.
-            include_full_img: whether to include full-size image for inference or training.
+            range: indices of all tiles.
         """
-        tiles = []
-        cache_result = []
-        for result in tqdm(self.dataset, desc="Loading dataset annotations..."):
-            cache_result.append(result)
-
-        pbar = tqdm(total=len(self.dataset) * 2, desc="Generating tile annotations...")
-        for idx, result in enumerate(cache_result):
+        self.image_metas: List[Dict] = []
+        full_boxes: List[np.ndarray] = []
+        full_ann_indices: List[np.ndarray] = []
+        tile_boxes: List[np.ndarray] = []
+        tile_image_indices: List[np.ndarray] = []
+        tile_ann_indices: List[np.ndarray] = []
+        for idx, result in enumerate(tqdm(self.dataset, desc="Generating tile annotations...")):
+            # Drop the image not to keep all images of the dataset in memory. It is loaded again on demand.
+            result.pop("img", None)
+            result.pop("dataset_item", None)
+            result.pop("columnar", None)
+            self.random_select_gt(result, self.max_annotation)
             if include_full_img:
-                tiles.append(self.gen_single_img(result, dataset_idx=idx))
-            pbar.update(1)
-
-        for idx, result in enumerate(cache_result):
-            tiles.extend(self.gen_tiles_single_img(result, dataset_idx=idx))
-            pbar.update(1)
-        return tiles, cache_result
+                result.setdefault("gt_bboxes", np.zeros((0, 4), dtype=np.float32))
+                result.setdefault("gt_labels", np.array([], dtype=int))
+                result.setdefault("gt_masks", [])
+            self.image_metas.append(result)
+
+            height, width = result["img_shape"][:2]
+            full_boxes.append(np.array([[0, 0, width, height]], dtype=np.int32))
+            full_ann_indices.append(np.arange(len(result.get("gt_labels", [])), dtype=np.int32))
+
+            boxes, ann_indices = self.gen_tiles_single_img(result, dataset_idx=idx)
+            tile_boxes.append(boxes)
+            tile_image_indices.append(np.full(len(boxes), idx, dtype=np.int32))
+            tile_ann_indices.extend(ann_indices)
+
+        if not include_full_img:
+            full_boxes, full_ann_indices = [], []
+        num_full = len(full_boxes)
+        ann_indices = full_ann_indices + tile_ann_indices
+        self.tile_boxes = np.concatenate([np.zeros((0, 4), dtype=np.int32), *full_boxes, *tile_boxes])
+        self.tile_image_indices = np.concatenate(
+            [np.arange(num_full, dtype=np.int32), *tile_image_indices, np.zeros(0, dtype=np.int32)]
+        )
+        self.tile_full_res = np.arange(len(self.tile_boxes)) < num_full
+        self.tile_ann_offsets = np.zeros(len(ann_indices) + 1, dtype=np.int64)
+        np.cumsum([len(indices) for indices in ann_indices], out=self.tile_ann_offsets[1:])
+        self.tile_ann_indices = np.concatenate([np.zeros(0, dtype=np.int32), *ann_indices])
+        return range(len(self.tile_boxes))
 
     def random_select_gt(self, result: Dict, num: int):
         """Randomly select ground truth masks for each image.
@@ -148,79 +209,37 @@ class Tile:
             result["gt_labels"] = result["gt_labels"][indices]
             result["gt_masks"] = result["gt_masks"][indices]
 
-    def gen_single_img(self, result: Dict, dataset_idx: int) -> Dict:
-        """Add full-size image for inference or training.
-
-        Args:
-            result (Dict): the original image-level result (i.e. the original image annotation)
-            dataset_idx (int): the image index this tile belongs to
-
-        Returns:
-            Dict: annotation with some other useful information for data pipeline.
-        """
-        self.random_select_gt(result, self.max_annotation)
-        result["full_res_image"] = True
-        result["tile_box"] = (0, 0, result["img_shape"][1], result["img_shape"][0])
-        result["dataset_idx"] = dataset_idx
-        result["original_shape_"] = result["img_shape"]
-        result["uuid"] = str(uuid.uuid4())
-        result["gt_bboxes"] = result["gt_bboxes"] if "gt_bboxes" in result else np.zeros((0, 4), dtype=np.float32)
-        result["gt_labels"] = result["gt_labels"] if "gt_labels" in result else np.array([], dtype=int)
-        result["gt_masks"] = result["gt_masks"] if "gt_masks" in result else []
-        return result
-
-    # pylint: disable=too-many-locals
-    def gen_tiles_single_img(self, result: Dict, dataset_idx: int) -> List[Dict]:
-        """Generate tile annotation for a single image.
+    def gen_tiles_single_img(self, result: Dict, dataset_idx: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Generate tile boxes and assign annotations to them for a single image.
 
         Args:
             result (Dict): the original image-level result (i.e. the original image annotation)
             dataset_idx (int): the image index this tile belongs to
 
         Returns:
-            List[Dict]: a list of tile annotation with some other useful information for data pipeline.
+            np.ndarray: tile boxes in shape (N, 4).
+            List[np.ndarray]: indices of the annotations assigned to each tile.
         """
-        tile_list = []
-        self.random_select_gt(result, self.max_annotation)
         gt_bboxes = result.get("gt_bboxes", np.zeros((0, 4), dtype=np.float32))
-        gt_masks = result.get("gt_masks", None)
-        gt_bboxes_ignore = result.get("gt_bboxes_ignore", np.zeros((0, 4), dtype=np.float32))
-        gt_labels = result.get("gt_labels", np.array([], dtype=np.int64))
-        img_shape = result.get("img_shape")
-        height, width = img_shape[:2]
-        _tile = self.prepare_result(result)
+        height, width = result["img_shape"][:2]
 
         num_patches_h = (height + self.stride - 1) // self.stride
         num_patches_w = (width + self.stride - 1) // self.stride
-        for (_, _), (loc_i, loc_j) in zip(
-            product(range(num_patches_h), range(num_patches_w)),
-            product(
-                range(0, height, self.stride),
-                range(0, width, self.stride),
-            ),
-        ):
-            x_1 = loc_j
-            x_2 = min(loc_j + self.tile_size, width)
-            y_1 = loc_i
-            y_2 = min(loc_i + self.tile_size, height)
-            tile = copy.deepcopy(_tile)
-            tile["full_res_image"] = False
-            tile["original_shape_"] = img_shape
-            tile["ori_shape"] = (y_2 - y_1, x_2 - x_1, 3)
-            tile["img_shape"] = tile["ori_shape"]
-            tile["tile_box"] = (x_1, y_1, x_2, y_2)
-            tile["dataset_idx"] = dataset_idx
-            tile["gt_bboxes_ignore"] = gt_bboxes_ignore
-            tile["uuid"] = str(uuid.uuid4())
-            self.tile_ann_assignment(tile, np.array([[x_1, y_1, x_2, y_2]]), gt_bboxes, gt_masks, gt_labels)
-            # filter empty ground truth
-            if self.filter_empty_gt and len(tile["gt_labels"]) == 0:
-                continue
-            tile_list.append(tile)
+        y_1, x_1 = np.meshgrid(np.arange(0, height, self.stride), np.arange(0, width, self.stride), indexing="ij")
+        x_1, y_1 = x_1.ravel(), y_1.ravel()
+        boxes = np.stack(
+            [x_1, y_1, np.minimum(x_1 + self.tile_size, width), np.minimum(y_1 + self.tile_size, height)], axis=1
+        ).astype(np.int32)
+
+        ann_indices = [self.tile_boxes_overlap(box[None], gt_bboxes).astype(np.int32) for box in boxes]
+        if self.filter_empty_gt:
+            keep = [i for i, indices in enumerate(ann_indices) if len(indices) > 0]
+            boxes = boxes[keep]
+            ann_indices = [ann_indices[i] for i in keep]
         if dataset_idx == 0:
             print(f"image: {height}x{width} ~ tile_size: {self.tile_size}")
-            print(f"{num_patches_h}x{num_patches_w} tiles -> {len(tile_list)} tiles after filtering")
-        return tile_list
+            print(f"{num_patches_h}x{num_patches_w} tiles -> {len(boxes)} tiles after filtering")
+        return boxes, ann_indices
 
     def prepare_result(self, result: Dict) -> Dict:
         """Prepare results dict for pipeline.
@@ -234,39 +253,81 @@ class Tile:
         result_template = dict(
             ori_filename=result["ori_filename"],
             filename=result["filename"],
-            bbox_fields=result["bbox_fields"],
-            mask_fields=result["mask_fields"],
-            seg_fields=result["seg_fields"],
-            img_fields=result["img_fields"],
+            bbox_fields=list(result["bbox_fields"]),
+            mask_fields=list(result["mask_fields"]),
+            seg_fields=list(result["seg_fields"]),
+            img_fields=list(result["img_fields"]),
         )
         return result_template
 
+    def prepare_tile(self, tile_idx: int) -> Dict:
+        """Prepare the tile annotation for data pipeline without the image.
+
+        Args:
+            tile_idx (int): index of the tile in the tile arrays.
+
+        Returns:
+            Dict: annotation with some other useful information for data pipeline.
+        """
+        dataset_idx = int(self.tile_image_indices[tile_idx])
+        tile_box = tuple(int(coord) for coord in self.tile_boxes[tile_idx])
+        image_meta = self.image_metas[dataset_idx]
+        img_shape = image_meta["img_shape"]
+
+        if self.tile_full_res[tile_idx]:
+            result = copy.deepcopy(image_meta)
+            result["full_res_image"] = True
+            result["tile_box"] = tile_box
+            result["dataset_idx"] = dataset_idx
+            result["original_shape_"] = img_shape
+            result["uuid"] = str(uuid.uuid5(self._uuid_namespace, str(tile_idx)))
+            return result
+
+        x_1, y_1, x_2, y_2 = tile_box
+        result = self.prepare_result(image_meta)
+        result["full_res_image"] = False
+        result["original_shape_"] = img_shape
+        result["ori_shape"] = (y_2 - y_1, x_2 - x_1, 3)
+        result["img_shape"] = result["ori_shape"]
+        result["tile_box"] = tile_box
+        result["dataset_idx"] = dataset_idx
+        result["gt_bboxes_ignore"] = image_meta.get("gt_bboxes_ignore", np.zeros((0, 4), dtype=np.float32)).copy()
+        result["uuid"] = str(uuid.uuid5(self._uuid_namespace, str(tile_idx)))
+        matched_indices = self.tile_ann_indices[self.tile_ann_offsets[tile_idx] : self.tile_ann_offsets[tile_idx + 1]]
+        self.tile_ann_assignment(
+            result,
+            np.array([tile_box]),
+            matched_indices,
+            image_meta.get("gt_bboxes", np.zeros((0, 4), dtype=np.float32)),
+            image_meta.get("gt_masks", None),
+            image_meta.get("gt_labels", np.array([], dtype=np.int64)),
+        )
+        return result
+
     def tile_ann_assignment(
         self,
         tile_result: Dict,
         tile_box: np.ndarray,
+        matched_indices: np.ndarray,
         gt_bboxes: np.ndarray,
-        gt_masks: BitmapMasks,
+        gt_masks: Optional[Union[BitmapMasks, PolygonMasks]],
         gt_labels: np.ndarray,
     ):
         """Assign new annotation to this tile.
 
-        Ground-truth is discarded if the overlap with this tile is lower than
-        min_area_ratio.
-
         Args:
             tile_result (Dict): the tile-level result (i.e. the tile annotation)
             tile_box (np.ndarray): the coordinate for this tile box (i.e. the tile coordinate relative to the image)
+            matched_indices (np.ndarray): indices of the annotations inside this tile
             gt_bboxes (np.ndarray): the original image-level boxes
-            gt_masks (BitmapMasks): the original image-level masks
+            gt_masks (BitmapMasks | PolygonMasks, optional): the original image-level masks
             gt_labels (np.ndarray): the original image-level labels
         """
         x_1, y_1 = tile_box[0][:2]
-        matched_indices = self.tile_boxes_overlap(tile_box, gt_bboxes)
 
         if len(matched_indices):
-            tile_lables = gt_labels[matched_indices][:]
-            tile_bboxes = gt_bboxes[matched_indices][:]
+            tile_lables = gt_labels[matched_indices]
+            tile_bboxes = gt_bboxes[matched_indices]
             tile_bboxes[:, 0] -= x_1
             tile_bboxes[:, 1] -= y_1
             tile_bboxes[:, 2] -= x_1
@@ -277,7 +338,7 @@ class Tile:
             tile_bboxes[:, 3] = np.minimum(self.tile_size, tile_bboxes[:, 3])
             tile_result["gt_bboxes"] = tile_bboxes
             tile_result["gt_labels"] = tile_lables
-            tile_result["gt_masks"] = gt_masks[matched_indices].crop(tile_box[0]) if gt_masks is not None else []
+            tile_result["gt_masks"] = gt_masks[matched_indices].crop(tile_box[0]) if gt_masks else []
         else:
             tile_result.pop("bbox_fields")
             tile_result.pop("mask_fields")
@@ -290,6 +351,35 @@ class Tile:
         if gt_masks is None:
             tile_result.pop("gt_masks")
 
+    def load_image(self, dataset_idx: int) -> np.ndarray:
+        """Load the source image of the tiles through the decoded image cache.
+
+        Only the image loading operation of the dataset pipeline is run, so that the in-memory and disk caches
+        of decoded images are used if enabled.
+
+        Args:
+            dataset_idx (int): the image index the tiles belong to.
+
+        Returns:
+            np.ndarray: the decoded image.
+        """
+        img = self.image_cache.get(dataset_idx)
+        if img is not None:
+            return img
+
+        index = self.image_metas[dataset_idx].get("index", dataset_idx)
+        load_image_op = next(
+            (op for op in self.dataset.pipeline.transforms if isinstance(op, LoadImageFromOTXDataset)), None
+        )
+        if load_image_op is not None:
+            results = copy.copy(self.dataset.data_infos[index])
+            self.dataset.pre_pipeline(results)
+            img = load_image_op(results)["img"]
+        else:
+            img = self.dataset[index]["img"]
+        self.image_cache.put(dataset_idx, img)
+        return img
+
     def tile_boxes_overlap(self, tile_box: np.ndarray, boxes: np.ndarray) -> np.ndarray:
         """Compute overlapping ratio over boxes.
 
@@ -326,51 +416,44 @@ class Tile:
         """
         if len(boxes) == 0:
             return None, []
-        max_coordinate = boxes.max()
-        offsets = idxs.astype(boxes.dtype) * (max_coordinate + 1)
-        boxes_for_nms = boxes + offsets[:, None]
-        dets, keep = nms(boxes_for_nms, scores, iou_threshold)
-        if max_num > 0:
-            dets = dets[:max_num]
-            keep = keep[:max_num]
+        keep, kept_scores = batched_nms(boxes, scores, idxs, iou_threshold, max_num=max_num)
+        dets = np.concatenate([boxes[keep], kept_scores[:, None].astype(boxes.dtype)], -1)
         return dets, keep
 
     def tile_nms(
         self,
-        bbox_results: List[np.ndarray],
-        mask_results: List[List],
-        label_results: List[np.ndarray],
+        score_bboxes: np.ndarray,
+        labels: np.ndarray,
+        masks: Optional[np.ndarray],
         iou_threshold: float,
         max_per_img: int,
-        detection: bool,
-    ):
-        """NMS after aggregation suppressing duplicate boxes in tile-overlap areas.
+    ) -> Tuple[List[np.ndarray], Optional[List[List]]]:
+        """NMS after aggregation suppressing duplicate boxes in tile-overlap areas of an image.
 
         Args:
-            bbox_results (List[List]): image-level box prediction
-            mask_results (List[np.ndarray]): image-level mask prediction
-            label_results (List[List]): image-level label prediction
+            score_bboxes (np.ndarray): image-level box prediction with scores in shape (N, 5)
+            labels (np.ndarray): image-level label prediction in shape (N, )
+            masks (np.ndarray, optional): image-level mask prediction in an object array in shape (N, ),
+                None for the detection task
             iou_threshold (float): IoU threshold to be used to suppress boxes in tiles' overlap areas.
             max_per_img (int): if there are more than max_per_img bboxes after NMS, only top max_per_img will be kept.
-            detection (bool): whether it is a detection task
-        """
-        assert len(bbox_results) == len(mask_results) == len(label_results)
-        for i, result in enumerate(zip(bbox_results, mask_results, label_results)):
-            score_bboxes, masks, labels = result
-            bboxes = score_bboxes[:, :4]
-            scores = np.ascontiguousarray(score_bboxes[:, 4])
-            _, keep_indices = self.multiclass_nms(
-                bboxes, scores, labels, iou_threshold=iou_threshold, max_num=max_per_img
-            )
-
-            bboxes = bboxes[keep_indices]
-            labels = labels[keep_indices]
-            scores = scores[keep_indices]
-            bbox_results[i] = bbox2result(np.concatenate([bboxes, scores[:, None]], -1), labels, self.num_classes)
 
-            if not detection:
-                masks = np.array([masks[keep_idx] for keep_idx in keep_indices])
-                mask_results[i] = [list(masks[labels == i]) for i in range(self.num_classes)]
+        Returns:
+            List[np.ndarray]: kept boxes with scores of each class.
+            List[List] | None: kept masks of each class, None for the detection task.
+        """
+        bboxes = score_bboxes[:, :4]
+        scores = np.ascontiguousarray(score_bboxes[:, 4])
+        _, keep_indices = self.multiclass_nms(bboxes, scores, labels, iou_threshold=iou_threshold, max_num=max_per_img)
+
+        bboxes = bboxes[keep_indices]
+        labels = labels[keep_indices]
+        scores = scores[keep_indices]
+        bbox_result = bbox2result(np.concatenate([bboxes, scores[:, None]], -1), labels, self.num_classes)
+        if masks is None:
+            return bbox_result, None
+        masks = masks[keep_indices]
+        return bbox_result, [list(masks[labels == i]) for i in range(self.num_classes)]
 
     def __len__(self):
         """Total number of tiles."""
@@ -385,19 +468,17 @@ class Tile:
         Returns:
             dict: Training/test data.
         """
-        result = copy.deepcopy(self.tiles[idx])
-        dataset_idx = result["dataset_idx"]
+        result = self.prepare_tile(self.tiles[idx])
         x_1, y_1, x_2, y_2 = result["tile_box"]
-        ori_img = self.cached_results[dataset_idx]["img"]
+        ori_img = self.load_image(result["dataset_idx"])
+        # Copy only the tile region not to modify the cached image in the pipeline
         cropped_tile = ori_img[y_1:y_2, x_1:x_2, :]
-        if self.img2fp32:
-            cropped_tile = cropped_tile.astype(np.float32)
-        result["img"] = cropped_tile
+        result["img"] = cropped_tile.astype(np.float32) if self.img2fp32 else cropped_tile.copy()
         return result
 
     # pylint: disable=too-many-locals
     @timeit
-    def merge(self, results: List[List]) -> Union[List[Tuple[np.ndarray, list]], List[np.ndarray]]:
+    def merge(self, results: List[List]) -> Union[List[Tuple[List[np.ndarray], list]], List[List[np.ndarray]]]:
         """Merge/Aggregate tile-level prediction to image-level prediction.
 
         Args:
@@ -419,54 +500,54 @@ class Tile:
         else:
             raise RuntimeError("Unknown data type")
 
-        merged_bbox_results: List[np.ndarray] = [np.empty((0, 5), dtype=dtype) for _ in range(self.num_images)]
-        merged_mask_results: List[List] = [[] for _ in range(self.num_images)]
-        merged_label_results: List[Union[List, np.ndarray]] = [np.array([]) for _ in range(self.num_images)]
-
-        for result, tile in zip(results, self.tiles):
-            tile_x1, tile_y1, _, _ = tile["tile_box"]
-            img_idx = tile["dataset_idx"]
-            img_h, img_w, _ = tile["original_shape_"]
-
-            mask_result: List[List] = [[] for _ in range(num_classes)]
-            if isinstance(result, tuple):
-                bbox_result, mask_result = result
-            else:
-                bbox_result = result
-
-            for cls_idx, cls_result in enumerate(zip(bbox_result, mask_result)):
-                cls_bbox_result, cls_mask_result = cls_result
-                _tmp_cls_bbox_result = np.zeros_like(cls_bbox_result)
-                _tmp_cls_bbox_result[:, 0] = cls_bbox_result[:, 0] + tile_x1
-                _tmp_cls_bbox_result[:, 1] = cls_bbox_result[:, 1] + tile_y1
-                _tmp_cls_bbox_result[:, 2] = cls_bbox_result[:, 2] + tile_x1
-                _tmp_cls_bbox_result[:, 3] = cls_bbox_result[:, 3] + tile_y1
-                _tmp_cls_bbox_result[:, 4] = cls_bbox_result[:, 4]
-
-                merged_bbox_results[img_idx] = np.concatenate((merged_bbox_results[img_idx], _tmp_cls_bbox_result))
-                merged_label_results[img_idx] = np.concatenate(
-                    [merged_label_results[img_idx], len(cls_bbox_result) * [cls_idx]]
-                )
-
-                for cls_mask_dict in cls_mask_result:
-                    cls_mask_dict.update(dict(tile_box=tile["tile_box"], img_size=(img_h, img_w)))
-                merged_mask_results[img_idx] += cls_mask_result
-
-        # run NMS after aggregation suppressing duplicate boxes in
-        # overlapping areas
-        self.tile_nms(
-            merged_bbox_results,
-            merged_mask_results,
-            merged_label_results,
-            iou_threshold=self.iou_threshold,
-            max_per_img=self.max_per_img,
-            detection=detection,
+        # Gather the predictions of all tiles into flat arrays at once, ordered by tile and class
+        tiles = np.asarray(self.tiles, dtype=np.int64)
+        bbox_results = [result[0] if isinstance(result, tuple) else result for result in results]
+        counts = np.array([[len(cls_result) for cls_result in bbox_result] for bbox_result in bbox_results])
+        counts = counts.reshape(len(results), num_classes)
+        score_bboxes = np.concatenate(
+            [np.empty((0, 5), dtype=dtype)] + [cls_result for bbox_result in bbox_results for cls_result in bbox_result]
         )
+        labels = np.tile(np.arange(num_classes), len(results)).repeat(counts.ravel())
+        pred_tiles = tiles.repeat(counts.sum(axis=1))
+        score_bboxes[:, :4] += self.tile_boxes[pred_tiles][:, [0, 1, 0, 1]]
+
+        masks = None
+        if not detection:
+            masks = np.empty(len(score_bboxes), dtype=object)
+            masks[:] = [cls_mask for result in results for cls_result in result[1] for cls_mask in cls_result]
+            tile_infos = [
+                dict(tile_box=tuple(tile_box), img_size=self.image_metas[img_idx]["img_shape"][:2])
+                for tile_box, img_idx in zip(self.tile_boxes.tolist(), self.tile_image_indices.tolist())
+            ]
+            for cls_mask_dict, tile_idx in zip(masks, pred_tiles.tolist()):
+                cls_mask_dict.update(tile_infos[tile_idx])
+
+        # Group the predictions by image and run NMS once per image suppressing duplicate boxes
+        # in overlapping areas. Images are processed in parallel.
+        pred_images = self.tile_image_indices[pred_tiles]
+        order = np.argsort(pred_images, kind="stable")
+        image_offsets = np.concatenate([[0], np.cumsum(np.bincount(pred_images, minlength=self.num_images))])
+
+        def _merge_single_img(img_idx: int) -> Tuple[List[np.ndarray], Optional[List[List]]]:
+            indices = order[image_offsets[img_idx] : image_offsets[img_idx + 1]]
+            return self.tile_nms(
+                score_bboxes[indices],
+                labels[indices],
+                masks[indices] if masks is not None else None,
+                iou_threshold=self.iou_threshold,
+                max_per_img=self.max_per_img,
+            )
+
+        if self.nproc > 1:
+            with ThreadPoolExecutor(max_workers=self.nproc) as executor:
+                merged_results = list(executor.map(_merge_single_img, range(self.num_images)))
+        else:
+            merged_results = [_merge_single_img(img_idx) for img_idx in range(self.num_images)]
 
-        assert len(merged_bbox_results) == len(merged_mask_results)
         if detection:
-            return list(merged_bbox_results)
-        return list(zip(merged_bbox_results, merged_mask_results))
+            return [bbox_result for bbox_result, _ in merged_results]
+        return [(bbox_result, mask_result) for bbox_result, mask_result in merged_results]
 
     def get_ann_info(self, idx):
         """Get annotation by index.
@@ -477,13 +558,14 @@ class Tile:
         Returns:
             dict: Annotation info of specified index.
         """
+        tile = self.prepare_tile(self.tiles[idx])
         ann = {}
-        if "gt_bboxes" in self.tiles[idx]:
-            ann["bboxes"] = self.tiles[idx]["gt_bboxes"]
-        if "gt_masks" in self.tiles[idx]:
-            ann["masks"] = self.tiles[idx]["gt_masks"]
-        if "gt_labels" in self.tiles[idx]:
-            ann["labels"] = self.tiles[idx]["gt_labels"]
+        if "gt_bboxes" in tile:
+            ann["bboxes"] = tile["gt_bboxes"]
+        if "gt_masks" in tile:
+            ann["masks"] = tile["gt_masks"]
+        if "gt_labels" in tile:
+            ann["labels"] = tile["gt_labels"]
         return ann
 
     def merge_vectors(self, feature_vectors: List[np.ndarray]) -> np.ndarray:
@@ -497,8 +579,8 @@ class Tile:
         """
 
         image_vectors: dict = {}
-        for vector, tile in zip(feature_vectors, self.tiles):
-            data_idx = tile.get("index", None) if "index" in tile else tile.get("dataset_idx", None)
+        for vector, tile_idx in zip(feature_vectors, self.tiles):
+            data_idx = int(self.tile_image_indices[tile_idx])
             if data_idx in image_vectors:
                 # tile vectors
                 image_vectors[data_idx].append(vector)
@@ -536,8 +618,7 @@ class Tile:
         ratios = {}
         num_classes = len(saliency_maps[0])
 
-        for orig_image in self.cached_results:
-            img_idx = orig_image["index"]
+        for img_idx, orig_image in enumerate(self.image_metas):
             image_h, image_w = orig_image["height"], orig_image["width"]
             ratios[img_idx] = np.array([feat_h / min(self.tile_size, image_h), feat_w / min(self.tile_size, image_w)])
 
@@ -545,13 +626,13 @@ class Tile:
             image_map_w = int(image_w * ratios[img_idx][1])
             merged_maps.append([np.zeros((image_map_h, image_map_w)) for _ in range(num_classes)])
 
-        for map, tile in zip(saliency_maps[self.num_images :], self.tiles[self.num_images :]):
+        for map, tile_idx in zip(saliency_maps[self.num_images :], self.tiles[self.num_images :]):
             for class_idx in range(num_classes):
                 if map[class_idx] is None:
                     continue
                 cls_map = map[class_idx]
-                img_idx = tile["dataset_idx"]
-                x_1, y_1, x_2, y_2 = tile["tile_box"]
+                img_idx = int(self.tile_image_indices[tile_idx])
+                x_1, y_1, x_2, y_2 = self.tile_boxes[tile_idx]
                 y_1, x_1 = ((y_1, x_1) * ratios[img_idx]).astype(np.uint16)
                 y_2, x_2 = ((y_2, x_2) * ratios[img_idx]).astype(np.uint16)
 
@@ -23,7 +23,7 @@ from openvino.model_api.adapters import OpenvinoAdapter, create_core
 from openvino.model_api.models import ImageModel, Model
 from openvino.model_api.tilers import DetectionTiler, InstanceSegmentationTiler
 
-from otx.algorithms.common.utils import OTXOpenVinoDataLoader
+from otx.algorithms.common.utils import OTXOpenVinoDataLoader, prefetch_items
 from otx.algorithms.common.utils.ir import check_if_quantized
 from otx.algorithms.common.utils.utils import get_default_async_reqs_num
 from otx.algorithms.detection.adapters.openvino import model_wrappers
@@ -111,8 +111,11 @@ class BaseInferencerWithConverter(IInferencer):
 
     def predict(self, image: np.ndarray):
         """Predict function of OpenVINO Detection Inferencer."""
-        image, metadata = self.pre_process(image)
-        raw_predictions = self.forward(image)
+        return self.predict_preprocessed(*self.pre_process(image))
+
+    def predict_preprocessed(self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any]):
+        """Predict function of OpenVINO Detection Inferencer for the inputs given by pre_process."""
+        raw_predictions = self.forward(inputs)
         detections = self.model.postprocess(raw_predictions, metadata)
         predictions = self.converter.convert_to_annotation(detections, metadata)
         if "feature_vector" not in raw_predictions or "saliency_map" not in raw_predictions:
@@ -159,15 +162,20 @@ class BaseInferencerWithConverter(IInferencer):
 
     def enqueue_prediction(self, image: np.ndarray, id: int, result_handler: Any) -> None:
         """Runs async inference."""
+        self.enqueue_preprocessed(*self.pre_process(image), id, result_handler)
+
+    def enqueue_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any], id: int, result_handler: Any
+    ) -> None:
+        """Runs async inference of the inputs given by pre_process."""
         if not self.is_callback_set:
             self.model.inference_adapter.set_callback(self._async_callback)
             self.is_callback_set = True
 
         if not self.model.is_ready():
             self.model.await_any()
-        image, metadata = self.pre_process(image)
         callback_data = id, metadata, result_handler
-        self.model.inference_adapter.infer_async(image, callback_data)
+        self.model.inference_adapter.infer_async(inputs, callback_data)
 
     def await_all(self) -> None:
         """Await all running infer requests if any."""
@@ -344,6 +352,25 @@ class OpenVINOTileClassifierWrapper(BaseInferencerWithConverter):
             self.tiler = DetectionTiler(inferencer.model, tiler_config, execution_mode=mode)
 
         super().__init__(inferencer.configuration, inferencer.model, inferencer.converter)
+        self.is_tile_classifier_callback_set = False
+        # image id -> tiles, tile results and result handler of the images whose tiles are in flight
+        self.pending_images: Dict[int, Dict[str, Any]] = {}
+
+    def pre_process(self, image: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Keep the image as it is, since the tiles are cropped and preprocessed by the tiler."""
+        return {"image": image}, {"original_shape": image.shape}
+
+    def predict_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any]
+    ) -> Tuple[AnnotationSceneEntity, Tuple[np.ndarray, np.ndarray]]:
+        """Run prediction of the image given by pre_process by tiling it."""
+        return self.predict(inputs["image"])
+
+    def enqueue_preprocessed(
+        self, inputs: Dict[str, np.ndarray], metadata: Dict[str, Any], id: int, result_handler: Any
+    ) -> None:
+        """Runs async inference of the tiles of the image given by pre_process."""
+        self.enqueue_prediction(inputs["image"], id, result_handler)
 
     def predict(self, image: np.ndarray) -> Tuple[AnnotationSceneEntity, Tuple[np.ndarray, np.ndarray]]:
         """Run prediction by tiling image to small patches.
@@ -356,14 +383,109 @@ class OpenVINOTileClassifierWrapper(BaseInferencerWithConverter):
             features: list including feature vector and saliency map
         """
         detections = self.tiler(image)
-        annotations = self.converter.convert_to_annotation(detections, metadata={"original_shape": image.shape})
+        return self._convert_tiler_result(detections, image.shape)
+
+    def _convert_tiler_result(
+        self, detections: Any, shape: Tuple[int, ...]
+    ) -> Tuple[AnnotationSceneEntity, Tuple[np.ndarray, np.ndarray]]:
+        """Convert the merged tiler prediction to the annotations and features."""
+        annotations = self.converter.convert_to_annotation(detections, metadata={"original_shape": shape})
         features = (
             detections.feature_vector.reshape(-1),
             self.get_saliency_map(detections),
         )
-
         return annotations, features
 
+    def _tile_classifier_callback(self, request: Any, callback_args: tuple) -> None:
+        """Fetches the objectness score of a tile."""
+        try:
+            tile_probs, tile_idx = callback_args
+            tile_probs[tile_idx] = request.get_tensor("tile_prob").data.reshape(-1)[0]
+        except Exception as e:  # pylint: disable=broad-except
+            self.callback_exceptions.append(e)
+
+    def filter_tiles(
+        self, image: np.ndarray, tile_coords: List[List[int]], confidence_threshold: float = 0.35
+    ) -> List[List[int]]:
+        """Filter tiles by the objectness score of the tile classifier.
+
+        The tiles are classified over the async infer requests of the tile classifier
+        instead of one synchronous call per tile. The full image tile is always kept.
+
+        Args:
+            image (np.ndarray): full size image
+            tile_coords (List[List[int]]): tile coordinates, the first one is the full image
+            confidence_threshold (float, optional): objectness score to keep a tile. Defaults to 0.35.
+
+        Returns:
+            List[List[int]]: tile coordinates to keep
+        """
+        classifier = getattr(self.tiler, "tile_classifier_model", None)
+        if classifier is None or len(tile_coords) <= 1:
+            return tile_coords
+
+        if not self.is_tile_classifier_callback_set:
+            classifier.inference_adapter.set_callback(self._tile_classifier_callback)
+            self.is_tile_classifier_callback_set = True
+
+        tile_probs = np.zeros(len(tile_coords), dtype=np.float32)
+        for tile_idx in range(1, len(tile_coords)):
+            tile_dict, _ = self.model.preprocess(self.tiler._crop_tile(image, tile_coords[tile_idx]))
+            classifier.infer_async_raw(tile_dict, (tile_probs, tile_idx))
+        classifier.await_all()
+        if self.callback_exceptions:
+            raise self.callback_exceptions[0]
+
+        return [coord for i, coord in enumerate(tile_coords) if i == 0 or tile_probs[i] > confidence_threshold]
+
+    def enqueue_prediction(self, image: np.ndarray, id: int, result_handler: Any) -> None:
+        """Runs async inference of the tiles of an image.
+
+        The tiles are submitted to the tiler's async pipeline along with the tiles of the images
+        enqueued before, so that all the infer requests are kept busy. The predictions of an image
+        are merged and passed to the result handler once its last tile is completed.
+
+        Args:
+            image (np.ndarray): input image
+            id (int): id of the image passed to the result handler
+            result_handler (Any): callable taking the id, annotations and features of the image
+        """
+        tile_coords = self.filter_tiles(image, self.tiler._tile(image))
+        self.pending_images[id] = {
+            "shape": image.shape,
+            "tile_coords": tile_coords,
+            "tile_results": [None] * len(tile_coords),
+            "num_remaining": len(tile_coords),
+            "result_handler": result_handler,
+        }
+        async_pipeline = self.tiler.async_pipeline
+        for tile_idx, coord in enumerate(tile_coords):
+            if not async_pipeline.is_ready():
+                async_pipeline.await_any()
+            async_pipeline.submit_data(self.tiler._crop_tile(image, coord), (id, tile_idx))
+            self._process_completed_tiles()
+
+    def _process_completed_tiles(self) -> None:
+        """Post-process the completed tiles and merge the images whose tiles are all completed."""
+        async_pipeline = self.tiler.async_pipeline
+        for tile_id in list(async_pipeline.completed_results):
+            image_id, tile_idx = tile_id
+            pending = self.pending_images[image_id]
+            tile_prediction, _ = async_pipeline.get_result(tile_id)
+            pending["tile_results"][tile_idx] = self.tiler._postprocess_tile(
+                tile_prediction, pending["tile_coords"][tile_idx]
+            )
+            pending["num_remaining"] -= 1
+            if pending["num_remaining"] == 0:
+                del self.pending_images[image_id]
+                detections = self.tiler._merge_results(pending["tile_results"], pending["shape"])
+                pending["result_handler"](image_id, *self._convert_tiler_result(detections, pending["shape"]))
+
+    def await_all(self) -> None:
+        """Await all running infer requests and merge the remaining images."""
+        self.tiler.async_pipeline.await_all()
+        self._process_completed_tiles()
+
 
 class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IOptimizationTask):
     """Task implementation for OTXDetection using OpenVINO backend."""
@@ -469,6 +591,7 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
                 self.config.tiling_parameters.tile_ir_scale_factor,
                 tile_classifier_model_file,
                 tile_classifier_weight_file,
+                num_requests=async_requests_num,
             )
         if not isinstance(
             inferencer,
@@ -496,15 +619,16 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
             process_saliency_maps = inference_parameters.process_saliency_maps
             explain_predicted_classes = inference_parameters.explain_predicted_classes
             enable_async_inference = inference_parameters.enable_async_inference
+            num_prefetch_workers = inference_parameters.num_prefetch_workers
+            max_prefetch = inference_parameters.max_prefetch
         else:
             update_progress_callback = default_progress_callback
             add_saliency_map = True
             process_saliency_maps = False
             explain_predicted_classes = True
             enable_async_inference = True
-
-        if self.config.tiling_parameters.enable_tiling:
-            enable_async_inference = False
+            num_prefetch_workers = 0
+            max_prefetch = 16
 
         def add_prediction(id: int, predicted_scene: AnnotationSceneEntity, aux_data: tuple):
             dataset_item = dataset[id]
@@ -536,13 +660,17 @@ class OpenVINODetectionTask(IDeploymentTask, IInferenceTask, IEvaluationTask, IO
 
         total_time = 0.0
         dataset_size = len(dataset)
-        for i, dataset_item in enumerate(dataset, 1):
+        # the upcoming images are decoded and preprocessed while the current image is inferred
+        preprocessed = prefetch_items(
+            dataset, lambda item: self.inferencer.pre_process(item.numpy), num_prefetch_workers, max_prefetch
+        )
+        for i, (_, (inputs, metadata)) in enumerate(preprocessed, 1):
             start_time = time.perf_counter()
 
             if enable_async_inference:
-                self.inferencer.enqueue_prediction(dataset_item.numpy, i - 1, add_prediction)
+                self.inferencer.enqueue_preprocessed(inputs, metadata, i - 1, add_prediction)
             else:
-                predicted_scene, features = self.inferencer.predict(dataset_item.numpy)
+                predicted_scene, features = self.inferencer.predict_preprocessed(inputs, metadata)
                 add_prediction(i - 1, predicted_scene, features)
 
             update_progress_callback(int(i / dataset_size * 100), None)
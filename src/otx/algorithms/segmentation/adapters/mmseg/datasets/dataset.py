@@ -15,7 +15,7 @@
 # and limitations under the License.
 
 from abc import ABCMeta
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import numpy as np
 from mmseg.datasets.builder import DATASETS
@@ -26,7 +26,15 @@ from otx.algorithms.common.utils.data import get_old_new_img_indices
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.label import LabelEntity
-from otx.api.utils.segmentation_utils import mask_from_dataset_item
+from otx.api.utils.segmentation_utils import (
+    MASK_CACHE,
+    decode_mask_rle,
+    encode_mask_rle,
+    mask_from_dataset_item,
+    mask_from_file_path,
+    mask_from_polygons,
+)
+from otx.core.data.columnar import ColumnarDataset, as_columnar_dataset
 
 
 # pylint: disable=invalid-name, too-many-locals, too-many-instance-attributes, super-init-not-called
@@ -52,6 +60,61 @@ def get_annotation_mmseg_format(
     return ann_info
 
 
+def get_annotation_mmseg_format_from_columnar(
+    columnar: ColumnarDataset,
+    index: int,
+    labels: List[LabelEntity],
+    use_otx_adapter: bool = True,
+) -> dict:
+    """Function to convert the annotations of an item of a columnar snapshot to mmsegmentation format.
+
+    It's same as `get_annotation_mmseg_format`, but the polygons and labels are read from the arrays
+    instead of the annotation objects. The items which need the DatasetItemEntity are rebuilt.
+
+    :param columnar: Columnar snapshot of the dataset
+    :param index: Index of the item in the snapshot
+    :param labels: List of labels in the project
+    :return dict: annotation information dict in mmseg format
+    """
+    gt_seg_map = mask_from_columnar(columnar, index, labels, use_otx_adapter)
+
+    gt_seg_map = gt_seg_map.squeeze(2).astype(np.uint8)
+    ann_info = dict(gt_semantic_seg=gt_seg_map)
+
+    return ann_info
+
+
+def mask_from_columnar(
+    columnar: ColumnarDataset, index: int, labels: List[LabelEntity], use_otx_adapter: bool = True
+) -> np.ndarray:
+    """Creates a mask of an item of a columnar snapshot, same as `mask_from_dataset_item`.
+
+    The masks rasterized from the annotations are cached in MASK_CACHE.
+    """
+    if columnar.needs_item(index):
+        return mask_from_dataset_item(columnar[index], labels, use_otx_adapter)
+    if not use_otx_adapter:
+        return mask_from_file_path(columnar.get_path(index))
+
+    width, height = int(columnar.widths[index]), int(columnar.heights[index])
+    # the snapshot is read-only, so that the item is identified by the snapshot and the index
+    key = (columnar.uid, index, tuple(label.id_ for label in labels), width, height)
+    mask = MASK_CACHE.get(key)
+    if mask is None:
+        class_idx = columnar.get_label_indices(labels)
+        polygons, class_indices = [], []
+        for ann_index, label_indices in columnar.get_annotations(index):
+            known_label_indices = label_indices[class_idx[label_indices] >= 0]
+            if len(known_label_indices) == 0:
+                # Skip unknown shapes
+                continue
+            polygons.append(columnar.get_annotation_polygon(ann_index))
+            class_indices.append(int(class_idx[known_label_indices[0]]) + 1)
+        mask = encode_mask_rle(mask_from_polygons(polygons, class_indices, width, height))
+        MASK_CACHE.put(key, mask)
+    return decode_mask_rle(mask)
+
+
 @DATASETS.register_module()
 class _OTXSegDataset(CustomDataset, metaclass=ABCMeta):
     """Wrapper that allows using a OTX dataset to train mmsegmentation models.
@@ -71,8 +134,9 @@ class _OTXSegDataset(CustomDataset, metaclass=ABCMeta):
 
         Instead of using list `data_infos` as in CustomDataset, our implementation of dataset OTXDataset
         uses this proxy class with overriden __len__ and __getitem__; this proxy class
-        forwards data access operations to otx_dataset and converts the dataset items to the view
-        convenient for mmsegmentation.
+        forwards data access operations to a columnar snapshot of otx_dataset and converts the dataset items
+        to the view convenient for mmsegmentation. The loading operations read the image and the annotations
+        from the arrays of the snapshot by the index, so that otx_dataset is not accessed in the workers.
         """
 
         def __init__(
@@ -81,12 +145,13 @@ class _OTXSegDataset(CustomDataset, metaclass=ABCMeta):
             labels=None,
             **kwargs,  # pylint: disable=unused-argument
         ):
-            self.otx_dataset = otx_dataset
             self.labels = labels
             self.label_idx = {label.id: i for i, label in enumerate(labels)}
+            self.columnar = as_columnar_dataset(otx_dataset, labels)
+            self.label_indices = self.columnar.get_label_indices(labels)
 
         def __len__(self):
-            return len(self.otx_dataset)
+            return len(self.columnar)
 
         def __getitem__(self, index):
             """Prepare a dict 'data_info' that is expected by the mmseg pipeline to handle images and annotations.
@@ -94,24 +159,24 @@ class _OTXSegDataset(CustomDataset, metaclass=ABCMeta):
             :return data_info: dictionary that contains the image and image metadata, as well as the labels of
             the objects in the image
             """
-            dataset = self.otx_dataset
-            item = dataset[index]
-            ignored_labels = np.array([self.label_idx[lbs.id] + 1 for lbs in item.ignored_labels])
+            ignored_labels = self.columnar.get_ignored_label_indices(index, self.label_indices) + 1
 
             data_info = dict(
-                dataset_item=item,
-                width=item.width,
-                height=item.height,
+                columnar=self.columnar,
+                width=int(self.columnar.widths[index]),
+                height=int(self.columnar.heights[index]),
                 index=index,
                 ann_info=dict(labels=self.labels),
                 ignored_labels=ignored_labels,
             )
+            if self.columnar.needs_item(index):
+                data_info["dataset_item"] = self.columnar[index]
 
             return data_info
 
     def __init__(
         self,
-        otx_dataset: DatasetEntity,
+        otx_dataset: Union[DatasetEntity, ColumnarDataset],
         pipeline: Sequence[dict],
         classes: Optional[List[str]] = None,
         test_mode: bool = False,
@@ -210,8 +275,9 @@ class _OTXSegDataset(CustomDataset, metaclass=ABCMeta):
         :return ann_info: dict that contains the coordinates of the bboxes and their corresponding labels
         """
 
-        dataset_item = self.otx_dataset[idx]
-        ann_info = get_annotation_mmseg_format(dataset_item, self.project_labels, self.use_otx_adapter)
+        ann_info = get_annotation_mmseg_format_from_columnar(
+            self.data_infos.columnar, idx, self.project_labels, self.use_otx_adapter
+        )
 
         return ann_info
 
@@ -10,6 +10,7 @@ from mmseg.datasets.builder import PIPELINES, build_from_cfg
 import otx.algorithms.common.adapters.mmcv.pipelines.load_image_from_otx_dataset as load_image_base
 from otx.algorithms.segmentation.adapters.mmseg.datasets.dataset import (
     get_annotation_mmseg_format,
+    get_annotation_mmseg_format_from_columnar,
 )
 
 
@@ -78,6 +79,7 @@ class LoadAnnotationFromOTXDataset:
 
     Expected entries in the 'results' dict that should be passed to this pipeline element are:
         results['dataset_item']: dataset_item from which to load the annotation
+            or results['columnar'] and results['index']: columnar snapshot and index of the item
         results['ann_info']['label_list']: list of all labels in the project
 
     """
@@ -87,10 +89,17 @@ class LoadAnnotationFromOTXDataset:
 
     def __call__(self, results: Dict[str, Any]):
         """Callback function of LoadAnnotationFromOTXDataset."""
-        dataset_item = results.pop("dataset_item")  # Prevent unnessary deepcopy
+        # Prevent unnessary deepcopy
+        dataset_item = results.pop("dataset_item", None)
+        columnar = results.pop("columnar", None)
         labels = results["ann_info"]["labels"]
 
-        ann_info = get_annotation_mmseg_format(dataset_item, labels, self.use_otx_adapter)
+        if dataset_item is not None:
+            ann_info = get_annotation_mmseg_format(dataset_item, labels, self.use_otx_adapter)
+        else:
+            ann_info = get_annotation_mmseg_format_from_columnar(
+                columnar, results["index"], labels, self.use_otx_adapter
+            )
 
         results["gt_semantic_seg"] = ann_info["gt_semantic_seg"]
         results["seg_fields"].append("gt_semantic_seg")
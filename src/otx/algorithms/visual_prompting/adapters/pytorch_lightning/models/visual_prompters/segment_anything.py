@@ -12,6 +12,7 @@ import re
 from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 from omegaconf import DictConfig
 from pytorch_lightning import LightningModule
@@ -27,6 +28,7 @@ from otx.algorithms.visual_prompting.adapters.pytorch_lightning.models.encoders
     SAMImageEncoder,
     SAMPromptEncoder,
 )
+from otx.algorithms.visual_prompting.utils.embedding_cache import ImageEmbeddingCache
 
 CKPT_PATHS = {
     "tiny_vit": "https://github.com/ChaoningZhang/MobileSAM/raw/master/weights/mobile_sam.pt",
@@ -54,6 +56,9 @@ class SegmentAnything(LightningModule):
         self.set_metrics()
         self.load_checkpoint(state_dict=state_dict)
 
+        self.embedding_cache: Optional[ImageEmbeddingCache] = ImageEmbeddingCache()
+        self._encoder_id: Optional[str] = None
+
     def set_models(self) -> None:
         """Set models for SAM."""
         # TODO (sungchul): Currently, backbone is assumed as vit.
@@ -175,6 +180,11 @@ class SegmentAnything(LightningModule):
                 state_dict = replace_state_dict_keys(state_dict, revise_keys)
                 self.load_state_dict(state_dict, strict=False)
 
+    def load_state_dict(self, *args, **kwargs):
+        """Load the state dict, the identity of the image encoder is computed again from the loaded weights."""
+        self._encoder_id = None
+        return super().load_state_dict(*args, **kwargs)
+
     ##########################################################
     #     forward for inference (export/deploy/optimize)     #
     ##########################################################
@@ -364,6 +374,55 @@ class SegmentAnything(LightningModule):
         masks = F.interpolate(masks, size=(h, w), mode="bilinear", align_corners=False)
         return masks
 
+    @property
+    def encoder_id(self) -> str:
+        """Identity of the image encoder in the keys of the embedding cache, computed once from its weights."""
+        if self._encoder_id is None:
+            self._encoder_id = ImageEmbeddingCache.get_encoder_id(
+                self.config.model.backbone,
+                self.config.model.image_size,
+                *(value.detach().cpu().float().numpy() for value in self.image_encoder.state_dict().values()),
+            )
+        return self._encoder_id
+
+    def forward_image_encoder(self, images: Tensor) -> Tensor:
+        """Forward the image encoder, reusing the cached embeddings of the images encoded before.
+
+        The embedding cache is only used with a frozen image encoder, whose embeddings of an image do not change.
+        It is meant for prediction, where the same images are encoded again, and is not used while training.
+
+        Args:
+            images (Tensor): Images with shape (B, C, H, W).
+
+        Returns:
+            image_embeddings (Tensor): Image embeddings with shape (B, C', H', W').
+        """
+        if self.embedding_cache is None or any(param.requires_grad for param in self.image_encoder.parameters()):
+            return self.image_encoder(images)
+
+        encoder_id = f"{self.encoder_id}:{torch.is_autocast_enabled()}"
+        keys = [self.embedding_cache.get_key({"images": image.detach().cpu().numpy()}, encoder_id) for image in images]
+        cached = [self.embedding_cache.get(key) for key in keys]
+        missing = [i for i, embeddings in enumerate(cached) if embeddings is None]
+        if not missing:
+            return torch.stack(
+                [torch.from_numpy(np.array(embeddings["image_embeddings"])) for embeddings in cached]  # type: ignore
+            ).to(images.device)
+
+        new_embeddings = self.image_encoder(images if len(missing) == len(images) else images[missing])
+        for i, embedding in zip(missing, new_embeddings):
+            if embedding.dtype != torch.bfloat16:
+                self.embedding_cache.put(keys[i], {"image_embeddings": embedding.detach().cpu().numpy()})
+        if len(missing) == len(images):
+            return new_embeddings
+
+        image_embeddings = new_embeddings.new_empty((len(images), *new_embeddings.shape[1:]))
+        image_embeddings[missing] = new_embeddings
+        for i, embeddings in enumerate(cached):
+            if embeddings is not None:
+                image_embeddings[i] = torch.from_numpy(np.array(embeddings["image_embeddings"]))
+        return image_embeddings
+
     ######################################################
     #     forward for training/validation/prediction     #
     ######################################################
@@ -373,6 +432,7 @@ class SegmentAnything(LightningModule):
         bboxes: List[Tensor],
         points: Optional[Tuple[Tensor, Tensor]] = None,
         masks: Optional[Tensor] = None,
+        use_embedding_cache: bool = False,
     ) -> Tuple[List[Tensor], List[Tensor]]:
         """Forward method for SAM training/validation/prediction.
 
@@ -387,12 +447,15 @@ class SegmentAnything(LightningModule):
                 coming from a previous prediction iteration. Has form Bx1xHxW, where
                 for SAM, H=W=256. Masks returned by a previous iteration of the
                 predict method do not need further transformation.
+            use_embedding_cache (bool, optional): Whether to reuse the cached embeddings of the images encoded before.
+                Training and validation images are mostly augmented or too many to be cached,
+                so it is only used for prediction. Defaults to False.
 
         Returns:
             pred_masks (List[Tensor]): List with predicted masks with shape (B, 1, H, W).
             ious (List[Tensor]): List with IoU predictions with shape (N, 1).
         """
-        image_embeddings = self.image_encoder(images)
+        image_embeddings = self.forward_image_encoder(images) if use_embedding_cache else self.image_encoder(images)
         pred_masks = []
         ious = []
         for embedding, bbox in zip(image_embeddings, bboxes):
@@ -528,7 +591,7 @@ class SegmentAnything(LightningModule):
         bboxes = batch["bboxes"]
         points = batch["points"]
 
-        pred_masks, iou_predictions = self.forward_train(images, bboxes, points)
+        pred_masks, iou_predictions = self.forward_train(images, bboxes, points, use_embedding_cache=True)
 
         masks: List[Tensor] = []
         for i, pred_mask in enumerate(pred_masks):
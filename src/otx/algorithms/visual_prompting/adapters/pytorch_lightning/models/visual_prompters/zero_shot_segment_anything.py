@@ -276,7 +276,7 @@ class ZeroShotSegmentAnything(SegmentAnything):
 
         self.prompt_getter.initialize()
 
-        image_embeddings = self.image_encoder(images)
+        image_embeddings = self.forward_image_encoder(images)
         ref_feat = image_embeddings.squeeze().permute(1, 2, 0)
 
         for label, input_prompts in processed_prompts.items():
@@ -360,7 +360,7 @@ class ZeroShotSegmentAnything(SegmentAnything):
             if image.ndim == 3:
                 image = image.unsqueeze(0)
 
-            image_embeddings = self.image_encoder(images)
+            image_embeddings = self.forward_image_encoder(images)
 
             total_points_scores, total_bg_coords = self.prompt_getter(
                 image_embeddings=image_embeddings, original_size=original_size
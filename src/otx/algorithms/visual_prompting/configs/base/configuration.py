@@ -132,6 +132,18 @@ class VisualPromptingBaseConfig(BaseConfig):
             affects_outcome_of=ModelLifecycle.INFERENCE,
         )
 
+        decoder_batch_size = configurable_integer(
+            default_value=1,
+            header="Batch size of the decoder",
+            description=(
+                "The maximum number of point prompts decoded in one inference request by zero-shot visual prompting "
+                "with OpenVINO. If it is greater than 1, the decoder is reshaped to a dynamic batch."
+            ),
+            min_value=1,
+            max_value=1024,
+            affects_outcome_of=ModelLifecycle.INFERENCE,
+        )
+
     @attrs
     class __POTParameter(BaseConfig.BasePOTParameter):
         header = string_attribute("POT Parameters")
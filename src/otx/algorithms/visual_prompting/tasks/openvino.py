@@ -43,6 +43,7 @@ from otx.algorithms.visual_prompting.adapters.pytorch_lightning.datasets.dataset
     get_transform,
 )
 from otx.algorithms.visual_prompting.configs.base import VisualPromptingBaseConfig
+from otx.algorithms.visual_prompting.utils import ImageEmbeddingCache
 from otx.api.entities.annotation import Annotation
 from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.datasets import DatasetEntity
@@ -97,6 +98,8 @@ class OpenVINOVisualPromptingInferencer(IInferencer):
         device (str): Device to run inference on, such as CPU, GPU or MYRIAD. Defaults to "CPU".
         num_requests (int) : Maximum number of requests that the inferencer can make.
             Good value is the number of available cores. Defaults to 1.
+        embedding_cache (Optional[ImageEmbeddingCache]): Cache of the image embeddings reused when the same
+            image is prompted again. Defaults to None, an in-memory cache is created.
     """
 
     def __init__(
@@ -107,6 +110,7 @@ class OpenVINOVisualPromptingInferencer(IInferencer):
         weight_files: Optional[Dict[str, Union[str, Path, bytes, None]]] = {},
         device: str = "CPU",
         num_requests: int = 1,
+        embedding_cache: Optional[ImageEmbeddingCache] = None,
     ):
 
         assert all(module in model_files for module in ["image_encoder", "decoder"])
@@ -129,6 +133,7 @@ class OpenVINOVisualPromptingInferencer(IInferencer):
                         "class_name",
                         "sim_threshold",
                         "num_bg_points",
+                        "decoder_batch_size",
                     ],
                 )
             },
@@ -147,6 +152,13 @@ class OpenVINOVisualPromptingInferencer(IInferencer):
         self.converter = VisualPromptingToAnnotationConverter()
         self.labels = label_schema.get_labels(include_empty=False)
         self.transform = get_transform()  # TODO (sungchul): insert args
+        self.embedding_cache = embedding_cache if embedding_cache is not None else ImageEmbeddingCache()
+        self._encoder_sources = (
+            model_files.get("image_encoder"),
+            weight_files.get("image_encoder", None),
+            json.dumps(self.configuration["image_encoder"], sort_keys=True, default=str),
+        )
+        self._encoder_id: Optional[str] = None
 
     def pre_process(
         self, dataset_item: DatasetItemEntity, extra_processing: bool = False
@@ -190,9 +202,24 @@ class OpenVINOVisualPromptingInferencer(IInferencer):
             soft_predictions.append(soft_prediction)
         return annotations
 
+    @property
+    def encoder_id(self) -> str:
+        """Identity of the image encoder in the keys of the embedding cache, computed once from its model files."""
+        if self._encoder_id is None:
+            self._encoder_id = ImageEmbeddingCache.get_encoder_id(*self._encoder_sources)
+        return self._encoder_id
+
     def forward_image_encoder(self, inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
-        """Forward function of OpenVINO Visual Prompting Inferencer."""
-        return self.model["image_encoder"].infer_sync(inputs)
+        """Forward function of OpenVINO Visual Prompting Inferencer.
+
+        The image embeddings of inputs encoded before are reused from the embedding cache.
+        """
+        key = self.embedding_cache.get_key(inputs, self.encoder_id)
+        image_embeddings = self.embedding_cache.get(key)
+        if image_embeddings is None:
+            image_embeddings = self.model["image_encoder"].infer_sync(inputs)
+            self.embedding_cache.put(key, image_embeddings)
+        return image_embeddings
 
     def forward_decoder(self, inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Forward function of OpenVINO Visual Prompting Inferencer."""
@@ -223,6 +250,10 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         device (str): Device to run inference on, such as CPU, GPU or MYRIAD. Defaults to "CPU".
         num_requests (int) : Maximum number of requests that the inferencer can make.
             Good value is the number of available cores. Defaults to 1.
+        embedding_cache (Optional[ImageEmbeddingCache]): Cache of the image embeddings reused when the same
+            image is prompted again. Defaults to None, an in-memory cache is created.
+        decoder_batch_size (int): Maximum number of point prompts decoded in one infer request. The decoder is
+            reshaped to a dynamic batch if it is greater than 1. Defaults to 1.
     """
 
     def __init__(
@@ -233,6 +264,8 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         weight_files: Optional[Dict[str, Union[str, Path, bytes, None]]] = {},
         device: str = "CPU",
         num_requests: int = 1,
+        embedding_cache: Optional[ImageEmbeddingCache] = None,
+        decoder_batch_size: int = 1,
     ):
 
         assert all(module in model_files for module in ["image_encoder", "prompt_getter", "decoder"])
@@ -265,6 +298,7 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
                         "class_name",
                         "sim_threshold",
                         "num_bg_points",
+                        "decoder_batch_size",
                     ],
                 )
             },
@@ -285,9 +319,39 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         self.converter = VisualPromptingToAnnotationConverter()
         self.labels = label_schema.get_labels(include_empty=False)
         self.transform = get_transform()  # TODO (sungchul): insert args
+        self.embedding_cache = embedding_cache if embedding_cache is not None else ImageEmbeddingCache()
+        self._encoder_sources = (
+            model_files.get("image_encoder"),
+            weight_files.get("image_encoder", None),
+            json.dumps(self.configuration["image_encoder"], sort_keys=True, default=str),
+        )
+        self._encoder_id: Optional[str] = None
 
         self.point_labels_box = np.array([[2, 3]], dtype=np.float32)
         self.has_mask_inputs = [np.array([[0.0]]), np.array([[1.0]])]
+        self.decoder_batch_size = 1
+        self.set_decoder_batch_size(decoder_batch_size)
+
+    def set_decoder_batch_size(self, decoder_batch_size: int) -> None:
+        """Decode up to decoder_batch_size point prompts in one infer request.
+
+        The batch dimension of the prompt inputs of the decoder is made dynamic the first time
+        decoder_batch_size is greater than 1.
+
+        Args:
+            decoder_batch_size (int): Maximum number of point prompts in one infer request, 1 disables batching.
+        """
+        if decoder_batch_size > 1 and self.decoder_batch_size <= 1:
+            inference_adapter = self.model["decoder"].inference_adapter
+            new_shape = {}
+            for model_input in inference_adapter.model.inputs:
+                name = model_input.get_any_name()
+                if name in ["point_coords", "point_labels", "mask_input"]:
+                    dims = list(model_input.get_partial_shape())
+                    new_shape[name] = [-1] + [dim.get_length() if dim.is_static else -1 for dim in dims[1:]]
+            inference_adapter.reshape_model(new_shape)
+            inference_adapter.load_model()
+        self.decoder_batch_size = max(decoder_batch_size, 1)
 
     def pre_process(  # type: ignore
         self, dataset_item: DatasetItemEntity, extra_processing: bool = False
@@ -324,36 +388,46 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         for label, (points_scores, bg_coords) in enumerate(
             zip(total_prompts["total_points_scores"], total_prompts["total_bg_coords"])
         ):
-            for points_score in points_scores:
-                if points_score[-1] == -1:
-                    continue
-                x, y = points_score[:2]
-                is_done = False
-                for pm in predicted_masks.get(label, []):
-                    # check if that point is already assigned
-                    if pm[int(y), int(x)] > 0:
-                        is_done = True
-                        break
-                if is_done:
-                    continue
-
-                point_coords = np.concatenate((np.array([[x, y]]), bg_coords), axis=0, dtype=np.float32)
-                point_coords = self.model["decoder"]._apply_coords(point_coords, original_size)
-                point_labels = np.array([1] + [0] * len(bg_coords), dtype=np.float32)
-                inputs_decoder = {"point_coords": point_coords[None], "point_labels": point_labels[None]}
-                inputs_decoder.update(image_embeddings)
-
-                prediction = self.forward_decoder(inputs_decoder, original_size)
-                metadata = {
-                    "label": [_label for _label in self.labels if int(_label.id_) == label][0],
-                    "original_size": original_size[None],
-                }
-
-                # set annotation for eval
-                annotation, hard_prediction, _ = self.post_process(prediction, metadata)
-                annotations[label].extend(annotation)
-                predicted_masks[label].append(hard_prediction)
-                used_points[label].append(points_score)
+            point_labels = np.array([1] + [0] * len(bg_coords), dtype=np.float32)
+            candidates = [points_score for points_score in points_scores if points_score[-1] != -1]
+            while candidates:
+                # skip the points already assigned to a mask, then decode the next points together
+                candidates = [
+                    points_score
+                    for points_score in candidates
+                    if not self._is_assigned(points_score, predicted_masks.get(label, []))
+                ]
+                chunk = candidates[: self.decoder_batch_size]
+                candidates = candidates[self.decoder_batch_size :]
+                if not chunk:
+                    break
+
+                chunk_inputs = []
+                for points_score in chunk:
+                    point_coords = np.concatenate((points_score[None, :2], bg_coords), axis=0, dtype=np.float32)
+                    point_coords = self.model["decoder"]._apply_coords(point_coords, original_size)
+                    inputs_decoder = {"point_coords": point_coords[None], "point_labels": point_labels[None]}
+                    inputs_decoder.update(image_embeddings)
+                    chunk_inputs.append(inputs_decoder)
+                if len(chunk_inputs) == 1:
+                    predictions = [self.forward_decoder(chunk_inputs[0], original_size)]
+                else:
+                    predictions = self.forward_decoder_batch(chunk_inputs, original_size)
+
+                for points_score, prediction in zip(chunk, predictions):
+                    # a mask of a previous point of the chunk may cover this point
+                    if self._is_assigned(points_score, predicted_masks.get(label, [])):
+                        continue
+                    metadata = {
+                        "label": [_label for _label in self.labels if int(_label.id_) == label][0],
+                        "original_size": original_size[None],
+                    }
+
+                    # set annotation for eval
+                    annotation, hard_prediction, _ = self.post_process(prediction, metadata)
+                    annotations[label].extend(annotation)
+                    predicted_masks[label].append(hard_prediction)
+                    used_points[label].append(points_score)
         self.__inspect_overlapping_areas(predicted_masks, used_points, annotations)
         return sum(annotations.values(), [])
 
@@ -365,48 +439,88 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         self, inputs: Dict[str, np.ndarray], original_size: np.ndarray
     ) -> Dict[str, np.ndarray]:
         """Forward function of OpenVINO Visual Prompting Inferencer."""
-        logits: np.ndarray
-        scores: np.ndarray
+        return self.forward_decoder_batch([inputs], original_size)[0]
+
+    def forward_decoder_batch(
+        self, inputs: List[Dict[str, np.ndarray]], original_size: np.ndarray
+    ) -> List[Dict[str, np.ndarray]]:
+        """Forward the decoder with the cascaded refinements for many point prompts of the same image.
+
+        Each refinement step infers all the prompts still refined at once, the prompts whose predicted mask
+        is empty are finished early and not inferred anymore.
+
+        Args:
+            inputs (List[Dict[str, np.ndarray]]): Decoder inputs of each prompt, with the same image embeddings.
+            original_size (np.ndarray): The original image size.
+
+        Returns:
+            List[Dict[str, np.ndarray]]: IoU predictions and low resolution masks of each prompt.
+        """
+        image_embeddings = inputs[0]["image_embeddings"]
+        point_coords = [prompt_inputs["point_coords"] for prompt_inputs in inputs]
+        point_labels = [prompt_inputs["point_labels"] for prompt_inputs in inputs]
+        mask_inputs = [
+            np.zeros((1, 1, *map(lambda x: x * 4, image_embeddings.shape[2:])), dtype=np.float32) for _ in inputs
+        ]
+        logits: List[np.ndarray] = [np.empty(0)] * len(inputs)
+        scores: List[np.ndarray] = [np.empty(0)] * len(inputs)
+        results: List[Dict[str, np.ndarray]] = [{}] * len(inputs)
+        active = list(range(len(inputs)))
         mask_slice = slice(0, 1)
         for i in range(3):
             if i == 0:
                 # First-step prediction
-                mask_input = np.zeros(
-                    (1, 1, *map(lambda x: x * 4, inputs["image_embeddings"].shape[2:])), dtype=np.float32
-                )
                 has_mask_input = self.has_mask_inputs[0]
-
-            elif i == 1:
-                # Cascaded Post-refinement-1
-                mask_input, masks, iou_predictions = self._postprocess_masks(
-                    logits, scores, original_size, is_single=True  # noqa: F821
-                )
-                if masks.sum() == 0:
-                    return {"iou_predictions": iou_predictions, "low_res_masks": mask_input}
-
+            else:
+                # Cascaded Post-refinement-1 and 2
+                refined = []
+                for k in active:
+                    mask_input, masks, iou_predictions = self._postprocess_masks(
+                        logits[k], scores[k], original_size, is_single=i == 1
+                    )
+                    if masks.sum() == 0:
+                        results[k] = {"iou_predictions": iou_predictions, "low_res_masks": mask_input}
+                        continue
+
+                    mask_inputs[k] = mask_input
+                    if i == 2:
+                        y, x = np.nonzero(masks)
+                        box_coords = self.model["decoder"]._apply_coords(
+                            np.array([[[x.min(), y.min()], [x.max(), y.max()]]], dtype=np.float32), original_size
+                        )
+                        point_coords[k] = np.concatenate((point_coords[k], box_coords), axis=1)
+                        point_labels[k] = np.concatenate((point_labels[k], self.point_labels_box), axis=1)
+                    refined.append(k)
+                active = refined
                 has_mask_input = self.has_mask_inputs[1]
 
-            elif i == 2:
-                # Cascaded Post-refinement-2
-                mask_input, masks, iou_predictions = self._postprocess_masks(
-                    logits, scores, original_size  # noqa: F821
-                )
-                if masks.sum() == 0:
-                    return {"iou_predictions": iou_predictions, "low_res_masks": mask_input}
-
-                has_mask_input = self.has_mask_inputs[1]
-                y, x = np.nonzero(masks)
-                box_coords = self.model["decoder"]._apply_coords(
-                    np.array([[[x.min(), y.min()], [x.max(), y.max()]]], dtype=np.float32), original_size
+            # prompts with the same number of points are inferred together
+            groups: DefaultDict[int, List[int]] = defaultdict(list)
+            for k in active:
+                groups[point_coords[k].shape[1]].append(k)
+            for group in groups.values():
+                prediction = self.model["decoder"].infer_sync(
+                    {
+                        "image_embeddings": image_embeddings,
+                        "point_coords": np.concatenate([point_coords[k] for k in group]),
+                        "point_labels": np.concatenate([point_labels[k] for k in group]),
+                        "mask_input": np.concatenate([mask_inputs[k] for k in group]),
+                        "has_mask_input": has_mask_input,
+                    }
                 )
-                inputs["point_coords"] = np.concatenate((inputs["point_coords"], box_coords), axis=1)
-                inputs["point_labels"] = np.concatenate((inputs["point_labels"], self.point_labels_box), axis=1)
+                for j, k in enumerate(group):
+                    scores[k] = prediction["iou_predictions"][j : j + 1].copy()
+                    logits[k] = prediction["low_res_masks"][j : j + 1].copy()
 
-            inputs.update({"mask_input": mask_input, "has_mask_input": has_mask_input})
-            prediction = self.model["decoder"].infer_sync(inputs)
-            scores, logits = prediction["iou_predictions"], prediction["low_res_masks"]
+        for k in active:
+            results[k] = {"iou_predictions": scores[k][:, mask_slice], "low_res_masks": logits[k][:, mask_slice, :, :]}
+        return results
 
-        return {"iou_predictions": scores[:, mask_slice], "low_res_masks": logits[:, mask_slice, :, :]}
+    @staticmethod
+    def _is_assigned(points_score: np.ndarray, predicted_masks: List[np.ndarray]) -> bool:
+        """Check if the point is already assigned to one of the predicted masks."""
+        x, y = points_score[:2]
+        return any(predicted_mask[int(y), int(x)] > 0 for predicted_mask in predicted_masks)
 
     def _postprocess_masks(
         self, logits: np.ndarray, scores: np.ndarray, original_size: np.ndarray, is_single: bool = False
@@ -442,17 +556,37 @@ class OpenVINOZeroShotVisualPromptingInferencer(OpenVINOVisualPromptingInference
         annotations: Dict[int, List[np.ndarray]],
         threshold_iou: float = 0.8,
     ):
-        def __calculate_mask_iou(mask1: np.ndarray, mask2: np.ndarray):
-            assert mask1.ndim == 2 and mask2.ndim == 2
-            intersection = np.logical_and(mask1, mask2).sum().item()
-            union = np.logical_or(mask1, mask2).sum().item()
-
+        def __get_bbox_and_area(mask: np.ndarray) -> Tuple[Tuple[int, int, int, int], int]:
+            if id(mask) in bboxes_areas:
+                return bboxes_areas[id(mask)]
+            assert mask.ndim == 2
+            rows, cols = np.any(mask, axis=1), np.any(mask, axis=0)
+            if not rows.any():
+                bboxes_areas[id(mask)] = (0, 0, 0, 0), 0
+                return bboxes_areas[id(mask)]
+            y1, y2 = np.nonzero(rows)[0][[0, -1]]
+            x1, x2 = np.nonzero(cols)[0][[0, -1]]
+            bboxes_areas[id(mask)] = (int(y1), int(x1), int(y2) + 1, int(x2) + 1), int(np.count_nonzero(mask))
+            return bboxes_areas[id(mask)]
+
+        def __calculate_mask_iou(mask1: np.ndarray, mask2: np.ndarray) -> float:
+            """Calculate the IoU of the masks, only on the intersection of their bounding boxes."""
+            (y1, x1, y2, x2), area1 = __get_bbox_and_area(mask1)
+            (other_y1, other_x1, other_y2, other_x2), area2 = __get_bbox_and_area(mask2)
             # Avoid division by zero
-            if union == 0:
+            if area1 == 0 or area2 == 0:
+                return 0.0
+
+            # the IoU is at most the ratio of the areas, and zero if the bounding boxes do not overlap
+            y1, x1, y2, x2 = max(y1, other_y1), max(x1, other_x1), min(y2, other_y2), min(x2, other_x2)
+            if y1 >= y2 or x1 >= x2 or min(area1, area2) <= threshold_iou * max(area1, area2):
                 return 0.0
-            iou = intersection / union
-            return iou
 
+            intersection = np.count_nonzero(np.logical_and(mask1[y1:y2, x1:x2], mask2[y1:y2, x1:x2]))
+            return intersection / (area1 + area2 - intersection)
+
+        # bounding boxes and areas of the masks, computed once per mask
+        bboxes_areas: Dict[int, Tuple[Tuple[int, int, int, int], int]] = {}
         for (label, masks), (other_label, other_masks) in product(predicted_masks.items(), predicted_masks.items()):
             if other_label <= label:
                 continue
@@ -861,6 +995,7 @@ class OpenVINOZeroShotVisualPromptingTask(OpenVINOVisualPromptingTask):
                 "decoder": self.model.get_data("visual_prompting_decoder.bin"),
             },
             num_requests=get_default_async_reqs_num(),
+            decoder_batch_size=self.hparams.postprocessing.decoder_batch_size,
         )
 
     def optimize(
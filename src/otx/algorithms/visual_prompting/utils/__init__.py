@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
+from .embedding_cache import ImageEmbeddingCache
 from .visual_prompting_utils import get_visual_prompting_inferencer_configuration
 
-__all__ = ["get_visual_prompting_inferencer_configuration"]
+__all__ = ["ImageEmbeddingCache", "get_visual_prompting_inferencer_configuration"]
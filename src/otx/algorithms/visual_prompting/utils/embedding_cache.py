@@ -0,0 +1,141 @@
+"""Cache of the image embeddings computed by the image encoders of visual prompting models."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from otx.api.utils.lru_cache import LRUCache
+
+Embeddings = Dict[str, np.ndarray]
+
+
+def _nbytes(embeddings: Embeddings) -> int:
+    return sum(value.nbytes for value in embeddings.values())
+
+
+class ImageEmbeddingCache:
+    """Least recently used cache of image embeddings keyed on the image content and the encoder identity.
+
+    Embeddings are kept in memory up to `max_bytes`. If `cache_dir` is given, every cached entry is also
+    written there as `.npy` files, and entries missing from memory are loaded back from disk memory-mapped,
+    so that they survive evictions and can be shared between runs using the same encoder.
+    Cached arrays are read-only.
+
+    Args:
+        max_bytes (int): Maximum number of bytes of the embeddings kept in memory. Defaults to 256 MiB.
+        cache_dir (Optional[Union[str, Path]]): Directory of the disk tier, disabled if None. Defaults to None.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memory: LRUCache[str, Embeddings] = LRUCache(max_bytes, get_nbytes=_nbytes)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Returns the number of embeddings kept in memory."""
+        return len(self._memory)
+
+    @property
+    def max_bytes(self) -> int:
+        """Returns the maximum number of bytes of the embeddings kept in memory."""
+        return self._memory.max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes of the embeddings kept in memory."""
+        return self._memory.nbytes
+
+    @staticmethod
+    def get_key(inputs: Embeddings, encoder_id: str) -> str:
+        """Returns the key of the embeddings of the encoder inputs.
+
+        The key is a digest of the encoder identity and the names, shapes, dtypes and content of the inputs.
+        """
+        digest = hashlib.blake2b(encoder_id.encode(), digest_size=20)
+        for name, value in sorted(inputs.items()):
+            value = np.ascontiguousarray(value)
+            digest.update(f"{name}:{value.shape}:{value.dtype.str};".encode())
+            digest.update(value.data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_encoder_id(*sources: Union[str, Path, bytes, np.ndarray, None]) -> str:
+        """Returns an identity of an encoder built from its model files, weights or configuration.
+
+        Bytes and arrays are hashed by content, paths of existing files by the content of the file,
+        and any other value by its string representation.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        for source in sources:
+            if isinstance(source, np.ndarray):
+                digest.update(np.ascontiguousarray(source).data)
+            elif isinstance(source, bytes):
+                digest.update(source)
+            elif isinstance(source, (str, Path)) and os.path.isfile(source):
+                with open(source, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+            else:
+                digest.update(repr(source).encode())
+            digest.update(b";")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Embeddings]:
+        """Returns the cached embeddings of the key if exist, from memory or else from the disk tier."""
+        embeddings = self._memory.get(key)
+        if embeddings is not None:
+            return embeddings
+
+        embeddings = self._load(key)
+        if embeddings is not None:
+            self._memory.put(key, embeddings)
+        return embeddings
+
+    def put(self, key: str, embeddings: Embeddings) -> Embeddings:
+        """Caches read-only copies of the embeddings and returns them.
+
+        The least recently used embeddings are evicted from memory if the cache is full.
+        """
+        embeddings = {name: np.array(value) for name, value in embeddings.items()}
+        for value in embeddings.values():
+            value.setflags(write=False)
+        self._memory.put(key, embeddings)
+        if self.cache_dir is not None:
+            self._save(key, embeddings)
+        return embeddings
+
+    def clear(self) -> None:
+        """Removes all embeddings from memory, the disk tier is kept."""
+        self._memory.clear()
+
+    def _load(self, key: str) -> Optional[Embeddings]:
+        if self.cache_dir is None or not (self.cache_dir / key).is_dir():
+            return None
+        try:
+            return {path.stem: np.load(path, mmap_mode="r") for path in (self.cache_dir / key).glob("*.npy")}
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, key: str, embeddings: Embeddings) -> None:
+        """Writes the embeddings in a temporary directory renamed to the key, readers never see partial entries."""
+        entry_dir = self.cache_dir / key  # type: ignore[operator]
+        if entry_dir.exists():
+            return
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir)
+        try:
+            for name, value in embeddings.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), value)
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # another process or thread saved the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -32,6 +32,12 @@ class InferenceParameters:
         explain_predicted_classes: If set to True, provide explanations only for predicted classes.
             Otherwise, explain all classes.
         enable_async_inference: Enables async inference to increase performance.
+        max_batch_size: Maximum number of images coalesced into one infer request in async inference
+            of OpenVINO models supporting it. 1 disables batching.
+        max_batch_wait_ms: Maximum time in milliseconds an image waits for its batch to be filled.
+        num_prefetch_workers: Number of threads decoding and preprocessing the upcoming images
+            in OpenVINO inference while the current ones are inferred. 0 disables prefetching.
+        max_prefetch: Maximum number of images decoded ahead of the inference.
     """
 
     is_evaluation: bool = False
@@ -41,3 +47,7 @@ class InferenceParameters:
     process_saliency_maps: bool = False
     explain_predicted_classes: bool = True
     enable_async_inference: bool = True
+    max_batch_size: int = 1
+    max_batch_wait_ms: float = 10.0
+    num_prefetch_workers: int = 0
+    max_prefetch: int = 16
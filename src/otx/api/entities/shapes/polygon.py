@@ -10,7 +10,7 @@
 import datetime
 import warnings
 from operator import attrgetter
-from typing import List, Optional
+from typing import List, Optional, cast
 import numpy as np
 
 from shapely.geometry import Polygon as shapely_polygon
@@ -20,6 +20,13 @@ from otx.api.entities.shapes.shape import Shape, ShapeType
 from otx.api.utils.time_utils import now
 
 
+def _clip_to_unit(value: float) -> float:
+    """Clips a coordinate to [0, 1] like np.clip, skipping the slow np.clip call for floats in range."""
+    if type(value) in (float, np.float64) and 0.0 <= value <= 1.0:  # pylint: disable=unidiomatic-typecheck
+        return cast(float, np.float64(value))
+    return np.clip(value, a_min=0.0, a_max=1.0)
+
+
 class Point:
     """This class defines a Point with an X and Y coordinate.
 
@@ -29,8 +36,8 @@ class Point:
     __slots__ = ["x", "y"]
 
     def __init__(self, x: float, y: float):
-        self.x = np.clip(x, a_min=0.0, a_max=1.0)
-        self.y = np.clip(y, a_min=0.0, a_max=1.0)
+        self.x = _clip_to_unit(x)
+        self.y = _clip_to_unit(y)
 
     def __repr__(self):
         """String representation of the point."""
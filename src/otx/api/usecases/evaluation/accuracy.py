@@ -6,7 +6,7 @@
 
 
 import copy
-from typing import List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import numpy as np
 from sklearn.metrics import confusion_matrix as sklearn_confusion_matrix
@@ -30,6 +30,8 @@ from otx.api.entities.metrics import (
 from otx.api.entities.resultset import ResultSetEntity
 from otx.api.usecases.evaluation.averaging import MetricAverageMethod
 from otx.api.usecases.evaluation.basic_operations import (
+    iterate_in_chunks,
+    map_chunks,
     precision_per_class,
     recall_per_class,
 )
@@ -53,15 +55,18 @@ class Accuracy(IPerformanceProvider):
         average (MetricAverageMethod, optional): The averaging method, either MICRO or MACRO
             MICRO: compute average over all predictions in all label groups
             MACRO: compute accuracy per label group, return the average of the per-label-group accuracy scores
+        num_workers (int, optional): The number of worker processes counting the confusions. If it is 0,
+            they are counted in the current process.
     """
 
     def __init__(
         self,
         resultset: ResultSetEntity,
         average: MetricAverageMethod = MetricAverageMethod.MICRO,
+        num_workers: int = 0,
     ):
         self._unnormalized_matrices: List[MatrixMetric] = compute_unnormalized_confusion_matrices_from_resultset(
-            resultset
+            resultset, num_workers
         )
 
         # accuracy computation
@@ -198,19 +203,15 @@ def recall_metrics_group(confusion_matrix: MatrixMetric) -> MetricsGroup:
 
 def __get_gt_and_predicted_label_indices_from_resultset(
     resultset: ResultSetEntity,
-) -> Tuple[List[Set[int]], List[Set[int]]]:
-    """Returns the label indices lists for ground truth and prediction datasets in a tuple.
+) -> Iterator[Tuple[Set[int], Set[int]]]:
+    """Yields the label indices of the ground truth and the prediction of each dataset item.
 
     Args:
         resultset
 
     Returns:
-        a tuple containing two lists. The first list contains the ground truth label indices, and the second contains
-        the prediction label indices.
+        an iterator of tuples containing the ground truth label indices and the prediction label indices of an item.
     """
-    true_label_idx = []
-    predicted_label_idx = []
-
     gt_dataset: DatasetEntity = resultset.ground_truth_dataset
     pred_dataset: DatasetEntity = resultset.prediction_dataset
 
@@ -221,70 +222,96 @@ def __get_gt_and_predicted_label_indices_from_resultset(
     task_labels = resultset.model.configuration.get_label_schema().get_labels(include_empty=True)
     for gt_item, pred_item in zip(gt_dataset, pred_dataset):
         if isinstance(gt_item, DatasetItemEntity) and isinstance(pred_item, DatasetItemEntity):
-            true_label_idx.append({task_labels.index(label) for label in gt_item.get_roi_labels(task_labels)})
-            predicted_label_idx.append({task_labels.index(label) for label in pred_item.get_roi_labels(task_labels)})
+            yield (
+                {task_labels.index(label) for label in gt_item.get_roi_labels(task_labels)},
+                {task_labels.index(label) for label in pred_item.get_roi_labels(task_labels)},
+            )
+
 
-    return true_label_idx, predicted_label_idx
+def _count_confusions_of_chunk(
+    chunk: List[Tuple[Set[int], Set[int]]],
+    group_indices: List[Dict[int, int]],
+) -> List[np.ndarray]:
+    """Returns the confusion counts of a chunk of items for each label group.
+
+    Args:
+        chunk (List[Tuple[Set[int], Set[int]]]): ground truth and prediction label indices of each item
+        group_indices (List[Dict[int, int]]): mapping of the task label indices to the group label indices
+            for each label group
+
+    Returns:
+        List[np.ndarray]: confusion counts for each label group. The last row and column count the items
+            without a label of the group in the multiclass case.
+    """
+    true_label_idx = [true_labels for true_labels, _ in chunk]
+    predicted_label_idx = [pred_labels for _, pred_labels in chunk]
+
+    confusion_counts = []
+    for map_task_labels_idx_to_group_idx in group_indices:
+        set_group_labels_idx = set(map_task_labels_idx_to_group_idx.keys())
+        if len(set_group_labels_idx) == 1:
+            # Single-class
+            # we use "not" to make presence of a class to be at index 0, while the absence of it at index 1
+            y_true = [int(not set_group_labels_idx.issubset(true_labels)) for true_labels in true_label_idx]
+            y_pred = [int(not set_group_labels_idx.issubset(pred_labels)) for pred_labels in predicted_label_idx]
+            n_columns = 2
+        else:
+            # Multiclass
+            undefined_idx = len(set_group_labels_idx)  # to define missing value
+
+            # find the intersections between GT and task labels, and Prediction and task labels
+            true_intersections = [true_labels.intersection(set_group_labels_idx) for true_labels in true_label_idx]
+            pred_intersections = [pred_labels.intersection(set_group_labels_idx) for pred_labels in predicted_label_idx]
+
+            # map the intersection to 0-index value
+            y_true = [
+                map_task_labels_idx_to_group_idx[list(true_intersection)[0]]
+                if len(true_intersection) != 0
+                else undefined_idx
+                for true_intersection in true_intersections
+            ]
+            y_pred = [
+                map_task_labels_idx_to_group_idx[list(pred_intersection)[0]]
+                if len(pred_intersection) != 0
+                else undefined_idx
+                for pred_intersection in pred_intersections
+            ]
+            n_columns = undefined_idx + 1
+
+        confusion_counts.append(sklearn_confusion_matrix(y_true, y_pred, labels=list(range(n_columns))))
+    return confusion_counts
 
 
 def __compute_unnormalized_confusion_matrices_for_label_group(
-    true_label_idx: List[Set[int]],
-    predicted_label_idx: List[Set[int]],
+    confusion_counts: np.ndarray,
     label_group: LabelGroup,
     task_labels: List[LabelEntity],
 ) -> MatrixMetric:
     """Returns matrix metric for a certain label group.
 
     Args:
-        true_label_idx (List[Set[int]]): list of sets of label indices for the ground truth dataset
-        predicted_label_idx (List[Set[int]]): list of sets of label indices for the prediction dataset
+        confusion_counts (np.ndarray): confusion counts of the label group over the whole resultset
         label_group (LabelGroup): label group to compute the confusion matrix for
         task_labels (List[LabelEntity]): list of labels for the task
 
     Returns:
         MatrixMetric: confusion matrix for the label group
     """
-    map_task_labels_idx_to_group_idx = {
-        task_labels.index(label): i_group for i_group, label in enumerate(label_group.labels)
-    }
-    set_group_labels_idx = set(map_task_labels_idx_to_group_idx.keys())
+    set_group_labels_idx = {task_labels.index(label) for label in label_group.labels}
     group_label_names = [task_labels[label_idx].name for label_idx in set_group_labels_idx]
 
     if len(group_label_names) == 1:
         # Single-class
-        # we use "not" to make presence of a class to be at index 0, while the absence of it at index 1
-        y_true = [int(not set_group_labels_idx.issubset(true_labels)) for true_labels in true_label_idx]
-        y_pred = [int(not set_group_labels_idx.issubset(pred_labels)) for pred_labels in predicted_label_idx]
         group_label_names += [f"~ {group_label_names[0]}"]
         column_labels = group_label_names.copy()
         remove_last_row = False
     else:
         # Multiclass
-        undefined_idx = len(group_label_names)  # to define missing value
-
-        # find the intersections between GT and task labels, and Prediction and task labels
-        true_intersections = [true_labels.intersection(set_group_labels_idx) for true_labels in true_label_idx]
-        pred_intersections = [pred_labels.intersection(set_group_labels_idx) for pred_labels in predicted_label_idx]
-
-        # map the intersection to 0-index value
-        y_true = [
-            map_task_labels_idx_to_group_idx[list(true_intersection)[0]]
-            if len(true_intersection) != 0
-            else undefined_idx
-            for true_intersection in true_intersections
-        ]
-        y_pred = [
-            map_task_labels_idx_to_group_idx[list(pred_intersection)[0]]
-            if len(pred_intersection) != 0
-            else undefined_idx
-            for pred_intersection in pred_intersections
-        ]
-
         column_labels = group_label_names.copy()
         column_labels.append("Other")
         remove_last_row = True
 
-    matrix_data = sklearn_confusion_matrix(y_true, y_pred, labels=list(range(len(column_labels))))
+    matrix_data = confusion_counts
     if remove_last_row:
         # matrix clean up
         matrix_data = np.delete(matrix_data, -1, 0)
@@ -305,11 +332,16 @@ def __compute_unnormalized_confusion_matrices_for_label_group(
 
 def compute_unnormalized_confusion_matrices_from_resultset(
     resultset: ResultSetEntity,
+    num_workers: int = 0,
 ) -> List[MatrixMetric]:
     """Computes an (unnormalized) confusion matrix for every label group in the resultset.
 
+    The label indices of the dataset items are streamed in chunks, whose confusion counts are summed up.
+
     Args:
         resultset: the input resultset
+        num_workers: the number of worker processes counting the confusions. If it is 0,
+            they are counted in the current process.
 
     Returns:
         the computed unnormalized confusion matrices
@@ -318,18 +350,30 @@ def compute_unnormalized_confusion_matrices_from_resultset(
     if len(resultset.ground_truth_dataset) == 0 or len(resultset.prediction_dataset) == 0:
         raise ValueError("Cannot compute the confusion matrix of an empty result set.")
 
-    unnormalized_confusion_matrices: List[MatrixMetric] = []
-    (
-        true_label_idx,
-        predicted_label_idx,
-    ) = __get_gt_and_predicted_label_indices_from_resultset(resultset)
-    task_labels = resultset.model.configuration.get_label_schema().get_labels(include_empty=False)
+    label_schema = resultset.model.configuration.get_label_schema()
+    task_labels = label_schema.get_labels(include_empty=False)
+    label_groups = label_schema.get_groups()
+    group_indices = [
+        {task_labels.index(label): i_group for i_group, label in enumerate(label_group.labels)}
+        for label_group in label_groups
+    ]
 
-    # Confusion matrix computation
-    for label_group in resultset.model.configuration.get_label_schema().get_groups():
-        matrix = __compute_unnormalized_confusion_matrices_for_label_group(
-            true_label_idx, predicted_label_idx, label_group, task_labels
-        )
-        unnormalized_confusion_matrices.append(matrix)
+    confusion_counts: Optional[List[np.ndarray]] = None
+    for chunk_confusion_counts in map_chunks(
+        _count_confusions_of_chunk,
+        iterate_in_chunks(__get_gt_and_predicted_label_indices_from_resultset(resultset)),
+        num_workers,
+        group_indices=group_indices,
+    ):
+        if confusion_counts is None:
+            confusion_counts = chunk_confusion_counts
+        else:
+            confusion_counts = [total + counts for total, counts in zip(confusion_counts, chunk_confusion_counts)]
+    if confusion_counts is None:
+        confusion_counts = _count_confusions_of_chunk([], group_indices)
 
-    return unnormalized_confusion_matrices
+    # Confusion matrix computation
+    return [
+        __compute_unnormalized_confusion_matrices_for_label_group(counts, label_group, task_labels)
+        for counts, label_group in zip(confusion_counts, label_groups)
+    ]
@@ -5,16 +5,74 @@
 #
 
 
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import numpy as np
 
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.segmentation_utils import RunLengthMask
 
 #: Dictionary storing a number for each label. The ``None`` key represents "all labels"
 NumberPerLabel = Dict[Optional[LabelEntity], int]
 
+#: Number of dataset items whose statistics are computed at once by a worker
+EVALUATION_CHUNK_SIZE = 64
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def iterate_in_chunks(iterable: Iterable[_T], chunk_size: int = EVALUATION_CHUNK_SIZE) -> Iterator[List[_T]]:
+    """Yields the elements of the iterable in lists of at most chunk_size elements.
+
+    Args:
+        iterable (Iterable[_T]): elements to split into chunks
+        chunk_size (int): maximum number of elements in a chunk
+
+    Returns:
+        Iterator[List[_T]]: chunks of elements in the original order
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(function: Callable[..., _R], chunks: Iterable[Any], num_workers: int = 0, **kwargs) -> Iterator[_R]:
+    """Applies the function to each chunk, in a process pool if num_workers is positive.
+
+    The chunks are consumed lazily and at most two chunks per worker are in flight,
+    so that the memory usage does not depend on the number of chunks.
+
+    Args:
+        function (Callable[..., _R]): picklable function called as function(chunk, **kwargs)
+        chunks (Iterable[Any]): picklable chunks of work
+        num_workers (int): number of worker processes. If it is 0, the chunks are processed in the current process.
+        kwargs: picklable keyword arguments passed to the function
+
+    Returns:
+        Iterator[_R]: results of the function in the order of the chunks
+    """
+    if num_workers <= 0:
+        for chunk in chunks:
+            yield function(chunk, **kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures: Deque[Future] = deque()
+        for chunk in chunks:
+            futures.append(executor.submit(function, chunk, **kwargs))
+            if len(futures) >= 2 * num_workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
 
 def get_intersections_and_cardinalities(
     references: List[np.ndarray],
@@ -53,6 +111,48 @@ def get_intersections_and_cardinalities(
     return all_intersections, all_cardinalities
 
 
+def get_rle_intersections_and_cardinalities(
+    reference: RunLengthMask, prediction: RunLengthMask, num_labels: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the intersections and cardinalities between a run-length encoded reference mask and prediction mask.
+
+    The counts are the same as get_intersections_and_cardinalities, but computed on the runs without decoding
+    the masks.
+
+    Args:
+        reference (RunLengthMask): reference mask
+        prediction (RunLengthMask): prediction mask
+        num_labels (int): number of labels in the masks, whose pixel values are 1 to num_labels
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: intersections and cardinalities of all labels at index 0,
+            followed by each label.
+    """
+    if reference.shape != prediction.shape:
+        raise ValueError(f"Reference mask {reference.shape} and prediction mask {prediction.shape} differ in shape.")
+
+    # Split the runs at the ends of both masks so that each segment has a single reference and prediction value
+    reference_ends = np.cumsum(reference.lengths, dtype=np.int64)
+    prediction_ends = np.cumsum(prediction.lengths, dtype=np.int64)
+    segment_ends = np.union1d(reference_ends, prediction_ends)
+    segment_lengths = np.diff(segment_ends, prepend=0)
+    reference_values = reference.values[reference_ends.searchsorted(segment_ends)].astype(np.int64)
+    prediction_values = prediction.values[prediction_ends.searchsorted(segment_ends)].astype(np.int64)
+
+    intersection_values = np.where(reference_values == prediction_values, reference_values, 0)
+    minlength = num_labels + 1
+    intersections = np.bincount(intersection_values, segment_lengths, minlength)[:minlength]
+    reference_areas = np.bincount(reference_values, segment_lengths, minlength)[:minlength]
+    prediction_areas = np.bincount(prediction_values, segment_lengths, minlength)[:minlength]
+
+    # Index 0 counts the pixels of any label, including the values out of the labels
+    n_pixels = segment_lengths.sum()
+    intersections[0] = n_pixels - intersections[0]
+    cardinalities = reference_areas + prediction_areas
+    cardinalities[0] = 2 * n_pixels - cardinalities[0]
+    return intersections.astype(np.int64), cardinalities.astype(np.int64)
+
+
 def intersection_box(box1: Rectangle, box2: Rectangle) -> Optional[List[float]]:
     """Calculate the intersection box of two bounding boxes.
 
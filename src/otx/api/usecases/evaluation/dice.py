@@ -5,9 +5,11 @@
 #
 
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 import numpy as np
 
+from otx.api.entities.annotation import Annotation
+from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.metrics import (
     BarChartInfo,
@@ -20,15 +22,98 @@ from otx.api.entities.metrics import (
 from otx.api.entities.resultset import ResultSetEntity
 from otx.api.usecases.evaluation.averaging import MetricAverageMethod
 from otx.api.usecases.evaluation.basic_operations import (
-    get_intersections_and_cardinalities,
+    NumberPerLabel,
+    get_rle_intersections_and_cardinalities,
+    iterate_in_chunks,
+    map_chunks,
 )
 from otx.api.usecases.evaluation.performance_provider_interface import (
     IPerformanceProvider,
 )
-from otx.api.utils.segmentation_utils import mask_from_dataset_item
+from otx.api.utils.segmentation_utils import (
+    MASK_CACHE,
+    RunLengthMask,
+    encode_mask_rle,
+    mask_from_annotation,
+)
 from otx.api.utils.time_utils import timeit
 from otx.api.entities.image import Image
 
+#: Annotations, width and height of a dataset item to build its mask
+_MaskSource = Tuple[List[Annotation], int, int]
+#: Key of the mask in MASK_CACHE or None if it is not cached, and the cached mask or the source to build it
+_CachedMaskSource = Tuple[Optional[Hashable], Union[RunLengthMask, _MaskSource]]
+
+
+def _combine_masks(annotations: List[Annotation], labels: List[LabelEntity]) -> np.ndarray:
+    """Combines the masks of annotations with Image shapes into a mask of label indices."""
+    labels_map = {label: i + 1 for i, label in enumerate(labels)}
+    combined_mask = None
+    for annotation in annotations:
+        if isinstance(annotation.shape, Image):
+            scored_label = annotation.get_labels()[0]
+            label = scored_label.label
+            if combined_mask is None:
+                combined_mask = np.where(annotation.shape.numpy > 0, labels_map[label], 0)
+            else:
+                combined_mask += np.where(annotation.shape.numpy > 0, labels_map[label], 0)
+    combined_mask = np.expand_dims(combined_mask, axis=2)
+    return combined_mask
+
+
+def _get_mask_source(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> _CachedMaskSource:
+    """Returns the cached mask of the dataset item, or the annotations and the size to build it."""
+    key = MASK_CACHE.get_key(dataset_item, labels)
+    mask = MASK_CACHE.get(key) if key is not None else None
+    if mask is not None:
+        return key, mask
+    return key, (dataset_item.get_annotations(), dataset_item.width, dataset_item.height)
+
+
+def _get_intersections_and_cardinalities_of_chunk(
+    chunk: List[Tuple[_CachedMaskSource, _CachedMaskSource]], labels: List[LabelEntity]
+) -> Tuple[np.ndarray, np.ndarray, List[Tuple[Hashable, RunLengthMask]]]:
+    """Counts the intersections and cardinalities of the prediction and reference masks of a chunk of items.
+
+    The masks which are not cached are rasterized and run-length encoded, and the counts are accumulated item by item
+    on the runs.
+
+    Args:
+        chunk (List[Tuple[_CachedMaskSource, _CachedMaskSource]]): Prediction and reference masks or their sources
+            of each item
+        labels (List[LabelEntity]): Labels in the masks
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List[Tuple[Hashable, RunLengthMask]]]: Intersections and cardinalities of
+            all labels followed by each label, and the rasterized masks to be cached.
+    """
+    intersections = np.zeros(len(labels) + 1, dtype=np.int64)
+    cardinalities = np.zeros(len(labels) + 1, dtype=np.int64)
+    rasterized_masks = []
+    for prediction, reference in chunk:
+        masks = []
+        for key, source in (prediction, reference):
+            if isinstance(source, RunLengthMask):
+                masks.append(source)
+                continue
+            annotations, width, height = source
+            try:
+                mask = encode_mask_rle(mask_from_annotation(annotations, labels, width, height))
+                if key is not None:
+                    rasterized_masks.append((key, mask))
+            except Exception:  # pylint: disable=broad-except
+                # when item consists of masks with Image properties
+                # TODO (sungchul): how to add condition to check if polygon or mask?
+                mask = encode_mask_rle(_combine_masks(annotations, labels))
+            masks.append(mask)
+
+        item_intersections, item_cardinalities = get_rle_intersections_and_cardinalities(
+            masks[1], masks[0], len(labels)
+        )
+        intersections += item_intersections
+        cardinalities += item_cardinalities
+    return intersections, cardinalities, rasterized_masks
+
 
 class DiceAverage(IPerformanceProvider):
     """Computes the average Dice coefficient overall and for individual labels.
@@ -36,7 +121,8 @@ class DiceAverage(IPerformanceProvider):
     See https://en.wikipedia.org/wiki/S%C3%B8rensen%E2%80%93Dice_coefficient for background information.
 
     To compute the Dice coefficient the shapes in the dataset items of the prediction and ground truth
-    dataset are first converted to masks.
+    dataset are first converted to masks. The masks are run-length encoded and cached in MASK_CACHE,
+    so that the shapes are rasterized only once when the same dataset items are evaluated again.
 
     Dice is computed by computing the intersection and union computed over the whole dataset, instead of
     computing intersection and union for individual images and then averaging.
@@ -46,18 +132,22 @@ class DiceAverage(IPerformanceProvider):
         average (MetricAverageMethod): One of
             - MICRO: every pixel has the same weight, regardless of label
             - MACRO: compute score per label, return the average of the per-label scores
+        num_workers (int): Number of worker processes computing the masks. The dataset items are streamed to
+            the workers in chunks and only the intersection and cardinality counts are accumulated, so that the full
+            masks are never held in memory. If it is 0, the chunks are processed in the current process.
     """
 
     def __init__(
         self,
         resultset: ResultSetEntity,
         average: MetricAverageMethod = MetricAverageMethod.MACRO,
+        num_workers: int = 0,
     ):
         self.average = average
         (
             self._overall_dice,
             self._dice_per_label,
-        ) = self.__compute_dice_averaged_over_pixels(resultset, average)
+        ) = self.__compute_dice_averaged_over_pixels(resultset, average, num_workers)
 
     @property
     def overall_dice(self) -> ScoreMetric:
@@ -90,13 +180,15 @@ class DiceAverage(IPerformanceProvider):
     @classmethod
     @timeit
     def __compute_dice_averaged_over_pixels(
-        cls, resultset: ResultSetEntity, average: MetricAverageMethod
+        cls, resultset: ResultSetEntity, average: MetricAverageMethod, num_workers: int = 0
     ) -> Tuple[ScoreMetric, Dict[LabelEntity, ScoreMetric]]:
         """Computes the diced averaged over pixels.
 
         Args:
             resultset (ResultSetEntity): Result set to use
             average (MetricAverageMethod): Averaging method to use
+            num_workers (int): Number of worker processes computing the masks. If it is 0, they are computed in
+                the current process.
 
         Returns:
             Tuple[ScoreMetric, Dict[LabelEntity, ScoreMetric]]: Tuple of the overall dice and the dice averaged over
@@ -114,38 +206,31 @@ class DiceAverage(IPerformanceProvider):
         resultset_labels = set(resultset.prediction_dataset.get_labels() + resultset.ground_truth_dataset.get_labels())
         model_labels = set(resultset.model.configuration.get_label_schema().get_labels(include_empty=False))
         labels = sorted(resultset_labels.intersection(model_labels))
-        hard_predictions = []
-        hard_references = []
-        for prediction_item, reference_item in zip(
-            list(resultset.prediction_dataset), list(resultset.ground_truth_dataset)
-        ):
-            try:
-                hard_predictions.append(mask_from_dataset_item(prediction_item, labels))
-                hard_references.append(mask_from_dataset_item(reference_item, labels))
-            except:
-                # when item consists of masks with Image properties
-                # TODO (sungchul): how to add condition to check if polygon or mask?
-                labels_map = {label: i + 1 for i, label in enumerate(labels)}
-
-                def combine_masks(annotations):
-                    combined_mask = None
-                    for annotation in annotations:
-                        if isinstance(annotation.shape, Image):
-                            scored_label = annotation.get_labels()[0]
-                            label = scored_label.label
-                            if combined_mask is None:
-                                combined_mask = np.where(annotation.shape.numpy > 0, labels_map[label], 0)
-                            else:
-                                combined_mask += np.where(annotation.shape.numpy > 0, labels_map[label], 0)
-                    combined_mask = np.expand_dims(combined_mask, axis=2)
-                    return combined_mask
-
-                hard_predictions.append(combine_masks(prediction_item.get_annotations()))
-                hard_references.append(combine_masks(reference_item.get_annotations()))
-
-        all_intersection, all_cardinality = get_intersections_and_cardinalities(
-            hard_references, hard_predictions, labels
+
+        # Only the cached masks or the annotations and the sizes are sent to the workers,
+        # and the masks are rasterized and reduced chunk by chunk
+        mask_sources = (
+            (_get_mask_source(prediction_item, labels), _get_mask_source(reference_item, labels))
+            for prediction_item, reference_item in zip(resultset.prediction_dataset, resultset.ground_truth_dataset)
         )
+        intersections = np.zeros(len(labels) + 1, dtype=np.int64)
+        cardinalities = np.zeros(len(labels) + 1, dtype=np.int64)
+        for chunk_intersections, chunk_cardinalities, rasterized_masks in map_chunks(
+            _get_intersections_and_cardinalities_of_chunk,
+            iterate_in_chunks(mask_sources),
+            num_workers,
+            labels=labels,
+        ):
+            intersections += chunk_intersections
+            cardinalities += chunk_cardinalities
+            for key, mask in rasterized_masks:
+                MASK_CACHE.put(key, mask)
+
+        all_intersection: NumberPerLabel = {None: int(intersections[0])}
+        all_cardinality: NumberPerLabel = {None: int(cardinalities[0])}
+        for i, label in enumerate(labels):
+            all_intersection[label] = int(intersections[i + 1])
+            all_cardinality[label] = int(cardinalities[i + 1])
 
         return cls.compute_dice_using_intersection_and_cardinality(all_intersection, all_cardinality, average)
 
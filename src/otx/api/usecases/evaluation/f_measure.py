@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Sized, Tuple
 from otx.utils.logger import get_logger
 
 import numpy as np
@@ -27,6 +27,7 @@ from otx.api.entities.metrics import (
 )
 from otx.api.entities.resultset import ResultSetEntity
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.usecases.evaluation.basic_operations import iterate_in_chunks, map_chunks
 from otx.api.usecases.evaluation.performance_provider_interface import (
     IPerformanceProvider,
 )
@@ -89,6 +90,49 @@ def bounding_box_intersection_over_union(
     return iou
 
 
+def _get_iou_matrix(ground_truth: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+    """Vectorized version of bounding_box_intersection_over_union for all pairs of boxes.
+
+    It gives exactly the same values as bounding_box_intersection_over_union.
+
+    Args:
+        ground_truth (np.ndarray): Ground truth boxes in shape (N, 4) in (x1, y1, x2, y2) format.
+        predicted (np.ndarray): Predicted boxes in shape (M, 4) in (x1, y1, x2, y2) format.
+
+    Raises:
+        ValueError: In case the IoU is outside of [0.0, 1.0]
+
+    Returns:
+        np.ndarray: IoU matrix of shape [ground_truth_boxes, predicted_boxes]
+    """
+    x_left = np.maximum(ground_truth[:, None, 0], predicted[None, :, 0])
+    y_top = np.maximum(ground_truth[:, None, 1], predicted[None, :, 1])
+    x_right = np.minimum(ground_truth[:, None, 2], predicted[None, :, 2])
+    y_bottom = np.minimum(ground_truth[:, None, 3], predicted[None, :, 3])
+
+    intersection_area = (x_right - x_left) * (y_bottom - y_top)
+    bb1_area = (ground_truth[:, 2] - ground_truth[:, 0]) * (ground_truth[:, 3] - ground_truth[:, 1])
+    bb2_area = (predicted[:, 2] - predicted[:, 0]) * (predicted[:, 3] - predicted[:, 1])
+    union_area = bb1_area[:, None] + bb2_area[None, :] - intersection_area
+    is_valid = (x_right > x_left) & (y_bottom > y_top) & (union_area != 0)
+    iou = np.divide(intersection_area, union_area, out=np.zeros_like(intersection_area), where=is_valid)
+    if np.any((iou < 0.0) | (iou > 1.0)):
+        raise ValueError(
+            f"intersection over union should be in range [0,1], actual={iou[(iou < 0.0) | (iou > 1.0)][0]}"
+        )
+    return iou
+
+
+def _get_boxes_as_arrays(
+    boxes: List[Tuple[float, float, float, float, str, float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split boxes into arrays of coordinates in shape (N, 4), class names in shape (N, ) and scores in shape (N, )."""
+    coordinates = np.array([box[:4] for box in boxes], dtype=float).reshape(-1, 4)
+    class_names = np.array([box[4] for box in boxes], dtype=object)
+    scores = np.array([float(box[5]) for box in boxes], dtype=float)  # type: ignore[arg-type]
+    return coordinates, class_names, scores
+
+
 def get_iou_matrix(
     ground_truth: List[Tuple[float, float, float, float, str, float]],
     predicted: List[Tuple[float, float, float, float, str, float]],
@@ -113,18 +157,18 @@ def get_iou_matrix(
     Returns:
         np.ndarray: IoU matrix of shape [ground_truth_boxes, predicted_boxes]
     """
-    matrix = np.array(
-        [[bounding_box_intersection_over_union(gts, preds) for preds in predicted] for gts in ground_truth]
+    return _get_iou_matrix(
+        np.array([box[:4] for box in ground_truth], dtype=float).reshape(-1, 4),
+        np.array([box[:4] for box in predicted], dtype=float).reshape(-1, 4),
     )
-    return matrix
 
 
 def get_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
     """Get the number of false negatives inside the IoU matrix for a given threshold.
 
-    The first loop accounts for all the ground truth boxes which do not have a high enough iou with any predicted
+    The first term accounts for all the ground truth boxes which do not have a high enough iou with any predicted
     box (they go undetected)
-    The second loop accounts for the much rarer case where two ground truth boxes are detected by the same predicted
+    The second term accounts for the much rarer case where two ground truth boxes are detected by the same predicted
     box. The principle is that each ground truth box requires a unique prediction box
 
     Args:
@@ -134,14 +178,9 @@ def get_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
     Returns:
         int: Number of false negatives
     """
-    n_false_negatives = 0
-    for row in iou_matrix:
-        if max(row) < iou_threshold:
-            n_false_negatives += 1
-    for column in np.rot90(iou_matrix):
-        indices = np.where(column > iou_threshold)
-        n_false_negatives += max(len(indices[0]) - 1, 0)
-    return n_false_negatives
+    n_undetected = np.count_nonzero(iou_matrix.max(axis=1) < iou_threshold)
+    n_duplicated = np.maximum(np.count_nonzero(iou_matrix > iou_threshold, axis=0) - 1, 0).sum()
+    return int(n_undetected + n_duplicated)
 
 
 class _Metrics:
@@ -244,6 +283,98 @@ class _OverallResults:
         self.best_f_measure = best_f_measure
 
 
+class _ClassStatistics:
+    """This class collects per-box statistics of a class, which are sufficient to count the results at any threshold.
+
+    A predicted box is counted at a threshold if its key is higher than the threshold,
+    e.g. the key is the confidence score when varying the confidence threshold.
+    Then, a ground truth box is detected if the highest key among the predicted boxes matching it is counted,
+    and a counted predicted box matching several ground truth boxes adds the extra matches to the false negatives.
+
+    Args:
+        n_true (int): Number of ground truth boxes.
+        gt_hit_keys (np.ndarray): Highest key among the predicted boxes matching each ground truth box.
+        pred_keys (np.ndarray): Key of each predicted box.
+        pred_duplicates (np.ndarray): Number of extra ground truth boxes matched by each predicted box.
+    """
+
+    def __init__(self, n_true: int, gt_hit_keys: np.ndarray, pred_keys: np.ndarray, pred_duplicates: np.ndarray):
+        self.n_true = n_true
+        self.gt_hit_keys = gt_hit_keys
+        self.pred_keys = pred_keys
+        self.pred_duplicates = pred_duplicates
+
+    def get_counters(self, thresholds: np.ndarray) -> np.ndarray:
+        """Returns the counters of the boxes whose key is higher than each threshold in one sweep.
+
+        Args:
+            thresholds (np.ndarray): Thresholds to count the results at.
+
+        Returns:
+            np.ndarray: Number of false negatives, true boxes and predicted boxes for each threshold
+                in shape (len(thresholds), 3). The counters of disjoint sets of images add up.
+        """
+        order = np.argsort(self.pred_keys, kind="stable")
+        sorted_keys = self.pred_keys[order]
+        cumulative_duplicates = np.concatenate([[0], np.cumsum(self.pred_duplicates[order])])
+
+        n_undetected = np.sort(self.gt_hit_keys).searchsorted(thresholds, side="right")
+        n_filtered = sorted_keys.searchsorted(thresholds, side="right")
+        n_duplicated = cumulative_duplicates[-1] - cumulative_duplicates[n_filtered]
+        n_predicted = len(sorted_keys) - n_filtered
+        return np.stack(
+            [n_undetected + n_duplicated, np.full(len(thresholds), self.n_true), n_predicted], axis=1
+        ).astype(np.int64)
+
+
+def _get_counters_of_chunk(
+    chunk: List[
+        Tuple[List[Tuple[float, float, float, float, str, float]], List[Tuple[float, float, float, float, str, float]]]
+    ],
+    classes: List[str],
+    confidence_range: List[float],
+    nms_range: Optional[List[float]],
+    iou_threshold: float,
+    cross_class_nms: bool,
+) -> Tuple[Dict[str, np.ndarray], Optional[Dict[str, np.ndarray]]]:
+    """Returns the counters of a chunk of images for each confidence threshold and each nms threshold.
+
+    Args:
+        chunk (List[Tuple[List[Tuple[float, float, float, float, str, float]], ...]]): Ground truth boxes and
+            predicted boxes of each image.
+        classes (List[str]): Names of classes to be evaluated.
+        confidence_range (List[float]): Range of confidence thresholds.
+        nms_range (Optional[List[float]]): Range of nms thresholds. If None, the counters per nms are not computed.
+        iou_threshold (float): IoU threshold.
+        cross_class_nms (bool): Whether to use cross class NMS.
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], Optional[Dict[str, np.ndarray]]]: Counters per confidence and per nms.
+    """
+    calculator = _FMeasureCalculator(
+        [ground_truth_boxes for ground_truth_boxes, _ in chunk],
+        [predicted_boxes for _, predicted_boxes in chunk],
+    )
+    counters_per_confidence = calculator.get_counters_per_confidence(classes, confidence_range, iou_threshold)
+    counters_per_nms = None
+    if nms_range is not None:
+        calculator.nms_range = nms_range
+        counters_per_nms = calculator.get_counters_per_nms(classes, iou_threshold, cross_class_nms)
+    return counters_per_confidence, counters_per_nms
+
+
+def _sum_counters(
+    counters_per_class: Optional[Dict[str, np.ndarray]], other_counters_per_class: Optional[Dict[str, np.ndarray]]
+) -> Optional[Dict[str, np.ndarray]]:
+    """Sums up the counters of each class computed on disjoint sets of images."""
+    if counters_per_class is None or other_counters_per_class is None:
+        return other_counters_per_class if counters_per_class is None else counters_per_class
+    return {
+        class_name: counters + other_counters_per_class[class_name]
+        for class_name, counters in counters_per_class.items()
+    }
+
+
 class _FMeasureCalculator:
     """This class contains the functions to calculate FMeasure.
 
@@ -256,15 +387,20 @@ class _FMeasureCalculator:
                 a box: [x1: float, y1, x2, y2, class: str, score: float]
                 boxes_per_image: [box1, box2, …]
                 predicted_boxes_per_image: [boxes_per_image_1, boxes_per_image_2, boxes_per_image_3, …]
+
+    The boxes per image can also be iterators building the boxes image by image, then they are consumed
+    chunk by chunk by evaluate_detections, which can be called only once.
     """
 
     def __init__(
         self,
-        ground_truth_boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]],
-        prediction_boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]],
+        ground_truth_boxes_per_image: Iterable[List[Tuple[float, float, float, float, str, float]]],
+        prediction_boxes_per_image: Iterable[List[Tuple[float, float, float, float, str, float]]],
     ):
         self.ground_truth_boxes_per_image = ground_truth_boxes_per_image
         self.prediction_boxes_per_image = prediction_boxes_per_image
+        # the images of iterators are counted while evaluate_detections consumes them
+        self._num_images = len(ground_truth_boxes_per_image) if isinstance(ground_truth_boxes_per_image, Sized) else 0
         self.confidence_range = [0.025, 1.0, 0.025]
         self.nms_range = [0.1, 1, 0.05]
         self.default_confidence_threshold = 0.35
@@ -275,6 +411,7 @@ class _FMeasureCalculator:
         iou_threshold: float = 0.5,
         result_based_nms_threshold: bool = False,
         cross_class_nms: bool = False,
+        num_workers: int = 0,
     ) -> _OverallResults:
         """Evaluates detections by computing f_measures across multiple confidence thresholds and iou thresholds.
 
@@ -291,6 +428,8 @@ class _FMeasureCalculator:
             result_based_nms_threshold (bool): Boolean that determines whether multiple nms threshold are examined.
                 Defaults to False.
             cross_class_nms (bool): Set to True to perform NMS between boxes with different classes. Defaults to False.
+            num_workers (int): Number of worker processes counting the results of chunks of images.
+                If it is 0, the chunks are counted in the current process. Defaults to 0.
 
         Returns:
             _OverallResults: _OverallResults object with the result statistics (e.g F-measure).
@@ -298,10 +437,14 @@ class _FMeasureCalculator:
 
         best_f_measure_per_class = {}
 
+        counters_per_confidence, counters_per_nms = self.__get_counters_in_chunks(
+            classes, iou_threshold, result_based_nms_threshold, cross_class_nms, num_workers
+        )
         results_per_confidence = self.get_results_per_confidence(
             classes=classes,
             confidence_range=self.confidence_range,
             iou_threshold=iou_threshold,
+            counters_per_class=counters_per_confidence,
         )
 
         best_f_measure = results_per_confidence.best_f_measure
@@ -317,6 +460,7 @@ class _FMeasureCalculator:
                 iou_threshold=iou_threshold,
                 min_f_measure=results_per_confidence.best_f_measure,
                 cross_class_nms=cross_class_nms,
+                counters_per_class=counters_per_nms,
             )
 
             for class_name in classes:
@@ -331,8 +475,64 @@ class _FMeasureCalculator:
 
         return result
 
-    def get_results_per_confidence(
+    def get_counters_per_confidence(
         self, classes: List[str], confidence_range: List[float], iou_threshold: float
+    ) -> Dict[str, np.ndarray]:
+        """Returns the counters of each class for confidence threshold in range confidence_range.
+
+        Args:
+            classes (List[str]): Names of classes to be evaluated.
+            confidence_range (List[float]): List of confidence thresholds to be evaluated.
+            iou_threshold (float): IoU threshold to use for false negatives.
+
+        Returns:
+            Dict[str, np.ndarray]: Counters of each class in shape (number of thresholds, 3).
+        """
+        confidence_thresholds = np.arange(*confidence_range)
+        ground_truth_arrays, prediction_arrays = self.__get_boxes_per_image_as_arrays()
+        return {
+            class_name: self.__get_class_statistics(
+                ground_truth_arrays, prediction_arrays, class_name, iou_threshold
+            ).get_counters(confidence_thresholds)
+            for class_name in classes
+            if class_name != ALL_CLASSES_NAME
+        }
+
+    def get_counters_per_nms(
+        self, classes: List[str], iou_threshold: float, cross_class_nms: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Returns the counters of each class for nms threshold in range nms_range.
+
+        First, we calculate the critical nms of each box, meaning the nms_threshold
+        that would cause it to be disappear. A box is kept if its critical nms is lower than the nms threshold,
+        so that the negated critical nms is used as the key to be higher than the negated nms threshold.
+
+        Args:
+            classes (List[str]): List of classes
+            iou_threshold (float): IoU threshold
+            cross_class_nms (bool): set to True to perform NMS between boxes with different classes. Defaults to False.
+
+        Returns:
+            Dict[str, np.ndarray]: Counters of each class in shape (number of thresholds, 3).
+        """
+        critical_nms_per_image = self.__get_critical_nms(self.prediction_boxes_per_image, cross_class_nms)
+
+        nms_thresholds = np.arange(*self.nms_range)
+        ground_truth_arrays, prediction_arrays = self.__get_boxes_per_image_as_arrays()
+        return {
+            class_name: self.__get_class_statistics(
+                ground_truth_arrays, prediction_arrays, class_name, iou_threshold, critical_nms_per_image
+            ).get_counters(-nms_thresholds)
+            for class_name in classes
+            if class_name != ALL_CLASSES_NAME
+        }
+
+    def get_results_per_confidence(
+        self,
+        classes: List[str],
+        confidence_range: List[float],
+        iou_threshold: float,
+        counters_per_class: Optional[Dict[str, np.ndarray]] = None,
     ) -> _AggregatedResults:
         """Returns the results for confidence threshold in range confidence_range.
 
@@ -343,6 +543,8 @@ class _FMeasureCalculator:
             classes (List[str]): Names of classes to be evaluated.
             confidence_range (List[float]): List of confidence thresholds to be evaluated.
             iou_threshold (float): IoU threshold to use for false negatives.
+            counters_per_class (Optional[Dict[str, np.ndarray]]): Counters already computed by
+                get_counters_per_confidence, e.g. summed up over chunks of images. Defaults to None.
 
         Returns:
             _AggregatedResults: _AggregatedResults object with the result statistics (e.g F-measure).
@@ -350,23 +552,11 @@ class _FMeasureCalculator:
         result = _AggregatedResults(classes)
         result.best_threshold = 0.1
 
-        for confidence_threshold in np.arange(*confidence_range):
-            result_point = self.evaluate_classes(
-                classes=classes.copy(),
-                iou_threshold=iou_threshold,
-                confidence_threshold=confidence_threshold,
-            )
-            all_classes_f_measure = result_point[ALL_CLASSES_NAME].f_measure
-            result.all_classes_f_measure_curve.append(all_classes_f_measure)
+        confidence_thresholds = np.arange(*confidence_range)
+        if counters_per_class is None:
+            counters_per_class = self.get_counters_per_confidence(classes, confidence_range, iou_threshold)
 
-            for class_name in classes:
-                result.f_measure_curve[class_name].append(result_point[class_name].f_measure)
-                result.precision_curve[class_name].append(result_point[class_name].precision)
-                result.recall_curve[class_name].append(result_point[class_name].recall)
-            if all_classes_f_measure > 0.0 and all_classes_f_measure >= result.best_f_measure:
-                result.best_f_measure = all_classes_f_measure
-                result.best_threshold = confidence_threshold
-                result.best_f_measure_metrics = result_point[ALL_CLASSES_NAME]
+        self.__aggregate_counters(result, classes, confidence_thresholds, counters_per_class)
         return result
 
     def get_results_per_nms(
@@ -375,6 +565,7 @@ class _FMeasureCalculator:
         iou_threshold: float,
         min_f_measure: float,
         cross_class_nms: bool = False,
+        counters_per_class: Optional[Dict[str, np.ndarray]] = None,
     ) -> _AggregatedResults:
         """Returns results for nms threshold in range nms_range.
 
@@ -388,6 +579,8 @@ class _FMeasureCalculator:
             iou_threshold (float): IoU threshold
             min_f_measure (float): the minimum F-measure required to select a NMS threshold
             cross_class_nms (bool): set to True to perform NMS between boxes with different classes. Defaults to False.
+            counters_per_class (Optional[Dict[str, np.ndarray]]): Counters already computed by
+                get_counters_per_nms, e.g. summed up over chunks of images. Defaults to None.
 
         Returns:
             _AggregatedResults: Object containing the results for each NMS threshold value
@@ -396,32 +589,11 @@ class _FMeasureCalculator:
         result.best_f_measure = min_f_measure
         result.best_threshold = 0.5
 
-        critical_nms_per_image = self.__get_critical_nms(self.prediction_boxes_per_image, cross_class_nms)
-
-        for nms_threshold in np.arange(*self.nms_range):
-            predicted_boxes_per_image_per_nms = self.__filter_nms(
-                self.prediction_boxes_per_image, critical_nms_per_image, nms_threshold
-            )
-            boxes_pair_for_nms = _FMeasureCalculator(
-                self.ground_truth_boxes_per_image, predicted_boxes_per_image_per_nms
-            )
-            result_point = boxes_pair_for_nms.evaluate_classes(
-                classes=classes.copy(),
-                iou_threshold=iou_threshold,
-                confidence_threshold=self.default_confidence_threshold,
-            )
-            all_classes_f_measure = result_point[ALL_CLASSES_NAME].f_measure
-            result.all_classes_f_measure_curve.append(all_classes_f_measure)
-
-            for class_name in classes:
-                result.f_measure_curve[class_name].append(result_point[class_name].f_measure)
-                result.precision_curve[class_name].append(result_point[class_name].precision)
-                result.recall_curve[class_name].append(result_point[class_name].recall)
+        nms_thresholds = np.arange(*self.nms_range)
+        if counters_per_class is None:
+            counters_per_class = self.get_counters_per_nms(classes, iou_threshold, cross_class_nms)
 
-            if all_classes_f_measure > 0.0 and all_classes_f_measure >= result.best_f_measure:
-                result.best_f_measure = all_classes_f_measure
-                result.best_threshold = nms_threshold
-                result.best_f_measure_metrics = result_point[ALL_CLASSES_NAME]
+        self.__aggregate_counters(result, classes, nms_thresholds, counters_per_class)
         return result
 
     def evaluate_classes(
@@ -495,9 +667,189 @@ class _FMeasureCalculator:
             results = (_Metrics(0.0, 0.0, 0.0), _ResultCounters(0, 0, 0))
         return results
 
+    def __aggregate_counters(
+        self,
+        result: _AggregatedResults,
+        classes: List[str],
+        thresholds: np.ndarray,
+        counters_per_class: Dict[str, np.ndarray],
+    ) -> None:
+        """Appends the metrics at each threshold to the result and updates the best threshold.
+
+        Args:
+            result (_AggregatedResults): Results to append the metrics to.
+            classes (List[str]): Names of classes to be evaluated.
+            thresholds (np.ndarray): Thresholds at which the counters are computed.
+            counters_per_class (Dict[str, np.ndarray]): Counters of each class in shape (len(thresholds), 3).
+        """
+        for i, threshold in enumerate(thresholds):
+            result_point = self.__evaluate_counters(
+                {name: _ResultCounters(*counters[i].tolist()) for name, counters in counters_per_class.items()}
+            )
+            all_classes_f_measure = result_point[ALL_CLASSES_NAME].f_measure
+            result.all_classes_f_measure_curve.append(all_classes_f_measure)
+
+            for class_name in classes:
+                result.f_measure_curve[class_name].append(result_point[class_name].f_measure)
+                result.precision_curve[class_name].append(result_point[class_name].precision)
+                result.recall_curve[class_name].append(result_point[class_name].recall)
+
+            if all_classes_f_measure > 0.0 and all_classes_f_measure >= result.best_f_measure:
+                result.best_f_measure = all_classes_f_measure
+                result.best_threshold = threshold
+                result.best_f_measure_metrics = result_point[ALL_CLASSES_NAME]
+
+    def __get_counters_in_chunks(
+        self,
+        classes: List[str],
+        iou_threshold: float,
+        result_based_nms_threshold: bool,
+        cross_class_nms: bool,
+        num_workers: int,
+    ) -> Tuple[Dict[str, np.ndarray], Optional[Dict[str, np.ndarray]]]:
+        """Counts the results per confidence and per nms of chunks of images and sums them up.
+
+        Args:
+            classes (List[str]): Names of classes to be evaluated.
+            iou_threshold (float): IoU threshold.
+            result_based_nms_threshold (bool): Whether the counters per nms are computed.
+            cross_class_nms (bool): Whether to use cross class NMS.
+            num_workers (int): Number of worker processes. If it is 0, the chunks are counted in the current process.
+
+        Returns:
+            Tuple[Dict[str, np.ndarray], Optional[Dict[str, np.ndarray]]]: Counters per confidence and per nms.
+        """
+        counters_per_confidence: Optional[Dict[str, np.ndarray]] = None
+        counters_per_nms: Optional[Dict[str, np.ndarray]] = None
+        for chunk_counters_per_confidence, chunk_counters_per_nms in map_chunks(
+            _get_counters_of_chunk,
+            self.__count_images(
+                iterate_in_chunks(zip(self.ground_truth_boxes_per_image, self.prediction_boxes_per_image))
+            ),
+            num_workers,
+            classes=classes,
+            confidence_range=self.confidence_range,
+            nms_range=self.nms_range if result_based_nms_threshold else None,
+            iou_threshold=iou_threshold,
+            cross_class_nms=cross_class_nms,
+        ):
+            counters_per_confidence = _sum_counters(counters_per_confidence, chunk_counters_per_confidence)
+            counters_per_nms = _sum_counters(counters_per_nms, chunk_counters_per_nms)
+
+        if counters_per_confidence is None:
+            # There is no image, so that the counters are computed on the empty lists of boxes
+            counters_per_confidence, counters_per_nms = _get_counters_of_chunk(
+                [],
+                classes,
+                self.confidence_range,
+                self.nms_range if result_based_nms_threshold else None,
+                iou_threshold,
+                cross_class_nms,
+            )
+        return counters_per_confidence, counters_per_nms
+
+    def __count_images(self, chunks: Iterator[List]) -> Iterator[List]:
+        """Counts the images of the chunks while they are consumed, if the boxes are given by iterators."""
+        is_sized = isinstance(self.ground_truth_boxes_per_image, Sized)
+        for chunk in chunks:
+            if not is_sized:
+                self._num_images += len(chunk)
+            yield chunk
+
+    def __get_class_statistics(
+        self,
+        ground_truth_arrays: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        prediction_arrays: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        class_name: str,
+        iou_threshold: float,
+        critical_nms_per_image: Optional[List[List[float]]] = None,
+    ) -> _ClassStatistics:
+        """Computes the IoU matrix of each image once and collects the statistics of a class.
+
+        Args:
+            ground_truth_arrays (List[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Ground truth boxes of each image
+                as arrays of coordinates, lowercase class names and scores.
+            prediction_arrays (List[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Predicted boxes of each image
+                as arrays of coordinates, lowercase class names and scores.
+            class_name (str): Name of the class for which the statistics are collected
+            iou_threshold (float): IoU threshold
+            critical_nms_per_image (Optional[List[List[float]]]): If given, the predicted boxes whose confidence
+                is higher than the default confidence threshold are keyed by their negated critical nms.
+                Otherwise, all predicted boxes are keyed by their confidence.
+
+        Returns:
+            _ClassStatistics: Statistics of the class
+        """
+        n_true = 0
+        gt_hit_keys, pred_keys, pred_duplicates = [], [], []
+        for i, ((gt_coordinates, gt_class_names, _), (coordinates, class_names, scores)) in enumerate(
+            zip(ground_truth_arrays, prediction_arrays)
+        ):
+            gt_coordinates = gt_coordinates[gt_class_names == class_name.lower()]
+            is_class = class_names == class_name.lower()
+            if critical_nms_per_image is None:
+                keys = scores[is_class]
+            else:
+                is_class &= scores > self.default_confidence_threshold
+                keys = -np.array(critical_nms_per_image[i], dtype=float).reshape(-1)[is_class]
+
+            iou_matrix = _get_iou_matrix(gt_coordinates, coordinates[is_class])
+            n_true += len(gt_coordinates)
+            gt_hit_keys.append(np.where(iou_matrix >= iou_threshold, keys, -np.inf).max(axis=1, initial=-np.inf))
+            pred_keys.append(keys)
+            pred_duplicates.append(np.maximum(np.count_nonzero(iou_matrix > iou_threshold, axis=0) - 1, 0))
+
+        return _ClassStatistics(
+            n_true,
+            np.concatenate(gt_hit_keys) if gt_hit_keys else np.empty(0),
+            np.concatenate(pred_keys) if pred_keys else np.empty(0),
+            np.concatenate(pred_duplicates) if pred_duplicates else np.empty(0, dtype=int),
+        )
+
+    def __get_boxes_per_image_as_arrays(
+        self,
+    ) -> Tuple[List[Tuple[np.ndarray, np.ndarray, np.ndarray]], List[Tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+        """Returns the ground truth and predicted boxes of each image as arrays with lowercase class names."""
+        ground_truth_arrays: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        prediction_arrays: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        for ground_truth_boxes, predicted_boxes in zip(
+            self.ground_truth_boxes_per_image, self.prediction_boxes_per_image
+        ):
+            for boxes, arrays in ((ground_truth_boxes, ground_truth_arrays), (predicted_boxes, prediction_arrays)):
+                coordinates, class_names, scores = _get_boxes_as_arrays(boxes)
+                class_names = np.array([name.lower() for name in class_names], dtype=object)
+                arrays.append((coordinates, class_names, scores))
+        return ground_truth_arrays, prediction_arrays
+
+    def __evaluate_counters(self, counters_per_class: Dict[str, _ResultCounters]) -> Dict[str, _Metrics]:
+        """Returns Dict of f_measure, precision and recall for each class and all classes from the counters.
+
+        Args:
+            counters_per_class (Dict[str, _ResultCounters]): Counters for each class.
+
+        Returns:
+            Dict[str, _Metrics]: The metrics (e.g. F-measure) for each class.
+        """
+        result: Dict[str, _Metrics] = {}
+        all_classes_counters = _ResultCounters(0, 0, 0)
+        for class_name, counters in counters_per_class.items():
+            if self._num_images > 0:
+                result[class_name] = counters.calculate_f_measure()
+            else:
+                logger.warning("No ground truth images supplied for f-measure calculation.")
+                result[class_name] = _Metrics(0.0, 0.0, 0.0)
+                counters = _ResultCounters(0, 0, 0)
+            all_classes_counters.n_false_negatives += counters.n_false_negatives
+            all_classes_counters.n_true += counters.n_true
+            all_classes_counters.n_predicted += counters.n_predicted
+
+        # for all classes
+        result[ALL_CLASSES_NAME] = all_classes_counters.calculate_f_measure()
+        return result
+
     @staticmethod
     def __get_critical_nms(
-        boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]], cross_class_nms: bool = False
+        boxes_per_image: Iterable[List[Tuple[float, float, float, float, str, float]]], cross_class_nms: bool = False
     ) -> List[List[float]]:
         """Return list of critical NMS values for each box in each image.
 
@@ -508,7 +860,7 @@ class _FMeasureCalculator:
         other box of the same class and higher confidence score.
 
         Args:
-            boxes_per_image (List[List[Tuple[float, float, float, float, str, float]]]): List of predicted boxes per
+            boxes_per_image (Iterable[List[Tuple[float, float, float, float, str, float]]]): List of predicted boxes per
                 image.
                 a box: [x1: float, y1, x2, y2, class: str, score: float]
                 boxes_per_image: [box1, box2, …]
@@ -519,20 +871,14 @@ class _FMeasureCalculator:
         """
         critical_nms_per_image = []
         for boxes in boxes_per_image:
-            critical_nms_per_box = []
-            for box1 in boxes:
-                highest_losing_iou = 0.0
-                for box2 in boxes:
-                    iou = bounding_box_intersection_over_union(box1, box2)
-                    if (
-                        (cross_class_nms or box1[FMeasure.box_class_index] == box2[FMeasure.box_class_index])
-                        # TODO boxes Tuple should be refactored to dataclass.
-                        and box1[FMeasure.box_score_index] < box2[FMeasure.box_score_index]  # type: ignore[operator]
-                        and iou > highest_losing_iou
-                    ):
-                        highest_losing_iou = iou
-                critical_nms_per_box.append(highest_losing_iou)
-            critical_nms_per_image.append(critical_nms_per_box)
+            coordinates, class_names, scores = _get_boxes_as_arrays(boxes)
+            iou_matrix = _get_iou_matrix(coordinates, coordinates)
+            # TODO boxes Tuple should be refactored to dataclass.
+            is_losing = scores[:, None] < scores[None, :]
+            if not cross_class_nms:
+                is_losing &= class_names[:, None] == class_names[None, :]
+            critical_nms_per_box = np.where(is_losing, iou_matrix, 0.0).max(axis=1, initial=0.0)
+            critical_nms_per_image.append(critical_nms_per_box.tolist())
         return critical_nms_per_image
 
     @staticmethod
@@ -564,12 +910,12 @@ class _FMeasureCalculator:
 
     @staticmethod
     def __filter_class(
-        boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]], class_name: str
+        boxes_per_image: Iterable[List[Tuple[float, float, float, float, str, float]]], class_name: str
     ) -> List[List[Tuple[float, float, float, float, str, float]]]:
         """Filters boxes to only keep members of one class.
 
         Args:
-            boxes_per_image (List[List[Tuple[float, float, float, float, str, float]]]): a list of lists of boxes
+            boxes_per_image (Iterable[List[Tuple[float, float, float, float, str, float]]]): a list of lists of boxes
             class_name (str): Name of the class for which the boxes are filtered
 
         Returns:
@@ -587,12 +933,12 @@ class _FMeasureCalculator:
 
     @staticmethod
     def __filter_confidence(
-        boxes_per_image: List[List[Tuple[float, float, float, float, str, float]]], confidence_threshold: float
+        boxes_per_image: Iterable[List[Tuple[float, float, float, float, str, float]]], confidence_threshold: float
     ) -> List[List[Tuple[float, float, float, float, str, float]]]:
         """Filters boxes to only keep ones with higher confidence than a given confidence threshold.
 
         Args:
-            boxes_per_image (List[List[Tuple[float, float, float, float, str, float]]]):
+            boxes_per_image (Iterable[List[Tuple[float, float, float, float, str, float]]]):
                 a box: [x1: float, y1, x2, y2, class: str, score: float]
                 boxes_per_image: [box1, box2, …]
             confidence_threshold (float): Confidence threshold
@@ -661,6 +1007,9 @@ class FMeasure(IPerformanceProvider):
             values. Defaults to False.
         cross_class_nms (bool): Whether non-max suppression should be applied cross-class. If True this will eliminate
             boxes with sufficient overlap even if they are from different classes. Defaults to False.
+        num_workers (int): Number of worker processes matching the boxes. The images are sent to the workers in chunks
+            whose result counters are summed up, so that only the counters are kept for the whole result set.
+            If it is 0, the chunks are processed in the current process. Defaults to 0.
 
     Raises:
         ValueError: if prediction dataset and ground truth dataset are empty
@@ -672,6 +1021,7 @@ class FMeasure(IPerformanceProvider):
         vary_confidence_threshold: bool = False,
         vary_nms_threshold: bool = False,
         cross_class_nms: bool = False,
+        num_workers: int = 0,
     ):
 
         ground_truth_dataset: DatasetEntity = resultset.ground_truth_dataset
@@ -682,15 +1032,23 @@ class FMeasure(IPerformanceProvider):
 
         labels = resultset.model.configuration.get_label_schema().get_labels(include_empty=False)
         classes = [label.name for label in labels]
+        # the boxes are built while the chunks of images are counted, not for the whole result set at once
+        converted_types_to_box: Set[str] = set()
         boxes_pair = _FMeasureCalculator(
-            FMeasure.__get_boxes_from_dataset_as_list(ground_truth_dataset, labels),
-            FMeasure.__get_boxes_from_dataset_as_list(prediction_dataset, labels),
+            FMeasure.__iterate_boxes_from_dataset(ground_truth_dataset, labels, converted_types_to_box),
+            FMeasure.__iterate_boxes_from_dataset(prediction_dataset, labels, converted_types_to_box),
         )
         result = boxes_pair.evaluate_detections(
             result_based_nms_threshold=vary_nms_threshold,
             classes=classes,
             cross_class_nms=cross_class_nms,
+            num_workers=num_workers,
         )
+        if len(converted_types_to_box) > 0:
+            logger.warning(
+                f"The shapes of types {tuple(converted_types_to_box)} have been converted to their "
+                f"full enclosing Box representation in order to compute the f-measure"
+            )
         self._f_measure = ScoreMetric(name="f-measure", value=result.best_f_measure)
         self._f_measure_per_label: Dict[LabelEntity, ScoreMetric] = {}
         for label in labels:
@@ -825,25 +1183,23 @@ class FMeasure(IPerformanceProvider):
         )
 
     @staticmethod
-    def __get_boxes_from_dataset_as_list(
-        dataset: DatasetEntity, labels: List[LabelEntity]
-    ) -> List[List[Tuple[float, float, float, float, str, float]]]:
-        """Return list of boxes from dataset.
+    def __iterate_boxes_from_dataset(
+        dataset: DatasetEntity, labels: List[LabelEntity], converted_types_to_box: Set[str]
+    ) -> Iterator[List[Tuple[float, float, float, float, str, float]]]:
+        """Yield the boxes of each image of the dataset.
 
         Explanation of output shape:
             a box: [x1: float, y1, x2, y2, class: str, score: float]
             boxes_per_image: [box1, box2, …]
-            ground_truth_boxes_per_image: [boxes_per_image_1, boxes_per_image_2, boxes_per_image_3, …]
 
         Args:
             dataset (DatasetEntity): Dataset to get boxes from.
             labels (List[LabelEntity]): Labels to get boxes for.
+            converted_types_to_box (Set[str]): Names of the shape types which are converted to boxes are added to it.
 
         Returns:
-            List[List[Tuple[float, float, float, float, str, float]]]: List of boxes for each image in the dataset.
+            Iterator[List[Tuple[float, float, float, float, str, float]]]: Boxes of each image in the dataset.
         """
-        boxes_per_image = []
-        converted_types_to_box = set()
         label_names = {label.name for label in labels}
         for item in dataset:
             boxes: List[Tuple[float, float, float, float, str, float]] = []
@@ -861,11 +1217,4 @@ class FMeasure(IPerformanceProvider):
                 )
                 if not isinstance(annotation.shape, Rectangle) and len(boxes) > n_boxes_before:
                     converted_types_to_box.add(annotation.shape.__class__.__name__)
-            boxes_per_image.append(boxes)
-        if len(converted_types_to_box) > 0:
-            logger.warning(
-                f"The shapes of types {tuple(converted_types_to_box)} have been converted to their "
-                f"full enclosing Box representation in order to compute the f-measure"
-            )
-
-        return boxes_per_image
+            yield boxes
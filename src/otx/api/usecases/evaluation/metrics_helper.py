@@ -31,6 +31,7 @@ class MetricsHelper:
         vary_confidence_threshold: bool = False,
         vary_nms_threshold: bool = False,
         cross_class_nms: bool = False,
+        num_workers: int = 0,
     ) -> FMeasure:
         """Compute the F-Measure on a resultset given some parameters.
 
@@ -43,43 +44,54 @@ class MetricsHelper:
                 be computed for different NMS threshold values
             cross_class_nms: Whether non-max suppression should be
                 applied cross-class
+            num_workers: The number of worker processes evaluating
+                chunks of the resultset. If it is 0, the chunks are
+                evaluated in the current process
 
         Returns:
             FMeasure object
         """
-        return FMeasure(resultset, vary_confidence_threshold, vary_nms_threshold, cross_class_nms)
+        return FMeasure(resultset, vary_confidence_threshold, vary_nms_threshold, cross_class_nms, num_workers)
 
     @staticmethod
     def compute_dice_averaged_over_pixels(
         resultset: ResultSetEntity,
         average: MetricAverageMethod = MetricAverageMethod.MACRO,
+        num_workers: int = 0,
     ) -> DiceAverage:
         """Compute the Dice average on a resultset, averaged over the pixels.
 
         Args:
             resultset: The resultset used to compute the Dice average
             average: The averaging method, either MICRO or MACRO
+            num_workers: The number of worker processes evaluating
+                chunks of the resultset. If it is 0, the chunks are
+                evaluated in the current process
 
         Returns:
             DiceAverage object
         """
-        return DiceAverage(resultset=resultset, average=average)
+        return DiceAverage(resultset=resultset, average=average, num_workers=num_workers)
 
     @staticmethod
     def compute_accuracy(
         resultset: ResultSetEntity,
         average: MetricAverageMethod = MetricAverageMethod.MICRO,
+        num_workers: int = 0,
     ) -> Accuracy:
         """Compute the Accuracy on a resultset, averaged over the different label groups.
 
         Args:
             resultset: The resultset used to compute the accuracy
             average: The averaging method, either MICRO or MACRO
+            num_workers: The number of worker processes evaluating
+                chunks of the resultset. If it is 0, the chunks are
+                evaluated in the current process
 
         Returns:
             Accuracy object
         """
-        return Accuracy(resultset=resultset, average=average)
+        return Accuracy(resultset=resultset, average=average, num_workers=num_workers)
 
     @staticmethod
     def compute_anomaly_segmentation_scores(
@@ -0,0 +1,75 @@
+"""This module implements a least recently used cache limited by the number of bytes of the cached values."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+def _get_nbytes(value: Any) -> int:
+    return value.nbytes
+
+
+class LRUCache(Generic[KT, VT]):
+    """Thread-safe least recently used cache limited by the number of bytes of the cached values.
+
+    Args:
+        max_bytes (int): Maximum number of bytes of the cached values. Defaults to 256 MiB.
+        get_nbytes (Callable[[VT], int]): Function returning the number of bytes of a value.
+            Defaults to the `nbytes` attribute of the value.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, get_nbytes: Callable[[VT], int] = _get_nbytes):
+        self.max_bytes = max_bytes
+        self._get_nbytes = get_nbytes
+        self._values: "OrderedDict[KT, Tuple[VT, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached values."""
+        return len(self._values)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes of the cached values."""
+        return self._nbytes
+
+    def get(self, key: KT) -> Optional[VT]:
+        """Returns the cached value of the key if exists."""
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            self._values.move_to_end(key)
+            return item[0]
+
+    def put(self, key: KT, value: VT) -> None:
+        """Caches the value and evicts the least recently used values if the cache is full.
+
+        Values larger than the cache are not cached.
+        """
+        nbytes = self._get_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._values.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            self._values[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._values.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    def clear(self) -> None:
+        """Removes all cached values."""
+        with self._lock:
+            self._values.clear()
+            self._nbytes = 0
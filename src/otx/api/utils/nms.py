@@ -1,45 +1,281 @@
 """NMS Module."""
 
-# Copyright (C) 2021-2022 Intel Corporation
+# Copyright (C) 2021-2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from typing import List, Tuple
+
+import cv2
 import numpy as np
 
+# Number of boxes resolved at once. Suppression inside a block is resolved with bitmasks
+# and the kept boxes of the block suppress the following boxes at once.
+NMS_BLOCK_SIZE = 128
+# Number of kept boxes whose candidate pairs are generated at once, which bounds the memory usage.
+NMS_PAIR_CHUNK_SIZE = 64
 
-def nms(boxes, scores, thresh):
-    """Adapted NMS implementation from OMZ: model_zoo/model_api/models/utils.py#L181."""
-    # pylint: disable=too-many-locals
 
-    x1, y1, x2, y2 = boxes.T
-    areas = (x2 - x1) * (y2 - y1)
+def box_iou(boxes1: np.ndarray, boxes2: np.ndarray, is_aligned: bool = False) -> np.ndarray:
+    """Compute IoU between two sets of axis-aligned boxes.
+
+    Args:
+        boxes1 (np.ndarray): boxes in shape (N, 4) in (x1, y1, x2, y2) format.
+        boxes2 (np.ndarray): boxes in shape (M, 4) in (x1, y1, x2, y2) format.
+        is_aligned (bool, optional): If True, N should be equal to M and IoU is computed
+            between the boxes of the same index. Defaults to False.
+
+    Returns:
+        np.ndarray: IoU matrix in shape (N, M), or IoU in shape (N, ) if is_aligned is True.
+            IoU is 0 if the union is empty.
+    """
+    if not is_aligned:
+        boxes1 = boxes1[:, None]
+    area1 = (boxes1[..., 2] - boxes1[..., 0]) * (boxes1[..., 3] - boxes1[..., 1])
+    area2 = (boxes2[..., 2] - boxes2[..., 0]) * (boxes2[..., 3] - boxes2[..., 1])
+
+    width = np.minimum(boxes1[..., 2], boxes2[..., 2]) - np.maximum(boxes1[..., 0], boxes2[..., 0])
+    height = np.minimum(boxes1[..., 3], boxes2[..., 3]) - np.maximum(boxes1[..., 1], boxes2[..., 1])
+    intersection = np.maximum(width, 0.0) * np.maximum(height, 0.0)
+    union = area1 + area2 - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection, dtype=float), where=union != 0)
+
+
+def rotated_box_iou(boxes1: np.ndarray, boxes2: np.ndarray, is_aligned: bool = False) -> np.ndarray:
+    """Compute IoU between two sets of rotated boxes.
+
+    The intersection is computed only for the pairs whose circumscribed circles overlap.
+
+    Args:
+        boxes1 (np.ndarray): boxes in shape (N, 5) in (cx, cy, w, h, angle) format. The angle is in radians.
+        boxes2 (np.ndarray): boxes in shape (M, 5) in (cx, cy, w, h, angle) format. The angle is in radians.
+        is_aligned (bool, optional): If True, N should be equal to M and IoU is computed
+            between the boxes of the same index. Defaults to False.
+
+    Returns:
+        np.ndarray: IoU matrix in shape (N, M), or IoU in shape (N, ) if is_aligned is True.
+    """
+    if not is_aligned:
+        index1, index2 = np.meshgrid(np.arange(len(boxes1)), np.arange(len(boxes2)), indexing="ij")
+        return rotated_box_iou(boxes1[index1.ravel()], boxes2[index2.ravel()], is_aligned=True).reshape(index1.shape)
+
+    ious = np.zeros(len(boxes1), dtype=float)
+    radius = np.hypot(boxes1[:, 2], boxes1[:, 3]) / 2 + np.hypot(boxes2[:, 2], boxes2[:, 3]) / 2
+    distance = np.hypot(boxes1[:, 0] - boxes2[:, 0], boxes1[:, 1] - boxes2[:, 1])
+    areas = boxes1[:, 2] * boxes1[:, 3] + boxes2[:, 2] * boxes2[:, 3]
+
+    for i in np.flatnonzero(distance < radius):
+        rect1 = ((boxes1[i, 0], boxes1[i, 1]), (boxes1[i, 2], boxes1[i, 3]), np.degrees(boxes1[i, 4]))
+        rect2 = ((boxes2[i, 0], boxes2[i, 1]), (boxes2[i, 2], boxes2[i, 3]), np.degrees(boxes2[i, 4]))
+        flag, points = cv2.rotatedRectangleIntersection(rect1, rect2)
+        if flag == cv2.INTERSECT_NONE or points is None:
+            continue
+        intersection = cv2.contourArea(cv2.convexHull(points))
+        union = areas[i] - intersection
+        if union > 0:
+            ious[i] = intersection / union
+    return ious
+
+
+def _get_extents(boxes: np.ndarray, rotated: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get (x_min, x_max, y_min, y_max) of the axis-aligned boxes enclosing the boxes."""
+    if rotated:
+        radius = np.hypot(boxes[:, 2], boxes[:, 3]) / 2
+        return boxes[:, 0] - radius, boxes[:, 0] + radius, boxes[:, 1] - radius, boxes[:, 1] + radius
+    return boxes[:, 0], boxes[:, 2], boxes[:, 1], boxes[:, 3]
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, thresh: float, max_num: int = -1, rotated: bool = False) -> np.ndarray:
+    """Greedy NMS computed on blocks of the IoU matrix.
+
+    Boxes are sorted by score and processed in blocks of ``NMS_BLOCK_SIZE``.
+    The suppression inside a block is resolved with packed bitmasks of its IoU matrix,
+    then the kept boxes of the block suppress all following boxes at once.
+    For the latter, IoU is only computed for the pairs whose enclosing boxes overlap,
+    which are found by binary search on the remaining boxes sorted by x-coordinate.
+    It gives the same result as the sequential greedy NMS, including the order of the boxes with tied scores.
+
+    Args:
+        boxes (np.ndarray): boxes in shape (N, 4) in (x1, y1, x2, y2) format
+            or in shape (N, 5) in (cx, cy, w, h, angle) format if rotated is True.
+        scores (np.ndarray): scores in shape (N, ).
+        thresh (float): IoU threshold. Boxes overlapping more than it with a higher scored box are suppressed.
+        max_num (int, optional): Stop once max_num boxes are kept if it is positive. Defaults to -1.
+        rotated (bool, optional): Whether the boxes are rotated. Defaults to False.
+
+    Returns:
+        np.ndarray: indices of kept boxes sorted by score in descending order.
+    """
+    # pylint: disable=too-many-locals
+    iou_fn = rotated_box_iou if rotated else box_iou
     order = scores.argsort()[::-1]
+    boxes = boxes[order]
+    num_boxes = len(boxes)
+    suppressed = np.zeros(num_boxes, dtype=bool)
+
+    x_min, x_max, y_min, y_max = _get_extents(boxes, rotated)
+    x_order = np.argsort(x_min, kind="stable")
 
     keep = []
-    while order.size > 0:
-        i = order[0]
-        keep.append(i)
+    num_kept = 0
+    for start in range(0, num_boxes, NMS_BLOCK_SIZE):
+        end = min(start + NMS_BLOCK_SIZE, num_boxes)
+        candidates = start + np.flatnonzero(~suppressed[start:end])
+        if len(candidates) == 0:
+            continue
+
+        # Bit j of masks[i] is set if the candidate i suppresses the candidate j
+        overlaps = np.triu(iou_fn(boxes[candidates], boxes[candidates]) > thresh, k=1)
+        masks = np.packbits(overlaps, axis=1)
+        removed = np.zeros(masks.shape[1], dtype=np.uint8)
+        block_keep = []
+        for i in range(len(candidates)):
+            if (removed[i >> 3] >> (7 - (i & 7))) & 1:
+                continue
+            block_keep.append(i)
+            removed |= masks[i]
+            if num_kept + len(block_keep) == max_num:
+                break
+
+        kept = candidates[block_keep]
+        keep.append(kept)
+        num_kept += len(kept)
+        if num_kept == max_num or end == num_boxes:
+            break
+
+        # Suppress the following boxes overlapping with the kept boxes of the block.
+        # Only the remaining boxes are kept in the x-sorted index, so that it gets smaller block by block.
+        x_order = x_order[x_order >= end]
+        x_order = x_order[~suppressed[x_order]]
+        if len(x_order) == 0:
+            break
+        sorted_x_min = x_min[x_order]
+        max_width = (x_max[x_order] - sorted_x_min).max()
+        lower = sorted_x_min.searchsorted(x_min[kept] - max_width, side="right")
+        upper = sorted_x_min.searchsorted(x_max[kept], side="left")
+        counts = np.maximum(upper - lower, 0)
+        for chunk in range(0, len(kept), NMS_PAIR_CHUNK_SIZE):
+            chunk_counts = counts[chunk : chunk + NMS_PAIR_CHUNK_SIZE]
+            offsets = np.arange(chunk_counts.sum()) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            rows = np.repeat(kept[chunk : chunk + NMS_PAIR_CHUNK_SIZE], chunk_counts)
+            cols = x_order[np.repeat(lower[chunk : chunk + NMS_PAIR_CHUNK_SIZE], chunk_counts) + offsets]
+            overlapped = (x_max[rows] > x_min[cols]) & (y_max[rows] > y_min[cols]) & (y_min[rows] < y_max[cols])
+            rows, cols = rows[overlapped], cols[overlapped]
+            suppressed[cols[iou_fn(boxes[rows], boxes[cols], is_aligned=True) > thresh]] = True
+
+    if not keep:
+        return np.empty((0,), dtype=np.int64)
+    return order[np.concatenate(keep)]
+
+
+def soft_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    thresh: float = 0.3,
+    sigma: float = 0.5,
+    method: str = "gaussian",
+    score_thresh: float = 0.001,
+    max_num: int = -1,
+    rotated: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Soft-NMS which decays the scores of overlapping boxes instead of suppressing them.
+
+    Args:
+        boxes (np.ndarray): boxes in shape (N, 4) in (x1, y1, x2, y2) format
+            or in shape (N, 5) in (cx, cy, w, h, angle) format if rotated is True.
+        scores (np.ndarray): scores in shape (N, ).
+        thresh (float, optional): IoU threshold for the linear method. Defaults to 0.3.
+        sigma (float, optional): Sigma for the gaussian method. Defaults to 0.5.
+        method (str, optional): Score decay method, "linear" or "gaussian". Defaults to "gaussian".
+        score_thresh (float, optional): Boxes whose decayed score is lower than it are removed. Defaults to 0.001.
+        max_num (int, optional): Stop once max_num boxes are kept if it is positive. Defaults to -1.
+        rotated (bool, optional): Whether the boxes are rotated. Defaults to False.
+
+    Returns:
+        tuple: (keep, scores), indices of kept boxes and their decayed scores sorted in descending order.
+    """
+    if method not in ("linear", "gaussian"):
+        raise ValueError(f"Unknown soft-NMS method: {method}")
+    iou_fn = rotated_box_iou if rotated else box_iou
+
+    indices = np.flatnonzero(scores >= score_thresh)
+    decayed = scores[indices].astype(float)
+    keep: List[int] = []
+    keep_scores: List[float] = []
+    while len(indices) > 0 and len(keep) != max_num:
+        top = np.argmax(decayed)
+        keep.append(indices[top])
+        keep_scores.append(decayed[top])
 
-        xx1 = np.maximum(x1[i], x1[order[1:]])
-        yy1 = np.maximum(y1[i], y1[order[1:]])
-        xx2 = np.minimum(x2[i], x2[order[1:]])
-        yy2 = np.minimum(y2[i], y2[order[1:]])
+        rest = np.arange(len(indices)) != top
+        indices, decayed = indices[rest], decayed[rest]
+        if len(indices) == 0:
+            break
+        ious = iou_fn(boxes[keep[-1:]], boxes[indices])[0]
+        if method == "linear":
+            decayed = np.where(ious > thresh, decayed * (1 - ious), decayed)
+        else:
+            decayed = decayed * np.exp(-(ious**2) / sigma)
 
-        width = np.maximum(0.0, xx2 - xx1)
-        height = np.maximum(0.0, yy2 - yy1)
-        intersection = width * height
+        valid = decayed >= score_thresh
+        indices, decayed = indices[valid], decayed[valid]
 
-        union = areas[i] + areas[order[1:]] - intersection
-        overlap = np.divide(
-            intersection,
-            union,
-            out=np.zeros_like(intersection, dtype=float),
-            where=union != 0,
-        )
+    return np.array(keep, dtype=np.int64), np.array(keep_scores, dtype=float)
 
-        order = order[np.where(overlap <= thresh)[0] + 1]
 
-    return keep
+def batched_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    idxs: np.ndarray,
+    iou_threshold: float,
+    max_num: int = -1,
+    rotated: bool = False,
+    soft: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """NMS applied independently per class.
+
+    Axis-aligned boxes of different classes are shifted by an offset which only depends on the class index,
+    so that they do not overlap and all classes can be processed by a single NMS.
+    Rotated boxes are processed class by class.
+
+    Args:
+        boxes (np.ndarray): boxes in shape (N, 4) in (x1, y1, x2, y2) format
+            or in shape (N, 5) in (cx, cy, w, h, angle) format if rotated is True.
+        scores (np.ndarray): scores in shape (N, ).
+        idxs (np.ndarray): class indices in shape (N, ). NMS is not applied between different indices.
+        iou_threshold (float): IoU threshold.
+        max_num (int, optional): Max number of kept boxes if it is positive. Defaults to -1.
+        rotated (bool, optional): Whether the boxes are rotated. Defaults to False.
+        soft (bool, optional): Whether to use linear Soft-NMS. Defaults to False.
+
+    Returns:
+        tuple: (keep, scores), indices of kept boxes and their scores sorted in descending order.
+    """
+    if len(boxes) == 0:
+        return np.empty((0,), dtype=np.int64), np.empty((0,), dtype=float)
+
+    def _nms(boxes, scores):
+        if soft:
+            return soft_nms(boxes, scores, thresh=iou_threshold, method="linear", max_num=max_num, rotated=rotated)
+        keep = nms(boxes, scores, iou_threshold, max_num=max_num, rotated=rotated)
+        return keep, scores[keep]
+
+    if not rotated:
+        max_coordinate = boxes.max()
+        offsets = idxs.astype(boxes.dtype) * (max_coordinate + 1)
+        return _nms(boxes + offsets[:, None], scores)
+
+    keep_list, score_list = [], []
+    for idx in np.unique(idxs):
+        cls_indices = np.flatnonzero(idxs == idx)
+        cls_keep, cls_scores = _nms(boxes[cls_indices], scores[cls_indices])
+        keep_list.append(cls_indices[cls_keep])
+        score_list.append(cls_scores)
+    keep, kept_scores = np.concatenate(keep_list), np.concatenate(score_list)
+    order = kept_scores.argsort()[::-1]
+    if max_num > 0:
+        order = order[:max_num]
+    return keep[order], kept_scores[order]
 
 
 def multiclass_nms(
@@ -65,12 +301,6 @@ def multiclass_nms(
     labels = detections[:, 0]
     scores = detections[:, 1]
     boxes = detections[:, 2:]
-    max_coordinate = boxes.max()
-    offsets = labels.astype(boxes.dtype) * (max_coordinate + 1)
-    boxes_for_nms = boxes + offsets[:, None]
-    keep = nms(boxes_for_nms, scores, iou_threshold)
-    if max_num > 0:
-        keep = keep[:max_num]
-    keep = np.array(keep)
+    keep, _ = batched_nms(boxes, scores, labels, iou_threshold, max_num=max_num)
     det = detections[keep]
     return det, keep
@@ -4,9 +4,11 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import hashlib
+import os
 import warnings
-from copy import copy
-from typing import List, Optional, Sequence, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, List, NamedTuple, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -17,10 +19,132 @@ from otx.api.entities.dataset_item import DatasetItemEntity
 from otx.api.entities.id import ID
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
 from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.lru_cache import LRUCache
 from otx.api.utils.shape_factory import ShapeFactory
 
 
+class RunLengthMask(NamedTuple):
+    """Run-length encoded mask.
+
+    The mask is flattened in C order and stored as runs of the same pixel value.
+
+    Attributes:
+        shape (Tuple[int, ...]): Shape of the mask
+        values (np.ndarray): Pixel value of each run
+        lengths (np.ndarray): Number of pixels of each run
+    """
+
+    shape: Tuple[int, ...]
+    values: np.ndarray
+    lengths: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes used by the runs."""
+        return self.values.nbytes + self.lengths.nbytes
+
+
+def encode_mask_rle(mask: np.ndarray) -> RunLengthMask:
+    """Encodes a mask into runs of the same pixel value.
+
+    Args:
+        mask (np.ndarray): Mask to encode
+
+    Returns:
+        RunLengthMask: Run-length encoded mask
+    """
+    flat_mask = mask.reshape(-1)
+    starts = np.flatnonzero(flat_mask[1:] != flat_mask[:-1]) + 1
+    if flat_mask.size > 0:
+        starts = np.concatenate([[0], starts])
+    lengths = np.diff(np.append(starts, flat_mask.size))
+    return RunLengthMask(mask.shape, flat_mask[starts], lengths.astype(np.min_scalar_type(flat_mask.size)))
+
+
+def decode_mask_rle(mask: RunLengthMask) -> np.ndarray:
+    """Decodes a run-length encoded mask.
+
+    Args:
+        mask (RunLengthMask): Run-length encoded mask
+
+    Returns:
+        np.ndarray: Decoded mask
+    """
+    return np.repeat(mask.values, mask.lengths).reshape(mask.shape)
+
+
+class MaskCache(LRUCache[Hashable, RunLengthMask]):
+    """Least recently used cache of the run-length encoded masks rasterized from dataset items.
+
+    Args:
+        max_bytes (int): Maximum number of bytes of the cached runs. Defaults to 256 MiB.
+    """
+
+    @staticmethod
+    def get_key(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> Optional[Hashable]:
+        """Returns the key of the mask of the dataset item rasterized with the labels.
+
+        The key consists of the annotation scene and the ids of its annotations, the ROI, the ignored labels,
+        the order of the labels and the size of the mask. Annotations and the ROI can be modified in place
+        keeping their ids, so a digest of their shapes and labels is a part of the key as well.
+        Items with shapes which are not rasterized, such as Image masks, are not cached and their key is None.
+        """
+        annotation_scene = dataset_item.annotation_scene
+        digest = hashlib.blake2b(digest_size=16)
+        for annotation in [*annotation_scene.annotations, dataset_item.roi]:
+            shape = annotation.shape
+            if isinstance(shape, Polygon):
+                coords = [coord for point in shape.points for coord in (point.x, point.y)]
+            elif isinstance(shape, (Rectangle, Ellipse)):
+                coords = [shape.x1, shape.y1, shape.x2, shape.y2]
+            else:
+                return None
+            digest.update(type(shape).__name__.encode())
+            digest.update(np.asarray(coords, dtype=np.float64).tobytes())
+            digest.update(repr([str(label.id_) for label in annotation.get_labels()]).encode())
+        return (
+            annotation_scene.id_,
+            tuple(annotation.id_ for annotation in annotation_scene.annotations),
+            dataset_item.roi.id_,
+            digest.digest(),
+            tuple(sorted(label.id_ for label in dataset_item.ignored_labels)),
+            tuple(label.id_ for label in labels),
+            dataset_item.width,
+            dataset_item.height,
+        )
+
+
+#: Cache of the masks rasterized by mask_from_dataset_item
+MASK_CACHE = MaskCache()
+
+
+def rle_mask_from_dataset_item(dataset_item: DatasetItemEntity, labels: List[LabelEntity]) -> RunLengthMask:
+    """Creates a run-length encoded mask from dataset item.
+
+    The mask is rasterized from the annotations only once and cached in MASK_CACHE.
+
+    Args:
+        dataset_item: Item to make mask for
+        labels: The labels to use for creating the mask. The order of
+            the labels determines the class index.
+
+    Returns:
+        Run-length encoded mask
+    """
+    key = MASK_CACHE.get_key(dataset_item, labels)
+    mask = MASK_CACHE.get(key) if key is not None else None
+    if mask is None:
+        mask = encode_mask_rle(
+            mask_from_annotation(dataset_item.get_annotations(), labels, dataset_item.width, dataset_item.height)
+        )
+        if key is not None:
+            MASK_CACHE.put(key, mask)
+    return mask
+
+
 def mask_from_dataset_item(
     dataset_item: DatasetItemEntity, labels: List[LabelEntity], use_otx_adapter: bool = True
 ) -> np.ndarray:
@@ -34,13 +158,14 @@ def mask_from_dataset_item(
         dataset_item: Item to make mask for
         labels: The labels to use for creating the mask. The order of
             the labels determines the class index.
+        use_otx_adapter: If True, the mask is rasterized from the
+            annotations and cached, otherwise it is loaded from the mask file.
 
     Returns:
         Numpy array of mask
     """
-    # todo: cache this so that it does not have to be redone for all the same media
     if use_otx_adapter:
-        mask = mask_from_annotation(dataset_item.get_annotations(), labels, dataset_item.width, dataset_item.height)
+        mask = decode_mask_rle(rle_mask_from_dataset_item(dataset_item, labels))
     else:
         mask = mask_from_file(dataset_item)
     return mask
@@ -52,7 +177,16 @@ def mask_from_file(dataset_item: DatasetItemEntity) -> np.ndarray:
     Only Common Sematic Segmentation format is supported.
     """
 
-    mask_form_file = dataset_item.media.path
+    return mask_from_file_path(dataset_item.media.path)
+
+
+def mask_from_file_path(image_path: Optional[str]) -> np.ndarray:
+    """Loads masks directly from annotation image of the image path.
+
+    Only Common Sematic Segmentation format is supported.
+    """
+
+    mask_form_file = image_path
     if mask_form_file is None:
         raise ValueError("Mask file doesn't exist or corrupted")
     mask_form_file = mask_form_file.replace("images", "masks")
@@ -81,7 +215,8 @@ def mask_from_annotation(
         2d numpy array of mask
     """
 
-    mask = np.zeros(shape=(height, width), dtype=np.uint8)
+    polygons = []
+    class_indices = []
     for annotation in annotations:
         shape = annotation.shape
         if not isinstance(shape, Polygon):
@@ -95,12 +230,31 @@ def mask_from_annotation(
 
         label_to_compare = known_labels[0].get_label()
 
-        class_idx = labels.index(label_to_compare) + 1
-        contour = []
-        for point in shape.points:
-            contour.append([int(point.x * width), int(point.y * height)])
+        class_indices.append(labels.index(label_to_compare) + 1)
+        polygons.append(np.array([[point.x, point.y] for point in shape.points], dtype=np.float64))
+
+    return mask_from_polygons(polygons, class_indices, width, height)
 
-        mask = cv2.drawContours(mask, np.asarray([contour]), 0, (class_idx, class_idx, class_idx), -1)
+
+def mask_from_polygons(
+    polygons: Sequence[np.ndarray], class_indices: Sequence[int], width: int, height: int
+) -> np.ndarray:
+    """Generate a segmentation mask from polygons and their class indices.
+
+    Args:
+        polygons: Polygons in (num_points, 2) arrays of the relative (x, y) coordinates
+        class_indices: Class index of each polygon, with offset 1
+        width: Width of the mask
+        height: Height of the mask
+
+    Returns:
+        2d numpy array of mask
+    """
+
+    mask = np.zeros(shape=(height, width), dtype=np.uint8)
+    for points, class_idx in zip(polygons, class_indices):
+        contour = (np.asarray(points, dtype=np.float64).reshape(-1, 2) * [width, height]).astype(np.int64)
+        mask = cv2.drawContours(mask, contour[np.newaxis], 0, (class_idx, class_idx, class_idx), -1)
 
     mask = np.expand_dims(mask, axis=2)
 
@@ -145,43 +299,96 @@ def create_hard_prediction_from_soft_prediction(
 Contour = List[Tuple[float, float]]
 
 
+def _split_loops(points: np.ndarray) -> List[np.ndarray]:
+    """Splits a (N, 2) array of contour points into loops that do not have self intersections."""
+    # Make sure that contour is closed.
+    if not np.array_equal(points[0], points[-1]):
+        points = np.concatenate([points, points[:1]])
+
+    # For each consecutive pair of equivalent points find their indices.
+    _, inverse = np.unique(points, axis=0, return_inverse=True)
+    order = np.argsort(inverse.reshape(-1), kind="stable")
+    is_pair = inverse.reshape(-1)[order[:-1]] == inverse.reshape(-1)[order[1:]]
+    starts, ends = order[:-1][is_pair], order[1:][is_pair]
+
+    subcontours: List[np.ndarray] = []
+    alive = np.ones(len(points), dtype=bool)
+    for i in np.argsort(-starts, kind="stable"):
+        start, end = starts[i], ends[i]
+        subcontour = points[start:end][alive[start:end]]
+        alive[start:end] = False
+        if len(subcontour) > 2:
+            subcontours.append(subcontour)
+    return subcontours
+
+
 def get_subcontours(contour: Contour) -> List[Contour]:
     """Splits contour into subcontours that do not have self intersections."""
+    return [[(x, y) for x, y in subcontour.tolist()] for subcontour in _split_loops(np.asarray(contour))]
+
 
-    ContourInternal = List[Optional[Tuple[float, float]]]
+def _create_label_annotations(
+    hard_prediction: np.ndarray, label_soft_prediction: np.ndarray, label_index: int, label: LabelEntity
+) -> Tuple[List[Annotation], List[str]]:
+    """Creates the polygons of one label, returns them with the warnings to raise."""
+    height, width = hard_prediction.shape[:2]
+    annotations: List[Annotation] = []
+    messages: List[str] = []
 
-    def find_loops(points: ContourInternal) -> List[Sequence[int]]:
-        """For each consecutive pair of equivalent rows in the input matrix returns their indices."""
-        _, inverse, count = np.unique(points, axis=0, return_inverse=True, return_counts=True)
-        duplicates = np.where(count > 1)[0]
-        indices = []
-        for x in duplicates:
-            y = np.nonzero(inverse == x)[0]
-            for i, _ in enumerate(y[:-1]):
-                indices.append(y[i : i + 2])
-        return indices
+    label_index_map = (hard_prediction == label_index).astype(np.uint8) * 255
+    # Contour retrieval mode CCOMP (Connected components) creates a two-level
+    # hierarchy of contours
+    contours, hierarchies = cv2.findContours(label_index_map, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_NONE)
+    if hierarchies is None:
+        return annotations, messages
 
-    base_contour = cast(ContourInternal, copy(contour))
+    for contour, hierarchy in zip(contours, hierarchies[0]):
+        if len(contour) <= 2 or cv2.contourArea(contour) < 1.0:
+            continue
 
-    # Make sure that contour is closed.
-    if not np.array_equal(base_contour[0], base_contour[-1]):
-        base_contour.append(base_contour[0])
-
-    subcontours: List[Contour] = []
-    loops = sorted(find_loops(base_contour), key=lambda x: x[0], reverse=True)
-    for loop in loops:
-        i, j = loop
-        subcontour = base_contour[i:j]
-        subcontour = list(x for x in subcontour if x is not None)
-        subcontours.append(cast(Contour, subcontour))
-        base_contour[i:j] = [None] * (j - i)
-
-    subcontours = [i for i in subcontours if len(i) > 2]
-    return subcontours
+        if hierarchy[3] != -1:
+            # If contour hierarchy[3] != -1 then contour has a parent and
+            # therefore is a hole
+            # Do not allow holes in segmentation masks to be filled silently,
+            # but trigger warning instead
+            messages.append(
+                "The geometry of the segmentation map you are converting is "
+                "not fully supported. A hole was found and will be filled."
+            )
+            continue
+
+        # Split contour into subcontours that do not have self intersections.
+        for subcontour in _split_loops(contour.reshape(-1, 2)):
+            # The probability of the shape is the mean soft prediction over the pixels of its points
+            xs, ys = subcontour[:, 0], subcontour[:, 1]
+            pixels = np.unique(ys.astype(np.int64) * width + xs)
+            probability = float(label_soft_prediction.reshape(-1)[pixels].astype(np.float64).mean())
+
+            # convert the list of points to a closed polygon
+            points = [Point(x=x, y=y) for x, y in zip((xs / (width - 1)).tolist(), (ys / (height - 1)).tolist())]
+            polygon = Polygon(points=points)
+
+            if polygon.get_area() > 0:
+                # Contour is a closed polygon with area > 0
+                annotations.append(
+                    Annotation(
+                        shape=polygon,
+                        labels=[ScoredLabel(label, probability)],
+                        id=ID(ObjectId()),
+                    )
+                )
+            else:
+                # Contour is a closed polygon with area == 0
+                messages.append(
+                    "The geometry of the segmentation map you are converting "
+                    "is not fully supported. Polygons with a area of zero "
+                    "will be removed."
+                )
+    return annotations, messages
 
 
 def create_annotation_from_segmentation_map(
-    hard_prediction: np.ndarray, soft_prediction: np.ndarray, label_map: dict
+    hard_prediction: np.ndarray, soft_prediction: np.ndarray, label_map: dict, num_workers: Optional[int] = None
 ) -> List[Annotation]:
     """Creates polygons from the soft predictions.
 
@@ -199,16 +406,14 @@ def create_annotation_from_segmentation_map(
         label_map: dictionary mapping labels to an index. It is assumed
             that the first item in the dictionary corresponds to the
             background label and will therefore be ignored.
+        num_workers: number of threads converting the labels in parallel.
+            Defaults to the number of CPUs, the labels are converted in
+            the calling thread if it is 1.
 
     Returns:
         List of shapes
     """
-    # pylint: disable=too-many-locals
-    height, width = hard_prediction.shape[:2]
-    img_class = hard_prediction.swapaxes(0, 1)
-
-    # pylint: disable=too-many-nested-blocks
-    annotations: List[Annotation] = []
+    tasks = []
     for label_index, label in label_map.items():
         # Skip background
         if label_index == 0:
@@ -219,67 +424,20 @@ def create_annotation_from_segmentation_map(
             current_label_soft_prediction = soft_prediction[:, :, label_index]
         else:
             current_label_soft_prediction = soft_prediction
+        tasks.append((hard_prediction, np.ascontiguousarray(current_label_soft_prediction), label_index, label))
 
-        obj_group = img_class == label_index
-        label_index_map = (obj_group.T.astype(int) * 255).astype(np.uint8)
-
-        # Contour retrieval mode CCOMP (Connected components) creates a two-level
-        # hierarchy of contours
-        contours, hierarchies = cv2.findContours(label_index_map, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_NONE)
-
-        if hierarchies is not None:
-            for contour, hierarchy in zip(contours, hierarchies[0]):
-                if len(contour) <= 2 or cv2.contourArea(contour) < 1.0:
-                    continue
-
-                if hierarchy[3] == -1:
-                    # In this case a contour does not represent a hole
-                    contour = list((point[0][0], point[0][1]) for point in contour)
-
-                    # Split contour into subcontours that do not have self intersections.
-                    subcontours = get_subcontours(contour)
-                    for subcontour in subcontours:
-                        # compute probability of the shape
-                        mask = np.zeros(hard_prediction.shape, dtype=np.uint8)
-                        cv2.drawContours(
-                            mask,
-                            np.asarray([[[x, y]] for x, y in subcontour]),
-                            contourIdx=-1,
-                            color=1,
-                            thickness=-1,
-                        )
-                        probability = cv2.mean(current_label_soft_prediction, mask)[0]
-
-                        # convert the list of points to a closed polygon
-                        points = [Point(x=x / (width - 1), y=y / (height - 1)) for x, y in subcontour]
-                        polygon = Polygon(points=points)
-
-                        if polygon.get_area() > 0:
-                            # Contour is a closed polygon with area > 0
-                            annotations.append(
-                                Annotation(
-                                    shape=polygon,
-                                    labels=[ScoredLabel(label, probability)],
-                                    id=ID(ObjectId()),
-                                )
-                            )
-                        else:
-                            # Contour is a closed polygon with area == 0
-                            warnings.warn(
-                                "The geometry of the segmentation map you are converting "
-                                "is not fully supported. Polygons with a area of zero "
-                                "will be removed.",
-                                UserWarning,
-                            )
-                else:
-                    # If contour hierarchy[3] != -1 then contour has a parent and
-                    # therefore is a hole
-                    # Do not allow holes in segmentation masks to be filled silently,
-                    # but trigger warning instead
-                    warnings.warn(
-                        "The geometry of the segmentation map you are converting is "
-                        "not fully supported. A hole was found and will be filled.",
-                        UserWarning,
-                    )
+    num_workers = min(num_workers or os.cpu_count() or 1, len(tasks))
+    if num_workers > 1:
+        with ThreadPoolExecutor(num_workers) as executor:
+            results = list(executor.map(lambda task: _create_label_annotations(*task), tasks))
+    else:
+        results = [_create_label_annotations(*task) for task in tasks]
+
+    # Results and warnings are reported in the label order whatever the number of workers
+    annotations: List[Annotation] = []
+    for label_annotations, messages in results:
+        annotations.extend(label_annotations)
+        for message in messages:
+            warnings.warn(message, UserWarning)
 
     return annotations
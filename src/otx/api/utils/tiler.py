@@ -315,7 +315,7 @@ class Tiler:
         vectors = [vector for (vector, _), _ in features]
         return np.average(vectors, axis=0)
 
-    def merge_maps(self, features: List) -> np.ndarray:
+    def merge_maps(self, features: List) -> List:
         """Merge tile-level saliency maps to image-level saliency map.
 
         Args:
@@ -323,7 +323,7 @@ class Tiler:
             Each saliency map is a list of maps for each detected class or None if class wasn't detected.
 
         Returns:
-            merged_maps (np.ndarray): Merged saliency maps for entire image.
+            merged_maps (List): Merged saliency maps of each class for entire image.
         """
         (_, image_saliency_map), image_meta = features[0]
 
@@ -338,7 +338,7 @@ class Tiler:
         # happens because of the bug then tile_size for IR in a few times more than original image
         if image_map_h == 0 or image_map_w == 0:
             return [None] * num_classes
-        merged_map = [np.zeros((image_map_h, image_map_w)) for _ in range(num_classes)]
+        merged_map = np.zeros((num_classes, image_map_h, image_map_w))
 
         for (_, saliency_map), meta in features[1:]:
             x_1, y_1, x_2, y_2 = meta["coord"]
@@ -348,25 +348,43 @@ class Tiler:
             map_h, map_w = saliency_map[0].shape
             # resize feature map if it got from the tile which width and height is less the tile_size
             if (map_h > y_2 - y_1 > 0) and (map_w > x_2 - x_1 > 0):
-                saliency_map = np.array([cv2.resize(cls_map, (x_2 - x_1, y_2 - y_1)) for cls_map in saliency_map])
+                saliency_map = self._resize_maps(saliency_map, (x_2 - x_1, y_2 - y_1))
             # cut the rest of the feature map that went out of the image borders
             map_h, map_w = y_2 - y_1, x_2 - x_1
 
-            for ci, hi, wi in [(c_, h_, w_) for c_ in range(num_classes) for h_ in range(map_h) for w_ in range(map_w)]:
-                map_pixel = saliency_map[ci, hi, wi]
-                # on tile overlap add 0.5 value of each tile
-                if merged_map[ci][y_1 + hi, x_1 + wi] != 0:
-                    merged_map[ci][y_1 + hi, x_1 + wi] = 0.5 * (map_pixel + merged_map[ci][y_1 + hi, x_1 + wi])
-                else:
-                    merged_map[ci][y_1 + hi, x_1 + wi] = map_pixel
-
-        for class_idx in range(num_classes):
-            image_map_cls = image_saliency_map[class_idx]
-            # resize the feature map for whole image to add it to merged saliency maps
-            image_map_cls = cv2.resize(image_map_cls, (image_map_w, image_map_h))
-            merged_map[class_idx] += (0.5 * image_map_cls).astype(dtype)
-            merged_map[class_idx] = non_linear_normalization(merged_map[class_idx])
-        return merged_map
+            # on tile overlap add 0.5 value of each tile
+            tile_map = saliency_map[:, :map_h, :map_w]
+            merged_tile_map = merged_map[:, y_1 : y_1 + map_h, x_1 : x_1 + map_w]
+            merged_tile_map[...] = np.where(merged_tile_map != 0, 0.5 * (tile_map + merged_tile_map), tile_map)
+
+        # resize the feature map for whole image to add it to merged saliency maps
+        image_map = self._resize_maps(image_saliency_map, (image_map_w, image_map_h))
+        merged_map += (0.5 * image_map).astype(dtype)
+        return [non_linear_normalization(cls_map) for cls_map in merged_map]
+
+    @staticmethod
+    def _resize_maps(maps: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+        """Resize the saliency maps of all classes.
+
+        uint8 maps are resized in one call as the channels of an image, up to 512 channels per call.
+        It gives the same maps as resizing them one by one because uint8 images are interpolated
+        in fixed-point arithmetic. The maps of the other types are resized one by one.
+
+        Args:
+            maps (np.ndarray): saliency maps in shape (C, H, W).
+            size (Tuple[int, int]): target size in (width, height).
+
+        Returns:
+            np.ndarray: resized saliency maps in shape (C, height, width).
+        """
+        if maps.dtype != np.uint8 or len(maps) == 0:
+            return np.array([cv2.resize(cls_map, size) for cls_map in maps])
+        width, height = size
+        resized_maps = [
+            cv2.resize(np.ascontiguousarray(maps[i : i + 512].transpose(1, 2, 0)), size).reshape(height, width, -1)
+            for i in range(0, len(maps), 512)
+        ]
+        return np.concatenate(resized_maps, axis=2).transpose(2, 0, 1)
 
     def get_tiling_saliency_map_from_segm_masks(self, detections: Union[Tuple, np.ndarray]) -> List:
         """Post process function for saliency map of OTX MaskRCNN model for tiling."""
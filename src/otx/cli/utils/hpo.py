@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import hashlib
 import json
 import os
 import re
@@ -14,22 +15,26 @@ from functools import partial
 from inspect import isclass
 from math import floor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 import yaml
 
 from otx.api.configuration.helper import create
 from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import TaskType
 from otx.api.entities.subset import Subset
 from otx.api.entities.task_environment import TaskEnvironment
 from otx.api.entities.train_parameters import TrainParameters, UpdateProgressCallback
+from otx.api.serialization.label_mapper import LabelSchemaMapper, label_schema_to_bytes
 from otx.cli.utils.importing import get_impl_class
 from otx.cli.utils.io import read_model, save_model_data
 from otx.core.data.adapter import get_dataset_adapter
-from otx.hpo import HyperBand, TrialStatus, run_hpo_loop
+from otx.core.data.columnar import ColumnarDataset
+from otx.hpo import SMBO, HyperBand, TrialStatus, run_hpo_loop
+from otx.hpo.resource_manager import get_reserved_cpu
 from otx.utils.logger import get_logger
 
 logger = get_logger()
@@ -141,19 +146,26 @@ class TaskManager:
 
         return epoch_name
 
-    def copy_weight(self, src: Union[str, Path], det: Union[str, Path]):
+    def copy_weight(
+        self, src: Union[str, Path], det: Union[str, Path], checkpoint_store: Optional["CheckpointStore"] = None
+    ):
         """Copy all model weights from work directory.
 
         Args:
             src (Union[str, Path]): path where model weights are saved
             det (Union[str, Path]): path to save model weights
+            checkpoint_store (Optional[CheckpointStore]): If given, model weights are moved by the store
+                                                          instead of being copied. Defaults to None.
         """
         src = Path(src)
         det = Path(det)
         if self.is_mmcv_framework_task():
             for weight_candidate in src.rglob("*epoch*.pth"):
                 if not (weight_candidate.is_symlink() or (det / weight_candidate.name).exists()):
-                    shutil.copy(weight_candidate, det)
+                    if checkpoint_store is not None:
+                        checkpoint_store.put(weight_candidate, det / weight_candidate.name, move=True)
+                    else:
+                        shutil.copy(weight_candidate, det)
         # TODO need to implement after anomaly task supports resume
 
     def get_latest_weight(self, workdir: Union[str, Path]) -> Optional[str]:
@@ -184,6 +196,92 @@ class TaskManager:
         return latest_weight
 
 
+class CheckpointStore:
+    """Store of model weights shared by HPO trials.
+
+    Weights which can be identical, e.g. initial weights saved by trials running at the same time, are deduplicated.
+    Each of their contents is kept once in the store directory, named by its hash, and the saved weights are
+    hard links of it. Trained weights are unique, so they are moved or copied as they are without hashing them.
+    If hard links aren't available, deduplicated weights are copied as well.
+
+    Args:
+        root (Union[str, Path]): store directory. It should be on the same file system as the trial directories.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        """Store directory."""
+        return self._root
+
+    def put(self, src: Union[str, Path], dst: Union[str, Path], move: bool = False, deduplicate: bool = False) -> Path:
+        """Save a model weight at dst.
+
+        Args:
+            src (Union[str, Path]): model weight to save
+            dst (Union[str, Path]): path to save the model weight
+            move (bool): whether to move src instead of copying it. Defaults to False.
+            deduplicate (bool): whether to share the content with identical weights in the store. Defaults to False.
+
+        Returns:
+            Path: saved model weight path
+        """
+        src = Path(src)
+        dst = Path(dst)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if not deduplicate:
+            if dst.exists():
+                dst.unlink()
+            (shutil.move if move else shutil.copy)(str(src), str(dst))  # type: ignore
+            return dst
+
+        self._root.mkdir(parents=True, exist_ok=True)
+        stored_weight = self._root / f"{self._get_digest(src)}.pth"
+        # dst is replaced at once, because other trials can be loading it
+        tmp_weight = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+        try:
+            os.link(stored_weight, tmp_weight)
+        except OSError:
+            # not stored yet, or hard link isn't supported
+            (shutil.move if move else shutil.copy)(str(src), str(tmp_weight))  # type: ignore
+            try:
+                os.link(tmp_weight, stored_weight)
+            except OSError:
+                # same weight is stored by another trial at the same time, or hard link isn't supported
+                pass
+        else:
+            if move:
+                src.unlink()
+        tmp_weight.replace(dst)
+        return dst
+
+    def collect_garbage(self):
+        """Remove model weights which aren't used by any trial from the store."""
+        if not self._root.exists():
+            return
+        for stored_weight in self._root.glob("*.pth"):
+            try:
+                if stored_weight.stat().st_nlink == 1:
+                    stored_weight.unlink()
+            except FileNotFoundError:
+                # removed by another trial
+                continue
+
+    @staticmethod
+    def _get_digest(path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _get_checkpoint_store(hpo_workdir: Union[str, Path]) -> CheckpointStore:
+    return CheckpointStore(Path(hpo_workdir) / "checkpoint_store")
+
+
 class TaskEnvironmentManager:
     """OTX environment utility class to set or get a value from environment class.
 
@@ -372,6 +470,19 @@ class TaskEnvironmentManager:
         hyper_parameter = {f"learning_parameters.{self.task.get_epoch_name()}": epoch}
         self.set_hyper_parameter_using_str_key(hyper_parameter)
 
+    def set_max_num_workers(self, max_num_workers: int):
+        """Limit the number of DataLoader workers on environment.
+
+        Args:
+            max_num_workers (int): maximum number of workers
+        """
+        env_hp = self._environment.get_hyper_parameters()  # type: ignore
+        for group_name in ["learning_parameters", "dataset"]:
+            parameter_group = getattr(env_hp, group_name, None)
+            num_workers = getattr(parameter_group, "num_workers", None)
+            if isinstance(num_workers, int) and num_workers > max_num_workers:
+                parameter_group.num_workers = max_num_workers
+
 
 class HpoRunner:
     """Class which is in charge of preparing and running HPO.
@@ -412,6 +523,11 @@ class HpoRunner:
 
         self._align_batch_size_search_space_to_dataset_size()
 
+    @property
+    def mode(self) -> str:
+        """Whether the HPO metric is maximized ("max") or minimized ("min")."""
+        return self._hpo_config.get("mode", "max")
+
     def _set_hpo_config(self):
         hpo_config_path = Path(self._environment.get_model_template_path()).parent / "hpo_config.yaml"
         with hpo_config_path.open("r") as f:
@@ -454,17 +570,22 @@ class HpoRunner:
                 self._fixed_hp[batch_size_name] = self._train_dataset_size
                 self._environment.set_hyper_parameter_using_str_key(self._fixed_hp)
 
-    def run_hpo(self, train_func: Callable, data_roots: Dict[str, Dict]) -> Union[Dict[str, Any], None]:
+    def run_hpo(
+        self, train_func: Callable, data_roots: Dict[str, Dict], dataset: Optional[DatasetEntity] = None
+    ) -> Union[Dict[str, Any], None]:
         """Run HPO and provides optimized hyper parameters.
 
         Args:
             train_func (Callable): training model function
             data_roots (Dict[str, Dict]): dataset path of each dataset type
+            dataset (Optional[DatasetEntity]): dataset imported from data_roots. If given, it's saved as a snapshot
+                                               which trials load instead of importing the dataset. Defaults to None.
 
         Returns:
             Union[Dict[str, Any], None]: Optimized hyper parameters. If there is no best hyper parameter, return None.
         """
-        self._environment.save_initial_weight(self._get_initial_model_weight_path())
+        self._save_initial_weight()
+        dataset_snapshot = self._save_dataset_snapshot(dataset) if dataset is not None else None
         hpo_algo = self._get_hpo_algo()
         resource_type = "gpu" if torch.cuda.is_available() else "cpu"
         run_hpo_loop(
@@ -477,6 +598,9 @@ class HpoRunner:
                 hpo_workdir=self._hpo_workdir,
                 initial_weight_name=self._initial_weight_name,
                 metric=self._hpo_config["metric"],
+                dataset_snapshot=dataset_snapshot,
+                warm_start_from_best_trial=self._hpo_config.get("warm_start_from_best_trial", False),
+                mode=self.mode,
             ),
             resource_type,  # type: ignore
         )
@@ -504,12 +628,25 @@ class HpoRunner:
         return hpo_algo
 
     def _prepare_asha(self):
-        args = {
+        args = self._get_hyperband_args()
+        logger.debug(f"ASHA args = {args}")
+
+        return HyperBand(**args)
+
+    def _prepare_smbo(self):
+        args = self._get_hyperband_args()
+        args["warm_start_paths"] = self._hpo_config.get("warm_start_paths")
+        logger.debug(f"SMBO args = {args}")
+
+        return SMBO(**args)
+
+    def _get_hyperband_args(self) -> Dict[str, Any]:
+        return {
             "search_space": self._hpo_config["hp_space"],
             "save_path": str(self._hpo_workdir),
             "maximum_resource": self._hpo_config.get("maximum_resource"),
             "minimum_resource": self._hpo_config.get("minimum_resource"),
-            "mode": self._hpo_config.get("mode", "max"),
+            "mode": self.mode,
             "num_workers": 1,
             "num_full_iterations": self._environment.get_max_epoch(),
             "full_dataset_size": self._train_dataset_size,
@@ -521,13 +658,6 @@ class HpoRunner:
             "asynchronous_sha": torch.cuda.device_count() != 1,
         }
 
-        logger.debug(f"ASHA args = {args}")
-
-        return HyperBand(**args)
-
-    def _prepare_smbo(self):
-        raise NotImplementedError
-
     def _get_default_hyper_parameters(self):
         default_hyper_parameters = {}
         hp_from_env = self._environment.get_dict_type_hyper_parameter()
@@ -543,6 +673,25 @@ class HpoRunner:
     def _get_initial_model_weight_path(self):
         return self._hpo_workdir / self._initial_weight_name
 
+    def _save_initial_weight(self):
+        initial_weight_path = self._get_initial_model_weight_path()
+        tmp_weight_path = initial_weight_path.with_name(f"tmp_{initial_weight_path.name}")
+        if self._environment.save_initial_weight(tmp_weight_path):
+            _get_checkpoint_store(self._hpo_workdir).put(
+                tmp_weight_path, initial_weight_path, move=True, deduplicate=True
+            )
+
+    def _save_dataset_snapshot(self, dataset: DatasetEntity) -> Optional[str]:
+        snapshot_path = self._hpo_workdir / "dataset_snapshot"
+        try:
+            ColumnarDataset(dataset).save(snapshot_path)
+        except ValueError as e:
+            logger.info(f"Dataset snapshot can't be made, each trial imports the dataset. {e}")
+            return None
+        label_schema = self._environment.environment.label_schema
+        (snapshot_path / "label_schema.json").write_bytes(label_schema_to_bytes(label_schema))
+        return str(snapshot_path)
+
 
 def run_hpo(
     hpo_time_ratio: int, output: Path, environment: TaskEnvironment, dataset: DatasetEntity, data_roots: Dict[str, Dict]
@@ -578,7 +727,7 @@ def run_hpo(
     )
 
     logger.info("started hyper-parameter optimization")
-    best_config = hpo_runner.run_hpo(run_trial, data_roots)
+    best_config = hpo_runner.run_hpo(run_trial, data_roots, dataset)
     logger.info("completed hyper-parameter optimization")
 
     env_manager = TaskEnvironmentManager(environment)
@@ -586,7 +735,7 @@ def run_hpo(
 
     if best_config is not None:
         env_manager.set_hyper_parameter_using_str_key(best_config["config"])
-        best_hpo_weight = get_best_hpo_weight(hpo_save_path, best_config["id"])
+        best_hpo_weight = get_best_hpo_weight(hpo_save_path, best_config["id"], hpo_runner.mode)
         if best_hpo_weight is None:
             logger.warning("Can not find the best HPO weight. Best HPO wegiht won't be used.")
         else:
@@ -604,12 +753,13 @@ def _remove_unused_model_weights(hpo_save_path: Path, best_hpo_weight: Optional[
         weight.unlink()
 
 
-def get_best_hpo_weight(hpo_dir: Union[str, Path], trial_id: Union[str, Path]) -> Optional[str]:
+def get_best_hpo_weight(hpo_dir: Union[str, Path], trial_id: Union[str, Path], mode: str = "max") -> Optional[str]:
     """Get best model weight path of the HPO trial.
 
     Args:
         hpo_dir (Union[str, Path]): HPO work directory path
         trial_id (Union[str, Path]): trial id
+        mode (str): Whether the score is maximized ("max") or minimized ("min"). Defaults to "max".
 
     Returns:
         Optional[str]: best HPO model weight
@@ -629,7 +779,7 @@ def get_best_hpo_weight(hpo_dir: Union[str, Path], trial_id: Union[str, Path]) -
         if best_score is None:
             best_score = score
             best_epochs.append(eph)
-        elif best_score < score:
+        elif _is_better(score, best_score, mode):
             best_score = score
             best_epochs = [eph]
         elif best_score == score:
@@ -637,13 +787,22 @@ def get_best_hpo_weight(hpo_dir: Union[str, Path], trial_id: Union[str, Path]) -
 
     best_weight = None
     for best_epoch in best_epochs:
-        best_weight_path = list(hpo_dir.glob(f"weight/{trial_id}/*epoch*{best_epoch}*"))
+        # exclude the weights of other epochs which contain the epoch, e.g. epoch_10.pth for the epoch 1
+        best_weight_path = [
+            path
+            for path in hpo_dir.glob(f"weight/{trial_id}/*epoch*{best_epoch}*")
+            if re.search(rf"(?<!\d){best_epoch}(?!\d)", path.name)
+        ]
         if best_weight_path:
             best_weight = str(best_weight_path[0])
 
     return best_weight
 
 
+def _is_better(score: float, other: float, mode: str) -> bool:
+    return score > other if mode == "max" else score < other
+
+
 class Trainer:
     """Class which prepares and trains a model given hyper parameters.
 
@@ -656,6 +815,12 @@ class Trainer:
         hpo_workdir (Union[str, Path]): work directory for HPO
         initial_weight_name (str): initial model weight name for each trials to load
         metric (str): metric name
+        dataset_snapshot (Optional[str]): path of the dataset snapshot to load instead of importing the dataset.
+                                          Defaults to None.
+        warm_start_from_best_trial (bool): whether a new trial starts from the best model weight of other trials
+                                           instead of the initial weight, as population based training.
+                                           Defaults to False.
+        mode (str): Whether the metric is maximized ("max") or minimized ("min"). Defaults to "max".
     """
 
     # pylint: disable=too-many-arguments, too-many-instance-attributes
@@ -670,6 +835,9 @@ class Trainer:
         hpo_workdir: Union[str, Path],
         initial_weight_name: str,
         metric: str,
+        dataset_snapshot: Optional[str] = None,
+        warm_start_from_best_trial: bool = False,
+        mode: str = "max",
     ):
         self._hp_config = hp_config
         self._report_func = report_func
@@ -679,19 +847,19 @@ class Trainer:
         self._hpo_workdir: Path = Path(hpo_workdir)
         self._initial_weight_name = initial_weight_name
         self._metric = metric
+        self._dataset_snapshot = dataset_snapshot
+        self._warm_start_from_best_trial = warm_start_from_best_trial
+        self._mode = mode
+        self._checkpoint_store = _get_checkpoint_store(self._hpo_workdir)
         self._epoch = floor(self._hp_config["configuration"]["iterations"])
         del self._hp_config["configuration"]["iterations"]
 
     def run(self):
         """Run each training of each trial with given hyper parameters."""
         hyper_parameters = self._prepare_hyper_parameter()
-        dataset_adapter = self._prepare_dataset_adapter()
-
-        dataset = dataset_adapter.get_otx_dataset()
+        dataset, label_schema = self._prepare_dataset()
         dataset = HpoDataset(dataset, self._hp_config)
 
-        label_schema = dataset_adapter.get_label_schema()
-
         environment = self._prepare_environment(hyper_parameters, label_schema)
         self._set_hyper_parameter(environment)
 
@@ -705,7 +873,7 @@ class Trainer:
                     self._report_func(0, 0, done=True)
                     return
             environment.resume_model_weight(resume_weight_path, dataset)
-        else:
+        elif not self._load_best_trial_weight(environment, dataset):
             initial_weight = self._load_fixed_initial_weight()
             if initial_weight is not None:
                 environment.load_model_weight(str(initial_weight), dataset)
@@ -725,6 +893,12 @@ class Trainer:
     def _prepare_hyper_parameter(self):
         return create(self._model_template.hyper_parameters.data)
 
+    def _prepare_dataset(self) -> Tuple[Union[DatasetEntity, ColumnarDataset], LabelSchemaEntity]:
+        if self._dataset_snapshot is not None:
+            return load_dataset_snapshot(self._dataset_snapshot)
+        dataset_adapter = self._prepare_dataset_adapter()
+        return dataset_adapter.get_otx_dataset(), dataset_adapter.get_label_schema()
+
     def _prepare_dataset_adapter(self):
         dataset_adapter = get_dataset_adapter(
             self._task.task_type,
@@ -744,6 +918,10 @@ class Trainer:
             environment.set_hyper_parameter_using_str_key({"learning_parameters.auto_decrease_batch_size": "None"})
             environment.set_hyper_parameter_using_str_key({"learning_parameters.auto_adapt_batch_size": "None"})
         environment.set_epoch(self._epoch)
+        reserved_cpu = get_reserved_cpu()
+        if reserved_cpu is not None:
+            # size DataLoader workers to the cores reserved for the trial
+            environment.set_max_num_workers(len(reserved_cpu))
 
     def _prepare_environment(self, hyper_parameters, label_schema):
         enviroment = TaskEnvironment(
@@ -761,6 +939,43 @@ class Trainer:
             return None
         return self._task.get_latest_weight(trial_work_dir)
 
+    def _load_best_trial_weight(self, environment: TaskEnvironmentManager, dataset: DatasetEntity) -> bool:
+        if not self._warm_start_from_best_trial:
+            return False
+
+        best_score = None
+        best_trial_id = None
+        for json_file in self._hpo_workdir.rglob("*.json"):
+            if not json_file.stem.isnumeric() or json_file.stem == self._hp_config["id"]:
+                continue
+            try:
+                with json_file.open("r") as f:
+                    trial_output = json.load(f)
+            except ValueError:
+                # being written by HPO
+                continue
+            if not trial_output.get("score"):
+                continue
+            scores = trial_output["score"].values()
+            score = max(scores) if self._mode == "max" else min(scores)
+            if best_score is None or _is_better(score, best_score, self._mode):
+                best_score = score
+                best_trial_id = json_file.stem
+
+        if best_trial_id is None:
+            return False
+        best_weight = get_best_hpo_weight(self._hpo_workdir, best_trial_id, self._mode)
+        if best_weight is None:
+            return False
+        try:
+            environment.load_model_weight(best_weight, dataset)
+        except FileNotFoundError:
+            # removed by the trial after it got better
+            return False
+
+        logger.info(f"Trial {self._hp_config['id']} starts from the best model weight of trial {best_trial_id}.")
+        return True
+
     def _load_fixed_initial_weight(self):
         initial_weight_path = self._get_initial_weight_path()
         if initial_weight_path.exists():
@@ -768,7 +983,7 @@ class Trainer:
         return None
 
     def _add_initial_weight_saving_hook(self, task):
-        initial_weight_path = self._get_initial_weight_path()
+        initial_weight_path = self._get_trial_initial_weight_path()
         task.update_override_configurations(
             {
                 "custom_hooks": [
@@ -787,10 +1002,19 @@ class Trainer:
     def _get_initial_weight_path(self) -> Path:
         return self._hpo_workdir / self._initial_weight_name
 
+    def _get_trial_initial_weight_path(self) -> Path:
+        return self._hpo_workdir / f"{self._hp_config['id']}_{self._initial_weight_name}"
+
     def _finalize_trial(self, task):
         weight_dir_path = self._get_weight_dir_path()
         weight_dir_path.mkdir(parents=True, exist_ok=True)
-        self._task.copy_weight(task.project_path, weight_dir_path)
+        self._task.copy_weight(task.project_path, weight_dir_path, self._checkpoint_store)
+        trial_initial_weight_path = self._get_trial_initial_weight_path()
+        if trial_initial_weight_path.exists():
+            # identical initial weights saved by trials running at the same time are stored once
+            self._checkpoint_store.put(
+                trial_initial_weight_path, self._get_initial_weight_path(), move=True, deduplicate=True
+            )
         self._report_func(0, 0, done=True)
 
     def _get_weight_dir_path(self) -> Path:
@@ -806,10 +1030,29 @@ class Trainer:
             if not weight_dir.exists():
                 continue
             latest_model_weight = self._task.get_latest_weight(weight_dir)
-            best_model_weight = get_best_hpo_weight(self._hpo_workdir, trial_num)
+            best_model_weight = get_best_hpo_weight(self._hpo_workdir, trial_num, self._mode)
             for each_model_weight in weight_dir.iterdir():
                 if str(each_model_weight) not in [latest_model_weight, best_model_weight]:
                     each_model_weight.unlink()
+        self._checkpoint_store.collect_garbage()
+
+
+def load_dataset_snapshot(path: Union[str, Path]) -> Tuple[ColumnarDataset, LabelSchemaEntity]:
+    """Load the dataset and the label schema from the snapshot saved by HpoRunner.
+
+    Arrays of the snapshot are memory-mapped, so trials running in parallel share them.
+    The snapshot isn't expanded to dataset items, training datasets attach to it directly.
+
+    Args:
+        path (Union[str, Path]): dataset snapshot path
+
+    Returns:
+        Tuple[ColumnarDataset, LabelSchemaEntity]: dataset and label schema
+    """
+    columnar = ColumnarDataset.load(path)
+    with (Path(path) / "label_schema.json").open("r", encoding="utf-8") as f:
+        label_schema = LabelSchemaMapper.backward(json.load(f))
+    return columnar, label_schema
 
 
 def run_trial(
@@ -821,6 +1064,9 @@ def run_trial(
     hpo_workdir: Union[str, Path],
     initial_weight_name: str,
     metric: str,
+    dataset_snapshot: Optional[str] = None,
+    warm_start_from_best_trial: bool = False,
+    mode: str = "max",
 ):
     """Function to train a model given hyper parameters.
 
@@ -833,10 +1079,26 @@ def run_trial(
         hpo_workdir (Union[str, Path]): work directory for HPO
         initial_weight_name (str): initial model weight name for each trials to load
         metric (str): metric name
+        dataset_snapshot (Optional[str]): path of the dataset snapshot to load instead of importing the dataset.
+                                          Defaults to None.
+        warm_start_from_best_trial (bool): whether a new trial starts from the best model weight of other trials
+                                           instead of the initial weight, as population based training.
+                                           Defaults to False.
+        mode (str): Whether the metric is maximized ("max") or minimized ("min"). Defaults to "max".
     """
     # pylint: disable=too-many-arguments
     trainer = Trainer(
-        hp_config, report_func, model_template, data_roots, task_type, hpo_workdir, initial_weight_name, metric
+        hp_config,
+        report_func,
+        model_template,
+        data_roots,
+        task_type,
+        hpo_workdir,
+        initial_weight_name,
+        metric,
+        dataset_snapshot,
+        warm_start_from_best_trial,
+        mode,
     )
     trainer.run()
 
@@ -879,6 +1141,9 @@ class HpoCallback(UpdateProgressCallback):
 class HpoDataset:
     """Wrapper class for DatasetEntity of dataset. It's used to make subset during HPO.
 
+    If the full dataset is a ColumnarDataset loaded from the dataset snapshot, training subsets are selected
+    from its arrays, and only validation and test subsets are converted to DatasetEntity for evaluation.
+
     Args:
         fullset: full dataset
         config (Optional[Dict[str, Any]], optional): hyper parameter trial config
@@ -920,6 +1185,9 @@ class HpoDataset:
             HpoDataset: subset wrapped by HpoDataset
         """
         dataset = self.fullset.get_subset(subset)
+        if isinstance(dataset, ColumnarDataset) and subset in (Subset.VALIDATION, Subset.TESTING):
+            # evaluation after training needs DatasetEntity, e.g. to add predictions to empty annotations
+            dataset = DatasetEntity(items=list(dataset))
         if subset != Subset.TRAINING or self.subset_ratio > 0.99:
             return dataset
 
@@ -927,4 +1195,6 @@ class HpoDataset:
         indices = indices.tolist()  # type: ignore
         indices = indices[: int(len(dataset) * self.subset_ratio)]
 
+        if isinstance(dataset, ColumnarDataset):
+            return dataset.select(indices)
         return HpoDataset(dataset, config=None, indices=indices)
@@ -3,7 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from .disk_cache_handler import DEFAULT_DISK_CACHE_SIZE, DiskCacheHandlerError, DiskCacheHandlerSingleton
 from .mem_cache_handler import MemCacheHandlerError, MemCacheHandlerSingleton
 from .storage_cache import init_arrow_cache
 
-__all__ = ["MemCacheHandlerSingleton", "MemCacheHandlerError", "init_arrow_cache"]
+__all__ = [
+    "MemCacheHandlerSingleton",
+    "MemCacheHandlerError",
+    "DiskCacheHandlerSingleton",
+    "DiskCacheHandlerError",
+    "DEFAULT_DISK_CACHE_SIZE",
+    "init_arrow_cache",
+]
@@ -0,0 +1,283 @@
+"""Disk cache handler to share decoded samples across processes and runs."""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import hashlib
+import os
+import pickle
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from otx.core.file import OTX_CACHE
+from otx.utils.logger import get_logger
+
+logger = get_logger()
+
+DECODED_CACHE = os.path.join(OTX_CACHE, "decoded")
+DEFAULT_DISK_CACHE_SIZE = 10 * 1024**3
+# Ratio of the size limit written by the handler between cleanups and the ratio to keep after a cleanup
+CLEANUP_INTERVAL_RATIO = 0.1
+CLEANUP_TARGET_RATIO = 0.9
+# Temporary files older than this are regarded as left by interrupted writes
+STALE_TMP_SECONDS = 3600
+
+
+class DiskCacheHandler:
+    """Disk cache handler which stores decoded samples as memory-mappable files.
+
+    It has the same get/put API as MemCacheHandlerBase and is used as a lower tier of it.
+    Each item is stored as a ``.npy`` file for the data and a ``.pkl`` file for the key and metadata
+    under ``cache_dir``. Files are written to temporary files first and renamed,
+    so concurrent processes (e.g. DataLoader workers and HPO trials) can safely share the same directory.
+    The cached data is read with ``np.memmap`` in copy-on-write mode, so reading it does not copy anything
+    until it is modified.
+
+    Since the cache is persistent, the key should be valid across runs,
+    e.g. it should consist of the media path, its modification time, ROI and the preprocessing config.
+
+    The size of the cache directory is bounded by ``max_size``. Whenever the handler has written
+    ``CLEANUP_INTERVAL_RATIO`` of it, the least recently used items are evicted by ``cleanup()``.
+    The recency is the modification time of the metadata file, which is updated on every hit.
+
+    Args:
+        cache_dir (Optional[str]): The directory to store the cached items.
+            If None, the handler is disabled and it caches nothing.
+        max_size (int): The maximum number of bytes of the cache directory. If it is 0, the size is not limited.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DECODED_CACHE, max_size: int = DEFAULT_DISK_CACHE_SIZE):
+        if max_size < 0:
+            raise ValueError(f"max_size should be non-negative, but {max_size} is given.")
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._written = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the handler caches samples or not."""
+        return self._cache_dir is not None
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        """Get the directory to store the cached items."""
+        return self._cache_dir
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of bytes of the cache directory."""
+        return self._max_size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the number of cache hits and misses in the current process."""
+        return {"hits": self._hits, "misses": self._misses}
+
+    def _get_path(self, key: Any) -> str:
+        assert self._cache_dir is not None
+        digest = hashlib.sha256(pickle.dumps(key)).hexdigest()
+        return os.path.join(self._cache_dir, digest[:2], digest)
+
+    def get(self, key: Any) -> Tuple[Optional[np.ndarray], Optional[Dict]]:
+        """Try to look up the cached item with the given key.
+
+        Args:
+            key (Any): A key for looking up the cached item
+
+        Returns:
+            If succeed return (np.ndarray, Dict), otherwise return (None, None)
+        """
+        if self._cache_dir is None:
+            return None, None
+
+        path = self._get_path(key)
+        try:
+            # Metadata file is written after the data file, so that the data file exists if it exists.
+            with open(f"{path}.pkl", "rb") as f:
+                stored_key, meta = pickle.load(f)
+            if stored_key != key:
+                self._misses += 1
+                return None, None
+            data = np.load(f"{path}.npy", mmap_mode="c")
+        except FileNotFoundError:
+            self._misses += 1
+            return None, None
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Skip loading cached {path} \nError msg: {e}")
+            self._misses += 1
+            return None, None
+
+        try:
+            # Mark the item as recently used
+            os.utime(f"{path}.pkl")
+        except OSError:
+            pass
+
+        self._hits += 1
+        return data, meta
+
+    def put(self, key: Any, data: np.ndarray, meta: Optional[Dict] = None) -> Optional[int]:
+        """Try to store np.ndarray and metadata with a key to the cache directory.
+
+        Args:
+            key (Any): A key to store the cached item
+            data (np.ndarray): A data sample to store
+            meta (Optional[Dict]): A metadata of the data sample
+
+        Returns:
+            Optional[int]: If succeed return the number of bytes of the stored data
+        """
+        if self._cache_dir is None:
+            return None
+
+        path = self._get_path(key)
+        if os.path.exists(f"{path}.pkl"):
+            return None
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(data), allow_pickle=False)
+            os.replace(tmp_path, f"{path}.npy")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, meta), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, f"{path}.pkl")
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Skip caching for {path} \nError msg: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        nbytes = data.size * data.itemsize
+        self._written += nbytes
+        if self._max_size > 0 and self._written > self._max_size * CLEANUP_INTERVAL_RATIO:
+            self.cleanup()
+        return nbytes
+
+    def cleanup(self) -> int:
+        """Evict the least recently used items if the cache directory exceeds the size limit.
+
+        Items are evicted until the directory is reduced to ``CLEANUP_TARGET_RATIO`` of the limit.
+        Temporary files left by interrupted writes are removed as well.
+
+        Returns:
+            int: The number of bytes freed
+        """
+        self._written = 0
+        if self._cache_dir is None or not os.path.isdir(self._cache_dir):
+            return 0
+
+        freed = 0
+        total = 0
+        # The last used time and the number of bytes of each item by its path without the extension
+        last_used: Dict[str, float] = {}
+        sizes: Dict[str, int] = {}
+        stale_time = time.time() - STALE_TMP_SECONDS
+        for sub_dir in os.scandir(self._cache_dir):
+            if not sub_dir.is_dir():
+                continue
+            for entry in os.scandir(sub_dir.path):
+                try:
+                    file_stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    if file_stat.st_mtime < stale_time and self._remove(entry.path):
+                        freed += file_stat.st_size
+                    else:
+                        total += file_stat.st_size
+                    continue
+                base_path, ext = os.path.splitext(entry.path)
+                if ext == ".pkl" or base_path not in last_used:
+                    last_used[base_path] = file_stat.st_mtime
+                sizes[base_path] = sizes.get(base_path, 0) + file_stat.st_size
+                total += file_stat.st_size
+
+        if self._max_size > 0 and total > self._max_size:
+            target = self._max_size * CLEANUP_TARGET_RATIO
+            for base_path in sorted(last_used, key=last_used.__getitem__):
+                if total <= target:
+                    break
+                # Remove the metadata first so that the item is not looked up while its data is removed
+                if self._remove(f"{base_path}.pkl") and self._remove(f"{base_path}.npy"):
+                    total -= sizes[base_path]
+                    freed += sizes[base_path]
+
+        if freed > 0:
+            logger.info(f"{self.__class__.__name__} freed {freed} bytes in {self._cache_dir}.")
+        return freed
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # e.g. the file is memory-mapped by another process on Windows
+            logger.warning(f"Skip removing cached {path} \nError msg: {e}")
+            return False
+        return True
+
+    def __repr__(self):
+        """Representation for the current handler status."""
+        if self._cache_dir is None:
+            return f"{self.__class__.__name__} is disabled."
+        return (
+            f"{self.__class__.__name__} at {self._cache_dir} has "
+            f"{self._hits} hits / {self._misses} misses in the current process."
+        )
+
+
+class DiskCacheHandlerError(Exception):
+    """Exception class for DiskCacheHandler."""
+
+
+class DiskCacheHandlerSingleton:
+    """A singleton class to create, delete and get DiskCacheHandler."""
+
+    instance: DiskCacheHandler
+
+    @classmethod
+    def get(cls) -> DiskCacheHandler:
+        """Get the created DiskCacheHandler.
+
+        If no one is created before, raise DiskCacheHandlerError.
+        """
+        if not hasattr(cls, "instance"):
+            cls_name = cls.__class__.__name__
+            raise DiskCacheHandlerError(f"Before calling {cls_name}.get(), you should call {cls_name}.create() first.")
+
+        return cls.instance
+
+    @classmethod
+    def create(
+        cls, enable: bool, cache_dir: str = DECODED_CACHE, max_size: int = DEFAULT_DISK_CACHE_SIZE
+    ) -> DiskCacheHandler:
+        """Create a new DiskCacheHandler instance.
+
+        The cache directory is cleaned up to fit in the size limit when the handler is created.
+
+        Args:
+            enable (bool): If False, create a disabled handler which caches nothing.
+            cache_dir (str): The directory to store the cached items.
+            max_size (int): The maximum number of bytes of the cache directory. If it is 0, the size is not limited.
+        """
+        if enable:
+            logger.info(f"Decoded samples are cached in {cache_dir} up to {max_size} bytes.")
+            cls.instance = DiskCacheHandler(cache_dir, max_size)
+            cls.instance.cleanup()
+        else:
+            cls.instance = DiskCacheHandler(None)
+        return cls.instance
+
+    @classmethod
+    def delete(cls) -> None:
+        """Delete the existing DiskCacheHandler instance."""
+        if hasattr(cls, "instance"):
+            del cls.instance
@@ -4,9 +4,10 @@
 #
 
 import ctypes as ct
+import hashlib
 import multiprocessing as mp
-from multiprocessing.managers import DictProxy
-from typing import Any, Dict, Optional, Tuple, Union
+import pickle
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 import psutil
@@ -17,6 +18,61 @@ from otx.utils.logger import get_logger
 logger = get_logger()
 GIB = 1024**3
 
+# Eviction order of the cached items given their (last access tick, access frequency, size in bytes)
+EVICTION_POLICIES: Dict[str, Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = {
+    # Evict the least recently used item first
+    "lru": lambda last_access, frequency, size: np.argsort(last_access, kind="stable"),
+    # Evict the least frequently used item first, ties are broken by recency
+    "lfu": lambda last_access, frequency, size: np.lexsort((last_access, frequency)),
+    # Evict the largest item first to keep as many small decoded samples as possible
+    "size": lambda last_access, frequency, size: np.lexsort((last_access, -size)),
+}
+
+# Data types which can be stored in the memory pool. The index of each type is stored in the index table.
+_DTYPES = [
+    np.dtype(dtype)
+    for dtype in (
+        np.uint8,
+        np.int8,
+        np.uint16,
+        np.int16,
+        np.uint32,
+        np.int32,
+        np.uint64,
+        np.int64,
+        np.float16,
+        np.float32,
+        np.float64,
+        np.bool_,
+    )
+]
+_DTYPE_CODES = {dtype: code for code, dtype in enumerate(_DTYPES)}
+_MAX_NDIM = 4
+
+# Fields of a fixed-size record in the index table
+(
+    _SEQ,  # Sequence number. It is odd while the record is being written.
+    _STATE,  # _EMPTY or _OCCUPIED
+    _KEY_HASH,
+    _OFFSET,
+    _DATA_BYTES,
+    _META_OFFSET,
+    _META_BYTES,
+    _DTYPE,
+    _NDIM,
+    _SHAPE,
+) = range(10)
+_STRIDES = _SHAPE + _MAX_NDIM
+_LAST_ACCESS = _STRIDES + _MAX_NDIM
+_FREQUENCY = _LAST_ACCESS + 1
+_NUM_FIELDS = _FREQUENCY + 1
+
+_EMPTY, _OCCUPIED = 0, 1
+
+# Fields of the counter array
+_USED_BYTES, _NUM_ITEMS, _CLOCK, _HITS, _MISSES, _EVICTIONS = range(6)
+_NUM_COUNTERS = 6
+
 
 class _DummyLock:
     def __enter__(self, *args, **kwargs):
@@ -26,53 +82,215 @@ class _DummyLock:
         pass
 
 
+def _hash_key(key: Any) -> int:
+    """Get a 64-bit hash of the key which is stable across processes."""
+    digest = hashlib.blake2b(pickle.dumps(key), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class _FreeListAllocator:
+    """Best-fit free-list allocator whose state is kept in the given (shared) arrays.
+
+    Args:
+        blocks (np.ndarray): (N, 2) array of offset-sorted free blocks, (offset, size)
+        num_blocks (np.ndarray): Single element array for the number of free blocks
+    """
+
+    def __init__(self, blocks: np.ndarray, num_blocks: np.ndarray):
+        self._blocks = blocks
+        self._num_blocks = num_blocks
+
+    def reset(self, size: int) -> None:
+        """Make the whole arena of the given size free."""
+        if size > 0:
+            self._blocks[0] = (0, size)
+            self._num_blocks[0] = 1
+
+    def find(self, size: int) -> Optional[int]:
+        """Find the index of the smallest free block which can hold the given size."""
+        block_sizes = self._blocks[: self._num_blocks[0], 1]
+        candidates = np.flatnonzero(block_sizes >= size)
+        if len(candidates) == 0:
+            return None
+        return int(candidates[np.argmin(block_sizes[candidates])])
+
+    def allocate(self, block_idx: int, size: int) -> int:
+        """Take the given size from the free block and return its offset."""
+        num_blocks = self._num_blocks[0]
+        offset, block_size = self._blocks[block_idx]
+        if block_size == size:
+            self._blocks[block_idx : num_blocks - 1] = self._blocks[block_idx + 1 : num_blocks].copy()
+            self._num_blocks[0] -= 1
+        else:
+            self._blocks[block_idx] = (offset + size, block_size - size)
+        return int(offset)
+
+    def release(self, offset: int, size: int) -> None:
+        """Return a block to the free list and coalesce it with its neighbors."""
+        num_blocks = self._num_blocks[0]
+        blocks = self._blocks
+        idx = int(np.searchsorted(blocks[:num_blocks, 0], offset))
+
+        merge_prev = idx > 0 and blocks[idx - 1, 0] + blocks[idx - 1, 1] == offset
+        merge_next = idx < num_blocks and offset + size == blocks[idx, 0]
+
+        if merge_prev and merge_next:
+            blocks[idx - 1, 1] += size + blocks[idx, 1]
+            blocks[idx : num_blocks - 1] = blocks[idx + 1 : num_blocks].copy()
+            self._num_blocks[0] -= 1
+        elif merge_prev:
+            blocks[idx - 1, 1] += size
+        elif merge_next:
+            blocks[idx] = (offset, size + blocks[idx, 1])
+        else:
+            blocks[idx + 1 : num_blocks + 1] = blocks[idx:num_blocks].copy()
+            blocks[idx] = (offset, size)
+            self._num_blocks[0] += 1
+
+
 class MemCacheHandlerBase:
     """Base class for memory cache handler.
 
     It will be combined with LoadImageFromOTXDataset to store/retrieve the samples in memory.
+    The data of the cached items are stored in a memory pool and their pickled metadata are stored
+    in a side arena. Both of them are managed by free-list allocators.
+    The items are looked up through an open-addressing hash table of fixed-size records,
+    (key hash, offset, dtype, shape, strides, ...), which is also stored in a flat array.
+    Writers are serialized by a lock, while readers are lock-free:
+    each record has a sequence number and a reader regards the item as a cache miss
+    if the record has been changed while it was reading the item.
+    If there is no free block to store a new item, the cached items are evicted
+    according to the given eviction policy until the new item fits in.
+
+    Args:
+        mem_size (int): The size of memory pool (bytes).
+        eviction_policy (str): Which items to evict first if the memory pool is full.
+            One of "lru" (least recently used), "lfu" (least frequently used)
+            or "size" (the largest decoded size). Defaults to "lru".
+        max_items (Optional[int]): The maximum number of items to store.
+            If None, it is determined by the memory pool size. Defaults to None.
     """
 
-    def __init__(self, mem_size: int):
+    # When eviction is required, evict at least this ratio of the memory pool at once
+    # to amortize the cost of sorting eviction candidates.
+    EVICTION_RATIO: float = 0.05
+    # Default maximum number of items is determined by assuming that an item is larger than this.
+    MIN_AVG_ITEM_BYTES: int = 64 * 1024
+    # The metadata arena size is this ratio of the memory pool size but not smaller than MIN_META_ARENA_BYTES.
+    META_ARENA_RATIO: float = 1 / 16
+    MIN_META_ARENA_BYTES: int = 16 * 1024**2
+
+    def __init__(self, mem_size: int, eviction_policy: str = "lru", max_items: Optional[int] = None):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise MemCacheHandlerError(
+                f"{eviction_policy} is unknown eviction policy. Choose one of {list(EVICTION_POLICIES.keys())}."
+            )
+        self._eviction_policy = eviction_policy
+
+        if mem_size == 0:
+            max_items = 0
+        elif max_items is None:
+            max_items = max(1024, mem_size // self.MIN_AVG_ITEM_BYTES)
+        self._max_items = max_items
         self._init_data_structs(mem_size)
 
+    def _create_array(self, ctype: Any, size: int) -> ct.Array:
+        """Create a zero-initialized ctypes array."""
+        return (ctype * size)()
+
+    def _create_lock(self) -> Union[Lock, _DummyLock]:
+        """Create a lock to serialize writers."""
+        return _DummyLock()
+
+    def _create_ndarray(self, ctype: Any, shape: Tuple[int, ...]) -> np.ndarray:
+        """Create a zero-initialized np.ndarray on top of the ctypes array from _create_array()."""
+        return np.frombuffer(self._create_array(ctype, int(np.prod(shape))), dtype=ctype).reshape(shape)
+
+    @classmethod
+    def get_meta_size(cls, mem_size: int) -> int:
+        """Get the size of the metadata arena allocated in addition to the memory pool of the given size."""
+        return max(int(mem_size * cls.META_ARENA_RATIO), cls.MIN_META_ARENA_BYTES) if mem_size > 0 else 0
+
     def _init_data_structs(self, mem_size: int):
-        self._arr = (ct.c_uint8 * mem_size)()
-        self._cur_page = ct.c_size_t(0)
-        self._cache_addr: Union[Dict, DictProxy] = {}
-        self._lock: Union[Lock, _DummyLock] = _DummyLock()
-        self._freeze = ct.c_bool(False)
+        meta_size = self.get_meta_size(mem_size)
+        # Keep the load factor of the hash table under 0.5
+        num_slots = 1 << (2 * self._max_items - 1).bit_length() if self._max_items > 0 else 0
+
+        self._arr = self._create_array(ct.c_uint8, mem_size)
+        self._pool = np.frombuffer(self._arr, dtype=np.uint8)
+        self._meta_arena = self._create_ndarray(ct.c_uint8, (meta_size,))
+        self._index = self._create_ndarray(ct.c_int64, (num_slots, _NUM_FIELDS))
+        self._counters = self._create_ndarray(ct.c_int64, (_NUM_COUNTERS,))
+
+        # The number of free blocks cannot exceed the number of items + 1
+        self._pool_allocator = _FreeListAllocator(
+            self._create_ndarray(ct.c_int64, (self._max_items + 1, 2)),
+            self._create_ndarray(ct.c_int64, (1,)),
+        )
+        self._pool_allocator.reset(mem_size)
+        self._meta_allocator = _FreeListAllocator(
+            self._create_ndarray(ct.c_int64, (self._max_items + 1, 2)),
+            self._create_ndarray(ct.c_int64, (1,)),
+        )
+        self._meta_allocator.reset(meta_size)
+
+        self._lock = self._create_lock()
+        self._freeze = self._create_array(ct.c_bool, 1)
 
     def __len__(self):
         """Get the number of cached items."""
-        return len(self._cache_addr)
+        return int(self._counters[_NUM_ITEMS])
 
     @property
     def mem_size(self) -> int:
         """Get the reserved memory pool size (bytes)."""
         return len(self._arr)
 
+    @property
+    def eviction_policy(self) -> str:
+        """Get the eviction policy of the memory pool."""
+        return self._eviction_policy
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the number of cache hits, misses and evictions.
+
+        Since the readers do not take the lock, the numbers are approximate in the multiprocessing case.
+        """
+        return {
+            "hits": int(self._counters[_HITS]),
+            "misses": int(self._counters[_MISSES]),
+            "evictions": int(self._counters[_EVICTIONS]),
+        }
+
     def get(self, key: Any) -> Tuple[Optional[np.ndarray], Optional[Dict]]:
         """Try to look up the cached item with the given key.
 
+        Since the cached item can be evicted and overwritten by other items,
+        it returns a copy of the cached data.
+
         Args:
             key (Any): A key for looking up the cached item
 
         Returns:
             If succeed return (np.ndarray, Dict), otherwise return (None, None)
         """
-        if self.mem_size == 0 or key not in self._cache_addr:
+        if self.mem_size == 0:
             return None, None
 
-        addr = self._cache_addr[key]
-
-        offset, count, dtype, shape, strides, meta = addr
+        item = self._read(key)
+        if item is None:
+            self._counters[_MISSES] += 1
+            return None, None
 
-        data = np.frombuffer(self._arr, dtype=dtype, count=count, offset=offset)
-        return np.lib.stride_tricks.as_strided(data, shape, strides), meta
+        self._counters[_HITS] += 1
+        return item
 
     def put(self, key: Any, data: np.ndarray, meta: Optional[Dict] = None) -> Optional[int]:
         """Try to store np.ndarray and metadata with a key to the reserved memory pool.
 
+        If there is no free space left, cached items are evicted according to the eviction policy.
+
         Args:
             key (Any): A key to store the cached item
             data (np.ndarray): A data sample to store
@@ -81,47 +299,210 @@ class MemCacheHandlerBase:
         Returns:
             Optional[int]: If succeed return the address of cached item in memory pool
         """
-        if self._freeze.value:
+        if self._freeze[0] or data.dtype not in _DTYPE_CODES or data.ndim > _MAX_NDIM:
             return None
 
+        data = np.ascontiguousarray(data)
         data_bytes = data.size * data.itemsize
 
+        if data_bytes == 0 or data_bytes > self.mem_size:
+            return None
+
+        key_hash = _hash_key(key)
+
         with self._lock:
-            new_page = self._cur_page.value + data_bytes
+            if self._find_slot(key_hash) is not None:
+                return None
 
-            if key in self._cache_addr or new_page > self.mem_size:
+            meta_blob = np.frombuffer(pickle.dumps((key, meta), protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+            meta_bytes = len(meta_blob)
+            if meta_bytes > len(self._meta_arena):
                 return None
 
-            offset = ct.byref(self._arr, self._cur_page.value)
-            ct.memmove(offset, data.ctypes.data, data_bytes)
+            if (
+                len(self) >= self._max_items
+                or self._pool_allocator.find(data_bytes) is None
+                or self._meta_allocator.find(meta_bytes) is None
+            ):
+                self._evict(data_bytes, meta_bytes)
 
-            self._cache_addr[key] = (
-                self._cur_page.value,
-                data.size,
-                data.dtype,
-                data.shape,
-                data.strides,
-                meta,
-            )
-            self._cur_page.value = new_page
-            return new_page
+            pool_block_idx = self._pool_allocator.find(data_bytes)
+            meta_block_idx = self._meta_allocator.find(meta_bytes)
+            if pool_block_idx is None or meta_block_idx is None:
+                return None
+
+            offset = self._pool_allocator.allocate(pool_block_idx, data_bytes)
+            meta_offset = self._meta_allocator.allocate(meta_block_idx, meta_bytes)
+            self._pool[offset : offset + data_bytes] = data.reshape(-1).view(np.uint8)
+            self._meta_arena[meta_offset : meta_offset + meta_bytes] = meta_blob
+
+            self._insert_record(key_hash, data, offset, meta_offset, meta_bytes)
+            self._counters[_USED_BYTES] += data_bytes
+            self._counters[_NUM_ITEMS] += 1
+            return offset + data_bytes
+
+    def _tick(self) -> int:
+        self._counters[_CLOCK] += 1
+        return int(self._counters[_CLOCK])
+
+    def _find_slot(self, key_hash: int) -> Optional[int]:
+        """Find the slot of the record with the given key hash."""
+        mask = len(self._index) - 1
+        slot = key_hash & mask
+        for _ in range(len(self._index)):
+            if self._index[slot, _STATE] == _EMPTY:
+                return None
+            if self._index[slot, _KEY_HASH] == key_hash:
+                return slot
+            slot = (slot + 1) & mask
+        return None
+
+    def _read(self, key: Any) -> Optional[Tuple[np.ndarray, Optional[Dict]]]:
+        """Read the item without holding the lock. Return None if it is not found or changed while reading."""
+        key_hash = _hash_key(key)
+        slot = self._find_slot(key_hash)
+        if slot is None:
+            return None
+
+        record = self._index[slot].tolist()
+        seq = record[_SEQ]
+        if seq % 2 == 1 or record[_STATE] != _OCCUPIED or record[_KEY_HASH] != key_hash:
+            return None
+
+        offset, data_bytes = record[_OFFSET], record[_DATA_BYTES]
+        meta_offset, meta_bytes = record[_META_OFFSET], record[_META_BYTES]
+        data = self._pool[offset : offset + data_bytes].copy()
+        meta_blob = self._meta_arena[meta_offset : meta_offset + meta_bytes].tobytes()
+
+        # The record was evicted or moved while reading
+        if self._index[slot, _SEQ] != seq:
+            return None
+
+        stored_key, meta = pickle.loads(meta_blob)
+        if stored_key != key:
+            return None
+
+        # Usage statistics can be updated without the lock since they are only hints for eviction
+        self._index[slot, _LAST_ACCESS] = self._tick()
+        self._index[slot, _FREQUENCY] += 1
+
+        ndim = record[_NDIM]
+        shape = record[_SHAPE : _SHAPE + ndim]
+        strides = record[_STRIDES : _STRIDES + ndim]
+        return np.ndarray(shape, dtype=_DTYPES[record[_DTYPE]], buffer=data, strides=strides), meta
+
+    def _insert_record(self, key_hash: int, data: np.ndarray, offset: int, meta_offset: int, meta_bytes: int) -> None:
+        """Write a new record to the first empty slot on the probe sequence. It should hold the lock."""
+        mask = len(self._index) - 1
+        slot = key_hash & mask
+        while self._index[slot, _STATE] != _EMPTY:
+            slot = (slot + 1) & mask
+
+        seq = self._index[slot, _SEQ] + 1
+        self._index[slot, _SEQ] = seq
+
+        record = np.zeros(_NUM_FIELDS, dtype=np.int64)
+        record[_SEQ] = seq
+        record[_STATE] = _OCCUPIED
+        record[_KEY_HASH] = key_hash
+        record[_OFFSET] = offset
+        record[_DATA_BYTES] = data.size * data.itemsize
+        record[_META_OFFSET] = meta_offset
+        record[_META_BYTES] = meta_bytes
+        record[_DTYPE] = _DTYPE_CODES[data.dtype]
+        record[_NDIM] = data.ndim
+        record[_SHAPE : _SHAPE + data.ndim] = data.shape
+        record[_STRIDES : _STRIDES + data.ndim] = data.strides
+        record[_LAST_ACCESS] = self._tick()
+        record[_FREQUENCY] = 1
+        self._index[slot] = record
+
+        self._index[slot, _SEQ] = seq + 1
+
+    def _delete_record(self, slot: int) -> None:
+        """Delete the record with backward-shift deletion so that no tombstone is left. It should hold the lock."""
+        mask = len(self._index) - 1
+        self._index[slot, _SEQ] += 1
+        self._index[slot, _STATE] = _EMPTY
+
+        hole = slot
+        cur = slot
+        while True:
+            cur = (cur + 1) & mask
+            if self._index[cur, _STATE] == _EMPTY:
+                break
+            home = self._index[cur, _KEY_HASH] & mask
+            # The record can be moved to the hole only if its home slot is not cyclically in (hole, cur]
+            if (hole < home <= cur) if hole <= cur else (hole < home or home <= cur):
+                continue
+            self._index[cur, _SEQ] += 1
+            self._index[hole, _STATE:] = self._index[cur, _STATE:]
+            self._index[hole, _SEQ] += 1
+            self._index[cur, _STATE] = _EMPTY
+            hole = cur
+
+        self._index[hole, _SEQ] += 1
+
+    def _evict(self, data_bytes: int, meta_bytes: int) -> None:
+        """Evict the cached items until both free blocks for the given data and metadata sizes are available.
+
+        It should be called while holding the lock.
+
+        Args:
+            data_bytes (int): The data size of the item to store
+            meta_bytes (int): The metadata size of the item to store
+        """
+        target_bytes = max(data_bytes, int(self.mem_size * self.EVICTION_RATIO))
+        records = self._index[self._index[:, _STATE] == _OCCUPIED]
+        order = EVICTION_POLICIES[self._eviction_policy](
+            records[:, _LAST_ACCESS], records[:, _FREQUENCY], records[:, _DATA_BYTES]
+        )
+
+        evicted_bytes = 0
+        for record in records[order]:
+            # Records can be moved by the deletion, so that they are looked up again by their key hashes
+            slot = self._find_slot(int(record[_KEY_HASH]))
+            if slot is None:
+                continue
+            self._delete_record(slot)
+            self._pool_allocator.release(int(record[_OFFSET]), int(record[_DATA_BYTES]))
+            self._meta_allocator.release(int(record[_META_OFFSET]), int(record[_META_BYTES]))
+
+            self._counters[_USED_BYTES] -= record[_DATA_BYTES]
+            self._counters[_NUM_ITEMS] -= 1
+            self._counters[_EVICTIONS] += 1
+            evicted_bytes += record[_DATA_BYTES]
+
+            if (
+                evicted_bytes >= target_bytes
+                and len(self) < self._max_items
+                and self._pool_allocator.find(data_bytes) is not None
+                and self._meta_allocator.find(meta_bytes) is not None
+            ):
+                return
 
     def __repr__(self):
         """Representation for the current handler status."""
-        perc = 100.0 * self._cur_page.value / self.mem_size if self.mem_size > 0 else 0.0
+        used_bytes = int(self._counters[_USED_BYTES])
+        perc = 100.0 * used_bytes / self.mem_size if self.mem_size > 0 else 0.0
+        stats = self.stats
+        num_lookups = stats["hits"] + stats["misses"]
+        hit_rate = 100.0 * stats["hits"] / num_lookups if num_lookups > 0 else 0.0
         return (
             f"{self.__class__.__name__} "
-            f"uses {self._cur_page.value} / {self.mem_size} ({perc:.1f}%) memory pool and "
-            f"store {len(self)} items."
+            f"uses {used_bytes} / {self.mem_size} ({perc:.1f}%) memory pool and "
+            f"store {len(self)} items. "
+            f"Hit rate is {hit_rate:.1f}% ({stats['hits']} hits / {stats['misses']} misses) and "
+            f"{stats['evictions']} items are evicted with {self._eviction_policy} policy."
         )
 
     def freeze(self):
         """If frozen, it is impossible to store a new item anymore."""
-        self._freeze.value = True
+        self._freeze[0] = True
 
     def unfreeze(self):
         """If unfrozen, it is possible to store a new item."""
-        self._freeze.value = False
+        self._freeze[0] = False
 
 
 class MemCacheHandlerForSP(MemCacheHandlerBase):
@@ -135,20 +516,15 @@ class MemCacheHandlerForMP(MemCacheHandlerBase):
     """Memory caching handler for multi processing.
 
     Use if PyTorch's DataLoader.num_workers > 0.
+    All the data structures are allocated in shared memory,
+    so that the forked DataLoader workers can look up the cached items without IPC.
     """
 
-    def _init_data_structs(self, mem_size: int):
-        self._arr = mp.Array(ct.c_uint8, mem_size, lock=False)
-        self._cur_page = mp.Value(ct.c_size_t, 0, lock=False)
-
-        self._manager = mp.Manager()
-        self._cache_addr: DictProxy = self._manager.dict()
-        self._lock = mp.Lock()
-        self._freeze = mp.Value(ct.c_bool, False, lock=False)
+    def _create_array(self, ctype: Any, size: int) -> ct.Array:
+        return mp.Array(ctype, size, lock=False)
 
-    def __del__(self):
-        """When deleting, manager should also be shutdowned."""
-        self._manager.shutdown()
+    def _create_lock(self) -> Union[Lock, _DummyLock]:
+        return mp.Lock()
 
 
 class MemCacheHandlerError(Exception):
@@ -174,12 +550,13 @@ class MemCacheHandlerSingleton:
         return cls.instance
 
     @classmethod
-    def create(cls, mode: str, mem_size: int) -> MemCacheHandlerBase:
+    def create(cls, mode: str, mem_size: int, eviction_policy: str = "lru") -> MemCacheHandlerBase:
         """Create a new MemCacheHandlerBase instance.
 
         Args:
             mode (str): There are two options: null, multiprocessing or singleprocessing.
             mem_size (int): The size of memory pool (bytes).
+            eviction_policy (str): Eviction policy of the memory pool: lru, lfu or size.
         """
 
         # COPY FROM mmcv.runner.get_dist_info
@@ -200,17 +577,19 @@ class MemCacheHandlerSingleton:
             logger.info(f"Since world_size={world_size} > 1, each worker a {mem_size} size memory pool.")
 
         logger.info(f"Try to create a {mem_size} size memory pool.")
-        if available_cpu_mem < ((mem_size / GIB) + cls.CPU_MEM_LIMITS_GIB):
+        # the metadata arena is allocated in addition to the memory pool
+        required_mem_size = mem_size + MemCacheHandlerBase.get_meta_size(mem_size)
+        if available_cpu_mem < ((required_mem_size / GIB) + cls.CPU_MEM_LIMITS_GIB):
             logger.warning("No available CPU memory left, mem_size will be set to 0.")
             mem_size = 0
 
         if mode == "null" or mem_size == 0:
-            cls.instance = MemCacheHandlerBase(mem_size=0)
+            cls.instance = MemCacheHandlerBase(mem_size=0, eviction_policy=eviction_policy)
             cls.instance.freeze()
         elif mode == "multiprocessing":
-            cls.instance = MemCacheHandlerForMP(mem_size)
+            cls.instance = MemCacheHandlerForMP(mem_size, eviction_policy=eviction_policy)
         elif mode == "singleprocessing":
-            cls.instance = MemCacheHandlerForSP(mem_size)
+            cls.instance = MemCacheHandlerForSP(mem_size, eviction_policy=eviction_policy)
         else:
             raise MemCacheHandlerError(f"{mode} is unknown mode.")
 
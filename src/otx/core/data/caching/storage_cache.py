@@ -4,17 +4,124 @@
 #
 
 import hashlib
+import json
 import os
+import pickle
 import shutil
 import stat
-from typing import List, Optional
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
+import pyarrow as pa
 from datumaro.components.dataset import Dataset as DatumDataset
+from datumaro.components.dataset_base import DatasetItem
 from datumaro.components.progress_reporting import SimpleProgressReporter
+from datumaro.plugins.data_formats.arrow.base import ArrowBase
 
 from otx.core.file import OTX_CACHE
 
 DATASET_CACHE = os.path.join(OTX_CACHE, "dataset")
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+STAGING_PREFIX = ".staging-"
+# Shards not in the manifest are removed only after they are left untouched for this long,
+# so that shards being published by a concurrent run are not swept.
+STALE_SHARD_SECONDS = 3600
+
+
+def _get_dataset_hash(dataset: DatumDataset, scheme: str) -> str:
+    """Get the hash identifying the cache directory of the dataset.
+
+    It does not depend on the dataset items so that the cache directory can be updated incrementally.
+    """
+    _hash = hashlib.sha256()
+    _hash.update(f"{dataset.data_path}".encode("utf-8"))
+    _hash.update(f"{sorted(dataset.subsets())}".encode("utf-8"))
+    _hash.update(f"{scheme}".encode("utf-8"))
+    _hash.update(pickle.dumps(dataset.categories()))
+    return _hash.hexdigest()
+
+
+def _get_item_hash(item: DatasetItem) -> str:
+    """Get the content hash of the dataset item.
+
+    The media is identified by its path, modification time and size if it is stored in a file,
+    otherwise by its decoded data.
+    """
+    _hash = hashlib.sha256()
+    _hash.update(f"{item.id}/{item.subset}".encode("utf-8"))
+    try:
+        _hash.update(pickle.dumps((item.annotations, item.attributes)))
+    except Exception:  # pylint: disable=broad-except
+        _hash.update(f"{item.annotations}{item.attributes}".encode("utf-8"))
+
+    media = item.media
+    path = getattr(media, "path", None)
+    if path and os.path.isfile(path):
+        file_stat = os.stat(path)
+        _hash.update(f"{path}/{file_stat.st_mtime_ns}/{file_stat.st_size}".encode("utf-8"))
+    elif media is not None and getattr(media, "data", None) is not None:
+        _hash.update(media.data.tobytes())
+    return _hash.hexdigest()
+
+
+def _get_file_hash(file: str) -> str:
+    _hash = hashlib.sha256()
+    _hash.update(str(file).encode("utf-8"))
+    _hash.update(str(os.stat(file)[stat.ST_MTIME]).encode("utf-8"))
+    return _hash.hexdigest()
+
+
+def _load_manifest(cache_dir: str) -> Dict:
+    manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "generation": 0, "shards": {}}
+
+
+def _save_manifest(cache_dir: str, manifest: Dict) -> None:
+    manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def _read_shard_ids(shard_path: str) -> List[Tuple[str, str]]:
+    with pa.memory_map(shard_path, "r") as mm_file:
+        with pa.ipc.open_file(mm_file) as reader:
+            table = reader.read_all().select(["id", "subset"])
+    return list(zip(table.column("id").to_pylist(), table.column("subset").to_pylist()))
+
+
+def _remove_stale_orphans(cache_dir: str, shards: Dict) -> None:
+    """Remove shards not in the manifest and staging directories left by interrupted runs.
+
+    Orphan shards are grouped by the prefix of the run which exported them,
+    and a group is removed only if none of its files has been modified for `STALE_SHARD_SECONDS`.
+    """
+    deadline = time.time() - STALE_SHARD_SECONDS
+    orphans: Dict[str, List[str]] = defaultdict(list)
+    for file in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, file)
+        if file.startswith(STAGING_PREFIX) and os.path.isdir(path):
+            if os.path.getmtime(path) < deadline:
+                shutil.rmtree(path, ignore_errors=True)
+        elif file.endswith(".arrow") and file not in shards:
+            orphans[file.rsplit("-", 1)[0]].append(path)
+
+    for paths in orphans.values():
+        if all(os.path.getmtime(path) < deadline for path in paths):
+            for path in paths:
+                os.remove(path)
 
 
 def arrow_cache_helper(
@@ -26,80 +133,84 @@ def arrow_cache_helper(
 ) -> List[str]:
     """A helper for dumping Datumaro arrow format.
 
+    The cache is updated incrementally. The content hash of each item is kept in a manifest
+    with the arrow shard containing it. Only added or changed items are exported into new shards,
+    and shards containing deleted or changed items are dropped after their unchanged items are re-exported.
+
     Args:
         dataset: Datumaro dataset to export in apache arrow.
         scheme: Datumaro apache arrow image encoding scheme.
-        num_workers: The number of workers to build arrow format.
+        num_workers: The number of workers to hash dataset items and build arrow format.
+            If it is 0, items are hashed by the default number of threads.
         cache_dir: The directory to save.
         force: If true, rebuild arrow even if cache is hit.
     """
-
-    def get_hash(dataset, scheme):
-        source_path = dataset.data_path
-        _hash = hashlib.sha256()
-        _hash.update(f"{source_path}".encode("utf-8"))
-        _hash.update(f"{len(dataset)}".encode("utf-8"))
-        _hash.update(f"{scheme}".encode("utf-8"))
-        if source_path:
-            _hash.update(str(os.stat(source_path)[stat.ST_MTIME]).encode("utf-8"))
-            if os.path.isdir(source_path):
-                for root, dirs, files in os.walk(source_path):
-                    for file in files:
-                        file = os.path.join(root, file)
-                        _hash.update(str(os.stat(file)[stat.ST_MTIME]).encode("utf-8"))
-                    for _dir in dirs:
-                        _dir = os.path.join(root, _dir)
-                        _hash.update(str(os.stat(_dir)[stat.ST_MTIME]).encode("utf-8"))
-        return _hash.hexdigest()
-
-    def get_file_hash(file):
-        _hash = hashlib.sha256()
-        _hash.update(str(file).encode("utf-8"))
-        _hash.update(str(os.stat(file)[stat.ST_MTIME]).encode("utf-8"))
-        return _hash.hexdigest()
-
-    cache_dir = os.path.join(cache_dir, get_hash(dataset, scheme))
+    cache_dir = os.path.join(cache_dir, _get_dataset_hash(dataset, scheme))
     if os.path.exists(cache_dir) and force:
         shutil.rmtree(cache_dir)
     os.makedirs(cache_dir, exist_ok=True)
 
-    cache_paths = []
-    cache_hit = []
-    for cache_path in os.listdir(cache_dir):
-        if not cache_path.endswith(".arrow"):
-            continue
-        cache_hit.append(False)
-        cache_path = os.path.join(cache_dir, cache_path)
-        cache_paths.append(cache_path)
-        hash_path = f"{cache_path}.hash"
-        if os.path.exists(cache_path) and os.path.exists(hash_path):
-            with open(hash_path, "r", encoding="utf-8") as f:
-                if get_file_hash(cache_path) == f.read():
-                    cache_hit[-1] = True
-
-    if cache_hit and all(cache_hit):
-        return cache_paths
-
-    dataset.export(
-        cache_dir,
-        "arrow",
-        save_media=True,
-        image_ext=scheme,
-        num_workers=num_workers,
-        progress_reporter=SimpleProgressReporter(0, 10),
-    )
-
-    cache_paths = []
-    for cache_path in os.listdir(cache_dir):
-        if not cache_path.endswith(".arrow"):
+    items = list(dataset)
+    with ThreadPoolExecutor(max_workers=num_workers or None) as executor:
+        item_hashes = list(executor.map(_get_item_hash, items))
+    current = {(item.id, item.subset): item_hash for item, item_hash in zip(items, item_hashes)}
+
+    manifest = _load_manifest(cache_dir)
+    shards = manifest["shards"]
+    cached: Set[Tuple[str, str]] = set()
+    changed = False
+    for shard_name in list(shards.keys()):
+        shard = shards[shard_name]
+        shard_path = os.path.join(cache_dir, shard_name)
+        is_valid = os.path.exists(shard_path) and _get_file_hash(shard_path) == shard["hash"]
+        if is_valid and all(current.get((_id, subset)) == item_hash for _id, subset, item_hash in shard["items"]):
+            cached.update((_id, subset) for _id, subset, _ in shard["items"])
             continue
-        cache_path = os.path.join(cache_dir, cache_path)
-        cache_paths.append(cache_path)
-        hash_path = f"{cache_path}.hash"
-        with open(hash_path, "w", encoding="utf-8") as f:
-            f.write(get_file_hash(cache_path))
-
-    return cache_paths
+        # Drop the shard if it contains deleted or changed items. Its unchanged items are exported again.
+        del shards[shard_name]
+        changed = True
+        if os.path.exists(shard_path):
+            os.remove(shard_path)
+
+    _remove_stale_orphans(cache_dir, shards)
+
+    new_items = [item for item in items if (item.id, item.subset) not in cached]
+    if new_items or not shards:
+        # The prefix is unique per run so that concurrent runs never overwrite each other's shards.
+        prefix = f"datum{manifest['generation']:06d}-{os.getpid()}"
+        manifest["generation"] += 1
+        new_dataset = DatumDataset.from_iterable(
+            new_items, categories=dataset.categories(), media_type=dataset.media_type()
+        )
+        # Export into a staging directory first so that incomplete shards never appear in the cache directory
+        staging_dir = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=cache_dir)
+        try:
+            new_dataset.export(
+                staging_dir,
+                "arrow",
+                save_media=True,
+                image_ext=scheme,
+                num_workers=num_workers,
+                prefix=prefix,
+                progress_reporter=SimpleProgressReporter(0, 10),
+            )
+            for file in os.listdir(staging_dir):
+                if not (file.startswith(prefix) and file.endswith(".arrow")):
+                    continue
+                shard_path = os.path.join(cache_dir, file)
+                os.replace(os.path.join(staging_dir, file), shard_path)
+                shards[file] = {
+                    "hash": _get_file_hash(shard_path),
+                    "items": [[_id, subset, current[(_id, subset)]] for _id, subset in _read_shard_ids(shard_path)],
+                }
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        changed = True
+
+    if changed:
+        _save_manifest(cache_dir, manifest)
+
+    return [os.path.join(cache_dir, shard_name) for shard_name in sorted(shards.keys())]
 
 
 def init_arrow_cache(dataset: DatumDataset, scheme: Optional[str] = None, **kwargs) -> DatumDataset:
@@ -113,5 +224,8 @@ def init_arrow_cache(dataset: DatumDataset, scheme: Optional[str] = None, **kwar
     if scheme is None or scheme == "NONE":
         return dataset
     cache_paths = arrow_cache_helper(dataset, scheme, **kwargs)
-    dataset = DatumDataset.import_from(os.path.dirname(cache_paths[0]), "arrow")
+    cache_dir = os.path.dirname(cache_paths[0])
+    # Import only the shards in the manifest, not the orphans which are not swept yet
+    dataset = DatumDataset.from_extractors(ArrowBase(cache_dir, file_paths=cache_paths))
+    dataset.bind(cache_dir, "arrow")
     return dataset
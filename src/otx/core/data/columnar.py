@@ -0,0 +1,513 @@
+"""Compact columnar snapshot of a DatasetEntity for DataLoader workers."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+import json
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from otx.api.entities.annotation import (
+    Annotation,
+    AnnotationSceneEntity,
+    AnnotationSceneKind,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity, DatasetItemEntityWithID
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.id import ID
+from otx.api.entities.image import Image
+from otx.api.entities.label import LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.subset import Subset
+from otx.api.serialization.label_mapper import LabelMapper
+
+# Shape type codes of the annotations
+_RECTANGLE, _ELLIPSE, _POLYGON = range(3)
+_SHAPE_TYPES = {Rectangle: _RECTANGLE, Ellipse: _ELLIPSE, Polygon: _POLYGON}
+
+
+class _Ragged:
+    """Rows of variable length flattened in one array, with the offsets of the rows."""
+
+    def __init__(self, rows: Sequence[Sequence], dtype: type, row_shape: Tuple[int, ...] = ()):
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        self.offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.values = np.empty((int(self.offsets[-1]), *row_shape), dtype=dtype)
+        for i, row in enumerate(rows):
+            if len(row) > 0:
+                self.values[self.offsets[i] : self.offsets[i + 1]] = row
+
+    @classmethod
+    def from_arrays(cls, offsets: np.ndarray, values: np.ndarray) -> "_Ragged":
+        ragged = cls.__new__(cls)
+        ragged.offsets, ragged.values = offsets, values
+        return ragged
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.values[self.offsets[index] : self.offsets[index + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + self.values.nbytes
+
+
+class _RaggedStr(_Ragged):
+    """Strings encoded in UTF-8 and flattened in one array of bytes."""
+
+    def __init__(self, strings: Sequence[str]):
+        super().__init__([np.frombuffer(string.encode(), dtype=np.uint8) for string in strings], np.uint8)
+
+    def get(self, index: int) -> str:
+        return self[index].tobytes().decode()
+
+
+class ColumnarDataset:
+    """Compact columnar snapshot of a DatasetEntity.
+
+    The dataset items are stored in flat numpy arrays instead of Python objects per item:
+    media paths, image and item sizes, subset codes, label indices of the ROIs, ignored labels and annotations,
+    annotation boxes and polygon points, with offset arrays indexing the rows of each item.
+    DataLoader workers forked from the main process can read these arrays without touching
+    the reference counts of the shared objects, so their memory stays flat,
+    and the item accessors are array slicing.
+
+    `heights` and `widths` are the sizes of the items taking into account their ROI, as DatasetItemEntity.
+    The loading operations of the data pipelines read the image and the annotations of an item
+    from the arrays by its index, e.g. `load_image` and `get_annotations`.
+    `__getitem__` rebuilds a DatasetItemEntity from the arrays, which is much slower,
+    so it's only for the items whose ROI is not the full image, see `needs_item`.
+    The items which cannot be represented by the arrays, e.g. items with in-memory media, metadata
+    or shapes other than rectangles, ellipses and polygons, are kept as they are.
+
+    Args:
+        otx_dataset (DatasetEntity): Dataset to take the snapshot of.
+        labels (Optional[List[LabelEntity]]): Labels taking the first indices of the label table, in order,
+            the other labels in the dataset follow them. Defaults to None.
+    """
+
+    _ARRAY_NAMES = [
+        "heights",
+        "widths",
+        "_media_sizes",
+        "subsets",
+        "_kinds",
+        "_roi_ann_indices",
+        "_roi_boxes",
+        "_ann_offsets",
+        "ann_types",
+        "ann_boxes",
+    ]
+    _RAGGED_NAMES: Dict[str, Type[_Ragged]] = {
+        "_paths": _RaggedStr,
+        "_item_ids": _RaggedStr,
+        "_roi_ids": _RaggedStr,
+        "_roi_label_indices": _Ragged,
+        "_roi_label_scores": _Ragged,
+        "_ignored_label_indices": _Ragged,
+        "_ann_ids": _RaggedStr,
+        "_ann_points": _Ragged,
+        "_ann_label_indices": _Ragged,
+        "_ann_label_scores": _Ragged,
+    }
+
+    def __init__(self, otx_dataset: DatasetEntity, labels: Optional[List[LabelEntity]] = None):
+        self.uid = uuid.uuid4().hex
+        self.labels: List[LabelEntity] = list(labels) if labels is not None else []
+        self.label_idx: Dict[ID, int] = {label.id: i for i, label in enumerate(self.labels)}
+        self._fallback_items: Dict[int, DatasetItemEntity] = {}
+        # rows of the items in the arrays if it's a selection of the items of another snapshot
+        self._item_indices: Optional[np.ndarray] = None
+
+        num_items = len(otx_dataset)
+        self.heights = np.zeros(num_items, dtype=np.int32)
+        self.widths = np.zeros(num_items, dtype=np.int32)
+        self._media_sizes = np.zeros((num_items, 2), dtype=np.int32)
+        self.subsets = np.zeros(num_items, dtype=np.int8)
+        self._kinds = np.zeros(num_items, dtype=np.int8)
+        self._roi_ann_indices = np.full(num_items, -1, dtype=np.int32)
+        self._roi_boxes = np.zeros((num_items, 4), dtype=np.float64)
+
+        paths, item_ids, roi_ids, roi_labels, ignored_labels = [], [], [], [], []
+        ann_counts, ann_ids, ann_types, ann_boxes, ann_points, ann_labels = [], [], [], [], [], []
+        for index, item in enumerate(otx_dataset):
+            self.heights[index], self.widths[index] = item.height, item.width
+            self.subsets[index] = item.subset.value
+            self._kinds[index] = item.annotation_scene.kind.value
+            ignored_labels.append([self._get_label_index(label) for label in item.ignored_labels])
+            annotations = item.annotation_scene.annotations
+            if not self._is_representable(item):
+                self._fallback_items[index] = item
+                annotations = []
+            else:
+                self._media_sizes[index] = item.media.height, item.media.width
+            roi = item.roi
+
+            paths.append(item.media.path if index not in self._fallback_items else "")
+            item_ids.append(str(item.id_) if isinstance(item, DatasetItemEntityWithID) else "")
+            roi_ids.append(str(roi.id_))
+            roi_labels.append(self._get_scored_labels(roi))
+            if isinstance(roi.shape, Rectangle):
+                self._roi_boxes[index] = roi.shape.x1, roi.shape.y1, roi.shape.x2, roi.shape.y2
+
+            ann_counts.append(len(annotations))
+            for ann_index, annotation in enumerate(annotations):
+                if annotation is roi:
+                    self._roi_ann_indices[index] = ann_index
+                shape = annotation.shape
+                ann_ids.append(str(annotation.id_))
+                ann_types.append(_SHAPE_TYPES[type(shape)])
+                if isinstance(shape, Polygon):
+                    ann_boxes.append((shape.min_x, shape.min_y, shape.max_x, shape.max_y))
+                    ann_points.append([(point.x, point.y) for point in shape.points])
+                else:
+                    ann_boxes.append((shape.x1, shape.y1, shape.x2, shape.y2))
+                    ann_points.append([])
+                ann_labels.append(self._get_scored_labels(annotation))
+
+        self._paths = _RaggedStr(paths)
+        self._item_ids = _RaggedStr(item_ids)
+        self._roi_ids = _RaggedStr(roi_ids)
+        self._roi_label_indices = _Ragged([[index for index, _ in labels] for labels in roi_labels], np.int32)
+        self._roi_label_scores = _Ragged([[score for _, score in labels] for labels in roi_labels], np.float64)
+        self._ignored_label_indices = _Ragged(ignored_labels, np.int32)
+        self._ann_offsets = np.zeros(num_items + 1, dtype=np.int64)
+        np.cumsum(ann_counts, out=self._ann_offsets[1:])
+        self._ann_ids = _RaggedStr(ann_ids)
+        self.ann_types = np.array(ann_types, dtype=np.int8)
+        self.ann_boxes = np.array(ann_boxes, dtype=np.float64).reshape(-1, 4)
+        self._ann_points = _Ragged(ann_points, np.float64, row_shape=(2,))
+        self._ann_label_indices = _Ragged([[index for index, _ in labels] for labels in ann_labels], np.int32)
+        self._ann_label_scores = _Ragged([[score for _, score in labels] for labels in ann_labels], np.float64)
+        self._empty_labels = np.array([label.is_empty for label in self.labels], dtype=bool)
+
+    def __len__(self) -> int:
+        """Returns the number of items."""
+        return len(self.heights)
+
+    def __iter__(self) -> Iterator[DatasetItemEntity]:
+        """Iterates over the rebuilt items."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> DatasetItemEntity:
+        """Rebuilds the dataset item of the index from the arrays."""
+        if index < 0:
+            index += len(self)
+        row = self._get_row(index)
+        if row in self._fallback_items:
+            return self._fallback_items[row]
+
+        ann_start, ann_end = self._ann_offsets[row], self._ann_offsets[row + 1]
+        annotations = [self._get_annotation(ann_index) for ann_index in range(ann_start, ann_end)]
+        roi_ann_index = self._roi_ann_indices[row]
+        if roi_ann_index >= 0:
+            roi = annotations[roi_ann_index]
+        else:
+            roi = Annotation(
+                Rectangle(*self._roi_boxes[row].tolist()),
+                labels=self._to_scored_labels(self._roi_label_indices[row], self._roi_label_scores[row]),
+                id=ID(self._roi_ids.get(row)),
+            )
+        media_height, media_width = self._media_sizes[row].tolist()
+        media = Image(file_path=self._paths.get(row), size=(media_height, media_width))
+        annotation_scene = AnnotationSceneEntity(annotations, kind=AnnotationSceneKind(self._kinds[row]))
+        subset = Subset(self.subsets[index])
+        ignored_labels = [self.labels[label_index] for label_index in self._ignored_label_indices[row]]
+
+        item_id = self._item_ids.get(row)
+        if item_id:
+            return DatasetItemEntityWithID(
+                media, annotation_scene, roi=roi, subset=subset, ignored_labels=ignored_labels, id_=item_id
+            )
+        return DatasetItemEntity(media, annotation_scene, roi=roi, subset=subset, ignored_labels=ignored_labels)
+
+    def __deepcopy__(self, memo: dict) -> "ColumnarDataset":
+        """The snapshot is read-only, so that it's shared instead of being copied with the data pipeline results."""
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes of the arrays, the items kept as they are are not counted."""
+        return sum(array.nbytes for array in self._get_arrays().values())
+
+    def save(self, path: Union[str, Path]):
+        """Saves the arrays and the label table in the directory, which can be loaded memory-mapped by `load`.
+
+        Raises:
+            ValueError: If there are items which cannot be represented by the arrays, or it's a selection.
+        """
+        if self._item_indices is not None:
+            raise ValueError("A selection of the items cannot be saved.")
+        if self._fallback_items:
+            raise ValueError(f"{len(self._fallback_items)} items cannot be represented by the arrays.")
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, array in self._get_arrays().items():
+            np.save(path / f"{name}.npy", array)
+        with (path / "labels.json").open("w", encoding="utf-8") as f:
+            json.dump([LabelMapper.forward(label) for label in self.labels], f)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap_mode: Optional[Literal["r", "c"]] = "r") -> "ColumnarDataset":
+        """Loads the arrays saved by `save`, memory-mapped by default, so that processes share their pages."""
+        snapshot_path = Path(path)
+        columnar = cls.__new__(cls)
+        columnar.uid = uuid.uuid4().hex
+        with (snapshot_path / "labels.json").open("r", encoding="utf-8") as f:
+            columnar.labels = [LabelMapper.backward(label) for label in json.load(f)]
+        columnar.label_idx = {label.id: i for i, label in enumerate(columnar.labels)}
+        columnar._fallback_items = {}  # pylint: disable=protected-access
+        columnar._item_indices = None  # pylint: disable=protected-access
+
+        def _load(name: str) -> np.ndarray:
+            # plain ndarray views of the memory maps, slicing np.memmap is much slower
+            return np.asarray(np.load(snapshot_path / f"{name}.npy", mmap_mode=mmap_mode))
+
+        for name in cls._ARRAY_NAMES:
+            setattr(columnar, name, _load(name))
+        for name, ragged_type in cls._RAGGED_NAMES.items():
+            setattr(columnar, name, ragged_type.from_arrays(_load(f"{name}.offsets"), _load(f"{name}.values")))
+        columnar._empty_labels = np.array(  # pylint: disable=protected-access
+            [label.is_empty for label in columnar.labels], dtype=bool
+        )
+        return columnar
+
+    def _get_arrays(self) -> Dict[str, np.ndarray]:
+        arrays = {name: getattr(self, name) for name in self._ARRAY_NAMES}
+        for name in self._RAGGED_NAMES:
+            ragged = getattr(self, name)
+            arrays[f"{name}.offsets"], arrays[f"{name}.values"] = ragged.offsets, ragged.values
+        return arrays
+
+    def select(self, indices: Sequence[int]) -> "ColumnarDataset":
+        """Returns a selection of the items of the indices, which shares the arrays with this snapshot."""
+        rows = np.asarray(indices, dtype=np.int64)
+        if self._item_indices is not None:
+            rows = self._item_indices[rows]
+        selection = copy.copy(self)
+        selection.uid = uuid.uuid4().hex
+        selection._item_indices = rows  # pylint: disable=protected-access
+        # the public arrays are indexed by the items of the selection, the others by the rows of the snapshot
+        selection.heights, selection.widths = self.heights[indices], self.widths[indices]
+        selection.subsets = self.subsets[indices]
+        return selection
+
+    def get_subset(self, subset: Subset) -> "ColumnarDataset":
+        """Returns a selection of the items of the subset, as `DatasetEntity.get_subset`."""
+        return self.select(np.flatnonzero(self.subsets == subset.value))
+
+    def get_labels(self, include_empty: bool = False) -> List[LabelEntity]:
+        """Returns the labels of the annotations of the items, as `DatasetEntity.get_labels`."""
+        label_offsets = self._ann_label_indices.offsets
+        if self._item_indices is None:
+            label_indices = self._ann_label_indices.values
+        else:
+            ann_starts = self._ann_offsets[self._item_indices]
+            ann_ends = self._ann_offsets[self._item_indices + 1]
+            label_indices = np.concatenate(
+                [
+                    self._ann_label_indices.values[label_offsets[start] : label_offsets[end]]
+                    for start, end in zip(ann_starts, ann_ends)
+                ]
+                or [np.empty(0, dtype=np.int32)]
+            )
+        return [
+            self.labels[label_index]
+            for label_index in np.unique(label_indices).tolist()
+            if include_empty or not self._empty_labels[label_index]
+        ]
+
+    def get_path(self, index: int) -> Optional[str]:
+        """Returns the media path of the item, None if the media is not a file."""
+        row = self._get_row(index)
+        if row in self._fallback_items:
+            return self._fallback_items[row].media.path
+        return self._paths.get(row)
+
+    def needs_item(self, index: int) -> bool:
+        """Returns True if the item should be passed to the data pipelines as DatasetItemEntity.
+
+        It's the case for the items kept as they are and the items whose ROI is not the full image,
+        whose annotations are taken relative to the ROI.
+        """
+        row = self._get_row(index)
+        if row in self._fallback_items:
+            return True
+        roi_ann_index = self._roi_ann_indices[row]
+        if roi_ann_index >= 0 and self.ann_types[self._ann_offsets[row] + roi_ann_index] != _RECTANGLE:
+            return True
+        return self._get_roi_box(row).tolist() != [0.0, 0.0, 1.0, 1.0]
+
+    def get_item_id(self, index: int) -> Optional[ID]:
+        """Returns the id of the item, None if it's not a DatasetItemEntityWithID."""
+        item_id = self._item_ids.get(self._get_row(index))
+        return ID(item_id) if item_id else None
+
+    def get_roi_id(self, index: int) -> ID:
+        """Returns the id of the ROI of the item."""
+        return ID(self._roi_ids.get(self._get_row(index)))
+
+    def get_roi_box(self, index: int) -> np.ndarray:
+        """Returns the (x1, y1, x2, y2) box of the ROI of the item in the relative coordinates of the media."""
+        return self._get_roi_box(self._get_row(index))
+
+    def load_image(self, index: int) -> np.ndarray:
+        """Loads the image of the item cropped by its ROI, as `DatasetItemEntity.numpy`."""
+        row = self._get_row(index)
+        if row in self._fallback_items:
+            return self._fallback_items[row].numpy
+        media_height, media_width = self._media_sizes[row].tolist()
+        data = Image(file_path=self._paths.get(row), size=(media_height, media_width)).numpy
+        roi_box = self._get_roi_box(row).tolist()
+        if roi_box == [0.0, 0.0, 1.0, 1.0]:
+            return data
+        return Rectangle(*roi_box).crop_numpy_array(data)
+
+    def get_ignored_label_indices(self, index: int, label_indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Returns the indices of the ignored labels of the item in the label table.
+
+        If `label_indices` given by `get_label_indices` is given, they are the indices in its labels instead,
+        and the ignored labels which are not in its labels are left out.
+        """
+        ignored_label_indices = self._ignored_label_indices[self._get_row(index)]
+        if label_indices is None:
+            return ignored_label_indices
+        ignored_label_indices = label_indices[ignored_label_indices]
+        return ignored_label_indices[ignored_label_indices >= 0]
+
+    def get_roi_label_indices(self, index: int) -> np.ndarray:
+        """Returns the indices of the labels of the ROI of the item in the label table."""
+        return self._roi_label_indices[self._get_row(index)]
+
+    def get_annotation_slice(self, index: int) -> slice:
+        """Returns the slice of the annotations of the item in the annotation arrays, e.g. `ann_boxes`."""
+        row = self._get_row(index)
+        return slice(int(self._ann_offsets[row]), int(self._ann_offsets[row + 1]))
+
+    def get_annotation_label_indices(self, ann_index: int) -> np.ndarray:
+        """Returns the indices of the labels of the annotation in the label table."""
+        return self._ann_label_indices[ann_index]
+
+    def get_polygon_points(self, ann_index: int) -> np.ndarray:
+        """Returns the (x, y) points of the polygon annotation, empty for the other shapes."""
+        return self._ann_points[ann_index]
+
+    def get_annotation_id(self, ann_index: int) -> ID:
+        """Returns the id of the annotation."""
+        return ID(self._ann_ids.get(ann_index))
+
+    def get_annotations(self, index: int) -> List[Tuple[int, np.ndarray]]:
+        """Returns the annotations of the item with the indices of their labels in the label table.
+
+        As `DatasetItemEntity.get_annotations` with the default arguments, the empty and the ignored labels
+        are left out, and so are the annotations without any other label. The ROI is not taken into account,
+        see `needs_item`.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: Index of each annotation in the annotation arrays and its label indices.
+        """
+        row = self._get_row(index)
+        ignored_label_indices = self._ignored_label_indices[row]
+        annotations = []
+        for ann_index in range(self._ann_offsets[row], self._ann_offsets[row + 1]):
+            label_indices = self._ann_label_indices[ann_index]
+            label_indices = label_indices[~self._empty_labels[label_indices]]
+            if len(ignored_label_indices) > 0:
+                label_indices = label_indices[~np.isin(label_indices, ignored_label_indices)]
+            if len(label_indices) > 0:
+                annotations.append((int(ann_index), label_indices))
+        return annotations
+
+    def get_annotation_polygon(self, ann_index: int) -> np.ndarray:
+        """Returns the (x, y) points of the annotation as a polygon, as `ShapeFactory.shape_as_polygon`."""
+        ann_type = self.ann_types[ann_index]
+        if ann_type == _POLYGON:
+            return self._ann_points[ann_index]
+        x1, y1, x2, y2 = self.ann_boxes[ann_index].tolist()
+        if ann_type == _ELLIPSE:
+            return np.array(Ellipse(x1, y1, x2, y2).get_evenly_distributed_ellipse_coordinates(), dtype=np.float64)
+        return np.array([[x1, y1], [x2, y1], [x2, y2], [x1, y2], [x1, y1]], dtype=np.float64)
+
+    def get_label_indices(self, labels: Sequence[LabelEntity]) -> np.ndarray:
+        """Returns the index of each label of the label table in the given labels, -1 if it's not there."""
+        indices = np.full(len(self.labels), -1, dtype=np.int64)
+        for i, label in enumerate(labels):
+            if label.id in self.label_idx:
+                indices[self.label_idx[label.id]] = i
+        return indices
+
+    def _get_row(self, index: int) -> int:
+        """Returns the row of the item in the arrays, which differs from the index in a selection."""
+        if self._item_indices is None:
+            return index
+        return int(self._item_indices[index])
+
+    def _get_roi_box(self, row: int) -> np.ndarray:
+        roi_ann_index = self._roi_ann_indices[row]
+        if roi_ann_index >= 0:
+            return self.ann_boxes[self._ann_offsets[row] + roi_ann_index]
+        return self._roi_boxes[row]
+
+    @staticmethod
+    def _is_representable(item: DatasetItemEntity) -> bool:
+        """Check if the item can be rebuilt from the arrays."""
+        if type(item.media) is not Image or item.media.path is None or item.get_metadata():
+            return False
+        annotations = item.annotation_scene.annotations
+        if not isinstance(item.roi.shape, Rectangle) and all(annotation is not item.roi for annotation in annotations):
+            return False
+        return all(type(annotation.shape) in _SHAPE_TYPES for annotation in annotations)
+
+    def _get_label_index(self, label: LabelEntity) -> int:
+        """Returns the index of the label in the label table, the label is appended if it is not there."""
+        if label.id not in self.label_idx:
+            self.label_idx[label.id] = len(self.labels)
+            self.labels.append(label)
+        return self.label_idx[label.id]
+
+    def _get_scored_labels(self, annotation: Annotation) -> List[Tuple[int, float]]:
+        return [
+            (self._get_label_index(label.get_label()), label.probability)
+            for label in annotation.get_labels(include_empty=True)
+        ]
+
+    def _to_scored_labels(self, label_indices: np.ndarray, scores: np.ndarray) -> List[ScoredLabel]:
+        return [
+            ScoredLabel(self.labels[label_index], probability=score)
+            for label_index, score in zip(label_indices.tolist(), scores.tolist())
+        ]
+
+    def _get_annotation(self, ann_index: int) -> Annotation:
+        """Rebuilds the annotation from the arrays."""
+        ann_type = self.ann_types[ann_index]
+        shape: Union[Rectangle, Ellipse, Polygon]
+        if ann_type == _POLYGON:
+            shape = Polygon(points=[Point(x, y) for x, y in self._ann_points[ann_index].tolist()])
+        elif ann_type == _ELLIPSE:
+            shape = Ellipse(*self.ann_boxes[ann_index].tolist())
+        else:
+            shape = Rectangle(*self.ann_boxes[ann_index].tolist())
+        labels = self._to_scored_labels(self._ann_label_indices[ann_index], self._ann_label_scores[ann_index])
+        return Annotation(shape, labels=labels, id=ID(self._ann_ids.get(ann_index)))
+
+
+def as_columnar_dataset(
+    dataset: Union[DatasetEntity, ColumnarDataset], labels: Optional[List[LabelEntity]] = None
+) -> ColumnarDataset:
+    """Returns the dataset itself if it's already a columnar snapshot, otherwise takes the snapshot of it.
+
+    A snapshot loaded by `ColumnarDataset.load` can be given to the datasets of the training frameworks directly,
+    so that its memory-mapped arrays are used without expanding the items to Python objects.
+    """
+    if isinstance(dataset, ColumnarDataset):
+        return dataset
+    return ColumnarDataset(dataset, labels)
@@ -17,9 +17,11 @@
 from .hpo_base import TrialStatus
 from .hpo_runner import run_hpo_loop
 from .hyperband import HyperBand
+from .smbo import SMBO
 
 __all__ = [
     "run_hpo_loop",
     "TrialStatus",
     "HyperBand",
+    "SMBO",
 ]
@@ -20,13 +20,13 @@ import queue
 import signal
 import sys
 import time
-from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
+from multiprocessing.connection import wait
 from typing import Any, Callable, Dict, Literal, Optional, Union
 
 from otx.hpo.hpo_base import HpoBase, Trial, TrialStatus
-from otx.hpo.resource_manager import get_resource_manager
+from otx.hpo.resource_manager import get_resource_manager, pin_reserved_cpu
 from otx.utils.logger import get_logger
 
 logger = get_logger()
@@ -41,16 +41,53 @@ class RunningTrial:
     queue: multiprocessing.Queue
 
 
+@dataclass
+class SchedulerMetrics:
+    """Data class for wall time spent by the HPO loop itself.
+
+    Report latency is the time from a trial sending a score to the trial status being sent back to it.
+    Busy time is the time spent on scheduling, and wait time is the time spent waiting for trial events.
+    """
+
+    num_reports: int = 0
+    total_report_latency: float = 0.0
+    max_report_latency: float = 0.0
+    busy_time: float = 0.0
+    wait_time: float = 0.0
+
+    @property
+    def mean_report_latency(self) -> float:
+        """Mean of report latencies in seconds."""
+        return self.total_report_latency / self.num_reports if self.num_reports else 0.0
+
+    def add_report_latency(self, latency: float):
+        """Add a report latency in seconds."""
+        self.num_reports += 1
+        self.total_report_latency += latency
+        self.max_report_latency = max(self.max_report_latency, latency)
+
+    def __str__(self) -> str:
+        """Summary of the metrics."""
+        return (
+            f"{self.num_reports} reports, report latency mean {self.mean_report_latency * 1000:.1f}ms "
+            f"max {self.max_report_latency * 1000:.1f}ms, busy {self.busy_time:.2f}s, waiting {self.wait_time:.2f}s"
+        )
+
+
 class HpoLoop:
     """HPO loop manager to run trials.
 
+    The loop blocks until a trial process exits or a trial reports a score, and handles it right away.
+    Wall time spent by the loop itself is measured in `metrics`.
+
     Args:
         hpo_algo (HpoBase): HPO algorithms.
         train_func (Callable): Function to train a model.
         resource_type (Literal['gpu', 'cpu'], optional): Which type of resource to use.
                                                          If can be changed depending on environment. Defaults to "gpu".
         num_parallel_trial (Optional[int], optional): How many trials to run in parallel.
-                                                    It's used for CPUResourceManager. Defaults to None.
+                                                    It's used for CPUResourceManager. If None, it's derived from
+                                                    the available cores and memory. Defaults to None.
         num_gpu_for_single_trial (Optional[int], optional): How many GPUs are used for a single trial.
                                                             It's used for GPUResourceManager. Defaults to None.
         available_gpu (Optional[str], optional): How many GPUs are available. It's used for GPUResourceManager.
@@ -77,35 +114,61 @@ class HpoLoop:
             resource_type, num_parallel_trial, num_gpu_for_single_trial, available_gpu
         )
         self._main_pid = os.getpid()
+        self._metrics = SchedulerMetrics()
 
         signal.signal(signal.SIGINT, self._terminate_signal_handler)
         signal.signal(signal.SIGTERM, self._terminate_signal_handler)
 
+    @property
+    def metrics(self) -> SchedulerMetrics:
+        """Wall time spent by the HPO loop."""
+        return self._metrics
+
     def run(self):
         """Run a HPO loop."""
         logger.info("HPO loop starts.")
         try:
             while not self._hpo_algo.is_done() and self._trial_fault_count < 3:
-                if self._resource_manager.have_available_resource():
-                    trial = self._hpo_algo.get_next_sample()
-                    if trial is not None:
-                        self._start_trial_process(trial)
+                start_time = time.monotonic()
+                self._start_trial_processes()
+                self._metrics.busy_time += time.monotonic() - start_time
 
-                self._remove_finished_process()
-                self._get_reports()
+                self._wait_trial_events()
 
-                time.sleep(1)
+                start_time = time.monotonic()
+                self._get_reports()
+                self._remove_finished_process()
+                self._metrics.busy_time += time.monotonic() - start_time
         except Exception as e:
             self._terminate_all_running_processes()
             raise e
         logger.info("HPO loop is done.")
+        logger.info(f"HPO loop metrics : {self._metrics}")
 
         if self._trial_fault_count >= 3:
             logger.warning("HPO trials exited abnormally more than three times. HPO is suspended.")
 
         self._get_reports()
+        self._hpo_algo.save_results()
         self._join_all_processes()
 
+    def _start_trial_processes(self):
+        while self._resource_manager.have_available_resource():
+            trial = self._hpo_algo.get_next_sample()
+            if trial is None:
+                break
+            self._start_trial_process(trial)
+
+    def _wait_trial_events(self, timeout: float = 1.0):
+        """Wait until a trial process exits or a trial reports a score.
+
+        Timeout is kept to sample trials again, in case the HPO algorithm has a trial to run without any event.
+        """
+        start_time = time.monotonic()
+        sentinels = [trial.process.sentinel for trial in self._running_trials.values()]
+        wait([self._report_queue._reader, *sentinels], timeout)  # type: ignore  # pylint: disable=protected-access
+        self._metrics.wait_time += time.monotonic() - start_time
+
     def _start_trial_process(self, trial: Trial):
         logger.info(f"{trial.id} trial is now running.")
         logger.debug(f"{trial.id} hyper paramter => {trial.configuration}")
@@ -113,11 +176,12 @@ class HpoLoop:
         trial.status = TrialStatus.RUNNING
         uid = self._get_uid()
 
-        origin_env = deepcopy(os.environ)
         env = self._resource_manager.reserve_resource(uid)
-        if env is not None:
-            for key, val in env.items():
-                os.environ[key] = val
+        if env is None:
+            env = {}
+        origin_env = {key: os.environ.get(key) for key in env}
+        for key, val in env.items():
+            os.environ[key] = val
 
         trial_queue = self._mp.Queue()
         process = self._mp.Process(
@@ -128,9 +192,16 @@ class HpoLoop:
                 partial(_report_score, recv_queue=trial_queue, send_queue=self._report_queue, uid=uid),
             ),
         )
-        os.environ = origin_env
         self._running_trials[uid] = RunningTrial(process, trial, trial_queue)  # type: ignore
-        process.start()
+        try:
+            process.start()
+        finally:
+            # the child process inherits the environment when it starts, restore it for the next trials
+            for key, val in origin_env.items():
+                if val is None:
+                    del os.environ[key]
+                else:
+                    os.environ[key] = val
 
     def _remove_finished_process(self):
         trial_to_remove = []
@@ -148,6 +219,7 @@ class HpoLoop:
             del self._running_trials[uid]
 
     def _get_reports(self):
+        num_reports = 0
         while not self._report_queue.empty():
             report = self._report_queue.get_nowait()
             trial = self._running_trials[report["uid"]]
@@ -155,8 +227,11 @@ class HpoLoop:
                 report["score"], report["progress"], trial.trial.id, report["done"]
             )
             trial.queue.put_nowait(trial_status)
+            self._metrics.add_report_latency(time.time() - report["time"])
+            num_reports += 1
 
-        self._hpo_algo.save_results()
+        if num_reports > 0:
+            self._hpo_algo.save_results()
 
     def _join_all_processes(self):
         for val in self._running_trials.values():
@@ -196,6 +271,7 @@ class HpoLoop:
 def _run_train(train_func: Callable, hp_config: Dict, report_func: Callable):
     # set multi process method as default
     multiprocessing.set_start_method(None, True)  # type: ignore
+    pin_reserved_cpu()
     train_func(hp_config, report_func)
 
 
@@ -209,7 +285,9 @@ def _report_score(
 ):
     logger.debug(f"score : {score}, progress : {progress}, uid : {uid}, pid : {os.getpid()}, done : {done}")
     try:
-        send_queue.put_nowait({"score": score, "progress": progress, "uid": uid, "pid": os.getpid(), "done": done})
+        send_queue.put_nowait(
+            {"score": score, "progress": progress, "uid": uid, "pid": os.getpid(), "done": done, "time": time.time()}
+        )
     except ValueError:
         return TrialStatus.STOP
 
@@ -241,7 +319,8 @@ def run_hpo_loop(
         resource_type (Literal['gpu', 'cpu'], optional): Which type of resource to use.
                                                          If can be changed depending on environment. Defaults to "gpu".
         num_parallel_trial (Optional[int], optional): How many trials to run in parallel.
-                                                      It's used for CPUResourceManager. Defaults to None.
+                                                      It's used for CPUResourceManager. If None, it's derived from
+                                                      the available cores and memory. Defaults to None.
         num_gpu_for_single_trial (Optional[int], optional): How many GPUs are used for a single trial.
                                                             It's used for GPUResourceManager. Defaults to None.
         available_gpu (Optional[str], optional): How many GPUs are available. It's used for GPUResourceManager.
@@ -18,6 +18,7 @@ import os
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Literal, Optional
 
+import psutil
 import torch
 
 from otx.hpo.utils import check_positive
@@ -25,6 +26,9 @@ from otx.utils.logger import get_logger
 
 logger = get_logger()
 
+# environment variable which has the cores reserved for a trial by CPUResourceManager
+CPU_AFFINITY_ENV = "OTX_HPO_CPU_AFFINITY"
+
 
 class BaseResourceManager(ABC):
     """Abstract class for resource manager class."""
@@ -48,15 +52,67 @@ class BaseResourceManager(ABC):
 class CPUResourceManager(BaseResourceManager):
     """Resource manager class for CPU.
 
+    Available cores are partitioned into disjoint core sets, one for each trial running in parallel.
+    A trial is pinned to its cores, and its OpenMP, MKL and torch thread pools and its DataLoader workers
+    are sized to them, so that parallel trials don't oversubscribe the cores.
+
     Args:
-        num_parallel_trial (int, optional): How many trials to run in parallel. Defaults to 4.
+        num_parallel_trial (Optional[int], optional): How many trials to run in parallel. If None, it's derived from
+                                                      the number of available cores and the available memory.
+                                                      Defaults to None.
+        available_cpu (Optional[str], optional): Which cores are available, delimited by ','.
+                                                 If None, cores which the current process can run on are used.
+                                                 Defaults to None.
     """
 
-    def __init__(self, num_parallel_trial: int = 4):
+    MIN_CPU_FOR_SINGLE_TRIAL = 4
+    MEMORY_GIB_FOR_SINGLE_TRIAL = 4
+
+    def __init__(self, num_parallel_trial: Optional[int] = None, available_cpu: Optional[str] = None):
+        self._available_cpu = self._set_available_cpu(available_cpu)
+        if num_parallel_trial is None:
+            num_parallel_trial = self._get_num_parallel_trial()
         check_positive(num_parallel_trial, "num_parallel_trial")
 
         self._num_parallel_trial = num_parallel_trial
-        self._usage_status: List = []
+        self._available_cpu_sets = self._split_available_cpu(num_parallel_trial)
+        self._usage_status: Dict[Any, List[int]] = {}
+
+    def _set_available_cpu(self, available_cpu: Optional[str] = None) -> List[int]:
+        if available_cpu is not None:
+            return _transform_cpu_format_from_string_to_arr(available_cpu)
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def _get_num_parallel_trial(self) -> int:
+        """Derive how many trials can run in parallel from the number of cores and the available memory."""
+        num_trial_by_cpu = len(self._available_cpu) // self.MIN_CPU_FOR_SINGLE_TRIAL
+        num_trial_by_memory = int(psutil.virtual_memory().available / (1024**3) // self.MEMORY_GIB_FOR_SINGLE_TRIAL)
+        num_parallel_trial = max(min(num_trial_by_cpu, num_trial_by_memory), 1)
+        logger.info(
+            f"{num_parallel_trial} trials run in parallel on {len(self._available_cpu)} cores "
+            f"({num_trial_by_cpu} by cores, {num_trial_by_memory} by memory)."
+        )
+        return num_parallel_trial
+
+    def _split_available_cpu(self, num_parallel_trial: int) -> List[List[int]]:
+        num_cpu = len(self._available_cpu)
+        if num_parallel_trial > num_cpu:
+            logger.warning(
+                f"num_parallel_trial({num_parallel_trial}) is bigger than the number of cores({num_cpu}). "
+                "Trials share the cores."
+            )
+            return [[self._available_cpu[i % num_cpu]] for i in range(num_parallel_trial)]
+
+        num_cpu_for_single_trial, num_remainder = divmod(num_cpu, num_parallel_trial)
+        cpu_sets = []
+        start = 0
+        for i in range(num_parallel_trial):
+            end = start + num_cpu_for_single_trial + (1 if i < num_remainder else 0)
+            cpu_sets.append(self._available_cpu[start:end])
+            start = end
+        return cpu_sets
 
     def reserve_resource(self, trial_id: Any) -> Optional[Dict]:
         """Reserve a resource under 'trial_id'.
@@ -66,15 +122,25 @@ class CPUResourceManager(BaseResourceManager):
 
         Raises:
             RuntimeError: If there is already resource reserved by 'trial_id', then raise an error.
+
+        Returns:
+            Optional[Dict]: Training environment to use. It has the reserved cores and the number of threads.
         """
         if not self.have_available_resource():
             return None
         if trial_id in self._usage_status:
             raise RuntimeError(f"{trial_id} already has reserved resource.")
 
-        logger.debug(f"{trial_id} reserved.")
-        self._usage_status.append(trial_id)
-        return {}
+        resource = self._available_cpu_sets.pop(0)
+        self._usage_status[trial_id] = resource
+        logger.debug(f"{trial_id} reserved cores {resource}.")
+
+        num_threads = str(len(resource))
+        return {
+            CPU_AFFINITY_ENV: ",".join([str(val) for val in resource]),
+            "OMP_NUM_THREADS": num_threads,
+            "MKL_NUM_THREADS": num_threads,
+        }
 
     def release_resource(self, trial_id: Any):
         """Release a resource under 'trial_id'.
@@ -85,12 +151,13 @@ class CPUResourceManager(BaseResourceManager):
         if trial_id not in self._usage_status:
             logger.warning(f"{trial_id} trial don't use resource now.")
         else:
-            self._usage_status.remove(trial_id)
+            self._available_cpu_sets.append(self._usage_status[trial_id])
+            del self._usage_status[trial_id]
             logger.debug(f"{trial_id} released.")
 
     def have_available_resource(self):
         """Check that there is available resource."""
-        return len(self._usage_status) < self._num_parallel_trial
+        return len(self._available_cpu_sets) > 0
 
 
 class GPUResourceManager(BaseResourceManager):
@@ -181,6 +248,7 @@ def get_resource_manager(
         resource_type (Literal["gpu", "cpu"]): Which type of resource to use.
                                                If can be changed depending on environment.
         num_parallel_trial (Optional[int]): How many trials to run in parallel. It's used for CPUResourceManager.
+                                            If None, it's derived from the available cores and memory.
                                             Defaults to None.
         num_gpu_for_single_trial (Optional[int]): How many GPUs is used for a single trial.
                                                   It's used for GPUResourceManager. Defaults to None.
@@ -207,6 +275,49 @@ def get_resource_manager(
     raise ValueError(f"Available resource type is cpu, gpu. Your value is {resource_type}.")
 
 
+def get_reserved_cpu() -> Optional[List[int]]:
+    """Get the cores reserved for the current trial by CPUResourceManager.
+
+    Returns:
+        Optional[List[int]]: Reserved cores. If cores aren't reserved, return None.
+    """
+    reserved_cpu = os.getenv(CPU_AFFINITY_ENV)
+    if not reserved_cpu:
+        return None
+    return _transform_cpu_format_from_string_to_arr(reserved_cpu)
+
+
+def pin_reserved_cpu():
+    """Pin the current process to the cores reserved by CPUResourceManager and size torch thread pools to them.
+
+    OpenMP and MKL thread pools are sized by the environment variables set when reserving the cores.
+    """
+    reserved_cpu = get_reserved_cpu()
+    if reserved_cpu is None:
+        return
+
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, reserved_cpu)
+        except OSError as e:
+            logger.warning(f"Failed to pin the process to cores {reserved_cpu} : {e}")
+    torch.set_num_threads(len(reserved_cpu))
+    try:
+        torch.set_num_interop_threads(len(reserved_cpu))
+    except RuntimeError:
+        # inter-op thread pool already started
+        pass
+
+
+def _transform_cpu_format_from_string_to_arr(cpu: str) -> List[int]:
+    for val in cpu.split(","):
+        if not val.isnumeric():
+            raise ValueError(
+                "cpu format is wrong. " "cpu should only have numbers delimited by ','.\n" f"your value is {cpu}"
+            )
+    return [int(val) for val in cpu.split(",")]
+
+
 def _remove_none_from_dict(dict_val: Dict):
     key_to_remove = [key for key, val in dict_val.items() if val is None]
     for key in key_to_remove:
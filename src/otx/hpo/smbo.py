@@ -0,0 +1,270 @@
+"""Sequential model-based optimization implementation."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+from scipy.special import logsumexp, ndtr
+from scipy.stats import truncnorm
+
+from otx.hpo.hyperband import AshaTrial, HyperBand
+from otx.hpo.utils import check_positive
+from otx.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class TPESampler:
+    """Tree-structured Parzen Estimator which samples a point in the zero-one scaled search space.
+
+    Observed points are split into good and bad ones by their scores. Each group is modeled by a mixture of
+    a uniform prior and truncated gaussian kernels put on the points, and the candidate sampled from the good model
+    which maximizes the ratio of the good model density to the bad model density is selected.
+
+    Please refer the below paper for the detailed algorithm.
+
+    [1] "Algorithms for Hyper-Parameter Optimization", NeurIPS 2011
+        https://papers.nips.cc/paper/2011/hash/86e8f7ab32cfd12577bc2619bc635690-Abstract.html
+
+    Args:
+        num_dims (int): Number of hyper parameters.
+        gamma (float, optional): Ratio of the observed points regarded as good ones. Defaults to 0.25.
+        num_candidates (int, optional): Number of candidates sampled from the good model. Defaults to 24.
+        seed (Optional[int], optional): Random seed. Defaults to None.
+    """
+
+    def __init__(self, num_dims: int, gamma: float = 0.25, num_candidates: int = 24, seed: Optional[int] = None):
+        check_positive(num_dims, "num_dims")
+        check_positive(num_candidates, "num_candidates")
+        if not 0 < gamma < 1:
+            raise ValueError(f"gamma should be greater than 0 and lesser than 1. Your value is {gamma}")
+
+        self._num_dims = num_dims
+        self._gamma = gamma
+        self._num_candidates = num_candidates
+        self._rng = np.random.default_rng(seed)
+
+    def sample_randomly(self) -> np.ndarray:
+        """Sample a point uniformly."""
+        return self._rng.random(self._num_dims)
+
+    def sample(self, points: np.ndarray, scores: np.ndarray) -> np.ndarray:
+        """Sample a point which is expected to improve the score.
+
+        Args:
+            points (np.ndarray): Observed points in zero-one scale whose shape is (num_points, num_dims).
+            scores (np.ndarray): Scores of the observed points. Higher score is better.
+
+        Returns:
+            np.ndarray: Sampled point in zero-one scale.
+        """
+        if len(points) < 2:
+            return self.sample_randomly()
+
+        order = np.argsort(-scores, kind="stable")
+        num_good = max(math.ceil(self._gamma * len(points)), 1)
+        good_points = points[order[:num_good]]
+        bad_points = points[order[num_good:]]
+
+        candidates = self._sample_from_parzen_estimator(good_points)
+        expected_improvement = self._get_log_pdf(candidates, good_points) - self._get_log_pdf(candidates, bad_points)
+        return candidates[np.argmax(expected_improvement)]
+
+    def _get_bandwidth(self, num_points: int) -> float:
+        # Scott's rule on the unit range, which gets narrower as points are observed
+        return 0.2 * num_points ** (-1 / (self._num_dims + 4))
+
+    def _sample_from_parzen_estimator(self, points: np.ndarray) -> np.ndarray:
+        bandwidth = self._get_bandwidth(len(points))
+        # index len(points) is the uniform prior
+        components = self._rng.integers(len(points) + 1, size=self._num_candidates)
+        candidates = self._rng.random((self._num_candidates, self._num_dims))
+        from_kernel = components < len(points)
+        if np.any(from_kernel):
+            means = points[components[from_kernel]]
+            candidates[from_kernel] = truncnorm.rvs(
+                -means / bandwidth,
+                (1 - means) / bandwidth,
+                loc=means,
+                scale=bandwidth,
+                random_state=self._rng,
+            )
+        return candidates
+
+    def _get_log_pdf(self, candidates: np.ndarray, points: np.ndarray) -> np.ndarray:
+        bandwidth = self._get_bandwidth(len(points))
+        diff = (candidates[:, None, :] - points[None, :, :]) / bandwidth
+        log_normalizer = np.log(bandwidth * np.sqrt(2 * np.pi)) + np.log(
+            ndtr((1 - points) / bandwidth) - ndtr(-points / bandwidth)
+        )
+        log_kernels = np.sum(-0.5 * diff**2 - log_normalizer[None, :, :], axis=-1)
+        # density of the uniform prior is 1 in the unit cube
+        log_kernels = np.concatenate([log_kernels, np.zeros((len(candidates), 1))], axis=1)
+        return logsumexp(log_kernels, axis=1) - np.log(len(points) + 1)
+
+
+class SMBO(HyperBand):
+    """It implements the sequential model-based optimization using TPE with ASHA early stopping.
+
+    Brackets and rungs are operated same as HyperBand, but hyper parameters of each new trial are sampled
+    right before the trial starts, by TPE fitted on the scores reported by previous trials.
+    Scores of trials trained with different resources are compared at the highest resource
+    which is reached by `num_startup_trials` trials at least.
+    If minimum_resource is same as maximum_resource, trials aren't stopped early.
+
+    Args:
+        num_startup_trials (Optional[int], optional): Number of observed trials needed to use TPE.
+                                                      Hyper parameters are sampled randomly until then.
+                                                      If None, it's the number of hyper parameters plus one,
+                                                      and three at least. Defaults to None.
+        gamma (float, optional): Ratio of trials regarded as good ones by TPE. Defaults to 0.25.
+        num_candidates (int, optional): Number of candidates TPE compares to sample hyper parameters.
+                                        Defaults to 24.
+        warm_start_paths (Optional[List[str]], optional): Result directories of previous HPO.
+                                                          Trials saved there are used as observations of TPE.
+                                                          Defaults to None.
+        seed (Optional[int], optional): Random seed to sample hyper parameters. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        num_startup_trials: Optional[int] = None,
+        gamma: float = 0.25,
+        num_candidates: int = 24,
+        warm_start_paths: Optional[List[str]] = None,
+        seed: Optional[int] = None,
+        **kwargs,
+    ):
+        # pylint: disable=too-many-arguments
+        if num_startup_trials is not None:
+            check_positive(num_startup_trials, "num_startup_trials")
+        # HyperBand makes trials during initialization, which are sampled when they start
+        self._unsampled_trials: Set[str] = set()
+        super().__init__(**kwargs)
+
+        if num_startup_trials is None:
+            num_startup_trials = max(len(self.search_space) + 1, 3)
+        self._num_startup_trials = num_startup_trials
+        self._sampler = TPESampler(len(self.search_space), gamma, num_candidates, seed)
+        self._warm_start_observations: List[Tuple[np.ndarray, Dict[float, Union[int, float]]]] = []
+        for path in warm_start_paths or []:
+            self._warm_start_observations.extend(self._load_observations(path))
+        if self._warm_start_observations:
+            logger.info(f"SMBO starts with {len(self._warm_start_observations)} trials of previous HPO.")
+
+    def _get_random_hyper_parameter(self, num_samples: int) -> List[AshaTrial]:
+        hp_configs = []
+        for _ in range(num_samples):
+            trial = self._make_trial({})
+            self._unsampled_trials.add(trial.id)
+            hp_configs.append(trial)
+
+        return hp_configs
+
+    def get_next_sample(self) -> Optional[AshaTrial]:
+        """Get next trial to train. Hyper parameters are sampled if the trial doesn't have them yet.
+
+        Returns:
+            Optional[AshaTrial]: Next trial to train. If there is no trial to train, then return None.
+        """
+        trial = super().get_next_sample()
+        if trial is not None and trial.id in self._unsampled_trials:
+            trial.configuration.update(self._convert_to_real_space(self._sample_point()))
+            self._unsampled_trials.remove(trial.id)
+        return trial
+
+    def _sample_point(self) -> np.ndarray:
+        observations = self._get_observations()
+        if observations is None:
+            return self._sampler.sample_randomly()
+        points, scores = observations
+        if self.mode == "min":
+            scores = -scores
+        return self._sampler.sample(points, scores)
+
+    def _get_observations(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Get points and scores of observed trials at the highest resource reached by enough trials."""
+        observations = list(self._warm_start_observations)
+        for trial in self._trials.values():
+            if trial.id in self._unsampled_trials or not trial.score:
+                continue
+            point = self._convert_to_zero_one_scale(trial.configuration)
+            if point is not None:
+                observations.append((point, trial.score))
+
+        if len(observations) < self._num_startup_trials:
+            return None
+
+        resource = sorted((max(score) for _, score in observations), reverse=True)[self._num_startup_trials - 1]
+        points = []
+        scores = []
+        for point, score in observations:
+            scores_in_resource = [val for key, val in score.items() if key <= resource]
+            if max(score) < resource or not scores_in_resource:
+                continue
+            points.append(point)
+            scores.append(max(scores_in_resource) if self.mode == "max" else min(scores_in_resource))
+
+        return np.array(points), np.array(scores, dtype=np.float64)
+
+    def _convert_to_real_space(self, point: np.ndarray) -> Dict:
+        """Convert a point in zero-one scale to config from human perspective.
+
+        Each choice of categorical hyper parameter takes the same width in zero-one scale.
+        """
+        config = {}
+        for idx, key in enumerate(self.search_space):
+            space = self.search_space[key]
+            if space.is_categorical():
+                config[key] = space.choice_list[min(int(point[idx] * len(space.choice_list)), space.max)]
+            else:
+                lower, upper = space.lower_space(), space.upper_space()
+                config[key] = space.space_to_real((upper - lower) * point[idx] + lower)
+
+        return config
+
+    def _convert_to_zero_one_scale(self, config: Dict) -> Optional[np.ndarray]:
+        """Convert config from human perspective to zero-one scale. If it's out of the search space, return None."""
+        point = []
+        for key in self.search_space:
+            space = self.search_space[key]
+            if key not in config:
+                return None
+            if space.is_categorical():
+                if config[key] not in space.choice_list:
+                    return None
+                point.append((space.choice_list.index(config[key]) + 0.5) / len(space.choice_list))
+            else:
+                lower, upper = space.lower_space(), space.upper_space()
+                point.append((space.real_to_space(config[key]) - lower) / (upper - lower))
+
+        return np.clip(np.array(point, dtype=np.float64), 0, 1)
+
+    def _load_observations(self, path: Union[str, Path]) -> List[Tuple[np.ndarray, Dict[float, Union[int, float]]]]:
+        """Load trials saved in the result directory of previous HPO."""
+        observations = []
+        for result_file in Path(path).rglob("*.json"):
+            try:
+                with result_file.open("r", encoding="utf-8") as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(result, dict) or not result.get("score") or "configuration" not in result:
+                continue
+
+            point = self._convert_to_zero_one_scale(result["configuration"])
+            if point is not None:
+                observations.append((point, {float(key): val for key, val in result["score"].items()}))
+
+        return observations
+
+    def print_result(self):
+        """Print a SMBO result."""
+        print(f"HPO(SMBO) used {len(self._warm_start_observations)} trials of previous HPO.")
+        super().print_result()
@@ -4,6 +4,8 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import time
+
 import numpy as np
 import pytest
 
@@ -15,6 +17,7 @@ from otx.algorithms.action.configs.classification.x3d.data_pipeline import (
     train_pipeline,
 )
 from otx.api.entities.label import Domain
+from otx.core.data.caching import MemCacheHandlerSingleton
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 from tests.unit.algorithms.action.test_helpers import (
     MockPipeline,
@@ -62,3 +65,64 @@ class TestRawFrameDecode:
         assert outputs["img_shape"] == (256, 256)
         assert np.all(outputs["gt_bboxes"] == np.array([[0, 0, 256, 256]]))
         assert np.all(outputs["proposals"] == np.array([[0, 0, 256, 256]]))
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("mode", ["singleprocessing", "multiprocessing"])
+    def test_call_cached(self, mocker, mode):
+        """Test frames are decoded once and read from the memory cache afterwards."""
+        mocker.patch.object(MemCacheHandlerSingleton, "CPU_MEM_LIMITS_GIB", 0)
+        MemCacheHandlerSingleton.create(mode, 10 * 1024**2)
+        decode = RawFrameDecode()
+        decode.otx_dataset = self.otx_dataset
+        spy_load_frame = mocker.spy(decode, "_load_frame")
+
+        first = decode({"frame_inds": [0, 1]})
+        second = decode({"frame_inds": [1, 2]})
+
+        assert spy_load_frame.call_count == 3
+        assert np.array_equal(first["imgs"][1], second["imgs"][0], equal_nan=True)
+        assert second["original_shape"] == (256, 256)
+        MemCacheHandlerSingleton.delete()
+
+    @e2e_pytest_unit
+    def test_call_resize_scale(self):
+        """Test frames are downscaled keeping their aspect ratio, while the original shape is kept."""
+        decode = RawFrameDecode(enable_memcache=False, resize_scale=(-1, 128))
+        decode.otx_dataset = self.otx_dataset
+
+        outputs = decode({"frame_inds": [0, 1], "gt_bboxes": np.array([[0, 0, 1, 1]])})
+
+        assert outputs["imgs"][0].shape == (128, 128, 3)
+        assert outputs["original_shape"] == (256, 256)
+        assert outputs["img_shape"] == (128, 128)
+        assert np.all(outputs["gt_bboxes"] == np.array([[0, 0, 128, 128]]))
+
+        # frames are never upscaled
+        decode = RawFrameDecode(enable_memcache=False, resize_scale=(-1, 512))
+        decode.otx_dataset = self.otx_dataset
+        assert decode({"frame_inds": [0]})["img_shape"] == (256, 256)
+
+    @e2e_pytest_unit
+    def test_call_prefetch(self, mocker):
+        """Test the frames of the next clip of the video are cached in the background."""
+        mocker.patch.object(MemCacheHandlerSingleton, "CPU_MEM_LIMITS_GIB", 0)
+        MemCacheHandlerSingleton.create("singleprocessing", 10 * 1024**2)
+        otx_dataset = generate_action_cls_otx_dataset(1, 8, self.labels)
+        decode = RawFrameDecode(num_prefetch_workers=2)
+        decode.otx_dataset = otx_dataset
+
+        outputs = decode({"frame_inds": [0, 2], "start_index": 0, "total_frames": 8})
+        assert len(outputs["imgs"]) == 2
+        mem_cache_handler = MemCacheHandlerSingleton.get()
+        for _ in range(100):
+            if len(mem_cache_handler) == 4:
+                break
+            time.sleep(0.01)
+
+        # the next clip starts after the span of the current clip
+        for index in [3, 5]:
+            img, meta = mem_cache_handler.get(decode._get_unique_key(index))
+            assert img is not None
+            assert meta == {"original_shape": (256, 256)}
+        assert len(mem_cache_handler) == 4
+        MemCacheHandlerSingleton.delete()
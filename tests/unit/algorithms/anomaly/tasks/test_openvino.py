@@ -12,7 +12,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from otx.algorithms.anomaly.tasks.openvino import OpenVINOTask
+from otx.algorithms.anomaly.tasks.openvino import OpenVINOAnomalyInferencer, OpenVINOTask
 from otx.algorithms.anomaly.tasks.train import TrainingTask
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.inference_parameters import InferenceParameters
@@ -141,3 +141,48 @@ class TestOpenVINOTask:
         metadata = openvino_task.get_metadata()
         for key in new_metadata.keys():
             assert metadata[key] == np.zeros(1, dtype=np.float32)
+
+
+class TestOpenVINOAnomalyInferencer:
+    """Tests the async inference of the anomaly OpenVINO inferencer."""
+
+    def test_enqueue_prediction(self, mocker):
+        model = MagicMock()
+        model.is_ready.return_value = True
+        model.preprocess.side_effect = lambda image: ({"image": image[None]}, {"original_shape": image.shape})
+        model.inference_adapter.copy_raw_result.side_effect = lambda request: {"output": request}
+        model.postprocess.side_effect = lambda outputs, meta: (float(outputs["output"].sum()), meta["original_shape"])
+        inferencer = OpenVINOAnomalyInferencer(model, num_workers=2)
+        callback = model.inference_adapter.set_callback.call_args[0][0]
+        # the infer request completes immediately and returns its inputs
+        model.infer_async_raw.side_effect = lambda inputs, callback_data: callback(inputs["image"], callback_data)
+
+        images = [np.full((4, 5, 3), i, dtype=np.uint8) for i in range(10)]
+        results = {}
+        for i, image in enumerate(images):
+            inferencer.enqueue_prediction(image, i, results.__setitem__)
+        inferencer.await_all()
+
+        assert results == {i: (float(image.sum()), image.shape) for i, image in enumerate(images)}
+
+    def test_await_all_raises_handler_exception(self):
+        model = MagicMock()
+        model.preprocess.return_value = ({}, {})
+        inferencer = OpenVINOAnomalyInferencer(model)
+        callback = model.inference_adapter.set_callback.call_args[0][0]
+        model.infer_async_raw.side_effect = lambda inputs, callback_data: callback(None, callback_data)
+
+        def result_handler(id, result):
+            raise ValueError(id)
+
+        inferencer.enqueue_prediction(np.zeros((4, 4, 3)), 0, result_handler)
+        with pytest.raises(ValueError):
+            inferencer.await_all()
+
+    def test_shutdown(self):
+        inferencer = OpenVINOAnomalyInferencer(MagicMock())
+
+        inferencer.shutdown()
+
+        with pytest.raises(RuntimeError):
+            inferencer.executor.submit(print)
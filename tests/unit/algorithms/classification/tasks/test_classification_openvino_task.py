@@ -109,9 +109,10 @@ class TestOpenVINOClassificationTask:
 
     @e2e_pytest_unit
     def test_infer(self, mocker):
+        mocker.patch.object(ClassificationOpenVINOInferencer, "pre_process", return_value=({}, {}))
         mock_predict = mocker.patch.object(
             ClassificationOpenVINOInferencer,
-            "predict",
+            "predict_preprocessed",
             return_value=(ClassificationResult([], np.array(0), np.array(0), np.array(0)), self.fake_ann_scene),
         )
         mocker.patch.object(ShapeFactory, "shape_produces_valid_crop", return_value=True)
@@ -125,9 +126,10 @@ class TestOpenVINOClassificationTask:
 
     @e2e_pytest_unit
     def test_infer_w_features_hierarhicallabel(self, mocker):
+        mocker.patch.object(ClassificationOpenVINOInferencer, "pre_process", return_value=({}, {}))
         mock_predict = mocker.patch.object(
             ClassificationOpenVINOInferencer,
-            "predict",
+            "predict_preprocessed",
             return_value=(
                 ClassificationResult([], np.empty((2, 2, 2)), np.array([0, 1]), np.array([0, 1])),
                 self.fake_ann_scene,
@@ -146,11 +148,12 @@ class TestOpenVINOClassificationTask:
     def test_infer_async(self, mocker):
         mocker.patch.object(ShapeFactory, "shape_produces_valid_crop", return_value=True)
 
-        def fake_enqueue_prediciton(obj, x, idx, result_handler):
+        def fake_enqueue_prediciton(obj, x, metadata, idx, result_handler):
             result_handler(idx, self.fake_ann_scene, (x, x, x))
 
+        mocker.patch.object(ClassificationOpenVINOInferencer, "pre_process", return_value=(np.zeros(1), {}))
         mock_enqueue = mocker.patch.object(
-            ClassificationOpenVINOInferencer, "enqueue_prediction", fake_enqueue_prediciton
+            ClassificationOpenVINOInferencer, "enqueue_preprocessed", fake_enqueue_prediciton
         )
 
         updated_dataset = self.cls_ov_task.infer(
@@ -5,6 +5,7 @@ from otx.algorithms.common.configs.configuration_enums import (
     StorageCacheScheme,
     BatchSizeAdaptType,
     InputSizePreset,
+    MemCacheEvictionPolicy,
 )
 
 
@@ -18,6 +19,12 @@ def test_storage_cache_scheme():
     assert len(StorageCacheScheme) == 6
 
 
+@e2e_pytest_unit
+def test_mem_cache_eviction_policy():
+    assert len(MemCacheEvictionPolicy) == 3
+    assert str(MemCacheEvictionPolicy.LRU) == "lru"
+
+
 @e2e_pytest_unit
 def test_batsh_size_adapt_type():
     assert len(BatchSizeAdaptType) == 3
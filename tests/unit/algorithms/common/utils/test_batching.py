@@ -0,0 +1,119 @@
+"""Tests for the batched OpenVINO infer queue."""
+import time
+
+import numpy as np
+import openvino.runtime as ov
+import pytest
+from openvino.model_api.adapters import OpenvinoAdapter, create_core
+from openvino.runtime import opset8 as opset
+from otx.algorithms.common.utils.batching import BatchedInferQueue
+
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+@pytest.fixture
+def inference_adapter(tmp_path):
+    image = opset.parameter([1, 3, -1, -1], np.float32, name="image")
+    weights = opset.constant(np.random.default_rng(0).normal(size=(4, 3, 1, 1)).astype(np.float32))
+    saliency_map = opset.convolution(image, weights, [1, 1], [0, 0], [0, 0], [1, 1])
+    logits = opset.reduce_mean(saliency_map, opset.constant([2, 3]), False)
+    saliency_map.output(0).get_tensor().set_names({"saliency_map"})
+    logits.output(0).get_tensor().set_names({"logits"})
+    ov.serialize(ov.Model([logits, saliency_map], [image]), str(tmp_path / "model.xml"), str(tmp_path / "model.bin"))
+    adapter = OpenvinoAdapter(
+        create_core(), str(tmp_path / "model.xml"), str(tmp_path / "model.bin"), max_num_requests=2
+    )
+    adapter.load_model()
+    return adapter
+
+
+def _images(shapes, seed=1):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(size=(1, 3, *shape)).astype(np.float32) for shape in shapes]
+
+
+@e2e_pytest_unit
+def test_batched_infer_queue(inference_adapter):
+    images = _images([(8, 8)] * 5 + [(6, 10)] * 3)
+    expected = [
+        {name: value.copy() for name, value in inference_adapter.infer_sync({"image": image}).items()}
+        for image in images
+    ]
+
+    results = {}
+    batch_sizes = []
+    queue = BatchedInferQueue(
+        inference_adapter, lambda outputs, id: results.__setitem__(id, outputs), max_batch_size=4, max_wait_ms=1000.0
+    )
+    infer_async = inference_adapter.infer_async
+
+    def count_batch(inputs, batch_data):
+        batch_sizes.append(len(batch_data))
+        infer_async(inputs, batch_data)
+
+    inference_adapter.infer_async = count_batch
+    for i, image in enumerate(images):
+        queue.submit({"image": image}, i)
+    queue.await_all()
+
+    assert sorted(batch_sizes) == [1, 3, 4]
+    assert sorted(results) == list(range(len(images)))
+    for i in range(len(images)):
+        for name, value in expected[i].items():
+            assert results[i][name].shape == value.shape
+            assert np.allclose(results[i][name], value, atol=1e-5)
+
+
+@e2e_pytest_unit
+def test_batched_infer_queue_timeout(inference_adapter):
+    results = {}
+    queue = BatchedInferQueue(
+        inference_adapter, lambda outputs, id: results.__setitem__(id, outputs), max_batch_size=8, max_wait_ms=1.0
+    )
+    for i, image in enumerate(_images([(8, 8)] * 2)):
+        queue.submit({"image": image}, i)
+
+    # the incomplete batch is inferred once it waited for max_wait_ms
+    for _ in range(100):
+        if len(results) == 2:
+            break
+        time.sleep(0.01)
+    assert sorted(results) == [0, 1]
+    queue.await_all()
+
+
+@e2e_pytest_unit
+def test_batched_infer_queue_callback_exception(inference_adapter):
+    def callback(outputs, id):
+        raise ValueError(id)
+
+    queue = BatchedInferQueue(inference_adapter, callback, max_batch_size=2)
+    queue.submit({"image": _images([(8, 8)])[0]}, 0)
+    with pytest.raises(ValueError):
+        queue.await_all()
+
+
+@e2e_pytest_unit
+def test_batched_infer_queue_shared_output(tmp_path):
+    image = opset.parameter([1, 3, 8, 8], np.float32, name="image")
+    logits = opset.reduce_mean(image, opset.constant([2, 3]), False)
+    # an output without the batch dimension, whose first dimension is same as the batch size by chance
+    anchors = opset.add(opset.constant(np.ones((2, 4), dtype=np.float32)), opset.constant(np.float32(1)))
+    logits.output(0).get_tensor().set_names({"logits"})
+    anchors.output(0).get_tensor().set_names({"anchors"})
+    ov.serialize(ov.Model([logits, anchors], [image]), str(tmp_path / "model.xml"), str(tmp_path / "model.bin"))
+    adapter = OpenvinoAdapter(create_core(), str(tmp_path / "model.xml"), str(tmp_path / "model.bin"))
+    adapter.load_model()
+
+    results = {}
+    queue = BatchedInferQueue(
+        adapter, lambda outputs, id: results.__setitem__(id, outputs), max_batch_size=2, max_wait_ms=1000.0
+    )
+    images = _images([(8, 8)] * 2)
+    for i, image in enumerate(images):
+        queue.submit({"image": image}, i)
+    queue.await_all()
+
+    for i, image in enumerate(images):
+        assert np.allclose(results[i]["logits"], image.mean(axis=(2, 3)), atol=1e-5)
+        assert results[i]["anchors"].shape == (2, 4)
@@ -4,6 +4,7 @@ from otx.algorithms.common.utils.data import (
     compute_robust_statistics,
     compute_robust_scale_statistics,
     compute_robust_dataset_statistics,
+    prefetch_items,
 )
 from otx.api.entities.datasets import DatasetEntity
 from otx.api.entities.dataset_item import DatasetItemEntity
@@ -12,7 +13,10 @@ from otx.api.entities.annotation import Annotation, AnnotationSceneEntity, Annot
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.scored_label import ScoredLabel, LabelEntity, Domain
 
+import threading
+
 import numpy as np
+import pytest
 
 
 @e2e_pytest_unit
@@ -105,3 +109,40 @@ def test_compute_robuste_dataset_statistics():
     stat = compute_robust_dataset_statistics(dataset, ann_stat=True)
     assert np.isclose(stat["annotation"]["num_per_image"]["avg"], 1.0)
     assert np.isclose(stat["annotation"]["size_of_shape"]["avg"], 10.0)
+
+
+@e2e_pytest_unit
+@pytest.mark.parametrize("num_workers", [0, 1, 4])
+def test_prefetch_items(num_workers):
+    items = list(range(50))
+    results = list(prefetch_items(items, lambda item: item * 2, num_workers=num_workers, max_prefetch=4))
+    assert results == [(item, item * 2) for item in items]
+
+
+@e2e_pytest_unit
+def test_prefetch_items_bounded():
+    processed = []
+    lock = threading.Lock()
+
+    def func(item):
+        with lock:
+            processed.append(item)
+        return item
+
+    prefetched = prefetch_items(range(100), func, num_workers=2, max_prefetch=4)
+    assert next(prefetched) == (0, 0)
+    # the items are processed at most max_prefetch ahead of the consumer
+    assert len(processed) <= 6
+    prefetched.close()
+    assert len(processed) <= 6
+
+
+@e2e_pytest_unit
+def test_prefetch_items_exception():
+    def func(item):
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        list(prefetch_items(range(10), func, num_workers=2))
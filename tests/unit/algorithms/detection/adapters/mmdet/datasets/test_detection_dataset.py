@@ -3,10 +3,18 @@
 # Copyright (C) 2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 #
+import cv2
 import numpy as np
 import pytest
 
-from otx.algorithms.detection.adapters.mmdet.datasets.dataset import OTXDetDataset, get_annotation_mmdet_format
+from otx.algorithms.detection.adapters.mmdet.datasets.dataset import (
+    OTXDetDataset,
+    get_annotation_mmdet_format,
+    get_annotation_mmdet_format_from_columnar,
+)
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.image import Image
 from otx.api.entities.label import Domain
 from otx.api.entities.model_template import TaskType
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
@@ -44,7 +52,7 @@ class TestOTXDetDataset:
         otx_dataset, labels = self.dataset[task_type]
         proxy = OTXDetDataset._DataInfoProxy(otx_dataset, labels)
         sample = proxy[0]
-        assert "dataset_item" in sample
+        assert "columnar" in sample
         assert "width" in sample
         assert "height" in sample
         assert "index" in sample
@@ -62,7 +70,7 @@ class TestOTXDetDataset:
         dataset = OTXDetDataset(otx_dataset, labels, self.pipeline, test_mode=False)
         img = dataset.prepare_train_img(0)
         assert isinstance(img, dict)
-        assert "dataset_item" in img
+        assert "columnar" in img
         assert "bbox_fields" in img
         assert "mask_fields" in img
         assert "seg_fields" in img
@@ -78,7 +86,7 @@ class TestOTXDetDataset:
         dataset = OTXDetDataset(otx_dataset, labels, self.pipeline, test_mode=True)
         img = dataset.prepare_test_img(0)
         assert isinstance(img, dict)
-        assert "dataset_item" in img
+        assert "columnar" in img
         assert "bbox_fields" in img
         assert "mask_fields" in img
         assert "seg_fields" in img
@@ -99,6 +107,36 @@ class TestOTXDetDataset:
         assert "masks" in ann_info
         assert "labels" in ann_info
 
+    @e2e_pytest_unit
+    @pytest.mark.parametrize(
+        "task_type, domain",
+        [(TaskType.DETECTION, Domain.DETECTION), (TaskType.INSTANCE_SEGMENTATION, Domain.INSTANCE_SEGMENTATION)],
+    )
+    def test_get_annotation_mmdet_format_from_columnar(self, task_type, domain, tmp_path) -> None:
+        """Test the annotations read from the columnar snapshot are same as the ones from the dataset items"""
+        otx_dataset, labels = self.dataset[task_type]
+        # the images are saved to files, so that the items are represented by the arrays
+        items = []
+        for index, dataset_item in enumerate(otx_dataset):
+            image_path = str(tmp_path / f"{index}.png")
+            cv2.imwrite(image_path, dataset_item.numpy)
+            media = Image(file_path=image_path, size=(dataset_item.height, dataset_item.width))
+            items.append(DatasetItemEntity(media, dataset_item.annotation_scene, subset=dataset_item.subset))
+        otx_dataset = DatasetEntity(items)
+        proxy = OTXDetDataset._DataInfoProxy(otx_dataset, labels)
+        for index, dataset_item in enumerate(otx_dataset):
+            assert not proxy.columnar.needs_item(index)
+            expected = get_annotation_mmdet_format(dataset_item, labels, domain, min_size=4)
+            ann_info = get_annotation_mmdet_format_from_columnar(proxy.columnar, index, labels, domain, min_size=4)
+            assert np.allclose(ann_info["bboxes"], expected["bboxes"])
+            assert np.array_equal(ann_info["labels"], expected["labels"])
+            assert ann_info["ann_ids"] == expected["ann_ids"]
+            if expected["masks"]:
+                for polygons, expected_polygons in zip(ann_info["masks"].masks, expected["masks"].masks):
+                    assert np.allclose(polygons[0], expected_polygons[0])
+            else:
+                assert ann_info["masks"] == []
+
     @e2e_pytest_unit
     @pytest.mark.parametrize(
         "task_type, domain",
@@ -134,7 +172,7 @@ class TestOTXDetDataset:
         sample = dataset[0]
 
         num_classes = len(dataset.labels)
-        anno = get_annotation_mmdet_format(sample["dataset_item"], dataset.labels, Domain.INSTANCE_SEGMENTATION)
+        anno = get_annotation_mmdet_format(otx_dataset[0], dataset.labels, Domain.INSTANCE_SEGMENTATION)
         bboxes = anno["bboxes"]
         scores = np.random.random((len(bboxes), 1))
         bboxes = np.hstack((bboxes, scores))
@@ -156,10 +194,10 @@ class TestOTXDetDataset:
         dataset = OTXDetDataset(otx_dataset, labels, self.pipeline)
         dataset.pipeline = MockPipeline()
         sample = dataset[0]
-        h, w = sample["dataset_item"].height, sample["dataset_item"].width
+        h, w = sample["height"], sample["width"]
 
         num_classes = len(dataset.labels)
-        anno = get_annotation_mmdet_format(sample["dataset_item"], dataset.labels, Domain.DETECTION)
+        anno = get_annotation_mmdet_format(otx_dataset[0], dataset.labels, Domain.DETECTION)
         bboxes = anno["bboxes"]
         scores = np.full((len(bboxes), 1), 0.5, dtype=np.float32)
         bboxes = np.hstack((bboxes, scores))
@@ -197,10 +235,10 @@ class TestOTXDetDataset:
         dataset = OTXDetDataset(otx_dataset, labels, self.pipeline)
         dataset.pipeline = MockPipeline()
         sample = dataset[0]
-        h, w = sample["dataset_item"].height, sample["dataset_item"].width
+        h, w = sample["height"], sample["width"]
 
         num_classes = len(dataset.labels)
-        anno = get_annotation_mmdet_format(sample["dataset_item"], dataset.labels, Domain.INSTANCE_SEGMENTATION)
+        anno = get_annotation_mmdet_format(otx_dataset[0], dataset.labels, Domain.INSTANCE_SEGMENTATION)
         bboxes = anno["bboxes"]
         scores = np.full((len(bboxes), 1), 0.5, dtype=np.float32)
         bboxes = np.hstack((bboxes, scores))
@@ -170,8 +170,9 @@ class TestOpenVINODetectionTask:
         """Test infer method in OpenVINODetectionTask."""
         self.dataset, labels = generate_det_dataset(task_type=TaskType.DETECTION)
         fake_ann_scene = self.dataset[0].annotation_scene
+        mocker.patch.object(OpenVINODetectionInferencer, "pre_process", return_value=({}, {}))
         mock_predict = mocker.patch.object(
-            OpenVINODetectionInferencer, "predict", return_value=(fake_ann_scene, (None, None))
+            OpenVINODetectionInferencer, "predict_preprocessed", return_value=(fake_ann_scene, (None, None))
         )
         updated_dataset = self.ov_task.infer(self.dataset, InferenceParameters(enable_async_inference=False))
 
@@ -17,6 +17,7 @@ from torch import nn
 from otx.algorithms.common.adapters.mmcv.utils.config_utils import OTXConfig
 from otx.algorithms.common.adapters.mmdeploy.apis import MMdeployExporter
 from otx.algorithms.common.utils.data import get_dataset
+from otx.algorithms.detection.adapters.mmdet.datasets.tiling import DecodedImageCache
 from otx.algorithms.detection.adapters.mmdet.task import MMDetectionTask
 from otx.algorithms.detection.adapters.mmdet.utils import build_detector, patch_tiling
 from otx.api.configuration.helper import create
@@ -229,6 +230,35 @@ class TestTilingDetection:
         merged_bbox_results = dataset.merge(results)
         assert len(merged_bbox_results) == dataset.num_samples
 
+        # merging images in parallel gives the same results
+        dataset.tile_dataset.nproc = 1
+        for image_result, serial_image_result in zip(merged_bbox_results, dataset.merge(results)):
+            for cls_result, serial_cls_result in zip(image_result, serial_image_result):
+                assert np.array_equal(cls_result, serial_cls_result)
+
+    @e2e_pytest_unit
+    def test_inference_merge_masks(self):
+        """Test that the masks are merged with the boxes kept by NMS."""
+        dataset = build_dataset(self.test_data_cfg)
+
+        results = []
+        for _ in range(len(dataset)):
+            bbox_result = [np.zeros((0, 5), dtype=np.float32) for _ in self.labels]
+            mask_result: List[List] = [[] for _ in self.labels]
+            bbox_result[0] = np.array([[10, 10, 50, 50, 0.9]], dtype=np.float32)
+            mask_result[0] = [dict()]
+            results.append((bbox_result, mask_result))
+
+        merged_results = dataset.merge(results)
+        assert len(merged_results) == dataset.num_samples
+        bbox_result, mask_result = merged_results[0]
+        assert len(bbox_result[0]) == len(mask_result[0]) > 0
+        for bbox, mask in zip(bbox_result[0], mask_result[0]):
+            x_1, y_1 = mask["tile_box"][:2]
+            assert np.array_equal(bbox[:4], [x_1 + 10, y_1 + 10, x_1 + 50, y_1 + 50])
+            assert mask["img_size"] == (self.height, self.width)
+        assert all(len(bboxes) == len(masks) == 0 for bboxes, masks in zip(bbox_result[1:], mask_result[1:]))
+
     @e2e_pytest_unit
     def test_merge_feature_vectors(self):
         """Test that the merge feature vectors works correctly."""
@@ -268,6 +298,51 @@ class TestTilingDetection:
         merged_maps = dataset.merge_maps(saliency_maps, dump_maps=False)
         assert len(merged_maps) == dataset.num_samples
 
+    @e2e_pytest_unit
+    def test_lazy_tile_loading(self):
+        """Test that tiles are cropped on demand from the image loaded through the decoded image cache."""
+        dataset = build_dataset(self.train_data_cfg)
+        tile_dataset = dataset.tile_dataset
+        num_tiles = len(tile_dataset.tiles_all)
+
+        # only image-level annotations are kept and tiles are stored in arrays
+        assert all("img" not in image_meta for image_meta in tile_dataset.image_metas)
+        assert tile_dataset.tile_boxes.shape == (num_tiles, 4)
+        assert tile_dataset.tile_image_indices.shape == (num_tiles,)
+        assert tile_dataset.tile_ann_offsets.shape == (num_tiles + 1,)
+        assert len(tile_dataset.image_cache) == 0
+
+        image = self.otx_dataset[0].numpy
+        for idx in range(len(tile_dataset)):
+            tile = tile_dataset[idx]
+            x_1, y_1, x_2, y_2 = tile["tile_box"]
+            assert np.array_equal(tile["img"], image[y_1:y_2, x_1:x_2])
+            assert tile["img_shape"] == tile["img"].shape
+            assert len(tile["gt_bboxes"]) == len(tile["gt_labels"])
+            # the cached image is not modified through the tile
+            tile["img"][:] = 0
+        assert len(tile_dataset.image_cache) == 1
+        assert np.array_equal(tile_dataset.load_image(0), image)
+
+    @e2e_pytest_unit
+    def test_decoded_image_cache(self):
+        """Test that the least recently used images are evicted from the decoded image cache."""
+        image = np.zeros((10, 10, 3), dtype=np.uint8)
+        cache = DecodedImageCache(max_bytes=2 * image.nbytes)
+        cache.put(0, image)
+        cache.put(1, image.copy())
+        assert cache.get(0) is image
+        cache.put(2, image.copy())
+        assert cache.get(1) is None
+        assert len(cache) == 2
+        assert cache.nbytes == 2 * image.nbytes
+
+        # an image larger than the cache is not cached
+        cache.put(3, np.zeros((20, 20, 3), dtype=np.uint8))
+        assert cache.get(3) is None
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+
     @e2e_pytest_unit
     def test_load_tiling_parameters(self, tmp_dir_path):
         maskrcnn_cfg = OTXConfig.fromfile(os.path.join(DEFAULT_ISEG_TEMPLATE_DIR, "model.py"))
@@ -23,6 +23,7 @@ from otx.algorithms.detection.adapters.openvino.task import (
 from otx.algorithms.detection.configs.base import DetectionConfig
 from otx.algorithms.detection.utils import generate_label_schema
 from otx.api.configuration.helper import create
+from otx.api.entities.inference_parameters import InferenceParameters
 from otx.api.entities.label import LabelEntity
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import (
@@ -116,7 +117,7 @@ class TestTilingTileClassifier:
         }
         mocker.patch.object(OpenVINODetectionTask, "load_inferencer", return_value=ov_inferencer)
         ov_task = OpenVINODetectionTask(self.task_env)
-        updated_dataset = ov_task.infer(self.dataset)
+        updated_dataset = ov_task.infer(self.dataset, InferenceParameters(enable_async_inference=False))
 
         mock_predict.assert_called()
         for updated in updated_dataset:
@@ -130,6 +131,75 @@ class TestTilingTileClassifier:
         ov_task.deploy(output_model)
         assert output_model.exportable_code is not None
 
+    @e2e_pytest_unit
+    def test_openvino_async(self, mocker):
+        """Test pipelined OpenVINO tiling inference with the tile classifier
+
+        Args:
+            mocker (_type_): pytest mocker from fixture
+        """
+        mocker.patch("otx.algorithms.detection.adapters.openvino.task.OpenvinoAdapter")
+        mocked_model = mocker.patch.object(Model, "create_model")
+        adapter_mock = mocker.Mock(
+            set_callback=mocker.Mock(return_value=None), get_rt_info=mocker.Mock(return_value=np.array([1]))
+        )
+        mocker.patch.object(ImageModel, "__init__", return_value=None)
+        mocker.patch.object(Model, "__init__", return_value=None)
+        mocked_model.return_value = mocker.MagicMock(
+            spec=MaskRCNNModel, inference_adapter=adapter_mock, postprocess_semantic_masks=False
+        )
+        params = DetectionConfig(header=self.hyper_parameters.header)
+        ov_mask_inferencer = OpenVINOMaskInferencer(params, self.label_schema, "")
+        ov_mask_inferencer.model.preprocess.return_value = ({"foo": "bar"}, {"baz": "qux"})
+        ov_mask_inferencer.model.is_ready.return_value = True
+        ov_inferencer = OpenVINOTileClassifierWrapper(
+            ov_mask_inferencer, tile_size=64, tile_classifier_model_file="", tile_classifier_weight_file=""
+        )
+
+        # every other tile is classified as an object
+        classifier = ov_inferencer.tiler.tile_classifier_model
+        classifier.inference_adapter = mocker.Mock()
+        classifier.await_all = mocker.Mock()
+
+        def infer_tile_classifier(tile_dict, callback_data):
+            tile_prob = np.array([callback_data[1] % 2], dtype=np.float32)
+            request = mocker.Mock(get_tensor=mocker.Mock(return_value=mocker.Mock(data=tile_prob)))
+            ov_inferencer._tile_classifier_callback(request, callback_data)
+
+        classifier.infer_async_raw = mocker.Mock(side_effect=infer_tile_classifier)
+
+        async_pipeline = ov_inferencer.tiler.async_pipeline
+        submitted_tiles = []
+
+        def submit_data(inputs, id, meta={}):
+            submitted_tiles.append(id)
+            async_pipeline.completed_results[id] = (None, meta, {}, 0.0)
+
+        mocker.patch.object(async_pipeline, "submit_data", side_effect=submit_data)
+        mocker.patch.object(ov_inferencer.tiler, "_postprocess_tile", return_value={})
+        mock_merge = mocker.patch.object(
+            ov_inferencer.tiler,
+            "_merge_results",
+            return_value=InstanceSegmentationResult(
+                [], [np.zeros((0, 4), dtype=np.float32)], np.zeros((0, 4), dtype=np.float32)
+            ),
+        )
+        mocker.patch.object(OpenVINODetectionTask, "load_inferencer", return_value=ov_inferencer)
+        ov_task = OpenVINODetectionTask(self.task_env)
+        updated_dataset = ov_task.infer(self.dataset, InferenceParameters(enable_async_inference=True))
+
+        classifier.infer_async_raw.assert_called()
+        assert mock_merge.call_count == len(self.dataset)
+        assert not ov_inferencer.pending_images
+        for image_id, dataset_item in enumerate(self.dataset):
+            tile_coords = ov_inferencer.tiler._tile(dataset_item.numpy)
+            num_kept_tiles = 1 + len(tile_coords[1::2])
+            assert [tile_id for tile_id in submitted_tiles if tile_id[0] == image_id] == [
+                (image_id, tile_idx) for tile_idx in range(num_kept_tiles)
+            ]
+        for updated in updated_dataset:
+            assert updated.annotation_scene.contains_any([LabelEntity(name=self.labels[0].name, domain="DETECTION")])
+
     @e2e_pytest_unit
     def test_load_tile_classifier_parameters(self, tmp_dir_path):
         """Test loading tile classifier parameters
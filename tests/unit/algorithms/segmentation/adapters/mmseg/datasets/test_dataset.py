@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import cv2
 import numpy as np
 import pytest
 
 from otx.algorithms.segmentation.adapters.mmseg.datasets import OTXSegDataset
+from otx.algorithms.segmentation.adapters.mmseg.datasets.dataset import mask_from_columnar
 from otx.api.entities.annotation import (
     Annotation,
     AnnotationSceneEntity,
@@ -17,7 +19,11 @@ from otx.api.entities.id import ID
 from otx.api.entities.image import Image
 from otx.api.entities.label import Domain, LabelEntity
 from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.utils.segmentation_utils import mask_from_dataset_item
+from otx.core.data.columnar import ColumnarDataset
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 
 
@@ -88,7 +94,7 @@ class TestOTXSegDataset:
     @e2e_pytest_unit
     def test_getitem_method(self) -> None:
         data_item: dict = self.dataset[0]
-        assert "dataset_item" in data_item
+        assert "columnar" in data_item
         assert "ann_info" in data_item
 
     @e2e_pytest_unit
@@ -100,3 +106,30 @@ class TestOTXSegDataset:
     def test_get_gt_seg_maps(self) -> None:
         gt_seg_map: np.ndarray = self.dataset.get_gt_seg_maps()[0]
         assert np.equal(gt_seg_map, np.zeros((10, 16))).all()
+
+
+@e2e_pytest_unit
+def test_mask_from_columnar(tmp_path) -> None:
+    labels = [label_entity(name, str(i)) for i, name in enumerate(["class_1", "class_2", "class_3"])]
+    image_path = str(tmp_path / "image.png")
+    cv2.imwrite(image_path, np.zeros((20, 32, 3), dtype=np.uint8))
+    annotations = [
+        Annotation(Rectangle(0.1, 0.1, 0.5, 0.6), labels=[ScoredLabel(labels[0])]),
+        Annotation(Ellipse(0.4, 0.3, 0.9, 0.9), labels=[ScoredLabel(labels[2]), ScoredLabel(labels[1])]),
+        Annotation(Polygon([Point(0.6, 0.0), Point(1.0, 0.2), Point(0.7, 0.5)]), labels=[ScoredLabel(labels[1])]),
+    ]
+    otx_dataset = DatasetEntity(
+        items=[
+            DatasetItemEntity(
+                media=Image(file_path=image_path, size=(20, 32)),
+                annotation_scene=AnnotationSceneEntity(annotations=annotations, kind=AnnotationSceneKind.ANNOTATION),
+                ignored_labels=[labels[1]],
+            )
+        ]
+    )
+    columnar = ColumnarDataset(otx_dataset, labels[:2])
+
+    assert not columnar.needs_item(0)
+    for task_labels in [labels, labels[:2], labels[::-1]]:
+        expected = mask_from_dataset_item(otx_dataset[0], task_labels)
+        assert np.array_equal(mask_from_columnar(columnar, 0, task_labels), expected)
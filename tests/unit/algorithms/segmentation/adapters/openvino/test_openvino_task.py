@@ -97,9 +97,10 @@ class TestOpenVINOSegmentationTask:
             )
         ]
         fake_ann_scene = AnnotationSceneEntity(kind=AnnotationSceneKind.ANNOTATION, annotations=fake_annotation)
+        mocker.patch.object(OpenVINOSegmentationInferencer, "pre_process", return_value=({}, {}))
         mock_predict = mocker.patch.object(
             OpenVINOSegmentationInferencer,
-            "predict",
+            "predict_preprocessed",
             return_value=(
                 ImageResultWithSoftPrediction(np.array(0), np.array(0), np.array(0), np.array(0)),
                 fake_ann_scene,
@@ -127,11 +128,12 @@ class TestOpenVINOSegmentationTask:
         ]
         fake_ann_scene = AnnotationSceneEntity(kind=AnnotationSceneKind.ANNOTATION, annotations=fake_annotation)
 
-        def fake_enqueue_prediciton(obj, x, idx, result_handler):
+        def fake_enqueue_prediciton(obj, x, metadata, idx, result_handler):
             result_handler(idx, fake_ann_scene, None, None)
 
+        mocker.patch.object(OpenVINOSegmentationInferencer, "pre_process", return_value=({}, {}))
         mock_enqueue = mocker.patch.object(
-            OpenVINOSegmentationInferencer, "enqueue_prediction", fake_enqueue_prediciton
+            OpenVINOSegmentationInferencer, "enqueue_preprocessed", fake_enqueue_prediciton
         )
         mocker.patch(
             "otx.algorithms.segmentation.adapters.openvino.task.get_activation_map", return_value=np.zeros((5, 1))
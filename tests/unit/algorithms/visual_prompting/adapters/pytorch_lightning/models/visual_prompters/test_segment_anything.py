@@ -368,6 +368,57 @@ class TestSegmentAnything:
 
         assert len(bboxes) == len(pred_masks) == len(ious)
 
+    @e2e_pytest_unit
+    def test_forward_train_embedding_cache(self, mocker) -> None:
+        """Test forward_train bypasses the embedding cache unless it is used for prediction."""
+        sam = SegmentAnything(config=self.base_config)
+        spy_cache_get = mocker.spy(sam.embedding_cache, "get")
+        images = torch.rand((1, 3, 4, 4))
+        bboxes = [torch.Tensor([[0, 0, 1, 1]])]
+
+        sam.forward_train(images=images, bboxes=bboxes, points=None)
+        spy_cache_get.assert_not_called()
+
+        sam.forward_train(images=images, bboxes=bboxes, points=None, use_embedding_cache=True)
+        spy_cache_get.assert_called_once()
+
+    @e2e_pytest_unit
+    def test_forward_image_encoder(self, mocker) -> None:
+        """Test forward_image_encoder reuses the embeddings of the images encoded before with a frozen encoder."""
+        sam = SegmentAnything(config=self.base_config)
+        sam.image_encoder = nn.Conv2d(3, 2, 1).requires_grad_(False)
+        spy_encoder = mocker.spy(sam.image_encoder, "forward")
+        images = torch.rand((3, 3, 4, 4))
+        expected = sam.image_encoder(images)
+        spy_encoder.reset_mock()
+
+        first = sam.forward_image_encoder(images[:2])
+        second = sam.forward_image_encoder(images)
+        third = sam.forward_image_encoder(images)
+
+        assert [call.args[0].shape[0] for call in spy_encoder.call_args_list] == [2, 1]
+        assert torch.allclose(first, expected[:2])
+        assert torch.allclose(second, expected)
+        assert torch.equal(third, second)
+
+        # trainable encoders are always forwarded
+        sam.image_encoder.requires_grad_(True)
+        sam.forward_image_encoder(images)
+        assert spy_encoder.call_count == 3
+
+    @e2e_pytest_unit
+    def test_load_state_dict_resets_encoder_id(self) -> None:
+        """Test the identity of the image encoder is computed again after loading new weights."""
+        sam = SegmentAnything(config=self.base_config)
+        sam.image_encoder = nn.Conv2d(3, 2, 1).requires_grad_(False)
+        encoder_id = sam.encoder_id
+
+        state_dict = sam.state_dict()
+        state_dict["image_encoder.weight"] = state_dict["image_encoder.weight"] + 1
+        sam.load_state_dict(state_dict)
+
+        assert sam.encoder_id != encoder_id
+
     @e2e_pytest_unit
     @pytest.mark.parametrize(
         "loss_type,expected", [("sam", torch.tensor(9.7160396576)), ("medsam", torch.tensor(3.8603453636))]
@@ -163,6 +163,20 @@ class TestOpenVINOVisualPromptingInferencer:
 
         assert returned_value == fake_output
 
+    @e2e_pytest_unit
+    def test_forward_image_encoder_cached(self):
+        """Test forward_image_encoder reuses the embeddings of the same inputs."""
+        image_encoder = self.visual_prompting_ov_inferencer.model["image_encoder"]
+        image_encoder.infer_sync.side_effect = lambda inputs: {"image_embeddings": inputs["images"] * 2}
+
+        first = self.visual_prompting_ov_inferencer.forward_image_encoder({"images": np.ones((1, 3, 2, 2))})
+        second = self.visual_prompting_ov_inferencer.forward_image_encoder({"images": np.ones((1, 3, 2, 2))})
+        other = self.visual_prompting_ov_inferencer.forward_image_encoder({"images": np.zeros((1, 3, 2, 2))})
+
+        assert image_encoder.infer_sync.call_count == 2
+        assert np.array_equal(first["image_embeddings"], second["image_embeddings"])
+        assert np.array_equal(other["image_embeddings"], np.zeros((1, 3, 2, 2)))
+
     @e2e_pytest_unit
     def test_forward_decoder(self):
         """Test forward_decoder."""
@@ -284,6 +298,73 @@ class TestOpenVINOZeroShotVisualPromptingInferencer:
         assert np.all(result["iou_predictions"] == expected["iou_predictions"])
         assert np.all(result["low_res_masks"] == expected["low_res_masks"])
 
+    @e2e_pytest_unit
+    def test_forward_decoder_batch(self, mocker):
+        """Test forward_decoder_batch gives the results of forward_decoder with less infer requests."""
+
+        def infer_sync(inputs):
+            # the outputs of each prompt only depend on its first point
+            first_points = inputs["point_coords"][:, :1, 0]
+            return {
+                "iou_predictions": np.repeat(first_points, 2, axis=1),
+                "low_res_masks": np.broadcast_to(first_points[..., None, None], (len(first_points), 2, 2, 2)).copy(),
+            }
+
+        def postprocess_masks(logits, scores, original_size, is_single=False):
+            # the mask of the prompt at (2, 2) is empty
+            masks = np.zeros((3, 3)) if scores[0, 0] == 2 else np.ones((3, 3))
+            return logits[:, :1], masks, scores[0, 0]
+
+        decoder = self.visual_prompting_ov_inferencer.model["decoder"]
+        mocker.patch.object(decoder, "infer_sync", side_effect=infer_sync)
+        mocker.patch.object(decoder, "_apply_coords", return_value=np.array([[[0, 0], [2, 2]]], dtype=np.float32))
+        mocker.patch.object(self.visual_prompting_ov_inferencer, "_postprocess_masks", side_effect=postprocess_masks)
+        inputs = [
+            {
+                "image_embeddings": np.empty((1, 4, 2, 2)),
+                "point_coords": np.array([[[x, x]]], dtype=np.float32),
+                "point_labels": np.array([[1]], dtype=np.float32),
+            }
+            for x in [1, 2, 3]
+        ]
+
+        expected = [self.visual_prompting_ov_inferencer.forward_decoder(prompt, np.array([3, 3])) for prompt in inputs]
+        assert decoder.infer_sync.call_count == 7
+        decoder.infer_sync.reset_mock()
+
+        results = self.visual_prompting_ov_inferencer.forward_decoder_batch(inputs, np.array([3, 3]))
+
+        assert decoder.infer_sync.call_count == 3
+        assert len(decoder.infer_sync.call_args_list[-1].args[0]["point_coords"]) == 2
+        for result, expected_result in zip(results, expected):
+            assert np.all(result["iou_predictions"] == expected_result["iou_predictions"])
+            assert np.all(result["low_res_masks"] == expected_result["low_res_masks"])
+
+    @e2e_pytest_unit
+    def test_inspect_overlapping_areas(self):
+        """Test __inspect_overlapping_areas removes the lower scored of overlapped masks of different labels."""
+        mask = np.zeros((8, 8), dtype=np.bool_)
+        mask[1:5, 1:5] = True
+        larger_mask = np.zeros((8, 8), dtype=np.bool_)
+        larger_mask[1:5, 1:5] = True
+        larger_mask[1, 5] = True
+        other_mask = np.zeros((8, 8), dtype=np.bool_)
+        other_mask[5:, 5:] = True
+        predicted_masks = {0: [mask, other_mask], 1: [larger_mask], 2: [other_mask[:, ::-1].copy()]}
+        used_points = {
+            0: [np.array([1, 1, 0.5]), np.array([6, 6, 0.9])],
+            1: [np.array([1, 1, 0.7])],
+            2: [np.array([1, 6, 0.9])],
+        }
+        annotations = {0: ["mask", "other_mask"], 1: ["larger_mask"], 2: ["flipped_other_mask"]}
+
+        self.visual_prompting_ov_inferencer._OpenVINOZeroShotVisualPromptingInferencer__inspect_overlapping_areas(
+            predicted_masks, used_points, annotations
+        )
+
+        assert annotations == {0: ["other_mask"], 1: ["larger_mask"], 2: ["flipped_other_mask"]}
+        assert len(predicted_masks[0]) == len(used_points[0]) == 1
+
     @e2e_pytest_unit
     @pytest.mark.parametrize(
         "high_res_masks,expected_masks,expected_scores",
@@ -583,11 +664,26 @@ class TestOpenVINOZeroShotVisualPromptingTask:
 
         # self.task_environment.model = mocker.patch("otx.api.entities.model.ModelEntity")
         self.task_environment.model = otx_model
-        mocker.patch.object(
+        self.mock_load_inferencer = mocker.patch.object(
             OpenVINOZeroShotVisualPromptingTask, "load_inferencer", return_value=visual_prompting_ov_inferencer
         )
         self.visual_prompting_ov_task = OpenVINOZeroShotVisualPromptingTask(task_environment=self.task_environment)
 
+    @e2e_pytest_unit
+    def test_load_inferencer(self, mocker):
+        """Test load_inferencer passes decoder_batch_size of the configuration."""
+        mocker.stop(self.mock_load_inferencer)
+        mock_inferencer = mocker.patch(
+            "otx.algorithms.visual_prompting.tasks.openvino.OpenVINOZeroShotVisualPromptingInferencer"
+        )
+        hparams = self.task_environment.get_hyper_parameters(VisualPromptingBaseConfig)
+        hparams.postprocessing.decoder_batch_size = 8
+        self.task_environment.set_hyper_parameters(hparams)
+
+        self.visual_prompting_ov_task.load_inferencer()
+
+        assert mock_inferencer.call_args.kwargs["decoder_batch_size"] == 8
+
     @e2e_pytest_unit
     def test_optimize(self, mocker):
         """Test optimize."""
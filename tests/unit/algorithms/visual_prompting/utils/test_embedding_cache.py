@@ -0,0 +1,84 @@
+"""Tests the image embedding cache."""
+
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+import pytest
+
+from otx.algorithms.visual_prompting.utils import ImageEmbeddingCache
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+def _embeddings(value: float, size: int = 4):
+    return {"image_embeddings": np.full((1, 2, size, size), value, dtype=np.float32)}
+
+
+class TestImageEmbeddingCache:
+    @e2e_pytest_unit
+    def test_get_key(self):
+        """Test get_key depends on the encoder and on the content, shape and dtype of the inputs."""
+        image = np.arange(12, dtype=np.uint8).reshape(1, 3, 2, 2)
+        key = ImageEmbeddingCache.get_key({"images": image}, "encoder")
+
+        assert key == ImageEmbeddingCache.get_key({"images": image.copy()}, "encoder")
+        assert key != ImageEmbeddingCache.get_key({"images": image}, "other_encoder")
+        assert key != ImageEmbeddingCache.get_key({"images": image + 1}, "encoder")
+        assert key != ImageEmbeddingCache.get_key({"images": image.reshape(1, 3, 4, 1)}, "encoder")
+        assert key != ImageEmbeddingCache.get_key({"images": image.astype(np.int8)}, "encoder")
+
+    @e2e_pytest_unit
+    def test_get_encoder_id(self, tmp_path):
+        """Test get_encoder_id hashes files by their content."""
+        model_path = tmp_path / "model.bin"
+        model_path.write_bytes(b"weights")
+
+        assert ImageEmbeddingCache.get_encoder_id(str(model_path), 1024) == ImageEmbeddingCache.get_encoder_id(
+            b"weights", 1024
+        )
+        assert ImageEmbeddingCache.get_encoder_id(str(model_path), 1024) != ImageEmbeddingCache.get_encoder_id(
+            str(model_path), 512
+        )
+
+    @e2e_pytest_unit
+    def test_lru(self):
+        """Test the least recently used embeddings are evicted when the cache is full."""
+        nbytes = _embeddings(0)["image_embeddings"].nbytes
+        cache = ImageEmbeddingCache(max_bytes=2 * nbytes)
+        cache.put("a", _embeddings(0))
+        cache.put("b", _embeddings(1))
+        assert cache.get("a") is not None
+        cache.put("c", _embeddings(2))
+
+        assert len(cache) == 2
+        assert cache.nbytes == 2 * nbytes
+        assert cache.get("b") is None
+        assert np.array_equal(cache.get("a")["image_embeddings"], _embeddings(0)["image_embeddings"])
+        assert np.array_equal(cache.get("c")["image_embeddings"], _embeddings(2)["image_embeddings"])
+
+    @e2e_pytest_unit
+    def test_put_copies(self):
+        """Test put caches read-only copies of the embeddings."""
+        cache = ImageEmbeddingCache()
+        embeddings = _embeddings(1)
+        cached = cache.put("a", embeddings)
+        embeddings["image_embeddings"][:] = 0
+
+        assert np.all(cache.get("a")["image_embeddings"] == 1)
+        with pytest.raises(ValueError):
+            cached["image_embeddings"][:] = 0
+
+    @e2e_pytest_unit
+    def test_disk_tier(self, tmp_path):
+        """Test the embeddings evicted from memory are loaded back memory-mapped from the disk tier."""
+        cache = ImageEmbeddingCache(max_bytes=0, cache_dir=tmp_path)
+        cache.put("a", _embeddings(3))
+        assert len(cache) == 0
+
+        for reader in [cache, ImageEmbeddingCache(cache_dir=tmp_path)]:
+            embeddings = reader.get("a")
+            assert isinstance(embeddings["image_embeddings"], np.memmap)
+            assert np.array_equal(embeddings["image_embeddings"], _embeddings(3)["image_embeddings"])
+        assert cache.get("b") is None
+        assert [path.name for path in tmp_path.iterdir()] == ["a"]
@@ -14,6 +14,7 @@
 
 from operator import attrgetter
 
+import numpy as np
 import pytest
 
 from otx.api.entities.shapes.polygon import Point, Polygon
@@ -65,6 +66,16 @@ class TestPoint:
         assert point1 != point3
         assert point1 != str
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_point_clip(self):
+        """Check that Point clips its coordinates to [0, 1] and keeps the numpy types of np.clip."""
+        for x, expected in [(0.5, 0.5), (-0.5, 0.0), (1.5, 1.0), (np.float64(0.25), 0.25), (np.float32(2.0), 1.0)]:
+            point = Point(x, x)
+            assert point.x == point.y == expected
+            assert type(point.x) is type(np.clip(x, 0.0, 1.0))
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -45,13 +45,17 @@ class TestInferenceParameters:
         infer_params = InferenceParameters()
 
         assert dataclasses.is_dataclass(infer_params)
-        assert len(dataclasses.fields(infer_params)) == 6
+        assert len(dataclasses.fields(infer_params)) == 10
         assert dataclasses.fields(infer_params)[0].name == "is_evaluation"
         assert dataclasses.fields(infer_params)[1].name == "update_progress"
         assert dataclasses.fields(infer_params)[2].name == "explainer"
         assert dataclasses.fields(infer_params)[3].name == "process_saliency_maps"
         assert dataclasses.fields(infer_params)[4].name == "explain_predicted_classes"
         assert dataclasses.fields(infer_params)[5].name == "enable_async_inference"
+        assert dataclasses.fields(infer_params)[6].name == "max_batch_size"
+        assert dataclasses.fields(infer_params)[7].name == "max_batch_wait_ms"
+        assert dataclasses.fields(infer_params)[8].name == "num_prefetch_workers"
+        assert dataclasses.fields(infer_params)[9].name == "max_prefetch"
         assert type(infer_params.is_evaluation) is bool
         assert type(infer_params.process_saliency_maps) is bool
         assert type(infer_params.explain_predicted_classes) is bool
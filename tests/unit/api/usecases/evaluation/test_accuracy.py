@@ -458,6 +458,7 @@ class TestAccuracy:
         <b>Steps</b>
         1. Check attributes of "Accuracy" class object initialized with default optional parameters
         2. Check attributes of "Accuracy" class object initialized with specified optional parameters
+        3. Check attributes of "Accuracy" class object computed by worker processes are the same
         """
 
         def check_confusion_matrices(unnormalized_matrices):
@@ -496,6 +497,10 @@ class TestAccuracy:
         # Checking "unnormalized_matrices" attribute
         actual_unnormalized_matrices = accuracy._unnormalized_matrices
         check_confusion_matrices(actual_unnormalized_matrices)
+        # Checking attributes of "Accuracy" object computed by worker processes
+        accuracy = Accuracy(resultset=result_set, average=MetricAverageMethod.MACRO, num_workers=2)
+        assert accuracy.accuracy == ScoreMetric(name="Accuracy", value=0.7916666666666667)
+        check_confusion_matrices(accuracy._unnormalized_matrices)
 
     @pytest.mark.priority_medium
     @pytest.mark.unit
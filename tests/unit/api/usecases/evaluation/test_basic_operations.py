@@ -15,20 +15,29 @@
 import numpy as np
 import pytest
 
+from otx.api.entities.id import ID
 from otx.api.entities.label import Domain, LabelEntity
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.usecases.evaluation.basic_operations import (
     divide_arrays_with_possible_zeros,
     get_intersections_and_cardinalities,
+    get_rle_intersections_and_cardinalities,
     intersection_box,
     intersection_over_union,
+    iterate_in_chunks,
+    map_chunks,
     precision_per_class,
     recall_per_class,
 )
+from otx.api.utils.segmentation_utils import encode_mask_rle
 from tests.unit.api.constants.components import OtxSdkComponent
 from tests.unit.api.constants.requirements import Requirements
 
 
+def sum_chunk(chunk, offset=0):
+    return sum(chunk) + offset
+
+
 @pytest.mark.components(OtxSdkComponent.OTX_API)
 class TestBasicOperationsFunctions:
     @pytest.mark.priority_medium
@@ -81,6 +90,44 @@ class TestBasicOperationsFunctions:
         assert cardinalities.get(non_assigned_label) == 0
         assert cardinalities.get(None) == 51
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_rle_intersections_and_cardinalities(self):
+        """
+        <b>Description:</b>
+        Check "get_rle_intersections_and_cardinalities" function
+
+        <b>Input data:</b>
+        Run-length encoded "reference" and "prediction" masks, number of labels
+
+        <b>Expected results:</b>
+        Test passes if the counts returned by "get_rle_intersections_and_cardinalities" function are equal to the
+        counts returned by "get_intersections_and_cardinalities" function for the decoded masks
+
+        <b>Steps</b>
+        1. Check counts for random blocky masks with a value out of the labels
+        2. Check "ValueError" exception is raised when the masks differ in shape
+        """
+        labels = [LabelEntity(name=f"label_{i}", domain=Domain.SEGMENTATION, id=ID(str(i))) for i in range(3)]
+        rng = np.random.default_rng(0)
+        for _ in range(5):
+            reference = np.repeat(rng.integers(0, 5, (32, 6, 1)), 4, axis=1).astype(np.uint8)
+            prediction = np.repeat(rng.integers(0, 4, (8, 24, 1)), 4, axis=0).astype(np.uint8)
+            expected_intersections, expected_cardinalities = get_intersections_and_cardinalities(
+                [reference], [prediction], labels
+            )
+            intersections, cardinalities = get_rle_intersections_and_cardinalities(
+                encode_mask_rle(reference), encode_mask_rle(prediction), len(labels)
+            )
+            assert intersections.tolist() == [expected_intersections[key] for key in [None, *labels]]
+            assert cardinalities.tolist() == [expected_cardinalities[key] for key in [None, *labels]]
+
+        with pytest.raises(ValueError):
+            get_rle_intersections_and_cardinalities(
+                encode_mask_rle(np.zeros((2, 3))), encode_mask_rle(np.zeros((3, 2))), len(labels)
+            )
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -219,3 +266,40 @@ class TestBasicOperationsFunctions:
             a1=divide_arrays_with_possible_zeros(array, other_array),
             a2=np.array([(3, 0.5, 0), (0, 5, 1.5), (0, 0, 12)]),
         )
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_iterate_in_chunks(self):
+        """
+        <b>Description:</b>
+        Check "iterate_in_chunks" function
+
+        <b>Input data:</b>
+        Iterable and chunk size
+
+        <b>Expected results:</b>
+        Test passes if the elements are yielded in order in chunks of at most the chunk size
+        """
+        assert list(iterate_in_chunks(range(7), chunk_size=3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(iterate_in_chunks(iter(range(6)), chunk_size=3)) == [[0, 1, 2], [3, 4, 5]]
+        assert list(iterate_in_chunks([], chunk_size=3)) == []
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_map_chunks(self, num_workers):
+        """
+        <b>Description:</b>
+        Check "map_chunks" function
+
+        <b>Input data:</b>
+        Function, chunks and number of workers
+
+        <b>Expected results:</b>
+        Test passes if the results of the function are yielded in the order of the chunks
+        """
+        chunks = iterate_in_chunks(range(100), chunk_size=7)
+        results = list(map_chunks(sum_chunk, chunks, num_workers, offset=1))
+        assert results == [sum(chunk) + 1 for chunk in iterate_in_chunks(range(100), chunk_size=7)]
@@ -190,9 +190,10 @@ class TestDice:
         <b>Steps</b>
         1. Check attributes of "DiceAverage" object initialized with default value of "average" parameter
         2. Check attributes of "DiceAverage" object initialized with specified value of "average" parameter
-        3. Check that "ValueError" exception is raised when initializing "DiceAverage" object with empty list prediction
+        3. Check attributes of "DiceAverage" object computed by worker processes are the same
+        4. Check that "ValueError" exception is raised when initializing "DiceAverage" object with empty list prediction
         "resultset" attribute
-        4. Check "ValueError" exception is raised when initializing "DiceAverage" object with "resultset" attribute with
+        5. Check "ValueError" exception is raised when initializing "DiceAverage" object with "resultset" attribute with
         unequal length of "ground_truth_dataset" and "prediction_dataset"
         """
 
@@ -269,6 +270,13 @@ class TestDice:
             expected_average_type=MetricAverageMethod.MICRO,
             expected_overall_dice=0.7746741154562383,
         )
+        # Checking attributes of "DiceAverage" computed by worker processes
+        dice = DiceAverage(resultset=result_set, average=MetricAverageMethod.MICRO, num_workers=2)
+        check_dice_attributes(
+            dice_actual=dice,
+            expected_average_type=MetricAverageMethod.MICRO,
+            expected_overall_dice=0.7746741154562383,
+        )
         # Checking "ValueError" exception raised when initializing "DiceAverage" with empty list prediction result_set
         result_set = ResultSetEntity(
             model=model,
@@ -408,6 +416,39 @@ class TestDice:
         # Checking "dashboard_metrics" attribute
         assert performance.dashboard_metrics == []
 
+    def human_mask_dataset_item(self, height: int) -> DatasetItemEntity:
+        human_roi = Annotation(shape=self.full_box_roi, labels=[ScoredLabel(self.human_label)])
+        mask = np.zeros((64, 32), dtype=np.uint8)
+        mask[:height, :8] = 1
+        human_annotation = Annotation(shape=Image(data=mask, size=mask.shape), labels=[ScoredLabel(self.human_label)])
+        human_annotation_scene = AnnotationSceneEntity(
+            annotations=[human_annotation], kind=AnnotationSceneKind.PREDICTION
+        )
+        return DatasetItemEntity(media=self.image, annotation_scene=human_annotation_scene, roi=human_roi)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_dice_with_image_masks(self):
+        """
+        <b>Description:</b>
+        Check "DiceAverage" class for annotations with Image masks such as visual prompting predictions
+
+        <b>Input data:</b>
+        "ResultSetEntity" object whose prediction and ground truth annotations have Image shapes
+
+        <b>Expected results:</b>
+        Test passes if the Dice coefficient is computed from the combined masks
+        """
+        result_set = ResultSetEntity(
+            model=self.model(),
+            ground_truth_dataset=DatasetEntity([self.human_mask_dataset_item(height=8)]),
+            prediction_dataset=DatasetEntity([self.human_mask_dataset_item(height=16)]),
+        )
+        dice = DiceAverage(resultset=result_set)
+        # intersection of 64 pixels over 64 + 128 pixels
+        self.check_score_metric(score_metric=dice.overall_dice, expected_name="Dice Average", expected_value=2 / 3)
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -999,6 +999,127 @@ class TestFMeasureCalculator:
         assert actual_results_per_confidence.best_f_measure == 0.0
         assert actual_results_per_confidence.best_threshold == 0.1
 
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_f_measure_calculator_sweep_consistency(self):
+        """
+        <b>Description:</b>
+        Check that the thresholds swept at once by "_FMeasureCalculator" give the same results as evaluating them one
+        by one
+
+        <b>Input data:</b>
+        "_FMeasureCalculator" class object with random boxes with duplicated scores and case-insensitive class names
+
+        <b>Expected results:</b>
+        Test passes if "get_results_per_confidence" and "get_results_per_nms" methods return the same curves as
+        "evaluate_classes" method for each threshold
+        """
+        rng = np.random.default_rng(0)
+        classes = ["class_1", "Class_2", "class_2"]
+
+        def random_boxes(num_boxes):
+            boxes = []
+            for _ in range(num_boxes):
+                x1, y1 = rng.uniform(0, 0.8, 2)
+                width, height = rng.uniform(0.05, 0.2, 2)
+                score = float(np.round(rng.uniform(), 1))
+                boxes.append((x1, y1, x1 + width, y1 + height, str(rng.choice(classes)), score))
+            return boxes
+
+        ground_truth_boxes_per_image = [random_boxes(rng.integers(0, 8)) for _ in range(10)]
+        prediction_boxes_per_image = []
+        for ground_truth_boxes in ground_truth_boxes_per_image:
+            jittered_boxes = [
+                (*(np.array(box[:4]) + rng.normal(0, 0.01, 4)), box[4], float(np.round(rng.uniform(), 1)))
+                for box in ground_truth_boxes
+            ]
+            prediction_boxes_per_image.append(jittered_boxes + random_boxes(rng.integers(0, 8)))
+        f_measure_calculator = _FMeasureCalculator(ground_truth_boxes_per_image, prediction_boxes_per_image)
+
+        results_per_confidence = f_measure_calculator.get_results_per_confidence(
+            classes=classes, confidence_range=f_measure_calculator.confidence_range, iou_threshold=0.5
+        )
+        for i, confidence_threshold in enumerate(np.arange(*f_measure_calculator.confidence_range)):
+            result_point = f_measure_calculator.evaluate_classes(classes.copy(), 0.5, confidence_threshold)
+            assert results_per_confidence.all_classes_f_measure_curve[i] == result_point["All Classes"].f_measure
+            for class_name in classes:
+                assert results_per_confidence.precision_curve[class_name][i] == result_point[class_name].precision
+                assert results_per_confidence.recall_curve[class_name][i] == result_point[class_name].recall
+
+        for cross_class_nms in [False, True]:
+            results_per_nms = f_measure_calculator.get_results_per_nms(
+                classes=classes, iou_threshold=0.5, min_f_measure=0.0, cross_class_nms=cross_class_nms
+            )
+            critical_nms = f_measure_calculator._FMeasureCalculator__get_critical_nms(  # type: ignore[attr-defined]
+                prediction_boxes_per_image, cross_class_nms
+            )
+            for i, nms_threshold in enumerate(np.arange(*f_measure_calculator.nms_range)):
+                result_point = _FMeasureCalculator(
+                    ground_truth_boxes_per_image,
+                    f_measure_calculator._FMeasureCalculator__filter_nms(  # type: ignore[attr-defined]
+                        prediction_boxes_per_image, critical_nms, nms_threshold
+                    ),
+                ).evaluate_classes(classes.copy(), 0.5, f_measure_calculator.default_confidence_threshold)
+                assert results_per_nms.all_classes_f_measure_curve[i] == result_point["All Classes"].f_measure
+                for class_name in classes:
+                    assert results_per_nms.f_measure_curve[class_name][i] == result_point[class_name].f_measure
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_f_measure_calculator_evaluate_detections_in_chunks(self, num_workers):
+        """
+        <b>Description:</b>
+        Check that "_FMeasureCalculator" gives the same results when the images are evaluated in chunks
+
+        <b>Input data:</b>
+        "_FMeasureCalculator" class object with random boxes on more images than a chunk
+
+        <b>Expected results:</b>
+        Test passes if "evaluate_detections" method returns the same curves as "get_results_per_confidence" and
+        "get_results_per_nms" methods evaluating all images at once
+        """
+        rng = np.random.default_rng(0)
+        classes = ["class_1", "class_2"]
+
+        def random_boxes(num_boxes):
+            boxes = []
+            for _ in range(num_boxes):
+                x1, y1 = rng.uniform(0, 0.8, 2)
+                width, height = rng.uniform(0.05, 0.2, 2)
+                boxes.append((x1, y1, x1 + width, y1 + height, str(rng.choice(classes)), float(rng.uniform())))
+            return boxes
+
+        ground_truth_boxes_per_image = [random_boxes(rng.integers(0, 5)) for _ in range(150)]
+        prediction_boxes_per_image = [random_boxes(rng.integers(0, 5)) for _ in range(150)]
+        f_measure_calculator = _FMeasureCalculator(ground_truth_boxes_per_image, prediction_boxes_per_image)
+
+        result = f_measure_calculator.evaluate_detections(
+            classes=classes.copy(), result_based_nms_threshold=True, num_workers=num_workers
+        )
+        results_per_confidence = f_measure_calculator.get_results_per_confidence(
+            classes=classes, confidence_range=f_measure_calculator.confidence_range, iou_threshold=0.5
+        )
+        results_per_nms = f_measure_calculator.get_results_per_nms(
+            classes=classes, iou_threshold=0.5, min_f_measure=results_per_confidence.best_f_measure
+        )
+        # the boxes can be built lazily while the chunks are evaluated
+        lazy_result = _FMeasureCalculator(
+            iter(ground_truth_boxes_per_image), iter(prediction_boxes_per_image)
+        ).evaluate_detections(classes=classes.copy(), result_based_nms_threshold=True, num_workers=num_workers)
+        for actual, expected in (
+            (result.per_confidence, results_per_confidence),
+            (result.per_nms, results_per_nms),
+            (lazy_result.per_confidence, results_per_confidence),
+            (lazy_result.per_nms, results_per_nms),
+        ):
+            assert actual.all_classes_f_measure_curve == expected.all_classes_f_measure_curve
+            assert actual.precision_curve == expected.precision_curve
+            assert actual.recall_curve == expected.recall_curve
+            assert actual.best_threshold == expected.best_threshold
+
     @pytest.mark.priority_medium
     @pytest.mark.unit
     @pytest.mark.reqids(Requirements.REQ_1)
@@ -1484,9 +1605,10 @@ class TestFMeasure:
         <b>Steps</b>
         1. Check attributes of "FMeasure" class object initialized with default optional parameters
         2. Check attributes of "FMeasure" class object initialized with specified optional parameters
-        3. Check ValueError exception is raised when empty list "ground_truth_dataset" is specified in "result_set"
+        3. Check attributes of "FMeasure" class object computed by worker processes are the same
+        4. Check ValueError exception is raised when empty list "ground_truth_dataset" is specified in "result_set"
         parameter
-        4. Check ValueError exception is raised when empty list "prediction_dataset" is specified in "result_set"
+        5. Check ValueError exception is raised when empty list "prediction_dataset" is specified in "result_set"
         parameter
         """
 
@@ -1533,9 +1655,15 @@ class TestFMeasure:
         label_schema_labels = result_set.model.configuration.get_label_schema().get_labels(include_empty=False)
         classes = [label.name for label in label_schema_labels]
         boxes_pair = _FMeasureCalculator(
-            f_measure._FMeasure__get_boxes_from_dataset_as_list(ground_dataset, labels),  # type: ignore[attr-defined]
-            f_measure._FMeasure__get_boxes_from_dataset_as_list(  # type: ignore[attr-defined]
-                prediction_dataset, labels
+            list(
+                f_measure._FMeasure__iterate_boxes_from_dataset(  # type: ignore[attr-defined]
+                    ground_dataset, labels, set()
+                )
+            ),
+            list(
+                f_measure._FMeasure__iterate_boxes_from_dataset(  # type: ignore[attr-defined]
+                    prediction_dataset, labels, set()
+                )
             ),
         )
         result = boxes_pair.evaluate_detections(
@@ -1559,6 +1687,18 @@ class TestFMeasure:
         assert f_measure.f_measure_per_nms.name == expected_f_measure_per_nms.name
         assert f_measure.f_measure_per_nms.xs == expected_f_measure_per_nms.xs
         assert f_measure.f_measure_per_nms.ys == expected_f_measure_per_nms.ys
+        # Checking attributes of "FMeasure" class object computed by worker processes
+        parallel_f_measure = FMeasure(
+            resultset=result_set,
+            vary_confidence_threshold=True,
+            vary_nms_threshold=True,
+            cross_class_nms=True,
+            num_workers=2,
+        )
+        assert parallel_f_measure.f_measure == f_measure.f_measure
+        assert parallel_f_measure.f_measure_per_label == f_measure.f_measure_per_label
+        assert parallel_f_measure.f_measure_per_confidence.ys == f_measure.f_measure_per_confidence.ys
+        assert parallel_f_measure.f_measure_per_nms.ys == f_measure.f_measure_per_nms.ys
         # Checking ValueError exception is raised when empty list "ground_truth_dataset" is specified in "result_set"
         empty_dataset = DatasetEntity([])
         result_set = ResultSetEntity(
@@ -0,0 +1,54 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+import pytest
+
+from otx.api.utils.lru_cache import LRUCache
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestLRUCache:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_lru(self):
+        values = [np.full(4, i, dtype=np.uint8) for i in range(4)]
+        cache = LRUCache(max_bytes=3 * values[0].nbytes)
+        for i in range(3):
+            cache.put(i, values[i])
+        assert cache.get(0) is values[0]
+        cache.put(3, values[3])
+
+        assert len(cache) == 3
+        assert cache.nbytes == 3 * values[0].nbytes
+        assert cache.get(1) is None
+        assert cache.get(0) is values[0]
+
+        # putting the same key again replaces the value
+        cache.put(0, values[1])
+        assert len(cache) == 3
+        assert cache.get(0) is values[1]
+
+        # values larger than the cache are not cached
+        cache.put(4, np.zeros(16, dtype=np.uint8))
+        assert cache.get(4) is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_get_nbytes(self):
+        cache = LRUCache(max_bytes=10, get_nbytes=len)
+        cache.put("a", "abcdef")
+        cache.put("b", "ghijkl")
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "ghijkl"
+        assert cache.nbytes == 6
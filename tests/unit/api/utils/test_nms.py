@@ -0,0 +1,144 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import numpy as np
+import pytest
+
+from otx.api.utils.nms import (
+    batched_nms,
+    box_iou,
+    multiclass_nms,
+    nms,
+    rotated_box_iou,
+    soft_nms,
+)
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+def greedy_nms(boxes, scores, thresh):
+    """Sequential greedy NMS which was used before, used as the reference."""
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+
+        width = np.maximum(0.0, xx2 - xx1)
+        height = np.maximum(0.0, yy2 - yy1)
+        intersection = width * height
+
+        union = areas[i] + areas[order[1:]] - intersection
+        overlap = np.divide(
+            intersection,
+            union,
+            out=np.zeros_like(intersection, dtype=float),
+            where=union != 0,
+        )
+
+        order = order[np.where(overlap <= thresh)[0] + 1]
+
+    return np.array(keep, dtype=np.int64)
+
+
+def random_boxes(num_boxes, seed=0, num_score_levels=0):
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform(0, 500, (num_boxes, 2))
+    wh = rng.uniform(5, 80, (num_boxes, 2))
+    scores = rng.uniform(0, 1, num_boxes).astype(np.float32)
+    if num_score_levels > 0:
+        # tied scores, e.g. duplicates of a detection predicted on overlapping tiles
+        scores = np.floor(scores * num_score_levels).astype(np.float32) / num_score_levels
+    return np.concatenate([xy, xy + wh], axis=1).astype(np.float32), scores
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestNMS:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_boxes", [0, 1, 100, 1000])
+    def test_nms(self, num_boxes):
+        boxes, scores = random_boxes(num_boxes)
+        expected = greedy_nms(boxes, scores, 0.5)
+
+        assert np.array_equal(nms(boxes, scores, 0.5), expected)
+        assert np.array_equal(nms(boxes, scores, 0.5, max_num=10), expected[:10])
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("num_boxes", [10, 100, 1000])
+    @pytest.mark.parametrize("num_score_levels", [1, 3, 10])
+    def test_nms_tied_scores(self, num_boxes, num_score_levels):
+        for seed in range(10):
+            boxes, scores = random_boxes(num_boxes, seed, num_score_levels)
+            # the same box repeated with the same score
+            boxes[1::2] = boxes[::2][: len(boxes[1::2])]
+            scores[1::2] = scores[::2][: len(scores[1::2])]
+
+            assert np.array_equal(nms(boxes, scores, 0.5), greedy_nms(boxes, scores, 0.5))
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_rotated_nms(self):
+        boxes, scores = random_boxes(300)
+        rotated_boxes = np.concatenate(
+            [(boxes[:, :2] + boxes[:, 2:]) / 2, boxes[:, 2:] - boxes[:, :2], np.zeros((300, 1))], axis=1
+        )
+
+        assert np.allclose(rotated_box_iou(rotated_boxes, rotated_boxes), box_iou(boxes, boxes), atol=1e-3)
+        assert np.array_equal(nms(rotated_boxes, scores, 0.5, rotated=True), greedy_nms(boxes, scores, 0.5))
+
+        # The same box rotated by 90 degrees with swapped width and height
+        rotated_boxes[:, 2:4] = rotated_boxes[:, [3, 2]]
+        rotated_boxes[:, 4] = np.pi / 2
+        assert np.allclose(rotated_box_iou(rotated_boxes, rotated_boxes), box_iou(boxes, boxes), atol=1e-3)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_soft_nms(self):
+        boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 9], [20, 20, 30, 30]], dtype=np.float32)
+        scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+
+        keep, decayed = soft_nms(boxes, scores, thresh=0.5, method="linear")
+        assert keep.tolist() == [0, 2, 1]
+        assert np.allclose(decayed, [0.9, 0.7, 0.8 * 0.1], atol=1e-6)
+
+        keep, decayed = soft_nms(boxes, scores, method="gaussian", max_num=2)
+        assert keep.tolist() == [0, 2]
+
+        with pytest.raises(ValueError):
+            soft_nms(boxes, scores, method="unknown")
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_batched_nms(self):
+        boxes, scores = random_boxes(500)
+        labels = np.random.default_rng(0).integers(0, 3, 500)
+
+        keep, kept_scores = batched_nms(boxes, scores, labels, 0.5)
+        expected = []
+        for label in range(3):
+            indices = np.flatnonzero(labels == label)
+            expected.extend(indices[greedy_nms(boxes[indices], scores[indices], 0.5)])
+        assert sorted(keep.tolist()) == sorted(expected)
+        assert np.array_equal(kept_scores, scores[keep])
+        assert np.all(np.diff(kept_scores) <= 0)
+
+        detections = np.concatenate([labels[:, None], scores[:, None], boxes], axis=1)
+        dets, keep = multiclass_nms(detections, iou_threshold=0.5, max_num=20)
+        assert len(dets) == 20
+        assert np.array_equal(dets, detections[keep])
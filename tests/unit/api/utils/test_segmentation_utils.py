@@ -21,8 +21,12 @@ from otx.api.entities.shapes.ellipse import Ellipse
 from otx.api.entities.shapes.polygon import Point, Polygon
 from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.utils.segmentation_utils import (
+    MASK_CACHE,
+    MaskCache,
     create_annotation_from_segmentation_map,
     create_hard_prediction_from_soft_prediction,
+    decode_mask_rle,
+    encode_mask_rle,
     get_subcontours,
     mask_from_annotation,
     mask_from_dataset_item,
@@ -193,6 +197,86 @@ class TestSegmentationUtils:
         )
         mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels)
         assert np.array_equal(mask, expected_mask)
+        # Checking the mask is cached and decoded again
+        assert MASK_CACHE.get(MASK_CACHE.get_key(dataset_item, labels)) is not None
+        mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels)
+        assert np.array_equal(mask, expected_mask)
+        # Checking the mask is rasterized again in another label order
+        mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels[::-1])
+        assert np.array_equal(
+            mask,
+            mask_from_annotation(
+                annotations=dataset_item.get_annotations(), labels=labels[::-1], width=640, height=480
+            ),
+        )
+        # Checking the mask is rasterized again after the annotations are modified in place
+        polygon_annotation.shape = Polygon(points=[Point(x=0.1, y=0.1), Point(x=0.1, y=0.9), Point(x=0.9, y=0.9)])
+        rectangle_annotation.set_labels([ScoredLabel(ellipse_label)])
+        mask = mask_from_dataset_item(dataset_item=dataset_item, labels=labels)
+        assert np.array_equal(
+            mask,
+            mask_from_annotation(annotations=dataset_item.get_annotations(), labels=labels, width=640, height=480),
+        )
+        assert not np.array_equal(mask, expected_mask)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_encode_decode_mask_rle(self):
+        """
+        <b>Description:</b>
+        Check "encode_mask_rle" and "decode_mask_rle" functions
+
+        <b>Input data:</b>
+        Masks of different shapes
+
+        <b>Expected results:</b>
+        Test passes if the decoded mask is equal to the encoded mask
+        """
+        mask = np.zeros((480, 640, 1), dtype=np.uint8)
+        mask[100:200, 50:300] = 1
+        mask[300:400, 200:600] = 2
+        encoded_mask = encode_mask_rle(mask)
+        assert encoded_mask.nbytes < mask.nbytes
+        assert encoded_mask.values.tolist()[:3] == [0, 1, 0]
+        decoded_mask = decode_mask_rle(encoded_mask)
+        assert decoded_mask.dtype == mask.dtype
+        assert np.array_equal(decoded_mask, mask)
+
+        for mask in (np.zeros((0, 4), dtype=np.uint8), np.arange(12).reshape(3, 4)):
+            assert np.array_equal(decode_mask_rle(encode_mask_rle(mask)), mask)
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_mask_cache(self):
+        """
+        <b>Description:</b>
+        Check "MaskCache" class
+
+        <b>Input data:</b>
+        "MaskCache" object with a limited number of bytes, run-length encoded masks
+
+        <b>Expected results:</b>
+        Test passes if the least recently used masks are evicted when the cache is full
+        """
+        masks = [encode_mask_rle(np.full((4, 4), i, dtype=np.uint8)) for i in range(4)]
+        cache = MaskCache(max_bytes=3 * masks[0].nbytes)
+        for i in range(3):
+            cache.put(i, masks[i])
+        assert len(cache) == 3
+        assert cache.get(0) is masks[0]
+        cache.put(3, masks[3])
+        assert len(cache) == 3
+        assert cache.nbytes == 3 * masks[0].nbytes
+        assert cache.get(1) is None
+        assert cache.get(0) is masks[0]
+        # Masks larger than the cache are not cached
+        cache.put(4, encode_mask_rle(np.arange(16).reshape(4, 4)))
+        assert cache.get(4) is None
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
 
     @pytest.mark.priority_medium
     @pytest.mark.unit
@@ -564,3 +648,35 @@ class TestSegmentationUtils:
             expected_label="true_label",
             expected_probability=0.91071,
         )
+
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    def test_create_annotation_from_segmentation_map_num_workers(self):
+        """Check that the labels converted in parallel give the polygons and probabilities of the serial conversion."""
+        rng = np.random.default_rng(0)
+        hard_prediction = np.zeros((120, 160), dtype=np.uint8)
+        for _ in range(40):
+            x, y = rng.integers(0, 160), rng.integers(0, 120)
+            cv2.circle(hard_prediction, (int(x), int(y)), int(rng.integers(2, 12)), int(rng.integers(1, 4)), -1)
+        soft_prediction = rng.uniform(size=(120, 160, 4)).astype(np.float32)
+        labels = {index: LabelEntity(name=f"class_{index}", domain=Domain.SEGMENTATION) for index in range(4)}
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "The geometry of the segmentation map")
+            serial = create_annotation_from_segmentation_map(hard_prediction, soft_prediction, labels, num_workers=1)
+            parallel = create_annotation_from_segmentation_map(hard_prediction, soft_prediction, labels, num_workers=3)
+
+        assert len(serial) == len(parallel) > 0
+        for expected, actual in zip(serial, parallel):
+            assert actual.shape.points == expected.shape.points
+            assert actual.get_labels()[0].label == expected.get_labels()[0].label
+            assert actual.get_labels()[0].probability == expected.get_labels()[0].probability
+
+        # The probability of a shape is the mean soft prediction over the pixels of its points
+        for annotation in serial:
+            label_index = int(annotation.get_labels()[0].label.name[-1])
+            points = np.array([[point.x * 159, point.y * 119] for point in annotation.shape.points]).round()
+            pixels = np.unique(points.astype(int), axis=0)
+            expected_probability = soft_prediction[pixels[:, 1], pixels[:, 0], label_index].astype(np.float64).mean()
+            assert np.isclose(annotation.get_labels()[0].probability, expected_probability)
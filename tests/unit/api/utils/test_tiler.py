@@ -0,0 +1,77 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import cv2
+import numpy as np
+import pytest
+
+from otx.api.utils.dataset_utils import non_linear_normalization
+from otx.api.utils.tiler import Tiler
+from tests.unit.api.constants.components import OtxSdkComponent
+from tests.unit.api.constants.requirements import Requirements
+
+
+def pixelwise_merge_maps(tiler, features):
+    """Pixel-by-pixel merge of the saliency maps used as the reference."""
+    (_, image_saliency_map), image_meta = features[0]
+    num_classes, feat_h, feat_w = image_saliency_map.shape
+    dtype = image_saliency_map[0][0].dtype
+    image_h, image_w, _ = image_meta["original_shape"]
+    ratio = np.array([feat_h / min(tiler.tile_size, image_h), feat_w / min(tiler.tile_size, image_w)])
+    image_map_h = int(image_h * ratio[0])
+    image_map_w = int(image_w * ratio[1])
+    merged_map = [np.zeros((image_map_h, image_map_w)) for _ in range(num_classes)]
+
+    for (_, saliency_map), meta in features[1:]:
+        x_1, y_1, x_2, y_2 = meta["coord"]
+        y_1, x_1 = ((y_1, x_1) * ratio).astype(np.uint16)
+        y_2, x_2 = ((y_2, x_2) * ratio).astype(np.uint16)
+        map_h, map_w = saliency_map[0].shape
+        if (map_h > y_2 - y_1 > 0) and (map_w > x_2 - x_1 > 0):
+            saliency_map = np.array([cv2.resize(cls_map, (x_2 - x_1, y_2 - y_1)) for cls_map in saliency_map])
+        map_h, map_w = y_2 - y_1, x_2 - x_1
+        for ci, hi, wi in [(c_, h_, w_) for c_ in range(num_classes) for h_ in range(map_h) for w_ in range(map_w)]:
+            map_pixel = saliency_map[ci, hi, wi]
+            if merged_map[ci][y_1 + hi, x_1 + wi] != 0:
+                merged_map[ci][y_1 + hi, x_1 + wi] = 0.5 * (map_pixel + merged_map[ci][y_1 + hi, x_1 + wi])
+            else:
+                merged_map[ci][y_1 + hi, x_1 + wi] = map_pixel
+
+    for class_idx in range(num_classes):
+        image_map_cls = cv2.resize(image_saliency_map[class_idx], (image_map_w, image_map_h))
+        merged_map[class_idx] += (0.5 * image_map_cls).astype(dtype)
+        merged_map[class_idx] = non_linear_normalization(merged_map[class_idx])
+    return merged_map
+
+
+def tile_features(tiler, image_shape, num_classes, map_size, dtype=np.uint8, seed=0):
+    """Random saliency maps of the tiles of an image, the first one is of the full image."""
+    rng = np.random.default_rng(seed)
+    features = []
+    for i, coord in enumerate(tiler.tile(np.empty(image_shape, dtype=np.uint8))):
+        saliency_map = rng.uniform(0, 255, (num_classes, map_size, map_size)).astype(dtype)
+        # some pixels are not activated
+        saliency_map[rng.uniform(size=saliency_map.shape) < 0.1] = 0
+        meta = {"original_shape": image_shape} if i == 0 else {"coord": coord}
+        features.append(((None, saliency_map), meta))
+    return features
+
+
+@pytest.mark.components(OtxSdkComponent.OTX_API)
+class TestTiler:
+    @pytest.mark.priority_medium
+    @pytest.mark.unit
+    @pytest.mark.reqids(Requirements.REQ_1)
+    @pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+    @pytest.mark.parametrize("image_shape", [(1000, 1300, 3), (300, 200, 3)])
+    def test_merge_maps(self, image_shape, dtype):
+        tiler = Tiler(tile_size=400, overlap=0.2, max_number=100, detector=None, mode="sync")
+        features = tile_features(tiler, image_shape, num_classes=3, map_size=13, dtype=dtype)
+
+        merged_maps = tiler.merge_maps(features)
+        expected_maps = pixelwise_merge_maps(tiler, features)
+        assert len(merged_maps) == len(expected_maps) == 3
+        for merged_map, expected_map in zip(merged_maps, expected_maps):
+            assert merged_map.dtype == np.uint8
+            assert np.array_equal(merged_map, expected_map)
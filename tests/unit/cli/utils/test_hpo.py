@@ -10,13 +10,24 @@ import pytest
 
 import otx
 from otx.api.configuration.helper import create as create_conf_hp
+from otx.api.entities.annotation import Annotation, AnnotationSceneEntity, AnnotationSceneKind
+from otx.api.entities.color import Color
+from otx.api.entities.dataset_item import DatasetItemEntity
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.id import ID
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.label_schema import LabelSchemaEntity
 from otx.api.entities.model import ModelEntity
 from otx.api.entities.model_template import TaskType
 from otx.api.entities.subset import Subset
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.rectangle import Rectangle
 from otx.api.entities.task_environment import TaskEnvironment
 from otx.cli.registry import find_and_parse_model_template
 from otx.cli.utils import hpo
 from otx.cli.utils.hpo import (
+    CheckpointStore,
     HpoCallback,
     HpoDataset,
     HpoRunner,
@@ -24,9 +35,11 @@ from otx.cli.utils.hpo import (
     TaskManager,
     Trainer,
     get_best_hpo_weight,
+    load_dataset_snapshot,
     run_hpo,
     run_trial,
 )
+from otx.core.data.columnar import ColumnarDataset
 from otx.hpo.hpo_base import TrialStatus
 from tests.test_suite.e2e_test_system import e2e_pytest_unit
 
@@ -161,6 +174,21 @@ class TestTaskManager:
 
             assert weight_in_det.exists()
 
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("task", MMCV_TASK)
+    def test_copy_weight_with_checkpoint_store(self, task: TaskType, tmp_path):
+        task_manager = TaskManager(task)
+        weight_in_src = tmp_path / "src" / "epoch_3.pth"
+        weight_in_src.parent.mkdir()
+        weight_in_src.write_text("fake")
+        (tmp_path / "det").mkdir()
+
+        task_manager.copy_weight(tmp_path / "src", tmp_path / "det", CheckpointStore(tmp_path / "store"))
+
+        # model weights are moved into the store
+        assert not weight_in_src.exists()
+        assert (tmp_path / "det" / "epoch_3.pth").read_text() == "fake"
+
     @e2e_pytest_unit
     @pytest.mark.parametrize("task", MMCV_TASK)
     def test_get_latest_weight(self, task: TaskType):
@@ -251,6 +279,57 @@ def action_task_env(action_template_path) -> TaskEnvironment:
     return make_task_env(action_template_path)
 
 
+class TestCheckpointStore:
+    @e2e_pytest_unit
+    def test_put(self, tmp_path):
+        store = CheckpointStore(tmp_path / "store")
+        for name in ["a.pth", "b.pth", "c.pth"]:
+            (tmp_path / name).write_text("same" if name != "c.pth" else "different")
+
+        weight_a = store.put(tmp_path / "a.pth", tmp_path / "0" / "a.pth", deduplicate=True)
+        weight_b = store.put(tmp_path / "b.pth", tmp_path / "1" / "b.pth", move=True, deduplicate=True)
+        weight_c = store.put(tmp_path / "c.pth", tmp_path / "1" / "c.pth", deduplicate=True)
+
+        assert (tmp_path / "a.pth").exists()
+        assert not (tmp_path / "b.pth").exists()
+        # identical weights share the content
+        assert weight_a.stat().st_ino == weight_b.stat().st_ino
+        assert weight_a.stat().st_ino != weight_c.stat().st_ino
+        assert weight_b.read_text() == "same"
+        assert weight_c.read_text() == "different"
+        assert len(list(store.root.glob("*.pth"))) == 2
+
+    @e2e_pytest_unit
+    def test_put_without_deduplication(self, mocker, tmp_path):
+        store = CheckpointStore(tmp_path / "store")
+        mock_get_digest = mocker.patch.object(CheckpointStore, "_get_digest")
+        (tmp_path / "a.pth").write_text("a")
+        (tmp_path / "0").mkdir()
+        (tmp_path / "0" / "a.pth").write_text("old")
+
+        weight_a = store.put(tmp_path / "a.pth", tmp_path / "0" / "a.pth", move=True)
+
+        # trained weights are moved without being hashed
+        mock_get_digest.assert_not_called()
+        assert not (tmp_path / "a.pth").exists()
+        assert weight_a.read_text() == "a"
+        assert not store.root.exists()
+
+    @e2e_pytest_unit
+    def test_collect_garbage(self, tmp_path):
+        store = CheckpointStore(tmp_path / "store")
+        (tmp_path / "a.pth").write_text("a")
+        (tmp_path / "b.pth").write_text("b")
+        weight_a = store.put(tmp_path / "a.pth", tmp_path / "0" / "a.pth", deduplicate=True)
+        weight_b = store.put(tmp_path / "b.pth", tmp_path / "0" / "b.pth", deduplicate=True)
+
+        weight_a.unlink()
+        store.collect_garbage()
+
+        assert len(list(store.root.glob("*.pth"))) == 1
+        assert weight_b.read_text() == "b"
+
+
 class TestTaskEnvironmentManager:
     @pytest.fixture(autouse=True)
     def _make_mock_task_env(self, mock_environment):
@@ -432,6 +511,19 @@ class TestTaskEnvironmentManager:
             task_manager.set_epoch(epoch)
             assert task_manager.get_max_epoch() == epoch
 
+    @e2e_pytest_unit
+    def test_set_max_num_workers(self, cls_template_path, anomaly_template_path):
+        cls_task_manager = TaskEnvironmentManager(make_task_env(cls_template_path))
+        cls_task_manager.set_hyper_parameter_using_str_key({"learning_parameters.num_workers": 4})
+        cls_task_manager.set_max_num_workers(2)
+        assert cls_task_manager.environment.get_hyper_parameters().learning_parameters.num_workers == 2
+        cls_task_manager.set_max_num_workers(8)
+        assert cls_task_manager.environment.get_hyper_parameters().learning_parameters.num_workers == 2
+
+        anomaly_task_manager = TaskEnvironmentManager(make_task_env(anomaly_template_path))
+        anomaly_task_manager.set_max_num_workers(2)
+        assert anomaly_task_manager.environment.get_hyper_parameters().dataset.num_workers == 2
+
 
 class TestHpoRunner:
     @e2e_pytest_unit
@@ -475,6 +567,68 @@ class TestHpoRunner:
 
         mock_run_hpo_loop.assert_called()  # call hpo_loop to run HPO
         mock_hb.assert_called()  # make hyperband
+        assert mock_run_hpo_loop.call_args.args[1].keywords["mode"] == "max"
+
+    @e2e_pytest_unit
+    def test_run_hpo_save_initial_weight(self, mocker, cls_task_env, tmp_path):
+        def mock_save_initial_weight(save_path):
+            Path(save_path).write_text("initial")
+            return True
+
+        mocker.patch.object(TaskEnvironmentManager, "save_initial_weight", side_effect=mock_save_initial_weight)
+        mocker.patch("otx.cli.utils.hpo.run_hpo_loop")
+        mocker.patch("otx.cli.utils.hpo.HyperBand")
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, tmp_path)
+
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"})
+
+        # the initial weight is saved through the checkpoint store
+        assert (tmp_path / "initial_weight.pth").read_text() == "initial"
+        assert [path.name for path in tmp_path.glob("*.pth")] == ["initial_weight.pth"]
+        assert len(list((tmp_path / "checkpoint_store").glob("*.pth"))) == 1
+
+    @e2e_pytest_unit
+    def test_mode(self, cls_task_env):
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, "fake_path")
+        assert hpo_runner.mode == "max"
+
+        hpo_runner._hpo_config["mode"] = "min"
+        assert hpo_runner.mode == "min"
+
+    @e2e_pytest_unit
+    def test_run_hpo_with_dataset_snapshot(self, mocker, cls_template_path, tmp_path):
+        labels = [
+            LabelEntity(name=name, domain=Domain.CLASSIFICATION, color=Color(0, 0, 0), id=ID(str(i)))
+            for i, name in enumerate(["cat", "dog"])
+        ]
+        items = [
+            DatasetItemEntity(
+                Image(file_path=f"image_{i}.jpg", size=(32, 32)),
+                AnnotationSceneEntity(
+                    [Annotation(Rectangle.generate_full_box(), labels=[ScoredLabel(labels[i % 2])])],
+                    kind=AnnotationSceneKind.ANNOTATION,
+                ),
+                subset=Subset.TRAINING if i < 3 else Subset.VALIDATION,
+            )
+            for i in range(4)
+        ]
+        task_env = make_task_env(cls_template_path)
+        task_env.label_schema = LabelSchemaEntity.from_labels(labels)
+        hpo_runner = HpoRunner(task_env, 100, 10, tmp_path)
+        mock_run_hpo_loop = mocker.patch("otx.cli.utils.hpo.run_hpo_loop")
+        mocker.patch("otx.cli.utils.hpo.HyperBand")
+
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"}, DatasetEntity(items))
+
+        # trials load the dataset from the snapshot
+        dataset_snapshot = mock_run_hpo_loop.call_args.args[1].keywords["dataset_snapshot"]
+        dataset, label_schema = load_dataset_snapshot(dataset_snapshot)
+        assert isinstance(dataset, ColumnarDataset)
+        assert label_schema.get_labels(include_empty=True) == labels
+        assert len(dataset.get_subset(Subset.TRAINING)) == 3
+        for item, expected in zip(dataset, items):
+            assert item.media.path == expected.media.path
+            assert item.get_roi_labels(labels) == expected.get_roi_labels(labels)
 
     @e2e_pytest_unit
     def test_run_hpo_w_dataset_smaller_than_batch(self, mocker, cls_task_env):
@@ -487,6 +641,47 @@ class TestHpoRunner:
 
         mock_run_hpo_loop.assert_called()  # call hpo_loop to run HPO
         mock_hb.assert_called()  # make hyperband
+        assert mock_run_hpo_loop.call_args.args[1].keywords["mode"] == "max"
+
+    @e2e_pytest_unit
+    def test_run_hpo_save_initial_weight(self, mocker, cls_task_env, tmp_path):
+        def mock_save_initial_weight(save_path):
+            Path(save_path).write_text("initial")
+            return True
+
+        mocker.patch.object(TaskEnvironmentManager, "save_initial_weight", side_effect=mock_save_initial_weight)
+        mocker.patch("otx.cli.utils.hpo.run_hpo_loop")
+        mocker.patch("otx.cli.utils.hpo.HyperBand")
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, tmp_path)
+
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"})
+
+        # the initial weight is saved through the checkpoint store
+        assert (tmp_path / "initial_weight.pth").read_text() == "initial"
+        assert [path.name for path in tmp_path.glob("*.pth")] == ["initial_weight.pth"]
+        assert len(list((tmp_path / "checkpoint_store").glob("*.pth"))) == 1
+
+    @e2e_pytest_unit
+    def test_mode(self, cls_task_env):
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, "fake_path")
+        assert hpo_runner.mode == "max"
+
+        hpo_runner._hpo_config["mode"] = "min"
+        assert hpo_runner.mode == "min"
+
+    @e2e_pytest_unit
+    def test_run_hpo_with_smbo(self, mocker, cls_task_env):
+        cls_task_env.model = None
+        hpo_runner = HpoRunner(cls_task_env, 100, 10, "fake_path")
+        hpo_runner._hpo_config["search_algorithm"] = "smbo"
+        hpo_runner._hpo_config["warm_start_paths"] = ["previous_hpo"]
+        mocker.patch("otx.cli.utils.hpo.run_hpo_loop")
+        mock_smbo = mocker.patch("otx.cli.utils.hpo.SMBO")
+
+        hpo_runner.run_hpo(mocker.MagicMock(), {"fake", "fake"})
+
+        mock_smbo.assert_called_once()
+        assert mock_smbo.call_args.kwargs["warm_start_paths"] == ["previous_hpo"]
 
 
 class TestTrainer:
@@ -557,6 +752,104 @@ class TestTrainer:
 
         mock_task.train.assert_called()  # check task.train() is called
 
+    @e2e_pytest_unit
+    def test_run_save_initial_weight(self, mocker, cls_template_path, mock_task):
+        mocker.patch("otx.cli.utils.hpo.get_dataset_adapter")
+        mocker.patch("otx.cli.utils.hpo.HpoDataset")
+
+        def mock_train(*args, **kwargs):
+            hook = mock_task.update_override_configurations.call_args.args[0]["custom_hooks"][0]
+            hook["save_path"].mkdir(parents=True, exist_ok=True)
+            (hook["save_path"] / hook["file_name"]).write_text("initial")
+
+        mock_task.train.side_effect = mock_train
+        trainers = [
+            Trainer(
+                hp_config={"configuration": {"iterations": 10}, "id": trial_id},
+                report_func=mocker.MagicMock(),
+                model_template=find_and_parse_model_template(cls_template_path),
+                data_roots=mocker.MagicMock(),
+                task_type=TaskType.CLASSIFICATION,
+                hpo_workdir=self.hpo_workdir,
+                initial_weight_name="initial_weight.pth",
+                metric="fake",
+            )
+            for trial_id in ["0", "1"]
+        ]
+        # trials start at the same time before the initial weight is saved
+        for trainer in trainers:
+            trainer._add_initial_weight_saving_hook(mock_task)
+            mock_train()
+        for trainer in trainers:
+            trainer._finalize_trial(mock_task)
+
+        # identical initial weights saved by the trials are stored once
+        assert (self.hpo_workdir / "initial_weight.pth").read_text() == "initial"
+        assert [path.name for path in self.hpo_workdir.glob("*.pth")] == ["initial_weight.pth"]
+        assert len(list((self.hpo_workdir / "checkpoint_store").glob("*.pth"))) == 1
+
+    @e2e_pytest_unit
+    def test_run_with_dataset_snapshot(self, mocker, cls_template_path, mock_task, tmp_dir):
+        mock_get_dataset_adapter = mocker.patch("otx.cli.utils.hpo.get_dataset_adapter")
+        mock_load_dataset_snapshot = mocker.patch("otx.cli.utils.hpo.load_dataset_snapshot")
+        mock_load_dataset_snapshot.return_value = (mocker.MagicMock(), mocker.MagicMock())
+        mocker.patch("otx.cli.utils.hpo.HpoDataset")
+
+        trainer = Trainer(
+            hp_config={"configuration": {"iterations": 10}, "id": "1"},
+            report_func=mocker.MagicMock(),
+            model_template=find_and_parse_model_template(cls_template_path),
+            data_roots=mocker.MagicMock(),
+            task_type=TaskType.CLASSIFICATION,
+            hpo_workdir=self.hpo_workdir,
+            initial_weight_name="fake",
+            metric="fake",
+            dataset_snapshot="fake_snapshot",
+        )
+        trainer.run()
+
+        mock_load_dataset_snapshot.assert_called_once_with("fake_snapshot")
+        mock_get_dataset_adapter.assert_not_called()
+
+    @e2e_pytest_unit
+    @pytest.mark.parametrize("warm_start_from_best_trial", [True, False])
+    @pytest.mark.parametrize("mode,best_trial_id,best_epoch", [("max", "1", 2), ("min", "0", 1)])
+    def test_run_with_warm_start_from_best_trial(
+        self, mocker, cls_template_path, mock_task, warm_start_from_best_trial, mode, best_trial_id, best_epoch
+    ):
+        mocker.patch("otx.cli.utils.hpo.get_dataset_adapter")
+        mocker.patch("otx.cli.utils.hpo.HpoDataset")
+        mock_load_model_weight = mocker.patch.object(TaskEnvironmentManager, "load_model_weight")
+        (self.hpo_workdir / "0").mkdir(parents=True)
+        (self.hpo_workdir / "weight" / "0").mkdir(parents=True)
+        (self.hpo_workdir / "weight" / "1").mkdir(parents=True)
+        for trial_id, score in [("0", {"1": 0.3, "2": 0.5}), ("1", {"1": 0.4, "2": 0.9, "3": 0.7})]:
+            with (self.hpo_workdir / "0" / f"{trial_id}.json").open("w") as f:
+                json.dump({"id": trial_id, "score": score}, f)
+            for epoch in score:
+                (self.hpo_workdir / "weight" / trial_id / self.weight_format.format(epoch)).write_text("fake")
+
+        trainer = Trainer(
+            hp_config={"configuration": {"iterations": 10}, "id": "2"},
+            report_func=mocker.MagicMock(),
+            model_template=find_and_parse_model_template(cls_template_path),
+            data_roots=mocker.MagicMock(),
+            task_type=TaskType.CLASSIFICATION,
+            hpo_workdir=self.hpo_workdir,
+            initial_weight_name="fake",
+            metric="fake",
+            warm_start_from_best_trial=warm_start_from_best_trial,
+            mode=mode,
+        )
+        trainer.run()
+
+        if warm_start_from_best_trial:
+            # new trial starts from the best weight of the best trial
+            best_weight = str(self.hpo_workdir / "weight" / best_trial_id / self.weight_format.format(best_epoch))
+            assert mock_load_model_weight.call_args.args[0] == best_weight
+        else:
+            mock_load_model_weight.assert_not_called()
+
     @e2e_pytest_unit
     def test_run_trial_already_done(self, mocker, cls_template_path, mock_task, tmp_dir):
         """Test a case where trial to run already training given epoch."""
@@ -692,6 +985,33 @@ class TestHpoDataset:
         for i in range(num_hpo_sub_dataset):
             hpo_sub_dataset[i]
 
+    @e2e_pytest_unit
+    def test_get_subset_from_columnar(self):
+        labels = [LabelEntity(name=name, domain=Domain.CLASSIFICATION, id=ID(name)) for name in ["a", "b"]]
+        items = [
+            DatasetItemEntity(
+                Image(file_path=f"image_{i}.jpg", size=(32, 32)),
+                AnnotationSceneEntity(
+                    [Annotation(Rectangle.generate_full_box(), labels=[ScoredLabel(labels[i % 2])])],
+                    kind=AnnotationSceneKind.ANNOTATION,
+                ),
+                subset=Subset.TRAINING if i < 6 else Subset.VALIDATION,
+            )
+            for i in range(8)
+        ]
+        columnar = ColumnarDataset(DatasetEntity(items), labels)
+        hpo_dataset = HpoDataset(fullset=columnar, config={"train_environment": {"subset_ratio": 0.5}})
+
+        train_dataset = hpo_dataset.get_subset(Subset.TRAINING)
+        val_dataset = hpo_dataset.get_subset(Subset.VALIDATION)
+
+        assert isinstance(train_dataset, ColumnarDataset)
+        assert len(train_dataset) == 3
+        train_paths = {item.media.path for item in items[:6]}
+        assert all(train_dataset.get_path(i) in train_paths for i in range(len(train_dataset)))
+        assert isinstance(val_dataset, DatasetEntity)
+        assert [item.media.path for item in val_dataset] == [item.media.path for item in items[6:]]
+
     @e2e_pytest_unit
     def test_len_before_get_subset(self):
         hpo_dataset = HpoDataset(fullset=range(10), config={"train_environment": {"subset_ratio": 0.5}})
@@ -795,6 +1115,7 @@ def test_get_best_hpo_weight():
                 (trial_weight_path / f"epoch_{i}.pth").write_text("fake")
 
         assert get_best_hpo_weight(hpo_dir, "1") == str(weight_path / "1" / "epoch_10.pth")
+        assert get_best_hpo_weight(hpo_dir, "1", mode="min") == str(weight_path / "1" / "epoch_1.pth")
 
 
 @e2e_pytest_unit
@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import multiprocessing as mp
 import string
 
 import numpy as np
 import pytest
 import psutil
 
-from otx.core.data.caching import MemCacheHandlerSingleton
+from otx.core.data.caching import MemCacheHandlerError, MemCacheHandlerSingleton
+from otx.core.data.caching.mem_cache_handler import MemCacheHandlerBase
 
 
 @pytest.fixture
@@ -48,6 +50,16 @@ class TestMemCacheHandler:
         MemCacheHandlerSingleton.create(mode, mem_size * (1024**3))
         assert MemCacheHandlerSingleton.instance.mem_size == 0
 
+    def test_cpu_limits_with_meta_arena(self, monkeypatch):
+        mem_size = 16 * 1024**3
+        meta_size = MemCacheHandlerBase.get_meta_size(mem_size)
+        available = mem_size + MemCacheHandlerSingleton.CPU_MEM_LIMITS_GIB * 1024**3 + meta_size // 2
+        monkeypatch.setattr(psutil, "virtual_memory", lambda: type("MemInfo", (), {"available": available}))
+
+        # the memory pool alone fits in the available memory, but not with its metadata arena
+        MemCacheHandlerSingleton.create("singleprocessing", mem_size)
+        assert MemCacheHandlerSingleton.instance.mem_size == 0
+
     @pytest.mark.parametrize("mode", ["singleprocessing", "multiprocessing"])
     def test_fully_caching(self, mode, fxt_data_list):
         mem_size = get_data_list_size(fxt_data_list)
@@ -72,20 +84,110 @@ class TestMemCacheHandler:
         MemCacheHandlerSingleton.create(mode, mem_size)
         handler = MemCacheHandlerSingleton.get()
 
-        for idx, (key, data, meta) in enumerate(fxt_data_list):
-            if idx < len(fxt_data_list) // 2:
-                assert handler.put(key, data, meta) > 0
-            else:
-                assert handler.put(key, data, meta) is None
+        # Every item can be cached by evicting the least recently used ones
+        for key, data, meta in fxt_data_list:
+            assert handler.put(key, data, meta) > 0
 
         for idx, (key, data, meta) in enumerate(fxt_data_list):
             get_data, get_meta = handler.get(key)
 
             if idx < len(fxt_data_list) // 2:
+                assert get_data is None
+            else:
                 assert np.array_equal(get_data, data)
                 assert get_meta == meta
-            else:
-                assert get_data is None
 
         # Unfully (half) cached
         assert len(handler) == len(fxt_data_list) // 2
+        assert handler.stats == {
+            "hits": len(fxt_data_list) // 2,
+            "misses": len(fxt_data_list) // 2,
+            "evictions": len(fxt_data_list) // 2,
+        }
+
+    @pytest.mark.parametrize("mode", ["singleprocessing", "multiprocessing"])
+    @pytest.mark.parametrize("eviction_policy", ["lru", "lfu"])
+    def test_eviction_policy(self, mode, eviction_policy, fxt_data_list):
+        data_size = fxt_data_list[0][1].size
+        MemCacheHandlerSingleton.create(mode, 2 * data_size, eviction_policy)
+        handler = MemCacheHandlerSingleton.get()
+        handler.EVICTION_RATIO = 0.0
+
+        (key_0, data_0, _), (key_1, data_1, _), (key_2, data_2, _) = fxt_data_list[:3]
+        handler.put(key_0, data_0)
+        handler.put(key_1, data_1)
+
+        # key_0 is accessed twice, key_1 is accessed once but more recently
+        handler.get(key_0)
+        handler.get(key_0)
+        handler.get(key_1)
+
+        assert handler.put(key_2, data_2) > 0
+        assert len(handler) == 2
+
+        evicted_key = key_0 if eviction_policy == "lru" else key_1
+        assert handler.get(evicted_key) == (None, None)
+        assert np.array_equal(handler.get(key_2)[0], data_2)
+
+    @pytest.mark.parametrize("mode", ["singleprocessing", "multiprocessing"])
+    def test_size_eviction_policy(self, mode):
+        small = np.zeros([4, 4], dtype=np.uint8)
+        large = np.ones([8, 8], dtype=np.uint8)
+        MemCacheHandlerSingleton.create(mode, large.size + small.size, "size")
+        handler = MemCacheHandlerSingleton.get()
+        handler.EVICTION_RATIO = 0.0
+
+        handler.put("large", large)
+        handler.put("small_0", small)
+        assert handler.put("small_1", small) > 0
+
+        # The largest item is evicted first and the freed block is reused
+        assert handler.get("large") == (None, None)
+        assert np.array_equal(handler.get("small_0")[0], small)
+        assert handler.put("small_2", small) > 0
+        assert len(handler) == 3
+
+    def test_unknown_eviction_policy(self):
+        with pytest.raises(MemCacheHandlerError):
+            MemCacheHandlerSingleton.create("singleprocessing", 1, "unknown")
+
+    @pytest.mark.parametrize("mode", ["singleprocessing", "multiprocessing"])
+    def test_freeze(self, mode, fxt_data_list):
+        mem_size = get_data_list_size(fxt_data_list)
+        MemCacheHandlerSingleton.create(mode, mem_size)
+        handler = MemCacheHandlerSingleton.get()
+
+        key, data, meta = fxt_data_list[0]
+        handler.freeze()
+        assert handler.put(key, data, meta) is None
+        handler.unfreeze()
+        assert handler.put(key, data, meta) > 0
+
+    def test_shared_index_across_processes(self, fxt_data_list):
+        mem_size = get_data_list_size(fxt_data_list)
+        MemCacheHandlerSingleton.create("multiprocessing", mem_size)
+        handler = MemCacheHandlerSingleton.get()
+
+        num_puts = len(fxt_data_list) // 2
+        for key, data, meta in fxt_data_list[:num_puts]:
+            handler.put(key, data, meta)
+
+        def _worker(data_list):
+            # Items from the parent are visible and the items put here are visible to the parent
+            for key, data, meta in data_list[:num_puts]:
+                get_data, get_meta = handler.get(key)
+                assert np.array_equal(get_data, data)
+                assert get_meta == meta
+            for key, data, meta in data_list[num_puts:]:
+                assert handler.put(key, data, meta) > 0
+
+        worker = mp.get_context("fork").Process(target=_worker, args=(fxt_data_list,))
+        worker.start()
+        worker.join()
+        assert worker.exitcode == 0
+
+        assert len(handler) == len(fxt_data_list)
+        for key, data, meta in fxt_data_list:
+            get_data, get_meta = handler.get(key)
+            assert np.array_equal(get_data, data)
+            assert get_meta == meta
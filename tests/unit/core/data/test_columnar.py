@@ -0,0 +1,225 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+
+import cv2
+import numpy as np
+import pytest
+
+from otx.api.entities.annotation import Annotation, AnnotationSceneEntity, AnnotationSceneKind
+from otx.api.entities.color import Color
+from otx.api.entities.dataset_item import DatasetItemEntity, DatasetItemEntityWithID
+from otx.api.entities.datasets import DatasetEntity
+from otx.api.entities.id import ID
+from otx.api.entities.image import Image
+from otx.api.entities.label import Domain, LabelEntity
+from otx.api.entities.scored_label import ScoredLabel
+from otx.api.entities.shapes.ellipse import Ellipse
+from otx.api.entities.shapes.polygon import Point, Polygon
+from otx.api.entities.shapes.rectangle import Rectangle
+from otx.api.entities.subset import Subset
+from otx.core.data.columnar import ColumnarDataset
+from tests.test_suite.e2e_test_system import e2e_pytest_unit
+
+
+@pytest.fixture
+def fxt_labels():
+    return [
+        LabelEntity(name=name, domain=Domain.DETECTION, color=Color(0, 0, 0), id=ID(str(i)))
+        for i, name in enumerate(["car", "person", "dog"])
+    ]
+
+
+@pytest.fixture
+def fxt_dataset(fxt_labels):
+    car, person, dog = fxt_labels
+    box = Annotation(Rectangle(0.1, 0.2, 0.5, 0.6), labels=[ScoredLabel(car, probability=0.9)], id=ID("box"))
+    ellipse = Annotation(Ellipse(0.2, 0.2, 0.4, 0.8), labels=[ScoredLabel(person)], id=ID("ellipse"))
+    polygon = Annotation(
+        Polygon([Point(0.1, 0.1), Point(0.9, 0.2), Point(0.5, 0.7)]),
+        labels=[ScoredLabel(dog), ScoredLabel(car, probability=0.5)],
+        id=ID("polygon"),
+    )
+    items = [
+        DatasetItemEntityWithID(
+            Image(file_path="image_0.jpg", size=(48, 64)),
+            AnnotationSceneEntity([box, ellipse, polygon], kind=AnnotationSceneKind.ANNOTATION),
+            subset=Subset.TRAINING,
+            ignored_labels=[dog],
+            id_="item_0",
+        ),
+        DatasetItemEntity(
+            Image(file_path="image_1.jpg", size=(100, 200)),
+            AnnotationSceneEntity([box, polygon], kind=AnnotationSceneKind.PREDICTION),
+            roi=box,
+            subset=Subset.VALIDATION,
+        ),
+        DatasetItemEntity(
+            Image(data=np.zeros((8, 8, 3), dtype=np.uint8)),
+            AnnotationSceneEntity([], kind=AnnotationSceneKind.ANNOTATION),
+            subset=Subset.TESTING,
+        ),
+    ]
+    return DatasetEntity(items)
+
+
+def _assert_same_annotation(annotation, expected):
+    assert annotation.id_ == expected.id_
+    assert type(annotation.shape) is type(expected.shape)
+    if isinstance(expected.shape, Polygon):
+        assert [(point.x, point.y) for point in annotation.shape.points] == [
+            (point.x, point.y) for point in expected.shape.points
+        ]
+    else:
+        shape, expected_shape = annotation.shape, expected.shape
+        assert (shape.x1, shape.y1, shape.x2, shape.y2) == (
+            expected_shape.x1,
+            expected_shape.y1,
+            expected_shape.x2,
+            expected_shape.y2,
+        )
+    assert [(label.id_, label.probability) for label in annotation.get_labels(include_empty=True)] == [
+        (label.id_, label.probability) for label in expected.get_labels(include_empty=True)
+    ]
+
+
+class TestColumnarDataset:
+    @e2e_pytest_unit
+    def test_getitem(self, fxt_dataset, fxt_labels):
+        columnar = ColumnarDataset(fxt_dataset, fxt_labels)
+
+        assert len(columnar) == len(fxt_dataset)
+        for index, expected in enumerate(fxt_dataset):
+            item = columnar[index]
+            assert type(item) is type(expected)
+            assert getattr(item, "id_", None) == getattr(expected, "id_", None)
+            assert item.media.path == expected.media.path
+            assert (item.media.height, item.media.width) == (expected.media.height, expected.media.width)
+            assert (item.height, item.width) == (expected.height, expected.width)
+            assert (columnar.heights[index], columnar.widths[index]) == (expected.height, expected.width)
+            assert item.subset == expected.subset
+            assert item.annotation_scene.kind == expected.annotation_scene.kind
+            assert item.ignored_labels == expected.ignored_labels
+            _assert_same_annotation(item.roi, expected.roi)
+            annotations = item.annotation_scene.annotations
+            expected_annotations = expected.annotation_scene.annotations
+            assert len(annotations) == len(expected_annotations)
+            for annotation, expected_annotation in zip(annotations, expected_annotations):
+                _assert_same_annotation(annotation, expected_annotation)
+
+        # the item with in-memory media is kept as it is
+        assert columnar[2] is fxt_dataset[2]
+        assert columnar.get_path(2) is None
+
+    @e2e_pytest_unit
+    def test_arrays(self, fxt_dataset, fxt_labels):
+        columnar = ColumnarDataset(fxt_dataset, fxt_labels[:2])
+
+        # the labels which are not given follow the given labels
+        assert columnar.labels == fxt_labels[:2] + [fxt_labels[2]]
+        assert columnar.get_path(0) == "image_0.jpg"
+        assert columnar.get_ignored_label_indices(0).tolist() == [2]
+        assert columnar.get_ignored_label_indices(1).tolist() == []
+        assert columnar.get_roi_label_indices(1).tolist() == [0]
+        assert columnar.subsets.tolist() == [Subset.TRAINING.value, Subset.VALIDATION.value, Subset.TESTING.value]
+
+        ann_slice = columnar.get_annotation_slice(0)
+        assert (ann_slice.start, ann_slice.stop) == (0, 3)
+        assert np.allclose(columnar.ann_boxes[ann_slice][0], [0.1, 0.2, 0.5, 0.6])
+        assert np.allclose(columnar.ann_boxes[ann_slice][2], [0.1, 0.1, 0.9, 0.7])
+        assert columnar.get_annotation_label_indices(2).tolist() == [2, 0]
+        assert np.allclose(columnar.get_polygon_points(2), [[0.1, 0.1], [0.9, 0.2], [0.5, 0.7]])
+        assert len(columnar.get_polygon_points(0)) == 0
+        assert columnar.get_annotation_slice(2) == slice(5, 5)
+        assert columnar.nbytes > 0
+
+    @e2e_pytest_unit
+    def test_loading_accessors(self, fxt_dataset, fxt_labels, tmp_path):
+        image_path = str(tmp_path / "image_0.png")
+        cv2.imwrite(image_path, np.arange(48 * 64 * 3, dtype=np.uint8).reshape(48, 64, 3))
+        item = fxt_dataset[0]
+        items = [
+            DatasetItemEntityWithID(
+                Image(file_path=image_path, size=(48, 64)),
+                item.annotation_scene,
+                subset=item.subset,
+                ignored_labels=item.ignored_labels,
+                id_="item_0",
+            ),
+            fxt_dataset[1],
+            fxt_dataset[2],
+        ]
+        columnar = ColumnarDataset(DatasetEntity(items), fxt_labels)
+
+        # the item whose ROI is not the full image and the item kept as it is need DatasetItemEntity
+        assert [columnar.needs_item(index) for index in range(3)] == [False, True, True]
+        assert columnar.get_item_id(0) == ID("item_0")
+        assert columnar.get_item_id(1) is None
+        assert columnar.get_roi_id(1) == ID("box")
+        assert np.allclose(columnar.get_roi_box(1), [0.1, 0.2, 0.5, 0.6])
+        assert np.array_equal(columnar.load_image(0), items[0].numpy)
+        assert np.array_equal(columnar.load_image(2), items[2].numpy)
+
+        # the ignored label of the polygon is left out
+        annotations = columnar.get_annotations(0)
+        assert [ann_index for ann_index, _ in annotations] == [0, 1, 2]
+        assert [label_indices.tolist() for _, label_indices in annotations] == [[0], [1], [0]]
+        assert columnar.get_annotation_id(2) == ID("polygon")
+        assert np.allclose(
+            columnar.get_annotation_polygon(0), [[0.1, 0.2], [0.5, 0.2], [0.5, 0.6], [0.1, 0.6], [0.1, 0.2]]
+        )
+        assert len(columnar.get_annotation_polygon(1)) == 50
+        assert columnar.get_label_indices(fxt_labels[::-1]).tolist() == [2, 1, 0]
+        assert copy.deepcopy(columnar) is columnar
+
+    @e2e_pytest_unit
+    def test_select(self, fxt_dataset, fxt_labels):
+        columnar = ColumnarDataset(fxt_dataset, fxt_labels)
+
+        validation = columnar.get_subset(Subset.VALIDATION)
+        assert len(validation) == 1
+        assert validation.uid != columnar.uid
+        assert validation.get_path(0) == "image_1.jpg"
+        assert (validation.heights[0], validation.widths[0]) == (columnar.heights[1], columnar.widths[1])
+        assert validation.get_annotation_slice(0) == columnar.get_annotation_slice(1)
+        assert validation[0].subset == Subset.VALIDATION
+        assert validation.get_labels() == [fxt_labels[0], fxt_labels[2]]
+        assert columnar.get_labels() == fxt_labels
+
+        # a selection of a selection refers to the items of the snapshot
+        selection = columnar.select([2, 0]).select([1])
+        assert selection.get_path(0) == "image_0.jpg"
+        assert selection.get_ignored_label_indices(0).tolist() == [2]
+        assert selection.get_ignored_label_indices(0, columnar.get_label_indices(fxt_labels[:2])).tolist() == []
+        assert len(columnar.get_subset(Subset.UNLABELED)) == 0
+        assert columnar.get_subset(Subset.UNLABELED).get_labels() == []
+
+    @e2e_pytest_unit
+    def test_save_load(self, fxt_dataset, fxt_labels, tmp_path):
+        # the item with in-memory media cannot be saved
+        with pytest.raises(ValueError):
+            ColumnarDataset(fxt_dataset, fxt_labels).save(tmp_path / "fail")
+
+        dataset = DatasetEntity([fxt_dataset[0], fxt_dataset[1]])
+        columnar = ColumnarDataset(dataset, fxt_labels)
+        columnar.save(tmp_path / "snapshot")
+        loaded = ColumnarDataset.load(tmp_path / "snapshot")
+
+        assert not loaded.ann_boxes.flags.writeable
+        assert loaded.labels == columnar.labels
+        assert len(loaded) == len(columnar)
+        assert loaded.nbytes == columnar.nbytes
+        for index, expected in enumerate(dataset):
+            item = loaded[index]
+            assert type(item) is type(expected)
+            assert item.media.path == expected.media.path
+            assert (item.height, item.width) == (expected.height, expected.width)
+            assert item.subset == expected.subset
+            assert item.ignored_labels == expected.ignored_labels
+            _assert_same_annotation(item.roi, expected.roi)
+            for annotation, expected_annotation in zip(
+                item.annotation_scene.annotations, expected.annotation_scene.annotations
+            ):
+                _assert_same_annotation(annotation, expected_annotation)
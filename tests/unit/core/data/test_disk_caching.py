@@ -0,0 +1,141 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from otx.core.data.caching import DiskCacheHandlerError, DiskCacheHandlerSingleton
+from otx.core.data.caching.disk_cache_handler import STALE_TMP_SECONDS, DiskCacheHandler
+
+
+@pytest.fixture
+def fxt_data():
+    np.random.seed(3003)
+    key = ("/path/to/image.jpg", 123, None, ("LoadImageFromOTXDataset",))
+    data = np.random.randint(0, 256, size=[16, 16, 3], dtype=np.uint8)
+    meta = {"img_shape": data.shape}
+    return key, data, meta
+
+
+class TestDiskCacheHandler:
+    def test_put_and_get(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        handler = DiskCacheHandler(str(tmp_path))
+
+        assert handler.get(key) == (None, None)
+        assert handler.put(key, data, meta) == data.nbytes
+        # Already cached
+        assert handler.put(key, data, meta) is None
+
+        cached_data, cached_meta = handler.get(key)
+        assert isinstance(cached_data, np.memmap)
+        assert np.array_equal(cached_data, data)
+        assert cached_meta == meta
+        assert handler.stats == {"hits": 1, "misses": 1}
+
+        # Copy-on-write, the cached file should not be modified
+        cached_data[:] = 0
+        cached_data, _ = handler.get(key)
+        assert np.array_equal(cached_data, data)
+
+    def test_shared_across_handlers(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        DiskCacheHandler(str(tmp_path)).put(key, data, meta)
+
+        cached_data, cached_meta = DiskCacheHandler(str(tmp_path)).get(key)
+        assert np.array_equal(cached_data, data)
+        assert cached_meta == meta
+
+    def test_get_invalidated_key(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        handler = DiskCacheHandler(str(tmp_path))
+        handler.put(key, data, meta)
+
+        # The media is modified after caching
+        modified_key = (key[0], key[1] + 1, *key[2:])
+        assert handler.get(modified_key) == (None, None)
+
+    def test_disabled(self, fxt_data):
+        key, data, meta = fxt_data
+        handler = DiskCacheHandler(None)
+
+        assert not handler.enabled
+        assert handler.put(key, data, meta) is None
+        assert handler.get(key) == (None, None)
+        assert handler.cleanup() == 0
+
+    def test_invalid_max_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            DiskCacheHandler(str(tmp_path), max_size=-1)
+
+    def test_evict_least_recently_used(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        keys = [(key[0], i, *key[2:]) for i in range(4)]
+        unlimited = DiskCacheHandler(str(tmp_path), max_size=0)
+        for i, _key in enumerate(keys):
+            unlimited.put(_key, data, meta)
+            # Older items are used earlier
+            path = unlimited._get_path(_key)
+            os.utime(f"{path}.pkl", (time.time() - 100 + i, time.time() - 100 + i))
+        # The first item is used recently
+        unlimited.get(keys[0])
+        item_size = sum(os.path.getsize(f"{unlimited._get_path(keys[0])}{ext}") for ext in (".npy", ".pkl"))
+        assert unlimited.cleanup() == 0
+
+        handler = DiskCacheHandler(str(tmp_path), max_size=int(item_size * 2.5))
+        assert handler.cleanup() == item_size * 2
+
+        assert handler.get(keys[0])[0] is not None
+        assert handler.get(keys[1]) == (None, None)
+        assert handler.get(keys[2]) == (None, None)
+        assert handler.get(keys[3])[0] is not None
+
+    def test_cleanup_on_put(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        handler = DiskCacheHandler(str(tmp_path), max_size=data.nbytes * 5)
+        for i in range(10):
+            handler.put((key[0], i, *key[2:]), data, meta)
+
+        total = sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(tmp_path) for file in files)
+        assert total <= handler.max_size
+
+    def test_cleanup_stale_tmp_files(self, tmp_path, fxt_data):
+        key, data, meta = fxt_data
+        handler = DiskCacheHandler(str(tmp_path))
+        handler.put(key, data, meta)
+        path = handler._get_path(key)
+        stale_tmp, fresh_tmp = f"{path}.1.tmp", f"{path}.2.tmp"
+        for tmp in (stale_tmp, fresh_tmp):
+            with open(tmp, "wb") as f:
+                f.write(b"0" * 10)
+        stale_time = time.time() - STALE_TMP_SECONDS - 1
+        os.utime(stale_tmp, (stale_time, stale_time))
+
+        assert handler.cleanup() == 10
+        assert not os.path.exists(stale_tmp)
+        assert os.path.exists(fresh_tmp)
+        assert handler.get(key)[0] is not None
+
+
+class TestDiskCacheHandlerSingleton:
+    def test_create_and_delete(self, tmp_path):
+        DiskCacheHandlerSingleton.delete()
+        with pytest.raises(DiskCacheHandlerError):
+            DiskCacheHandlerSingleton.get()
+
+        handler = DiskCacheHandlerSingleton.create(True, str(tmp_path), max_size=1024)
+        assert handler.enabled
+        assert handler.cache_dir == str(tmp_path)
+        assert handler.max_size == 1024
+        assert DiskCacheHandlerSingleton.get() is handler
+
+        handler = DiskCacheHandlerSingleton.create(False, str(tmp_path))
+        assert not handler.enabled
+
+        DiskCacheHandlerSingleton.delete()
+        with pytest.raises(DiskCacheHandlerError):
+            DiskCacheHandlerSingleton.get()
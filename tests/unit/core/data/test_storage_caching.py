@@ -4,7 +4,9 @@
 
 
 from copy import deepcopy
+import json
 import os
+import shutil
 import stat
 import tempfile
 import time
@@ -16,7 +18,7 @@ from datumaro.components.dataset import Dataset
 from datumaro.components.dataset_base import DatasetItem
 from datumaro.components.media import Image
 
-from otx.core.data.caching.storage_cache import init_arrow_cache
+from otx.core.data.caching.storage_cache import MANIFEST_FILE, STALE_SHARD_SECONDS, init_arrow_cache
 
 
 @pytest.fixture
@@ -130,3 +132,92 @@ class TestStorageCache:
 
             for file in os.listdir(cached_dataset.data_path):
                 assert mapping[file] != os.stat(os.path.join(cached_dataset.data_path, file))[stat.ST_MTIME]
+
+    def test_incremental_update(self, fxt_datumaro_dataset):
+        with tempfile.TemporaryDirectory() as tempdir:
+            source_dataset = deepcopy(fxt_datumaro_dataset)
+            cached_dataset = init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+
+            mapping = {}
+            for file in os.listdir(cached_dataset.data_path):
+                if file.endswith(".arrow"):
+                    mapping[file] = os.stat(os.path.join(cached_dataset.data_path, file))[stat.ST_MTIME]
+
+            # sleep 1 second to distinguish re-exported shards
+            time.sleep(1)
+
+            for i in range(64, 72):
+                media = Image.from_numpy(data=np.random.randint(0, 255, (5, 5, 3)), ext=".png")
+                source_dataset.put(DatasetItem(id=i, subset="test", media=media, annotations=[Label(0)]))
+
+            cached_dataset = init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+
+            # Shards of unchanged items are kept and only added items are exported
+            arrow_files = [file for file in os.listdir(cached_dataset.data_path) if file.endswith(".arrow")]
+            assert len(arrow_files) == len(mapping) + 1
+            for file, mtime in mapping.items():
+                assert mtime == os.stat(os.path.join(cached_dataset.data_path, file))[stat.ST_MTIME]
+
+            assert len(cached_dataset) == len(source_dataset)
+            for item in source_dataset:
+                assert cached_dataset.get(item.id, item.subset).annotations == item.annotations
+
+    def test_incremental_remove(self, fxt_datumaro_dataset):
+        with tempfile.TemporaryDirectory() as tempdir:
+            source_dataset = deepcopy(fxt_datumaro_dataset)
+            init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+
+            source_dataset.remove("0", "test")
+            source_dataset.put(DatasetItem(id="1", subset="test", media=source_dataset.get("1", "test").media))
+
+            cached_dataset = init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+
+            assert len(cached_dataset) == len(source_dataset)
+            assert cached_dataset.get("0", "test") is None
+            assert cached_dataset.get("1", "test").annotations == []
+            for item in source_dataset:
+                assert cached_dataset.get(item.id, item.subset).media == item.media
+
+    def test_incremental_remove_only(self, fxt_datumaro_dataset):
+        with tempfile.TemporaryDirectory() as tempdir:
+            source_dataset = deepcopy(fxt_datumaro_dataset)
+            init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+            media = Image.from_numpy(data=np.random.randint(0, 255, (5, 5, 3)), ext=".png")
+            source_dataset.put(DatasetItem(id="extra", subset="test", media=media, annotations=[Label(0)]))
+            cached_dataset = init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+            with open(os.path.join(cached_dataset.data_path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                shards = json.load(f)["shards"]
+            assert len(shards) == 2
+
+            source_dataset.remove("extra", "test")
+            cached_dataset = init_arrow_cache(source_dataset, scheme="AS-IS", cache_dir=tempdir)
+
+            # The manifest is saved even if no shard is exported
+            with open(os.path.join(cached_dataset.data_path, MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            assert len(manifest["shards"]) == 1
+            assert set(manifest["shards"]) < set(shards)
+            assert len(cached_dataset) == len(source_dataset)
+            assert cached_dataset.get("extra", "test") is None
+
+    def test_remove_stale_orphans(self, fxt_datumaro_dataset):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cached_dataset = init_arrow_cache(deepcopy(fxt_datumaro_dataset), scheme="AS-IS", cache_dir=tempdir)
+            cache_dir = cached_dataset.data_path
+            shard_name = next(file for file in os.listdir(cache_dir) if file.endswith(".arrow"))
+
+            # Shards of a concurrent run which are not in the manifest yet
+            fresh_orphan = os.path.join(cache_dir, "datum000009-fresh-0.arrow")
+            shutil.copy(os.path.join(cache_dir, shard_name), fresh_orphan)
+            # Shards left by an interrupted run long ago
+            stale_orphan = os.path.join(cache_dir, "datum000009-stale-0.arrow")
+            shutil.copy(os.path.join(cache_dir, shard_name), stale_orphan)
+            stale_time = time.time() - STALE_SHARD_SECONDS - 1
+            os.utime(stale_orphan, (stale_time, stale_time))
+
+            cached_dataset = init_arrow_cache(deepcopy(fxt_datumaro_dataset), scheme="AS-IS", cache_dir=tempdir)
+
+            assert os.path.exists(fresh_orphan)
+            assert not os.path.exists(stale_orphan)
+            # Orphans are not imported
+            assert len(cached_dataset) == len(fxt_datumaro_dataset)
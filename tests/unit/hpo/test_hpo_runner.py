@@ -0,0 +1,83 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from otx.hpo.hpo_base import Trial, TrialStatus
+from otx.hpo.hpo_runner import HpoLoop, SchedulerMetrics
+from tests.test_suite.e2e_test_system import e2e_pytest_component
+
+
+def train_func(hp_config, report_func):
+    for epoch in range(1, 4):
+        if report_func(epoch * hp_config["configuration"]["lr"], epoch, done=epoch == 3) == TrialStatus.STOP:
+            break
+
+
+class HpoAlgo:
+    def __init__(self, num_trials):
+        self.trials = [Trial(i, {"lr": 0.1 * (i + 1)}, {}) for i in range(num_trials)]
+        self.scores = {trial.id: [] for trial in self.trials}
+        self.save_results = MagicMock()
+
+    def is_done(self):
+        return all(trial.status == TrialStatus.STOP for trial in self.trials)
+
+    def get_next_sample(self):
+        for trial in self.trials:
+            if trial.status == TrialStatus.READY:
+                return trial
+        return None
+
+    def report_score(self, score, resource, trial_id, done=False):
+        self.scores[trial_id].append(score)
+        return TrialStatus.STOP if done else TrialStatus.RUNNING
+
+
+class TestSchedulerMetrics:
+    @e2e_pytest_component
+    def test_add_report_latency(self):
+        metrics = SchedulerMetrics()
+        assert metrics.mean_report_latency == 0.0
+
+        metrics.add_report_latency(0.1)
+        metrics.add_report_latency(0.3)
+
+        assert metrics.num_reports == 2
+        assert metrics.mean_report_latency == pytest.approx(0.2)
+        assert metrics.max_report_latency == pytest.approx(0.3)
+        assert "2 reports" in str(metrics)
+
+
+class TestHpoLoop:
+    @e2e_pytest_component
+    def test_run(self):
+        hpo_algo = HpoAlgo(num_trials=2)
+        hpo_loop = HpoLoop(hpo_algo, train_func, "cpu", num_parallel_trial=2)
+
+        hpo_loop.run()
+
+        assert hpo_algo.scores == {0: pytest.approx([0.1, 0.2, 0.3]), 1: pytest.approx([0.2, 0.4, 0.6])}
+        assert hpo_loop.metrics.num_reports == 6
+        assert hpo_loop.metrics.max_report_latency < 1
+        hpo_algo.save_results.assert_called()
+
+    @e2e_pytest_component
+    def test_get_reports(self):
+        hpo_algo = HpoAlgo(num_trials=1)
+        hpo_loop = HpoLoop(hpo_algo, train_func, "cpu", num_parallel_trial=1)
+        trial_queue = MagicMock()
+        hpo_loop._running_trials[0] = MagicMock(trial=hpo_algo.trials[0], queue=trial_queue)
+
+        # results aren't saved when nothing is reported
+        hpo_loop._get_reports()
+        hpo_algo.save_results.assert_not_called()
+
+        hpo_loop._report_queue.put({"score": 1.0, "progress": 1, "uid": 0, "done": False, "time": time.time()})
+        while hpo_loop._report_queue.empty():
+            time.sleep(0.01)
+        hpo_loop._get_reports()
+
+        trial_queue.put_nowait.assert_called_once_with(TrialStatus.RUNNING)
+        hpo_algo.save_results.assert_called_once()
+        assert hpo_loop.metrics.num_reports == 1
@@ -1,17 +1,20 @@
 import pytest
 
 from otx.hpo.resource_manager import (
+    CPU_AFFINITY_ENV,
     CPUResourceManager,
     GPUResourceManager,
     _remove_none_from_dict,
+    get_reserved_cpu,
     get_resource_manager,
+    pin_reserved_cpu,
 )
 from tests.test_suite.e2e_test_system import e2e_pytest_component
 
 
 @pytest.fixture
 def cpu_resource_manager():
-    return CPUResourceManager(num_parallel_trial=4)
+    return CPUResourceManager(num_parallel_trial=4, available_cpu="0,1,2,3,4,5,6,7,8,9")
 
 
 @pytest.fixture
@@ -31,16 +34,48 @@ class TestCPUResourceManager:
         with pytest.raises(ValueError):
             CPUResourceManager(num_parallel_trial)
 
+    @e2e_pytest_component
+    @pytest.mark.parametrize("available_cpu", [",", "a,b", "0,a", ""])
+    def test_init_wrong_available_cpu_value(self, available_cpu):
+        with pytest.raises(ValueError):
+            CPUResourceManager(available_cpu=available_cpu)
+
+    @e2e_pytest_component
+    def test_init_without_num_parallel_trial(self, mocker):
+        mock_virtual_memory = mocker.patch("otx.hpo.resource_manager.psutil.virtual_memory")
+        mock_virtual_memory.return_value.available = 100 * 1024**3
+        assert CPUResourceManager(available_cpu="0,1,2,3,4,5,6,7,8")._num_parallel_trial == 2
+        assert CPUResourceManager(available_cpu="0,1")._num_parallel_trial == 1
+
+        mock_virtual_memory.return_value.available = 5 * 1024**3
+        assert CPUResourceManager(available_cpu=",".join([str(i) for i in range(16)]))._num_parallel_trial == 1
+
     @e2e_pytest_component
     def test_reserve_resource(self, cpu_resource_manager):
         num_parallel_trial = cpu_resource_manager._num_parallel_trial
 
+        reserved_cpu = []
         for i in range(num_parallel_trial):
-            assert cpu_resource_manager.reserve_resource(i) == {}
+            env = cpu_resource_manager.reserve_resource(i)
+            cpu = [int(val) for val in env[CPU_AFFINITY_ENV].split(",")]
+            assert len(cpu) in (2, 3)
+            assert env["OMP_NUM_THREADS"] == env["MKL_NUM_THREADS"] == str(len(cpu))
+            reserved_cpu.extend(cpu)
+
+        # cores are split into disjoint sets
+        assert sorted(reserved_cpu) == list(range(10))
 
         for i in range(10):
             assert cpu_resource_manager.reserve_resource(i) is None
 
+    @e2e_pytest_component
+    def test_reserve_resource_more_trials_than_cores(self):
+        cpu_resource_manager = CPUResourceManager(num_parallel_trial=4, available_cpu="0,1")
+
+        for i in range(4):
+            env = cpu_resource_manager.reserve_resource(i)
+            assert env[CPU_AFFINITY_ENV] == str(i % 2)
+
     @e2e_pytest_component
     def test_reserve_resource_reserved_already(self, cpu_resource_manager):
         cpu_resource_manager.reserve_resource(0)
@@ -49,9 +84,12 @@ class TestCPUResourceManager:
 
     @e2e_pytest_component
     def test_release_resource(self, cpu_resource_manager):
-        cpu_resource_manager.reserve_resource(1)
+        envs = [cpu_resource_manager.reserve_resource(i) for i in range(cpu_resource_manager._num_parallel_trial)]
         cpu_resource_manager.release_resource(1)
 
+        # released cores are reserved again
+        assert cpu_resource_manager.reserve_resource("new") == envs[1]
+
     @e2e_pytest_component
     def test_release_unreserved_resource(self, cpu_resource_manager):
         cpu_resource_manager.release_resource(1)
@@ -169,6 +207,30 @@ def test_get_resource_manager_gpu_without_available_gpu(mocker):
     assert isinstance(manager, CPUResourceManager)
 
 
+@e2e_pytest_component
+def test_get_reserved_cpu(monkeypatch):
+    monkeypatch.delenv(CPU_AFFINITY_ENV, raising=False)
+    assert get_reserved_cpu() is None
+    monkeypatch.setenv(CPU_AFFINITY_ENV, "2,3")
+    assert get_reserved_cpu() == [2, 3]
+
+
+@e2e_pytest_component
+def test_pin_reserved_cpu(mocker, monkeypatch):
+    mock_sched_setaffinity = mocker.patch("otx.hpo.resource_manager.os.sched_setaffinity", create=True)
+    mock_set_num_threads = mocker.patch("otx.hpo.resource_manager.torch.set_num_threads")
+    mocker.patch("otx.hpo.resource_manager.torch.set_num_interop_threads")
+
+    monkeypatch.delenv(CPU_AFFINITY_ENV, raising=False)
+    pin_reserved_cpu()
+    mock_sched_setaffinity.assert_not_called()
+
+    monkeypatch.setenv(CPU_AFFINITY_ENV, "2,3")
+    pin_reserved_cpu()
+    mock_sched_setaffinity.assert_called_once_with(0, [2, 3])
+    mock_set_num_threads.assert_called_once_with(2)
+
+
 @e2e_pytest_component
 def test_remove_none_from_dict():
     some_dict = {"a": 1, "b": None}
@@ -0,0 +1,132 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import math
+
+import numpy as np
+import pytest
+
+from otx.hpo.hyperband import HyperBand
+from otx.hpo.smbo import SMBO, TPESampler
+from tests.test_suite.e2e_test_system import e2e_pytest_component
+
+
+def get_search_space():
+    return {
+        "lr": {"param_type": "loguniform", "range": [0.0001, 0.1, 10]},
+        "bs": {"param_type": "qloguniform", "range": [8, 64, 2, 2]},
+        "optimizer": {"param_type": "choice", "range": ["sgd", "adam"]},
+    }
+
+
+def get_score(config, resource):
+    return resource / 9 - (math.log10(config["lr"]) + 2.5) ** 2 - (config["optimizer"] == "sgd") * 0.5
+
+
+def run_hpo(hpo_algo):
+    while not hpo_algo.is_done():
+        trial = hpo_algo.get_next_sample()
+        if trial is None:
+            break
+        trial.status = 1
+        for resource in range(int(trial.get_progress()) + 1, int(trial.iteration) + 1):
+            hpo_algo.report_score(get_score(trial.configuration, resource), resource, trial.id)
+        hpo_algo.report_score(0, trial.iteration, trial.id, done=True)
+        trial.status = 2
+
+
+@pytest.fixture
+def smbo_args(tmp_path):
+    return {
+        "search_space": get_search_space(),
+        "save_path": str(tmp_path / "smbo"),
+        "maximum_resource": 9,
+        "minimum_resource": 1,
+        "reduction_factor": 3,
+        "full_dataset_size": 100,
+        "seed": 0,
+    }
+
+
+class TestTPESampler:
+    @e2e_pytest_component
+    def test_init_wrong_gamma(self):
+        with pytest.raises(ValueError):
+            TPESampler(1, gamma=1)
+
+    @e2e_pytest_component
+    def test_sample(self):
+        sampler = TPESampler(2, seed=0)
+        points = np.random.default_rng(0).random((30, 2))
+        scores = -np.sum((points - [0.3, 0.7]) ** 2, axis=1)
+
+        samples = np.array([sampler.sample(points, scores) for _ in range(10)])
+
+        assert np.all((samples >= 0) & (samples <= 1))
+        assert np.mean(np.linalg.norm(samples - [0.3, 0.7], axis=1)) < 0.25
+
+    @e2e_pytest_component
+    def test_sample_with_few_points(self):
+        sampler = TPESampler(2, seed=0)
+        sample = sampler.sample(np.array([[0.5, 0.5]]), np.array([1.0]))
+        assert sample.shape == (2,)
+
+
+class TestSMBO:
+    @e2e_pytest_component
+    def test_sample_when_trial_starts(self, smbo_args):
+        smbo = SMBO(**smbo_args)
+        assert all(not trial.configuration for trial in smbo._trials.values())
+
+        trial = smbo.get_next_sample()
+
+        assert set(trial.configuration) == {"lr", "bs", "optimizer"}
+        assert 0.0001 <= trial.configuration["lr"] <= 0.1
+        assert trial.configuration["optimizer"] in ["sgd", "adam"]
+
+    @e2e_pytest_component
+    def test_run(self, smbo_args):
+        smbo = SMBO(**smbo_args)
+
+        run_hpo(smbo)
+
+        assert smbo.is_done()
+        best_config = smbo.get_best_config()["config"]
+        assert abs(math.log10(best_config["lr"]) + 2.5) < 0.5
+        assert best_config["optimizer"] == "adam"
+
+    @e2e_pytest_component
+    def test_get_observations_at_highest_resource(self, smbo_args):
+        smbo = SMBO(num_startup_trials=2, **smbo_args)
+        assert smbo._get_observations() is None
+
+        for resource, config in zip([9, 3, 1], [{"lr": 0.001}, {"lr": 0.01}, {"lr": 0.1}]):
+            trial = smbo.get_next_sample()
+            trial.configuration.update(config)
+            for epoch in range(1, resource + 1):
+                smbo.report_score(epoch, epoch, trial.id)
+
+        # the trial trained for 1 epoch is left out, and the others are compared at 3 epochs
+        points, scores = smbo._get_observations()
+        assert len(points) == 2
+        assert scores.tolist() == [3, 3]
+
+    @e2e_pytest_component
+    def test_warm_start(self, smbo_args, tmp_path):
+        hyperband = HyperBand(
+            search_space=get_search_space(),
+            save_path=str(tmp_path / "asha"),
+            maximum_resource=9,
+            minimum_resource=1,
+            reduction_factor=3,
+            full_dataset_size=100,
+        )
+        run_hpo(hyperband)
+        hyperband.save_results()
+        num_trials = sum(1 for trial in hyperband._trials.values() if trial.score)
+
+        smbo = SMBO(warm_start_paths=[str(tmp_path / "asha")], **smbo_args)
+
+        assert len(smbo._warm_start_observations) == num_trials
+        assert smbo._get_observations() is not None
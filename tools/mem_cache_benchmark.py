@@ -0,0 +1,119 @@
+"""Micro-benchmark of get/put latency of the memory cache handler.
+
+It compares the shared-memory index of MemCacheHandlerForMP with
+the multiprocessing.Manager based index which was used before.
+
+Usage:
+    python tools/mem_cache_benchmark.py --num-items 2000 --num-workers 8
+"""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import ctypes as ct
+import multiprocessing as mp
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from otx.core.data.caching.mem_cache_handler import MemCacheHandlerBase, MemCacheHandlerForMP
+
+
+class ManagerIndexedMemCacheHandler(MemCacheHandlerBase):
+    """Reference handler whose key to address table is a multiprocessing.Manager().dict()."""
+
+    def _init_data_structs(self, mem_size: int):
+        self._arr = mp.Array(ct.c_uint8, mem_size, lock=False)
+        self._cur_page = mp.Value(ct.c_size_t, 0, lock=False)
+        self._manager = mp.Manager()
+        self._cache_addr = self._manager.dict()
+        self._lock = mp.Lock()
+
+    def get(self, key: Any) -> Tuple[Optional[np.ndarray], Optional[Dict]]:
+        """Get the data and the meta of the key from the Manager dict index."""
+        if key not in self._cache_addr:
+            return None, None
+        offset, count, dtype, shape, strides, meta = self._cache_addr[key]
+        data = np.frombuffer(self._arr, dtype=dtype, count=count, offset=offset)
+        return np.lib.stride_tricks.as_strided(data, shape, strides), meta
+
+    def put(self, key: Any, data: np.ndarray, meta: Optional[Dict] = None) -> Optional[int]:
+        """Put the data at the end of the pool and add its address to the Manager dict index."""
+        data_bytes = data.size * data.itemsize
+        with self._lock:
+            new_page = self._cur_page.value + data_bytes
+            if key in self._cache_addr or new_page > self.mem_size:
+                return None
+            ct.memmove(ct.byref(self._arr, self._cur_page.value), data.ctypes.data, data_bytes)
+            self._cache_addr[key] = (self._cur_page.value, data.size, data.dtype, data.shape, data.strides, meta)
+            self._cur_page.value = new_page
+            return new_page
+
+    def __len__(self):
+        """Number of cached items."""
+        return len(self._cache_addr)
+
+    def __del__(self):
+        """Shut down the Manager process."""
+        self._manager.shutdown()
+
+
+def _get_worker(handler: MemCacheHandlerBase, keys: list, num_repeats: int, result: Any, worker_idx: int):
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        for key in keys:
+            handler.get(key)
+    result[worker_idx] = (time.perf_counter() - start) / (num_repeats * len(keys))
+
+
+def benchmark(handler: MemCacheHandlerBase, args: argparse.Namespace) -> Dict[str, float]:
+    """Measure the average put and get latencies (us)."""
+    rng = np.random.default_rng(0)
+    items = [
+        ((f"/path/to/image_{idx:06d}.jpg", f"roi_{idx}"), rng.integers(0, 256, args.shape, dtype=np.uint8))
+        for idx in range(args.num_items)
+    ]
+
+    start = time.perf_counter()
+    for key, data in items:
+        handler.put(key, data)
+    put_latency = (time.perf_counter() - start) / len(items)
+
+    keys = [key for key, _ in items]
+    result = mp.Array(ct.c_double, args.num_workers)
+    ctx = mp.get_context("fork")
+    workers = [
+        ctx.Process(target=_get_worker, args=(handler, keys, args.num_repeats, result, idx))
+        for idx in range(args.num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return {"put": 1e6 * put_latency, "get": 1e6 * float(np.mean(result[:]))}
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-items", type=int, default=2000)
+    parser.add_argument("--num-workers", type=int, default=8)
+    parser.add_argument("--num-repeats", type=int, default=3)
+    parser.add_argument("--shape", type=int, nargs="+", default=[64, 64, 3])
+    args = parser.parse_args()
+
+    mem_size = args.num_items * int(np.prod(args.shape))
+    for handler_cls in (ManagerIndexedMemCacheHandler, MemCacheHandlerForMP):
+        handler = handler_cls(mem_size)
+        latency = benchmark(handler, args)
+        print(
+            f"{handler_cls.__name__:>32}: put {latency['put']:8.1f} us, "
+            f"get {latency['get']:8.1f} us ({args.num_workers} workers)"
+        )
+        del handler
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Micro-benchmark of otx.api.utils.nms.
+
+It compares the blocked NMS with the sequential greedy NMS which was used before,
+on uniformly scattered boxes and on clustered boxes which look like tiled detection results.
+
+Usage:
+    python tools/nms_benchmark.py --num-boxes 1000 10000 50000
+"""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import numpy as np
+from otx.api.utils.nms import nms
+
+
+def greedy_nms(boxes: np.ndarray, scores: np.ndarray, thresh: float) -> np.ndarray:
+    """Sequential greedy NMS which was used before, copied verbatim except for the returned array."""
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+
+        width = np.maximum(0.0, xx2 - xx1)
+        height = np.maximum(0.0, yy2 - yy1)
+        intersection = width * height
+
+        union = areas[i] + areas[order[1:]] - intersection
+        overlap = np.divide(
+            intersection,
+            union,
+            out=np.zeros_like(intersection, dtype=float),
+            where=union != 0,
+        )
+
+        order = order[np.where(overlap <= thresh)[0] + 1]
+
+    return np.array(keep, dtype=np.int64)
+
+
+def uniform_boxes(num_boxes: int, rng: np.random.Generator) -> np.ndarray:
+    """Boxes scattered over the image, most of them are kept."""
+    xy = rng.uniform(0, 2000, (num_boxes, 2))
+    wh = rng.uniform(5, 100, (num_boxes, 2))
+    return np.concatenate([xy, xy + wh], axis=1).astype(np.float32)
+
+
+def clustered_boxes(num_boxes: int, rng: np.random.Generator) -> np.ndarray:
+    """Boxes jittered around objects, e.g. duplicates predicted on overlapping tiles."""
+    num_objects = max(num_boxes // 25, 1)
+    centers = rng.uniform(0, 4000, (num_objects, 2))
+    sizes = rng.uniform(20, 200, (num_objects, 2))
+    indices = rng.integers(0, num_objects, num_boxes)
+    center = centers[indices] + rng.normal(0, 4, (num_boxes, 2))
+    size = sizes[indices] * rng.uniform(0.9, 1.1, (num_boxes, 2))
+    return np.concatenate([center - size / 2, center + size / 2], axis=1).astype(np.float32)
+
+
+def benchmark(nms_fn: Callable, boxes: np.ndarray, scores: np.ndarray, args: argparse.Namespace) -> float:
+    """Measure the best latency (ms) among the repeats."""
+    latencies = []
+    for _ in range(args.num_repeats):
+        start = time.perf_counter()
+        nms_fn(boxes, scores, args.iou_threshold)
+        latencies.append(time.perf_counter() - start)
+    return 1e3 * min(latencies)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-boxes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--num-repeats", type=int, default=3)
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for name, box_fn in (("uniform", uniform_boxes), ("clustered", clustered_boxes)):
+        for num_boxes in args.num_boxes:
+            boxes = box_fn(num_boxes, rng)
+            scores = rng.uniform(0, 1, num_boxes).astype(np.float32)
+            assert np.array_equal(nms(boxes, scores, args.iou_threshold), greedy_nms(boxes, scores, args.iou_threshold))
+
+            latency: Dict[str, float] = {
+                "greedy": benchmark(greedy_nms, boxes, scores, args),
+                "blocked": benchmark(nms, boxes, scores, args),
+            }
+            print(
+                f"{name:>9} {num_boxes:>6} boxes: greedy {latency['greedy']:9.1f} ms, "
+                f"blocked {latency['blocked']:9.1f} ms ({latency['greedy'] / latency['blocked']:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Micro-benchmark of otx.api.utils.tiler.Tiler.merge_maps.
+
+It compares the vectorized merge of tile-level saliency maps with the pixel-by-pixel merge which was used before.
+
+Usage:
+    python tools/tiler_merge_maps_benchmark.py --image-size 1024 2048 --num-classes 10
+"""
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import cv2
+import numpy as np
+from otx.api.utils.dataset_utils import non_linear_normalization
+from otx.api.utils.tiler import Tiler
+
+
+def pixelwise_merge_maps(tiler: Tiler, features: List) -> List[np.ndarray]:
+    """Pixel-by-pixel merge of the saliency maps which was used before."""
+    (_, image_saliency_map), image_meta = features[0]
+    num_classes, feat_h, feat_w = image_saliency_map.shape
+    dtype = image_saliency_map[0][0].dtype
+    image_h, image_w, _ = image_meta["original_shape"]
+    ratio = np.array([feat_h / min(tiler.tile_size, image_h), feat_w / min(tiler.tile_size, image_w)])
+    image_map_h = int(image_h * ratio[0])
+    image_map_w = int(image_w * ratio[1])
+    merged_map = [np.zeros((image_map_h, image_map_w)) for _ in range(num_classes)]
+
+    for (_, saliency_map), meta in features[1:]:
+        x_1, y_1, x_2, y_2 = meta["coord"]
+        y_1, x_1 = ((y_1, x_1) * ratio).astype(np.uint16)
+        y_2, x_2 = ((y_2, x_2) * ratio).astype(np.uint16)
+        map_h, map_w = saliency_map[0].shape
+        if (map_h > y_2 - y_1 > 0) and (map_w > x_2 - x_1 > 0):
+            saliency_map = np.array([cv2.resize(cls_map, (x_2 - x_1, y_2 - y_1)) for cls_map in saliency_map])
+        map_h, map_w = y_2 - y_1, x_2 - x_1
+        for ci, hi, wi in [(c_, h_, w_) for c_ in range(num_classes) for h_ in range(map_h) for w_ in range(map_w)]:
+            map_pixel = saliency_map[ci, hi, wi]
+            if merged_map[ci][y_1 + hi, x_1 + wi] != 0:
+                merged_map[ci][y_1 + hi, x_1 + wi] = 0.5 * (map_pixel + merged_map[ci][y_1 + hi, x_1 + wi])
+            else:
+                merged_map[ci][y_1 + hi, x_1 + wi] = map_pixel
+
+    for class_idx in range(num_classes):
+        image_map_cls = cv2.resize(image_saliency_map[class_idx], (image_map_w, image_map_h))
+        merged_map[class_idx] += (0.5 * image_map_cls).astype(dtype)
+        merged_map[class_idx] = non_linear_normalization(merged_map[class_idx])
+    return merged_map
+
+
+def tile_features(tiler: Tiler, image_size: int, num_classes: int, map_size: int, rng: np.random.Generator) -> List:
+    """Random saliency maps of the tiles of an image, the first one is of the full image."""
+    image_shape = (image_size, image_size, 3)
+    features = []
+    for i, coord in enumerate(tiler.tile(np.empty(image_shape, dtype=np.uint8))):
+        saliency_map = rng.uniform(0, 255, (num_classes, map_size, map_size)).astype(np.uint8)
+        # some pixels are not activated
+        saliency_map[rng.uniform(size=saliency_map.shape) < 0.1] = 0
+        meta = {"original_shape": image_shape} if i == 0 else {"coord": coord}
+        features.append(((None, saliency_map), meta))
+    return features
+
+
+def benchmark(merge_fn: Callable, num_repeats: int) -> float:
+    """Measure the best latency (ms) among the repeats."""
+    latencies = []
+    for _ in range(num_repeats):
+        start = time.perf_counter()
+        merge_fn()
+        latencies.append(time.perf_counter() - start)
+    return 1e3 * min(latencies)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image-size", type=int, nargs="+", default=[1024, 2048])
+    parser.add_argument("--tile-size", type=int, default=256)
+    parser.add_argument("--overlap", type=float, default=0.2)
+    parser.add_argument("--num-classes", type=int, default=10)
+    parser.add_argument("--map-size", type=int, default=13)
+    parser.add_argument("--num-repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tiler = Tiler(tile_size=args.tile_size, overlap=args.overlap, max_number=100, detector=None, mode="sync")
+    for image_size in args.image_size:
+        features = tile_features(tiler, image_size, args.num_classes, args.map_size, rng)
+        for merged_map, expected_map in zip(tiler.merge_maps(features), pixelwise_merge_maps(tiler, features)):
+            assert np.array_equal(merged_map, expected_map)
+
+        latency: Dict[str, float] = {
+            # The pixel-by-pixel merge takes seconds, so it is measured once
+            "pixelwise": benchmark(lambda: pixelwise_merge_maps(tiler, features), 1),
+            "vectorized": benchmark(lambda: tiler.merge_maps(features), args.num_repeats),
+        }
+        print(
+            f"{image_size:>5}px {len(features) - 1:>4} tiles: pixelwise {latency['pixelwise']:9.1f} ms, "
+            f"vectorized {latency['vectorized']:9.1f} ms ({latency['pixelwise'] / latency['vectorized']:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()